@@ -0,0 +1,11 @@
+import os
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'settings')
+# Route proxied services to the async view (see urls.py)
+os.environ.setdefault('ASGI', 'true')
+application = get_asgi_application()
+
+# Do the startup work now, not on the first request
+from startup import warm
+warm()
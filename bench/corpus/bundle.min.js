@@ -0,0 +1 @@
+var v=location.pathname.split("/");var gsg=location.pathname.split("/");function hi(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}m.getAttribute("href");function k(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}if(window.location.pathname==="/settings/user/docs"){eg()}function te(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function hoh(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}function es(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}if(window.location.pathname==="/vendor/static"){oc()}function v(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}location.href="/reference/account/item";fetch("/module?page="+aw).then(function(r){return r.json()});fetch("/page/search?page="+d).then(function(r){return r.json()});var y=location.pathname.split("/");function zol(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}if(window.location.pathname==="/item/user"){zu()}fetch("/api?page="+gu).then(function(r){return r.json()});var yef=location.pathname.split("/");var s=location.pathname.split("/");location.href="/settings/reference";function y(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function dl(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}if(window.location.pathname==="/guide"){t()}var o=location.pathname.split("/");if(window.location.pathname==="/chunk/reference"){my()}fetch("/api/account/item?page="+x).then(function(r){return r.json()});fetch("/static/image/docs?page="+wh).then(function(r){return r.json()});em.getAttribute("href");function ful(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}aut.getAttribute("href");fetch("/docs?page="+ay).then(function(r){return r.json()});function ghc(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var iyd=location.pathname.split("/");function e(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}if(window.location.pathname==="/assets"){s()}if(window.location.pathname==="/static"){h()}var nz=location.pathname.split("/");xe.getAttribute("href");function nr(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}location.href="/item/page/page";function ju(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}fetch("/api/reference?page="+ojo).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}fetch("/guide/module/user?page="+vp).then(function(r){return r.json()});function co(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}fetch("/chunk?page="+h).then(function(r){return r.json()});nmc.getAttribute("href");function scg(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}if(window.location.pathname==="/user"){i()}function qz(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}s.getAttribute("href");fetch("/page/api/chunk?page="+jz).then(function(r){return r.json()});if(window.location.pathname==="/chunk"){opm()}location.href="/vendor/user";var ml=location.pathname.split("/");var du=location.pathname.split("/");fetch("/image/guide/vendor?page="+q).then(function(r){return r.json()});if(window.location.pathname==="/search/search/account"){lj()}location.href="/guide/module/docs";fetch("/account/static/api?page="+khh).then(function(r){return r.json()});if(window.location.pathname==="/settings/settings/account"){l()}if(window.location.pathname==="/account"){v()}fetch("/image/account?page="+cry).then(function(r){return r.json()});if(window.location.pathname==="/image/vendor/assets"){i()}fetch("/reference?page="+nv).then(function(r){return r.json()});function y(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}fetch("/assets/settings/reference?page="+uw).then(function(r){return r.json()});var is=location.pathname.split("/");function sm(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}var bu=location.pathname.split("/");fetch("/guide?page="+uah).then(function(r){return r.json()});v.getAttribute("href");var p=location.pathname.split("/");var qg=location.pathname.split("/");fetch("/settings/static?page="+gv).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function zwx(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}poy.getAttribute("href");function uta(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function jjf(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}var a=location.pathname.split("/");function ngi(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}var gxc=location.pathname.split("/");var y=location.pathname.split("/");fetch("/page/docs?page="+ubq).then(function(r){return r.json()});var ota=location.pathname.split("/");function rs(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}var k=location.pathname.split("/");function dl(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var sh=location.pathname.split("/");if(window.location.pathname==="/api/module"){j()}var w=location.pathname.split("/");function qkm(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function jbf(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}fetch("/docs?page="+f).then(function(r){return r.json()});function xzh(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}var f=location.pathname.split("/");dz.getAttribute("href");function tx(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function zsx(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}var bv=location.pathname.split("/");function at(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}if(window.location.pathname==="/user/chunk"){gs()}function btc(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function uv(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}if(window.location.pathname==="/reference"){ye()}function gwi(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}if(window.location.pathname==="/page"){g()}function kb(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/image/chunk/page?page="+lgy).then(function(r){return r.json()});function bz(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var z=location.pathname.split("/");location.href="/api/vendor";iji.getAttribute("href");var w=location.pathname.split("/");var zt=location.pathname.split("/");function oau(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function hpq(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}if(window.location.pathname==="/account/item"){t()}function e(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}fetch("/vendor/item?page="+fee).then(function(r){return r.json()});var m=location.pathname.split("/");if(window.location.pathname==="/docs/vendor"){x()}location.href="/image";function nve(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}var so=location.pathname.split("/");function dss(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function vd(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}var d=location.pathname.split("/");fetch("/account/assets?page="+sev).then(function(r){return r.json()});if(window.location.pathname==="/item/settings/guide"){r()}function qv(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function sf(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}if(window.location.pathname==="/reference/account/item"){rwk()}function k(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}location.href="/account";function ps(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}fetch("/page?page="+olc).then(function(r){return r.json()});v.getAttribute("href");function a(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}location.href="/vendor";var jx=location.pathname.split("/");fetch("/item/module?page="+d).then(function(r){return r.json()});ntu.getAttribute("href");function uec(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function vmq(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}location.href="/account/docs/reference";function wso(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}if(window.location.pathname==="/settings"){eov()}fetch("/user/search/user?page="+sth).then(function(r){return r.json()});fetch("/guide/vendor/chunk?page="+w).then(function(r){return r.json()});location.href="/guide/chunk";fetch("/reference?page="+jjm).then(function(r){return r.json()});var u=location.pathname.split("/");fetch("/docs/page/search?page="+hcl).then(function(r){return r.json()});fetch("/vendor/guide/search?page="+b).then(function(r){return r.json()});if(window.location.pathname==="/vendor/module"){c()}function kf(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}var l=location.pathname.split("/");var i=location.pathname.split("/");function ztc(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}fetch("/vendor/guide/assets?page="+g).then(function(r){return r.json()});function hs(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}var z=location.pathname.split("/");function p(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}var bj=location.pathname.split("/");fetch("/api?page="+a).then(function(r){return r.json()});function n(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}var bq=location.pathname.split("/");function gh(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}function nrp(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}var r=location.pathname.split("/");fetch("/guide/page?page="+w).then(function(r){return r.json()});var qbt=location.pathname.split("/");function m(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function jdw(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}var d=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function vh(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function kvd(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}var fwo=location.pathname.split("/");if(window.location.pathname==="/search/chunk"){qck()}function mnw(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}function xce(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}fetch("/reference/image/image?page="+cg).then(function(r){return r.json()});fetch("/reference?page="+x).then(function(r){return r.json()});if(window.location.pathname==="/item/guide"){u()}if(window.location.pathname==="/account"){i()}fetch("/chunk/search?page="+w).then(function(r){return r.json()});if(window.location.pathname==="/image/chunk/api"){p()}function c(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}var q=location.pathname.split("/");function sd(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}t.getAttribute("href");if(window.location.pathname==="/account"){yhy()}function i(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}var a=location.pathname.split("/");var xcs=location.pathname.split("/");function sgh(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}fetch("/vendor/module/api?page="+rho).then(function(r){return r.json()});z.getAttribute("href");function w(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}fetch("/assets/chunk?page="+dm).then(function(r){return r.json()});function sx(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}location.href="/account/settings/item";function bex(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}if(window.location.pathname==="/chunk"){z()}if(window.location.pathname==="/assets/vendor"){lsz()}function vvn(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}ffp.getAttribute("href");function ao(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function ssn(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}var c=location.pathname.split("/");function ebc(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function zuz(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}if(window.location.pathname==="/search"){ylt()}function s(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function wwk(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function ycg(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function qyi(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}var s=location.pathname.split("/");fetch("/search/module?page="+pmv).then(function(r){return r.json()});function jca(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var xwq=location.pathname.split("/");jd.getAttribute("href");function w(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function qk(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function oz(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}fetch("/reference?page="+d).then(function(r){return r.json()});fetch("/page/settings/chunk?page="+uwr).then(function(r){return r.json()});fetch("/vendor/module?page="+dq).then(function(r){return r.json()});var bfy=location.pathname.split("/");if(window.location.pathname==="/docs/assets"){ipn()}var vek=location.pathname.split("/");function c(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var iqi=location.pathname.split("/");var wj=location.pathname.split("/");fetch("/item?page="+i).then(function(r){return r.json()});function iea(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}var ev=location.pathname.split("/");function f(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}fetch("/page/reference?page="+no).then(function(r){return r.json()});var b=location.pathname.split("/");function c(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function xq(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}function ei(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function lor(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}fetch("/account?page="+kld).then(function(r){return r.json()});var mj=location.pathname.split("/");function cy(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}rbf.getAttribute("href");if(window.location.pathname==="/docs/api"){jgz()}function loe(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}fetch("/user?page="+rxe).then(function(r){return r.json()});var fbh=location.pathname.split("/");if(window.location.pathname==="/docs/static/account"){fc()}if(window.location.pathname==="/account"){quk()}location.href="/module/chunk";function gr(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function lom(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}fetch("/user/item/docs?page="+d).then(function(r){return r.json()});function p(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}fetch("/search/user/static?page="+rmq).then(function(r){return r.json()});var q=location.pathname.split("/");var tng=location.pathname.split("/");function o(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}fetch("/docs?page="+n).then(function(r){return r.json()});function war(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}var jo=location.pathname.split("/");var v=location.pathname.split("/");var h=location.pathname.split("/");var mjn=location.pathname.split("/");function ru(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}if(window.location.pathname==="/docs/item"){cct()}fetch("/chunk/docs/item?page="+r).then(function(r){return r.json()});fetch("/reference?page="+euc).then(function(r){return r.json()});function o(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}function et(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}fetch("/docs?page="+dbw).then(function(r){return r.json()});location.href="/static";if(window.location.pathname==="/user/item"){qb()}fetch("/vendor?page="+gf).then(function(r){return r.json()});var yc=location.pathname.split("/");fetch("/item?page="+usw).then(function(r){return r.json()});function foa(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}var m=location.pathname.split("/");fetch("/page/vendor/api?page="+tp).then(function(r){return r.json()});function cs(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}fetch("/search?page="+k).then(function(r){return r.json()});fetch("/settings?page="+id).then(function(r){return r.json()});function adg(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}var fl=location.pathname.split("/");function ef(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}function ux(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}if(window.location.pathname==="/guide/assets/reference"){je()}var kid=location.pathname.split("/");location.href="/search/item";function aqa(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}var q=location.pathname.split("/");function fff(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function cq(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}fetch("/chunk/image/vendor?page="+vl).then(function(r){return r.json()});location.href="/chunk/settings/assets";n.getAttribute("href");fetch("/assets/settings?page="+u).then(function(r){return r.json()});if(window.location.pathname==="/chunk"){xne()}function b(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}var gg=location.pathname.split("/");function mhy(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}var w=location.pathname.split("/");function xxy(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}var syp=location.pathname.split("/");var gr=location.pathname.split("/");b.getAttribute("href");if(window.location.pathname==="/image/account/static"){r()}function uv(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}var v=location.pathname.split("/");fetch("/assets/item/user?page="+ymr).then(function(r){return r.json()});function rkw(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}var ib=location.pathname.split("/");fetch("/account/assets/search?page="+dmr).then(function(r){return r.json()});function c(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}if(window.location.pathname==="/guide/reference/module"){b()}function xrg(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function az(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}if(window.location.pathname==="/item/chunk"){nb()}function wf(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}location.href="/assets";fetch("/user?page="+a).then(function(r){return r.json()});function ns(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function ksd(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function ndz(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}y.getAttribute("href");var i=location.pathname.split("/");fetch("/reference?page="+m).then(function(r){return r.json()});var hd=location.pathname.split("/");function vm(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function cs(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/api/assets/user?page="+v).then(function(r){return r.json()});function sx(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}fetch("/account/module?page="+xxd).then(function(r){return r.json()});var w=location.pathname.split("/");function lfe(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}fetch("/item/search/item?page="+n).then(function(r){return r.json()});if(window.location.pathname==="/guide/module"){p()}fetch("/assets/reference?page="+x).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}if(window.location.pathname==="/settings/module"){ufc()}function e(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function rgu(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}function pvk(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}var vxy=location.pathname.split("/");var evp=location.pathname.split("/");var rep=location.pathname.split("/");function sfs(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}fetch("/module?page="+jt).then(function(r){return r.json()});fetch("/vendor/guide?page="+qx).then(function(r){return r.json()});function vgr(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function xn(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}fetch("/search/user?page="+wt).then(function(r){return r.json()});if(window.location.pathname==="/reference"){qx()}function k(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function zrh(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function vv(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}if(window.location.pathname==="/module/static"){tun()}function a(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}fetch("/reference/guide/guide?page="+pj).then(function(r){return r.json()});fetch("/chunk/api/vendor?page="+umj).then(function(r){return r.json()});fetch("/account/settings/chunk?page="+uu).then(function(r){return r.json()});var zrq=location.pathname.split("/");var orp=location.pathname.split("/");var q=location.pathname.split("/");location.href="/search";fetch("/guide/module?page="+ykl).then(function(r){return r.json()});function xue(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}io.getAttribute("href");fetch("/guide?page="+xd).then(function(r){return r.json()});fetch("/reference?page="+dwp).then(function(r){return r.json()});fetch("/user/settings/docs?page="+qh).then(function(r){return r.json()});function hni(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}location.href="/static/settings";function ap(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}fetch("/search/chunk/image?page="+cp).then(function(r){return r.json()});if(window.location.pathname==="/module/guide/image"){i()}var s=location.pathname.split("/");ow.getAttribute("href");var fw=location.pathname.split("/");function ylc(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}if(window.location.pathname==="/user/reference/account"){wiv()}var aql=location.pathname.split("/");function lca(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function jk(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var rm=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function vqq(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}fetch("/docs/image?page="+qcj).then(function(r){return r.json()});function i(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function em(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}fetch("/vendor/page?page="+zs).then(function(r){return r.json()});function fgv(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function fb(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function va(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}var mho=location.pathname.split("/");function re(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}fetch("/static/page?page="+nwj).then(function(r){return r.json()});function ua(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function xm(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}var nj=location.pathname.split("/");var dxl=location.pathname.split("/");var ek=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}if(window.location.pathname==="/api/account"){ue()}function zcs(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}if(window.location.pathname==="/image/docs"){hvp()}var f=location.pathname.split("/");if(window.location.pathname==="/item/chunk/settings"){a()}var r=location.pathname.split("/");var gkq=location.pathname.split("/");fetch("/item/account/user?page="+ldy).then(function(r){return r.json()});fetch("/docs/page?page="+vo).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}location.href="/chunk";fetch("/vendor?page="+cn).then(function(r){return r.json()});location.href="/account/account";function onq(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}if(window.location.pathname==="/guide/api/vendor"){fvp()}fetch("/image/docs?page="+g).then(function(r){return r.json()});fetch("/image/guide?page="+zco).then(function(r){return r.json()});fetch("/settings/docs?page="+m).then(function(r){return r.json()});fetch("/settings/settings?page="+d).then(function(r){return r.json()});function ssk(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function xpy(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}var mu=location.pathname.split("/");function mz(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}fpg.getAttribute("href");var zd=location.pathname.split("/");fetch("/settings?page="+p).then(function(r){return r.json()});fetch("/reference?page="+sku).then(function(r){return r.json()});location.href="/settings";fetch("/guide/user?page="+vwd).then(function(r){return r.json()});var qz=location.pathname.split("/");function rn(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}if(window.location.pathname==="/chunk/settings/page"){p()}var h=location.pathname.split("/");function v(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}function qy(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function eed(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}var m=location.pathname.split("/");function c(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}fetch("/user?page="+l).then(function(r){return r.json()});m.getAttribute("href");fetch("/item/item?page="+nf).then(function(r){return r.json()});function fg(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function ppr(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function vs(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}fetch("/account?page="+bya).then(function(r){return r.json()});var asa=location.pathname.split("/");function cqm(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}if(window.location.pathname==="/image/chunk/api"){zhc()}function nic(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}it.getAttribute("href");var i=location.pathname.split("/");function uny(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}var tpc=location.pathname.split("/");function cdy(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function zeq(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}fetch("/item/page?page="+w).then(function(r){return r.json()});var deq=location.pathname.split("/");fetch("/item/user/static?page="+kb).then(function(r){return r.json()});var blt=location.pathname.split("/");var ft=location.pathname.split("/");var do=location.pathname.split("/");var d=location.pathname.split("/");fetch("/account?page="+iw).then(function(r){return r.json()});fetch("/module/page/docs?page="+t).then(function(r){return r.json()});function ibx(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}fetch("/item?page="+ff).then(function(r){return r.json()});var gmb=location.pathname.split("/");location.href="/api/settings";var pxg=location.pathname.split("/");fetch("/vendor?page="+u).then(function(r){return r.json()});function ylc(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}var ro=location.pathname.split("/");function hg(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function vo(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function lyi(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}var as=location.pathname.split("/");if(window.location.pathname==="/item/static"){wh()}fetch("/static/settings?page="+chl).then(function(r){return r.json()});if(window.location.pathname==="/settings"){gd()}function az(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}location.href="/image/item";fetch("/reference/docs?page="+p).then(function(r){return r.json()});function sft(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}fetch("/reference?page="+de).then(function(r){return r.json()});function mrm(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function hal(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}var eie=location.pathname.split("/");function eo(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function ip(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}var t=location.pathname.split("/");var eb=location.pathname.split("/");function xt(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}fetch("/account/vendor?page="+n).then(function(r){return r.json()});function c(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function cqk(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function pf(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function bwk(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function fag(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}fetch("/search/static?page="+jtc).then(function(r){return r.json()});var it=location.pathname.split("/");function zfv(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}var y=location.pathname.split("/");function rc(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function bgi(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}fetch("/settings?page="+pin).then(function(r){return r.json()});var ndt=location.pathname.split("/");function wuh(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}var fi=location.pathname.split("/");var zz=location.pathname.split("/");function e(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}fetch("/chunk/module/item?page="+wj).then(function(r){return r.json()});var vtm=location.pathname.split("/");fetch("/module/assets/item?page="+c).then(function(r){return r.json()});fetch("/account?page="+mh).then(function(r){return r.json()});function lhr(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}var me=location.pathname.split("/");function hsw(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function kzu(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function xod(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}sck.getAttribute("href");fetch("/assets/settings/docs?page="+rjt).then(function(r){return r.json()});var bwa=location.pathname.split("/");fetch("/settings?page="+m).then(function(r){return r.json()});var v=location.pathname.split("/");var o=location.pathname.split("/");fetch("/item/settings/chunk?page="+ouj).then(function(r){return r.json()});fetch("/vendor/static?page="+d).then(function(r){return r.json()});function i(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function wsb(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}var pft=location.pathname.split("/");function qae(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function hbj(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}location.href="/reference/page/docs";var w=location.pathname.split("/");function t(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}fetch("/account?page="+p).then(function(r){return r.json()});if(window.location.pathname==="/image/settings"){kw()}function vow(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}fetch("/reference/docs?page="+sgd).then(function(r){return r.json()});fetch("/vendor/item?page="+fu).then(function(r){return r.json()});function s(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}fetch("/reference/assets/guide?page="+thc).then(function(r){return r.json()});var ds=location.pathname.split("/");var ljs=location.pathname.split("/");var e=location.pathname.split("/");fetch("/account/chunk?page="+d).then(function(r){return r.json()});fetch("/guide?page="+a).then(function(r){return r.json()});function jka(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}fetch("/api/api/guide?page="+jvv).then(function(r){return r.json()});function xfk(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}function jv(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}function wdq(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var wuh=location.pathname.split("/");hwh.getAttribute("href");fetch("/item/user?page="+n).then(function(r){return r.json()});bv.getAttribute("href");function i(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function qi(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}fetch("/guide?page="+iy).then(function(r){return r.json()});function nq(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function a(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}fetch("/assets/settings?page="+c).then(function(r){return r.json()});function kjt(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}fetch("/guide?page="+fzc).then(function(r){return r.json()});var j=location.pathname.split("/");function i(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}fetch("/reference/account/settings?page="+m).then(function(r){return r.json()});location.href="/user/guide";function wb(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}fetch("/image?page="+nx).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}var avl=location.pathname.split("/");function yh(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function ar(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}fetch("/chunk/module/static?page="+x).then(function(r){return r.json()});fetch("/vendor?page="+pr).then(function(r){return r.json()});t.getAttribute("href");fetch("/docs/item?page="+f).then(function(r){return r.json()});if(window.location.pathname==="/page/reference"){x()}fetch("/settings?page="+rdu).then(function(r){return r.json()});function p(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}if(window.location.pathname==="/docs"){ybd()}function l(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}if(window.location.pathname==="/docs/page"){biw()}function ish(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}if(window.location.pathname==="/vendor/reference"){gy()}function i(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function ek(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}fetch("/reference/api?page="+l).then(function(r){return r.json()});var hch=location.pathname.split("/");function a(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function sc(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}fetch("/assets/item/module?page="+fjt).then(function(r){return r.json()});fetch("/reference?page="+wj).then(function(r){return r.json()});function flg(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}fetch("/guide?page="+v).then(function(r){return r.json()});function e(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function syl(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function yh(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}var ffy=location.pathname.split("/");hpm.getAttribute("href");if(window.location.pathname==="/chunk/image/chunk"){q()}fetch("/user/module?page="+rdc).then(function(r){return r.json()});if(window.location.pathname==="/reference/settings/item"){nqr()}var gr=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}var ma=location.pathname.split("/");if(window.location.pathname==="/static/static/chunk"){if()}function j(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function mbt(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}var rba=location.pathname.split("/");function h(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function pag(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}if(window.location.pathname==="/image"){z()}if(window.location.pathname==="/search/page/search"){rtp()}function xu(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}if(window.location.pathname==="/static/static/page"){dk()}var hh=location.pathname.split("/");var rq=location.pathname.split("/");location.href="/assets";fetch("/guide?page="+yg).then(function(r){return r.json()});var vsz=location.pathname.split("/");var ged=location.pathname.split("/");var muj=location.pathname.split("/");location.href="/vendor";fetch("/item?page="+ezi).then(function(r){return r.json()});var n=location.pathname.split("/");fetch("/page?page="+r).then(function(r){return r.json()});function rvl(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function ku(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}var wf=location.pathname.split("/");if(window.location.pathname==="/api"){pb()}function sg(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}if(window.location.pathname==="/assets/module/assets"){i()}function bn(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}fetch("/vendor?page="+wsc).then(function(r){return r.json()});fetch("/reference?page="+luh).then(function(r){return r.json()});if(window.location.pathname==="/module"){lxn()}var z=location.pathname.split("/");if(window.location.pathname==="/image"){wr()}function u(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}kc.getAttribute("href");function sz(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}if(window.location.pathname==="/guide"){q()}function v(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}fetch("/static?page="+al).then(function(r){return r.json()});function jr(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}var onj=location.pathname.split("/");fetch("/reference?page="+fqr).then(function(r){return r.json()});w.getAttribute("href");function lyc(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function zx(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}function hu(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}fetch("/vendor?page="+zhe).then(function(r){return r.json()});location.href="/vendor/user/module";in.getAttribute("href");function qms(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}i.getAttribute("href");function ox(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function fak(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}fetch("/docs?page="+wd).then(function(r){return r.json()});location.href="/docs/static";var xim=location.pathname.split("/");fetch("/module?page="+pdk).then(function(r){return r.json()});var c=location.pathname.split("/");function zr(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}if(window.location.pathname==="/docs/account"){pd()}fetch("/chunk?page="+znc).then(function(r){return r.json()});if(window.location.pathname==="/docs/static/reference"){ns()}location.href="/chunk";function cx(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}fetch("/image/user?page="+ls).then(function(r){return r.json()});var t=location.pathname.split("/");function nu(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}if(window.location.pathname==="/search"){qjf()}location.href="/search/image/user";fetch("/page?page="+yo).then(function(r){return r.json()});var g=location.pathname.split("/");kiw.getAttribute("href");fetch("/account?page="+axn).then(function(r){return r.json()});fetch("/static/account?page="+as).then(function(r){return r.json()});var hf=location.pathname.split("/");location.href="/guide/static/api";fetch("/settings?page="+bi).then(function(r){return r.json()});fetch("/static?page="+m).then(function(r){return r.json()});var ho=location.pathname.split("/");function u(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/assets/image/account?page="+qcq).then(function(r){return r.json()});function da(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}var bt=location.pathname.split("/");fetch("/vendor/reference?page="+vca).then(function(r){return r.json()});function d(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}function nz(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function ol(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}if(window.location.pathname==="/reference"){zum()}var q=location.pathname.split("/");vt.getAttribute("href");function j(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}var h=location.pathname.split("/");function jo(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/assets/static/settings?page="+s).then(function(r){return r.json()});var gb=location.pathname.split("/");var ul=location.pathname.split("/");function uxj(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function uc(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}var pmg=location.pathname.split("/");function lg(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/api/docs?page="+pv).then(function(r){return r.json()});fetch("/search/account?page="+jf).then(function(r){return r.json()});var o=location.pathname.split("/");if(window.location.pathname==="/search/module"){v()}function kx(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function yer(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/settings/vendor?page="+ibl).then(function(r){return r.json()});var lxw=location.pathname.split("/");function o(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function ssr(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}var q=location.pathname.split("/");function f(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}fetch("/image/reference?page="+qx).then(function(r){return r.json()});location.href="/guide/search/settings";var v=location.pathname.split("/");fetch("/api/guide/docs?page="+en).then(function(r){return r.json()});function k(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function sky(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function qxi(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function dxj(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}var w=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}if(window.location.pathname==="/static/vendor/docs"){ov()}function b(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}location.href="/assets";wbn.getAttribute("href");fetch("/static/guide?page="+ndx).then(function(r){return r.json()});if(window.location.pathname==="/item"){yh()}function g(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}if(window.location.pathname==="/image"){i()}fetch("/page?page="+adz).then(function(r){return r.json()});if(window.location.pathname==="/item/image/page"){v()}function h(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}fetch("/vendor/static/search?page="+li).then(function(r){return r.json()});function y(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}function kh(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}fetch("/image?page="+il).then(function(r){return r.json()});var t=location.pathname.split("/");if(window.location.pathname==="/user/api"){zf()}function kn(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}fetch("/guide/vendor/static?page="+ied).then(function(r){return r.json()});function o(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}fetch("/item/page?page="+b).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}vfs.getAttribute("href");if(window.location.pathname==="/settings/page"){h()}function wlu(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function qg(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}var in=location.pathname.split("/");function yd(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}var fp=location.pathname.split("/");function suh(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}fetch("/search?page="+hzh).then(function(r){return r.json()});var h=location.pathname.split("/");fetch("/account/module?page="+ynl).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function dpr(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}fetch("/assets/api/static?page="+d).then(function(r){return r.json()});var kys=location.pathname.split("/");var ulb=location.pathname.split("/");if(window.location.pathname==="/assets/user"){ha()}fetch("/chunk/docs/guide?page="+x).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}var cez=location.pathname.split("/");function n(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}if(window.location.pathname==="/api/module/chunk"){yhj()}var zn=location.pathname.split("/");var fu=location.pathname.split("/");function se(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}var w=location.pathname.split("/");var g=location.pathname.split("/");function m(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}fetch("/docs/static?page="+zkz).then(function(r){return r.json()});n.getAttribute("href");function zx(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}function ld(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}var dw=location.pathname.split("/");function dtv(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}var kmp=location.pathname.split("/");function p(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function woo(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}var kq=location.pathname.split("/");if(window.location.pathname==="/user/chunk/settings"){gb()}function z(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}fetch("/module/search?page="+k).then(function(r){return r.json()});function pi(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function gr(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function nc(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}b.getAttribute("href");if(window.location.pathname==="/guide/vendor"){tzk()}var b=location.pathname.split("/");function np(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}var kg=location.pathname.split("/");function ond(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}var t=location.pathname.split("/");var q=location.pathname.split("/");var vsu=location.pathname.split("/");je.getAttribute("href");fetch("/static/item/chunk?page="+jvs).then(function(r){return r.json()});fetch("/image/guide/vendor?page="+dqr).then(function(r){return r.json()});if(window.location.pathname==="/chunk/settings"){hc()}if(window.location.pathname==="/guide/user/assets"){hg()}fetch("/static/guide?page="+we).then(function(r){return r.json()});var cp=location.pathname.split("/");y.getAttribute("href");fetch("/search?page="+m).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var du=location.pathname.split("/");fetch("/settings/vendor/page?page="+kw).then(function(r){return r.json()});fetch("/module?page="+dbo).then(function(r){return r.json()});fetch("/vendor/static?page="+mg).then(function(r){return r.json()});t.getAttribute("href");function ci(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function ym(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}ttq.getAttribute("href");function f(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}if(window.location.pathname==="/api"){out()}function td(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function doc(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}var sv=location.pathname.split("/");if(window.location.pathname==="/module/item"){dh()}var uw=location.pathname.split("/");var f=location.pathname.split("/");function iss(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}fetch("/search/guide?page="+xk).then(function(r){return r.json()});var jpo=location.pathname.split("/");if(window.location.pathname==="/search"){oj()}fetch("/vendor/user/image?page="+cc).then(function(r){return r.json()});fetch("/docs/vendor/image?page="+o).then(function(r){return r.json()});function vl(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}var dx=location.pathname.split("/");if(window.location.pathname==="/reference/settings"){hkl()}fetch("/assets?page="+cuh).then(function(r){return r.json()});function hvt(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function xq(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function mda(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function umc(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function uin(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}var y=location.pathname.split("/");function i(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}fetch("/module/user?page="+j).then(function(r){return r.json()});fetch("/item?page="+b).then(function(r){return r.json()});fetch("/settings/item/reference?page="+w).then(function(r){return r.json()});location.href="/static/image";function b(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}var ov=location.pathname.split("/");var x=location.pathname.split("/");function e(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}if(window.location.pathname==="/page/page/user"){syc()}location.href="/image/chunk";function tbe(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}location.href="/assets";fetch("/guide/docs/item?page="+fv).then(function(r){return r.json()});fetch("/account/user?page="+nz).then(function(r){return r.json()});function npw(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}var y=location.pathname.split("/");fetch("/chunk/page/docs?page="+pp).then(function(r){return r.json()});var y=location.pathname.split("/");fetch("/image/vendor/user?page="+a).then(function(r){return r.json()});var qd=location.pathname.split("/");var vpq=location.pathname.split("/");if(window.location.pathname==="/api"){ty()}fetch("/module/module?page="+k).then(function(r){return r.json()});fetch("/vendor?page="+s).then(function(r){return r.json()});location.href="/docs/chunk";function p(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function blb(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}var pl=location.pathname.split("/");location.href="/api/guide/settings";location.href="/docs";function cd(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function eff(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function jj(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}if(window.location.pathname==="/settings/docs/docs"){t()}function nd(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}if(window.location.pathname==="/item/guide/item"){kc()}location.href="/static/search";location.href="/account/account";function bn(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}if(window.location.pathname==="/assets/image"){sr()}function js(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}var mw=location.pathname.split("/");function v(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}fetch("/reference/static?page="+da).then(function(r){return r.json()});fetch("/account/assets?page="+r).then(function(r){return r.json()});function s(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function ps(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}if(window.location.pathname==="/page"){lu()}var sxh=location.pathname.split("/");var x=location.pathname.split("/");fetch("/settings?page="+a).then(function(r){return r.json()});p.getAttribute("href");if(window.location.pathname==="/search/user"){xf()}function xo(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function ix(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}fetch("/vendor/user/assets?page="+xk).then(function(r){return r.json()});var fg=location.pathname.split("/");function h(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function sol(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}fetch("/chunk/settings/chunk?page="+n).then(function(r){return r.json()});fetch("/static/item/vendor?page="+ve).then(function(r){return r.json()});if(window.location.pathname==="/docs/module"){tk()}fetch("/search?page="+zv).then(function(r){return r.json()});fetch("/static?page="+bes).then(function(r){return r.json()});if(window.location.pathname==="/search"){v()}function w(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function cok(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function jgw(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function zv(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function haw(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/image/page/static?page="+t).then(function(r){return r.json()});function gxo(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}eyq.getAttribute("href");location.href="/vendor/vendor/docs";if(window.location.pathname==="/api"){ji()}fetch("/item?page="+smg).then(function(r){return r.json()});fetch("/api/settings?page="+mk).then(function(r){return r.json()});function pj(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}function hfx(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}bdb.getAttribute("href");var h=location.pathname.split("/");function ibe(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}function pc(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function fx(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}var hq=location.pathname.split("/");function tv(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}ze.getAttribute("href");var bn=location.pathname.split("/");function q(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function is(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}var xv=location.pathname.split("/");function o(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}var cn=location.pathname.split("/");function zi(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}var si=location.pathname.split("/");fetch("/account/static/vendor?page="+uq).then(function(r){return r.json()});function zg(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function mbc(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function pr(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}if(window.location.pathname==="/settings"){n()}fetch("/search/search?page="+c).then(function(r){return r.json()});var rz=location.pathname.split("/");function n(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function kej(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}fetch("/search/user/guide?page="+u).then(function(r){return r.json()});var y=location.pathname.split("/");function tmy(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}fetch("/account/docs/image?page="+yr).then(function(r){return r.json()});fetch("/reference/image?page="+ih).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function kw(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/image/item?page="+aw).then(function(r){return r.json()});location.href="/module";fetch("/image/chunk?page="+bns).then(function(r){return r.json()});fetch("/assets/vendor?page="+hh).then(function(r){return r.json()});function rdt(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function fk(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}var dkc=location.pathname.split("/");fetch("/module/assets?page="+p).then(function(r){return r.json()});function xlx(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}fetch("/guide/guide?page="+o).then(function(r){return r.json()});fetch("/image/settings?page="+vmc).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}var ks=location.pathname.split("/");if(window.location.pathname==="/search/settings"){u()}var b=location.pathname.split("/");function qqj(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}function pz(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}fetch("/account/api?page="+lg).then(function(r){return r.json()});fetch("/image/item/module?page="+glw).then(function(r){return r.json()});var aha=location.pathname.split("/");location.href="/vendor/reference";function bnc(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function sfy(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}fetch("/image/item?page="+z).then(function(r){return r.json()});var iz=location.pathname.split("/");if(window.location.pathname==="/api/api"){auw()}function ep(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}var ubs=location.pathname.split("/");fetch("/settings/settings?page="+n).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}fetch("/guide?page="+u).then(function(r){return r.json()});function q(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}location.href="/settings/item";fetch("/chunk/reference?page="+nw).then(function(r){return r.json()});if(window.location.pathname==="/static/reference"){ihg()}fetch("/account/static/module?page="+xqr).then(function(r){return r.json()});function i(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function bas(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function aso(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}fetch("/chunk/page?page="+t).then(function(r){return r.json()});fetch("/user/guide/item?page="+nd).then(function(r){return r.json()});function xu(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function rt(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}function bt(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}fetch("/page/reference?page="+c).then(function(r){return r.json()});function gz(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}var kt=location.pathname.split("/");var h=location.pathname.split("/");if(window.location.pathname==="/search"){u()}fetch("/guide?page="+siy).then(function(r){return r.json()});if(window.location.pathname==="/item/guide/static"){rh()}var a=location.pathname.split("/");fetch("/static?page="+aj).then(function(r){return r.json()});var gkq=location.pathname.split("/");function b(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}if(window.location.pathname==="/account"){ylz()}fetch("/account/image?page="+pk).then(function(r){return r.json()});function jo(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}fetch("/account?page="+s).then(function(r){return r.json()});gka.getAttribute("href");fetch("/account/user/search?page="+f).then(function(r){return r.json()});function q(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}fetch("/reference/reference?page="+vyz).then(function(r){return r.json()});fetch("/page?page="+bgx).then(function(r){return r.json()});function uek(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}location.href="/docs/module";function gn(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}var y=location.pathname.split("/");if(window.location.pathname==="/guide/settings/image"){jvj()}function ck(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function uq(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}fetch("/assets/module?page="+xx).then(function(r){return r.json()});function yq(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}fetch("/static/reference/image?page="+fj).then(function(r){return r.json()});function pp(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}fetch("/static/chunk?page="+wn).then(function(r){return r.json()});fetch("/settings/assets/item?page="+tut).then(function(r){return r.json()});function qye(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function it(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function iy(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}location.href="/image";location.href="/docs/chunk";var rt=location.pathname.split("/");if(window.location.pathname==="/user"){u()}function qmn(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}fetch("/docs/page/guide?page="+oys).then(function(r){return r.json()});function t(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}if(window.location.pathname==="/module/settings"){clr()}function mq(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}var t=location.pathname.split("/");var zxt=location.pathname.split("/");function t(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}if(window.location.pathname==="/chunk/api"){gt()}function c(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}function mdl(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}var xk=location.pathname.split("/");function haj(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}fetch("/account/settings/module?page="+v).then(function(r){return r.json()});if(window.location.pathname==="/user/module"){ks()}var v=location.pathname.split("/");if(window.location.pathname==="/docs/settings"){kwd()}fetch("/api/docs/assets?page="+fl).then(function(r){return r.json()});fetch("/guide/user/settings?page="+o).then(function(r){return r.json()});function uym(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}fetch("/account/guide/reference?page="+vkj).then(function(r){return r.json()});function o(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}location.href="/static";if(window.location.pathname==="/item/reference/chunk"){rm()}function ffd(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}var e=location.pathname.split("/");function qa(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}fetch("/search/search/chunk?page="+tz).then(function(r){return r.json()});fetch("/item/page?page="+j).then(function(r){return r.json()});var jsx=location.pathname.split("/");if(window.location.pathname==="/settings/assets"){he()}var w=location.pathname.split("/");function mi(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}if(window.location.pathname==="/settings/guide/assets"){mxu()}function lmm(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function xd(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function fzh(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function gv(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}location.href="/settings";function yj(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}location.href="/search/chunk";var es=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function dgd(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}fetch("/module/account/search?page="+jsk).then(function(r){return r.json()});var ea=location.pathname.split("/");function kam(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}fetch("/item/item/user?page="+g).then(function(r){return r.json()});function gd(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function ml(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function bca(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}if(window.location.pathname==="/search"){slk()}if(window.location.pathname==="/chunk/guide/user"){wkc()}hnb.getAttribute("href");fetch("/module/page/chunk?page="+mg).then(function(r){return r.json()});location.href="/settings";if(window.location.pathname==="/account/user/image"){h()}function ouq(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}fetch("/chunk/user/user?page="+cz).then(function(r){return r.json()});function ii(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}if(window.location.pathname==="/reference/item"){jo()}hcr.getAttribute("href");fetch("/user/chunk/user?page="+jv).then(function(r){return r.json()});var prr=location.pathname.split("/");var nj=location.pathname.split("/");if(window.location.pathname==="/item/settings"){e()}function wtl(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}if(window.location.pathname==="/settings"){zuj()}function adb(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function nym(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function dz(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}var nm=location.pathname.split("/");function gj(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/vendor/image/vendor?page="+se).then(function(r){return r.json()});fetch("/image/module/chunk?page="+xr).then(function(r){return r.json()});function dah(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}var pje=location.pathname.split("/");fetch("/chunk/assets?page="+al).then(function(r){return r.json()});location.href="/reference";if(window.location.pathname==="/image"){cjc()}var gg=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}var izm=location.pathname.split("/");function ah(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function kl(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function mnl(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}function tpu(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}fetch("/docs/chunk/static?page="+jq).then(function(r){return r.json()});function c(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function iq(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}var arj=location.pathname.split("/");function uy(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}fetch("/module/chunk?page="+ajc).then(function(r){return r.json()});fetch("/page/search/image?page="+c).then(function(r){return r.json()});function igo(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/api/image?page="+i).then(function(r){return r.json()});fetch("/search/settings/settings?page="+mpj).then(function(r){return r.json()});var pcz=location.pathname.split("/");fetch("/module?page="+dd).then(function(r){return r.json()});function pd(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function oet(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function czw(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}var ob=location.pathname.split("/");var tj=location.pathname.split("/");function d(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function hpv(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}fetch("/static/assets/module?page="+ikn).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function az(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}if(window.location.pathname==="/account"){vv()}fetch("/module/module/image?page="+om).then(function(r){return r.json()});fetch("/reference?page="+asp).then(function(r){return r.json()});function wsh(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}fetch("/page/search/image?page="+zr).then(function(r){return r.json()});if(window.location.pathname==="/static"){g()}function a(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}var nkx=location.pathname.split("/");function unf(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function lw(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}if(window.location.pathname==="/vendor"){m()}function r(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}zet.getAttribute("href");var ad=location.pathname.split("/");lll.getAttribute("href");var o=location.pathname.split("/");ri.getAttribute("href");function nu(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}if(window.location.pathname==="/user"){d()}fetch("/item?page="+ib).then(function(r){return r.json()});fetch("/reference/page?page="+quq).then(function(r){return r.json()});var hvt=location.pathname.split("/");function eq(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}fetch("/search?page="+pk).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}fetch("/module?page="+q).then(function(r){return r.json()});var hv=location.pathname.split("/");location.href="/reference/module";function h(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}location.href="/vendor/assets/search";fetch("/page?page="+ktf).then(function(r){return r.json()});function vah(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}fetch("/page/item?page="+hz).then(function(r){return r.json()});function i(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function lvt(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}if(window.location.pathname==="/search"){k()}if(window.location.pathname==="/page/image"){k()}if(window.location.pathname==="/chunk/vendor/settings"){d()}var v=location.pathname.split("/");location.href="/reference";var chi=location.pathname.split("/");var c=location.pathname.split("/");var x=location.pathname.split("/");fetch("/module/image/account?page="+ts).then(function(r){return r.json()});function hfx(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}fetch("/page/assets?page="+xfe).then(function(r){return r.json()});fetch("/vendor/page?page="+huq).then(function(r){return r.json()});function j(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}fetch("/account/page/reference?page="+rw).then(function(r){return r.json()});function zp(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}fetch("/vendor/search/guide?page="+lol).then(function(r){return r.json()});function pkl(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}if(window.location.pathname==="/page/image/reference"){d()}fetch("/item?page="+ilu).then(function(r){return r.json()});function i(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}if(window.location.pathname==="/page/reference"){k()}var zn=location.pathname.split("/");function fm(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}var x=location.pathname.split("/");function uar(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function dz(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}var fs=location.pathname.split("/");var y=location.pathname.split("/");o.getAttribute("href");fetch("/guide/assets/static?page="+rmc).then(function(r){return r.json()});diw.getAttribute("href");fxd.getAttribute("href");klu.getAttribute("href");function gdw(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}fetch("/account?page="+hs).then(function(r){return r.json()});fetch("/docs/assets?page="+gnd).then(function(r){return r.json()});function j(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function tc(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}if(window.location.pathname==="/settings"){hl()}function w(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}if(window.location.pathname==="/api/docs/chunk"){aa()}var q=location.pathname.split("/");if(window.location.pathname==="/guide/module"){mq()}qg.getAttribute("href");function js(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function ojn(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}function esy(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function zv(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function qa(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}fetch("/item/module/api?page="+n).then(function(r){return r.json()});if(window.location.pathname==="/chunk"){oe()}function t(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}fetch("/vendor/user/chunk?page="+esf).then(function(r){return r.json()});var o=location.pathname.split("/");function e(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}if(window.location.pathname==="/user"){ym()}var g=location.pathname.split("/");if(window.location.pathname==="/static"){ali()}utp.getAttribute("href");fetch("/api/settings?page="+m).then(function(r){return r.json()});fetch("/module/static?page="+zlw).then(function(r){return r.json()});if(window.location.pathname==="/user"){v()}var jwm=location.pathname.split("/");function s(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}var tu=location.pathname.split("/");fetch("/page/module?page="+i).then(function(r){return r.json()});vt.getAttribute("href");fetch("/image?page="+p).then(function(r){return r.json()});function d(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}fetch("/vendor/page?page="+do).then(function(r){return r.json()});location.href="/search";var pbx=location.pathname.split("/");var c=location.pathname.split("/");function mh(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}if(window.location.pathname==="/account/settings/image"){ijw()}function y(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}var mj=location.pathname.split("/");fetch("/image?page="+qos).then(function(r){return r.json()});fetch("/assets?page="+j).then(function(r){return r.json()});var jr=location.pathname.split("/");fetch("/static?page="+z).then(function(r){return r.json()});fetch("/image?page="+dx).then(function(r){return r.json()});fetch("/reference/account?page="+u).then(function(r){return r.json()});var qbo=location.pathname.split("/");fetch("/docs?page="+a).then(function(r){return r.json()});fetch("/static/docs?page="+mz).then(function(r){return r.json()});function ba(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}var i=location.pathname.split("/");var d=location.pathname.split("/");if(window.location.pathname==="/assets/item/api"){d()}function w(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function qjx(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}fetch("/chunk/chunk?page="+ito).then(function(r){return r.json()});function mt(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}location.href="/user/assets/chunk";function d(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}if(window.location.pathname==="/account/item/image"){clw()}function jf(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}location.href="/vendor";fetch("/vendor/api/settings?page="+naf).then(function(r){return r.json()});fetch("/docs?page="+wk).then(function(r){return r.json()});var ud=location.pathname.split("/");var y=location.pathname.split("/");location.href="/settings/assets/chunk";fetch("/docs/vendor/item?page="+zs).then(function(r){return r.json()});var k=location.pathname.split("/");function os(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}location.href="/module/item/guide";fetch("/api/guide?page="+eao).then(function(r){return r.json()});h.getAttribute("href");fetch("/search/settings/docs?page="+ei).then(function(r){return r.json()});function wf(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/assets?page="+mnq).then(function(r){return r.json()});function rwa(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}var nb=location.pathname.split("/");if(window.location.pathname==="/docs/api"){kfx()}function gvr(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}fetch("/page/docs?page="+qa).then(function(r){return r.json()});function pap(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}if(window.location.pathname==="/user"){qqa()}function r(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}fetch("/docs/guide/account?page="+e).then(function(r){return r.json()});var vd=location.pathname.split("/");var osz=location.pathname.split("/");fetch("/assets?page="+wmw).then(function(r){return r.json()});function spz(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}if(window.location.pathname==="/api"){qsj()}location.href="/image/docs/guide";location.href="/image/assets/item";xzx.getAttribute("href");fetch("/account/settings?page="+oj).then(function(r){return r.json()});function p(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function how(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}fetch("/item?page="+ty).then(function(r){return r.json()});var twq=location.pathname.split("/");function r(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function jcx(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function ofo(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function xq(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function rbn(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}fetch("/search?page="+fs).then(function(r){return r.json()});fetch("/account?page="+l).then(function(r){return r.json()});function hsh(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function gvs(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}var f=location.pathname.split("/");fetch("/guide/api?page="+so).then(function(r){return r.json()});function zz(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}fetch("/static?page="+y).then(function(r){return r.json()});fetch("/account/docs/item?page="+iz).then(function(r){return r.json()});function vo(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}var vmk=location.pathname.split("/");if(window.location.pathname==="/guide/item"){ifj()}function b(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}fetch("/settings/reference/search?page="+fey).then(function(r){return r.json()});if(window.location.pathname==="/vendor/search"){jx()}function edm(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function icb(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function sfp(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/item/settings?page="+sk).then(function(r){return r.json()});var euq=location.pathname.split("/");g.getAttribute("href");function sr(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}var qvi=location.pathname.split("/");function gps(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function zhl(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function us(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function tt(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function dqk(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}fetch("/user/guide/item?page="+z).then(function(r){return r.json()});function p(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function ly(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function sw(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}var am=location.pathname.split("/");function dkk(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}location.href="/vendor";fetch("/account/vendor?page="+ghc).then(function(r){return r.json()});location.href="/vendor/search/vendor";function zs(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}fetch("/search?page="+ii).then(function(r){return r.json()});function t(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}if(window.location.pathname==="/page"){z()}fetch("/page/item?page="+yzs).then(function(r){return r.json()});function gt(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}var ssv=location.pathname.split("/");fetch("/module?page="+if).then(function(r){return r.json()});fetch("/module/docs?page="+w).then(function(r){return r.json()});fetch("/item/api/assets?page="+n).then(function(r){return r.json()});location.href="/module";function i(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function jng(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}fetch("/item?page="+d).then(function(r){return r.json()});var r=location.pathname.split("/");fetch("/page/assets/image?page="+usy).then(function(r){return r.json()});function oux(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var cd=location.pathname.split("/");fetch("/chunk?page="+g).then(function(r){return r.json()});fetch("/search/assets?page="+yb).then(function(r){return r.json()});location.href="/account/account";function z(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function qs(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}location.href="/settings";if(window.location.pathname==="/image/account"){ibs()}function ct(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}fetch("/search/settings?page="+gur).then(function(r){return r.json()});location.href="/module";fetch("/assets/static?page="+wam).then(function(r){return r.json()});fetch("/guide/module/docs?page="+j).then(function(r){return r.json()});var sar=location.pathname.split("/");var kw=location.pathname.split("/");function qj(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}fetch("/user/docs/search?page="+bp).then(function(r){return r.json()});kfh.getAttribute("href");var b=location.pathname.split("/");function uji(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function lj(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}location.href="/image/module";var xc=location.pathname.split("/");function y(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}var qdl=location.pathname.split("/");fetch("/chunk?page="+v).then(function(r){return r.json()});fetch("/api/reference?page="+pj).then(function(r){return r.json()});function xi(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}fetch("/page?page="+ln).then(function(r){return r.json()});function ic(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}location.href="/user/settings";fetch("/search/guide?page="+js).then(function(r){return r.json()});function ght(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function kw(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function woj(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}if(window.location.pathname==="/docs"){hzn()}location.href="/static/page";function pj(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function ry(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function um(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function vch(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}fetch("/account/user/api?page="+qb).then(function(r){return r.json()});fetch("/settings/api?page="+mpg).then(function(r){return r.json()});function wv(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}var as=location.pathname.split("/");var k=location.pathname.split("/");fetch("/guide/image?page="+mgo).then(function(r){return r.json()});var dc=location.pathname.split("/");function dh(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}fetch("/reference?page="+wsw).then(function(r){return r.json()});fetch("/static/user/user?page="+cr).then(function(r){return r.json()});function kcy(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}fetch("/settings/vendor?page="+s).then(function(r){return r.json()});if(window.location.pathname==="/settings/api"){jk()}function dir(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function iq(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function hsh(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}zj.getAttribute("href");fetch("/vendor/account/docs?page="+lx).then(function(r){return r.json()});fetch("/image?page="+tav).then(function(r){return r.json()});function c(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function we(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function eeb(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function aa(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}var uia=location.pathname.split("/");var lvz=location.pathname.split("/");ccu.getAttribute("href");d.getAttribute("href");function y(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}location.href="/user/page/assets";function us(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}fetch("/chunk?page="+nsz).then(function(r){return r.json()});function t(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}fetch("/reference?page="+vkz).then(function(r){return r.json()});fetch("/vendor?page="+l).then(function(r){return r.json()});function s(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}s.getAttribute("href");if(window.location.pathname==="/image/user"){zrm()}location.href="/api/module/search";fetch("/static/api?page="+hi).then(function(r){return r.json()});function q(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}if(window.location.pathname==="/page/module"){no()}function svr(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var nmu=location.pathname.split("/");fetch("/guide?page="+sl).then(function(r){return r.json()});if(window.location.pathname==="/account/settings"){kz()}oil.getAttribute("href");i.getAttribute("href");fetch("/settings/assets?page="+he).then(function(r){return r.json()});function kk(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function nhj(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}fetch("/module/docs?page="+fkc).then(function(r){return r.json()});fetch("/guide/static?page="+dd).then(function(r){return r.json()});location.href="/api/static/settings";fetch("/docs/item/static?page="+eb).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function xg(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function lu(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}if(window.location.pathname==="/vendor"){ys()}fetch("/account/settings?page="+z).then(function(r){return r.json()});fetch("/guide?page="+z).then(function(r){return r.json()});function oo(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function pe(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}var k=location.pathname.split("/");function mp(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}fetch("/page/chunk?page="+s).then(function(r){return r.json()});var oa=location.pathname.split("/");var oge=location.pathname.split("/");fetch("/user?page="+luy).then(function(r){return r.json()});function ni(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function nxm(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}krx.getAttribute("href");function y(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}fetch("/assets/static?page="+mxu).then(function(r){return r.json()});var sds=location.pathname.split("/");var u=location.pathname.split("/");a.getAttribute("href");function guv(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function gjn(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}var jg=location.pathname.split("/");fetch("/static/settings?page="+uu).then(function(r){return r.json()});var f=location.pathname.split("/");function od(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}fetch("/account?page="+kb).then(function(r){return r.json()});location.href="/docs";fetch("/page/user/module?page="+ce).then(function(r){return r.json()});var bm=location.pathname.split("/");function m(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function on(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}fetch("/assets/account?page="+eoj).then(function(r){return r.json()});function p(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function a(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}fetch("/vendor/image/item?page="+dq).then(function(r){return r.json()});var u=location.pathname.split("/");if(window.location.pathname==="/static/reference/search"){fe()}function dp(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}var ecg=location.pathname.split("/");var g=location.pathname.split("/");var f=location.pathname.split("/");var xj=location.pathname.split("/");fetch("/vendor/account/page?page="+w).then(function(r){return r.json()});var d=location.pathname.split("/");fetch("/guide?page="+bn).then(function(r){return r.json()});if(window.location.pathname==="/page/page"){lz()}fetch("/module/static/api?page="+dh).then(function(r){return r.json()});rr.getAttribute("href");if(window.location.pathname==="/docs/vendor"){wvl()}function f(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function sy(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}if(window.location.pathname==="/static/chunk"){py()}fetch("/item/settings/page?page="+lqq).then(function(r){return r.json()});function evz(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function muk(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}if(window.location.pathname==="/api/settings"){yw()}om.getAttribute("href");function w(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}location.href="/account/page/settings";location.href="/vendor/image/account";location.href="/item";var lqe=location.pathname.split("/");var ztb=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}fetch("/item/page?page="+v).then(function(r){return r.json()});function hv(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}bys.getAttribute("href");var ri=location.pathname.split("/");fetch("/chunk/static?page="+c).then(function(r){return r.json()});vdy.getAttribute("href");function cuc(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function mhy(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/item?page="+vl).then(function(r){return r.json()});function buc(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function edx(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}fetch("/item?page="+fhh).then(function(r){return r.json()});if(window.location.pathname==="/module/assets/item"){tot()}function rsz(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}function wr(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}fetch("/image/docs/account?page="+fd).then(function(r){return r.json()});if(window.location.pathname==="/image"){i()}fetch("/docs?page="+ch).then(function(r){return r.json()});var wr=location.pathname.split("/");function b(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}if(window.location.pathname==="/search/guide"){bn()}function wv(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}fetch("/search/settings?page="+t).then(function(r){return r.json()});fetch("/page/search/api?page="+h).then(function(r){return r.json()});fetch("/page/static/chunk?page="+e).then(function(r){return r.json()});function zsh(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}fetch("/chunk/item/user?page="+zpm).then(function(r){return r.json()});location.href="/assets/static";function i(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function ue(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}fetch("/search/item?page="+rs).then(function(r){return r.json()});function qvk(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}if(window.location.pathname==="/account/item"){uii()}if(window.location.pathname==="/docs/reference"){lo()}function lf(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}fetch("/account/reference?page="+p).then(function(r){return r.json()});function l(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}fetch("/guide/docs?page="+e).then(function(r){return r.json()});function iu(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function rw(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}location.href="/page";var sc=location.pathname.split("/");if(window.location.pathname==="/reference"){nb()}fetch("/reference/static?page="+fpt).then(function(r){return r.json()});var ivi=location.pathname.split("/");var h=location.pathname.split("/");location.href="/assets/reference";bkq.getAttribute("href");var mf=location.pathname.split("/");if(window.location.pathname==="/docs/module/assets"){fxw()}var s=location.pathname.split("/");function b(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}var xpx=location.pathname.split("/");function v(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}fetch("/module?page="+t).then(function(r){return r.json()});if(window.location.pathname==="/guide/page"){mjv()}function w(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function fi(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function aj(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}fetch("/search?page="+t).then(function(r){return r.json()});if(window.location.pathname==="/search"){r()}if(window.location.pathname==="/assets"){kr()}function tbu(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}var oum=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function def(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function yvo(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}var lg=location.pathname.split("/");function mcy(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}var ux=location.pathname.split("/");fetch("/user/search?page="+sb).then(function(r){return r.json()});var gs=location.pathname.split("/");function b(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function env(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}var h=location.pathname.split("/");var hr=location.pathname.split("/");function j(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}fetch("/chunk?page="+gig).then(function(r){return r.json()});function qrj(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}var v=location.pathname.split("/");var zc=location.pathname.split("/");if(window.location.pathname==="/item/user"){ixw()}var q=location.pathname.split("/");location.href="/image";function w(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}if(window.location.pathname==="/module/module"){pd()}var rrb=location.pathname.split("/");function co(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}function pu(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/page?page="+nre).then(function(r){return r.json()});function oad(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}var tt=location.pathname.split("/");fetch("/assets/item?page="+g).then(function(r){return r.json()});function mw(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}location.href="/account/static/guide";var rs=location.pathname.split("/");var th=location.pathname.split("/");function rf(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}fetch("/assets?page="+w).then(function(r){return r.json()});if(window.location.pathname==="/item/module"){rvu()}fetch("/chunk?page="+o).then(function(r){return r.json()});if(window.location.pathname==="/page"){roc()}if(window.location.pathname==="/page/image"){ye()}var kd=location.pathname.split("/");function hpi(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}xl.getAttribute("href");var j=location.pathname.split("/");fetch("/guide/assets/user?page="+guq).then(function(r){return r.json()});function q(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function ulp(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}var qlc=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}var ul=location.pathname.split("/");location.href="/api";function uj(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}fetch("/module?page="+yd).then(function(r){return r.json()});if(window.location.pathname==="/search"){def()}function x(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function ter(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}var ka=location.pathname.split("/");var zo=location.pathname.split("/");if(window.location.pathname==="/reference/search/page"){oc()}location.href="/static";var y=location.pathname.split("/");location.href="/search";fetch("/account/chunk?page="+tw).then(function(r){return r.json()});fetch("/user?page="+kci).then(function(r){return r.json()});function qj(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}var e=location.pathname.split("/");if(window.location.pathname==="/settings/item"){etx()}if(window.location.pathname==="/vendor"){fe()}function vq(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function rqc(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}var g=location.pathname.split("/");location.href="/api/settings/guide";var e=location.pathname.split("/");location.href="/search/account/vendor";var fuu=location.pathname.split("/");function kx(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function ri(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}fetch("/module/settings?page="+c).then(function(r){return r.json()});var p=location.pathname.split("/");qmk.getAttribute("href");fetch("/api?page="+abt).then(function(r){return r.json()});function or(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}fetch("/module/search/module?page="+tid).then(function(r){return r.json()});function jtn(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}var er=location.pathname.split("/");if(window.location.pathname==="/page/image/vendor"){m()}fetch("/search/settings?page="+me).then(function(r){return r.json()});var as=location.pathname.split("/");if(window.location.pathname==="/account/static/account"){yj()}function lgt(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}var cf=location.pathname.split("/");if(window.location.pathname==="/user/docs"){g()}location.href="/reference/module";location.href="/vendor/chunk";function df(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function ol(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}function np(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function mx(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}var wg=location.pathname.split("/");fetch("/reference/settings/static?page="+h).then(function(r){return r.json()});fetch("/page/docs?page="+y).then(function(r){return r.json()});function dgb(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}yiz.getAttribute("href");var g=location.pathname.split("/");var ara=location.pathname.split("/");function vr(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function qg(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}if(window.location.pathname==="/chunk"){a()}fetch("/account/chunk?page="+mrm).then(function(r){return r.json()});var x=location.pathname.split("/");location.href="/assets";var yn=location.pathname.split("/");var m=location.pathname.split("/");fetch("/assets/assets/reference?page="+o).then(function(r){return r.json()});var gik=location.pathname.split("/");if(window.location.pathname==="/settings/vendor"){vhf()}function rqm(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}if(window.location.pathname==="/page/search/image"){qzx()}qwd.getAttribute("href");function h(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}fetch("/static/search/api?page="+rg).then(function(r){return r.json()});function yvr(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function jsl(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}if(window.location.pathname==="/reference/settings/account"){i()}function xlu(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/reference?page="+u).then(function(r){return r.json()});function fho(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}fetch("/module/image?page="+xmi).then(function(r){return r.json()});function vr(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}location.href="/account/api";function x(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}var q=location.pathname.split("/");function k(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}var qf=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}var fbi=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function xaz(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}fetch("/page?page="+wwh).then(function(r){return r.json()});sta.getAttribute("href");function uhh(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function eay(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function dts(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}var wbh=location.pathname.split("/");function wqz(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}if(window.location.pathname==="/settings/assets/static"){qyg()}var j=location.pathname.split("/");jt.getAttribute("href");function tua(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}fetch("/image/page/api?page="+gs).then(function(r){return r.json()});function np(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}var i=location.pathname.split("/");if(window.location.pathname==="/account/user"){iod()}function qko(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}ygs.getAttribute("href");function bql(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}eaf.getAttribute("href");var zuo=location.pathname.split("/");location.href="/vendor";if(window.location.pathname==="/vendor"){rj()}function x(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function bd(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function ij(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}var nph=location.pathname.split("/");fetch("/item/image?page="+fk).then(function(r){return r.json()});zqn.getAttribute("href");function s(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}fetch("/module?page="+xyv).then(function(r){return r.json()});var m=location.pathname.split("/");function s(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}var lfa=location.pathname.split("/");if(window.location.pathname==="/docs/vendor"){p()}function ca(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}fetch("/chunk/chunk/settings?page="+su).then(function(r){return r.json()});if(window.location.pathname==="/vendor"){j()}var qnq=location.pathname.split("/");fetch("/assets/settings/user?page="+crf).then(function(r){return r.json()});fetch("/docs/search?page="+vaf).then(function(r){return r.json()});iv.getAttribute("href");fetch("/account/api?page="+y).then(function(r){return r.json()});function dhz(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}var zo=location.pathname.split("/");fetch("/chunk/module/static?page="+y).then(function(r){return r.json()});lt.getAttribute("href");function ay(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}fetch("/reference/page/image?page="+b).then(function(r){return r.json()});location.href="/user/reference/assets";function j(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}fetch("/module/api/guide?page="+gnf).then(function(r){return r.json()});function oo(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}if(window.location.pathname==="/vendor/settings"){mwb()}var u=location.pathname.split("/");fetch("/account/item/item?page="+gk).then(function(r){return r.json()});function kor(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}var uiv=location.pathname.split("/");vqe.getAttribute("href");location.href="/module/guide";fetch("/docs/image/chunk?page="+da).then(function(r){return r.json()});fetch("/vendor/image?page="+l).then(function(r){return r.json()});var p=location.pathname.split("/");var oa=location.pathname.split("/");location.href="/chunk/reference";fetch("/static?page="+qh).then(function(r){return r.json()});function b(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}fetch("/reference/image?page="+u).then(function(r){return r.json()});function zg(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function lf(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function dd(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}fetch("/user/guide?page="+rmz).then(function(r){return r.json()});function uod(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}fetch("/api?page="+aq).then(function(r){return r.json()});var n=location.pathname.split("/");function t(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function wyk(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/guide/docs/settings?page="+c).then(function(r){return r.json()});var rmf=location.pathname.split("/");function imq(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}if(window.location.pathname==="/search"){f()}location.href="/guide";var b=location.pathname.split("/");function rup(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function zq(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function hg(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}fetch("/module/api/search?page="+c).then(function(r){return r.json()});var k=location.pathname.split("/");var az=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}var ean=location.pathname.split("/");function mq(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}fetch("/search/account/vendor?page="+h).then(function(r){return r.json()});function sv(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}fetch("/item?page="+pd).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function nys(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}var m=location.pathname.split("/");function o(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function jk(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function iq(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}cnu.getAttribute("href");function fd(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}var rf=location.pathname.split("/");function exs(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}fetch("/module/account?page="+x).then(function(r){return r.json()});var vu=location.pathname.split("/");fetch("/chunk/static?page="+c).then(function(r){return r.json()});function d(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}var r=location.pathname.split("/");function kof(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}function dx(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function vb(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}function dfv(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function cn(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}var tbt=location.pathname.split("/");function dt(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function lcy(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}fetch("/reference/reference?page="+bg).then(function(r){return r.json()});function vaj(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}fetch("/reference?page="+pu).then(function(r){return r.json()});location.href="/item/item";var iqy=location.pathname.split("/");function f(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function jw(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var ju=location.pathname.split("/");location.href="/search";v.getAttribute("href");var np=location.pathname.split("/");fetch("/assets?page="+b).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}function du(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}location.href="/item/guide";fetch("/image/chunk/static?page="+lc).then(function(r){return r.json()});fetch("/account/account/guide?page="+fn).then(function(r){return r.json()});function bvm(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function xo(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}fetch("/item/docs?page="+no).then(function(r){return r.json()});var zap=location.pathname.split("/");fetch("/chunk/vendor/chunk?page="+xv).then(function(r){return r.json()});fetch("/user?page="+ggy).then(function(r){return r.json()});var rfv=location.pathname.split("/");fetch("/guide/guide?page="+ywk).then(function(r){return r.json()});fetch("/image/assets?page="+i).then(function(r){return r.json()});function tsf(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function fq(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}var p=location.pathname.split("/");var k=location.pathname.split("/");var edc=location.pathname.split("/");function jxa(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var li=location.pathname.split("/");function uy(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}var z=location.pathname.split("/");var kf=location.pathname.split("/");function b(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}fetch("/guide?page="+jsk).then(function(r){return r.json()});var tv=location.pathname.split("/");function w(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function bcg(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}fetch("/docs?page="+f).then(function(r){return r.json()});if(window.location.pathname==="/settings/item/reference"){scb()}fetch("/reference?page="+rah).then(function(r){return r.json()});function mru(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}fetch("/account/search/image?page="+xrz).then(function(r){return r.json()});function b(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}fetch("/api/chunk/search?page="+ge).then(function(r){return r.json()});function jvo(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}location.href="/settings/user/reference";if(window.location.pathname==="/guide"){t()}fetch("/search/image?page="+ws).then(function(r){return r.json()});var gfi=location.pathname.split("/");function jr(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}fetch("/vendor/static?page="+ua).then(function(r){return r.json()});if(window.location.pathname==="/module"){hfs()}function ql(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function hfl(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}var xm=location.pathname.split("/");var v=location.pathname.split("/");function v(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}if(window.location.pathname==="/module/guide/vendor"){b()}function fj(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/page/module/page?page="+qk).then(function(r){return r.json()});fetch("/search/page/item?page="+n).then(function(r){return r.json()});function kem(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}var zni=location.pathname.split("/");var o=location.pathname.split("/");var i=location.pathname.split("/");fetch("/api/user/module?page="+uq).then(function(r){return r.json()});if(window.location.pathname==="/page/api/reference"){kg()}function nas(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function mz(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}var y=location.pathname.split("/");fetch("/reference?page="+j).then(function(r){return r.json()});var ong=location.pathname.split("/");var ja=location.pathname.split("/");if(window.location.pathname==="/module/module/assets"){wu()}fetch("/item/reference?page="+ss).then(function(r){return r.json()});function y(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}var h=location.pathname.split("/");fetch("/item/assets?page="+z).then(function(r){return r.json()});function nqa(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}if(window.location.pathname==="/api/settings"){b()}fetch("/api?page="+uv).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function aqg(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}location.href="/item/item";var w=location.pathname.split("/");function nho(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}var bgf=location.pathname.split("/");if(window.location.pathname==="/user"){qb()}fetch("/vendor?page="+qdp).then(function(r){return r.json()});function pcm(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function qzk(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function bs(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function sxc(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function fd(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}fetch("/guide/static?page="+awa).then(function(r){return r.json()});fetch("/item/user?page="+jh).then(function(r){return r.json()});fetch("/user?page="+llg).then(function(r){return r.json()});var vzs=location.pathname.split("/");location.href="/search/module";var j=location.pathname.split("/");location.href="/vendor/module/item";function oj(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}function lk(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function wd(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function eq(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}var x=location.pathname.split("/");function lu(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function qy(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}fetch("/settings?page="+q).then(function(r){return r.json()});var gi=location.pathname.split("/");function cco(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function eof(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function xl(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}var q=location.pathname.split("/");function u(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}if(window.location.pathname==="/assets/image"){rtf()}fetch("/chunk/page?page="+k).then(function(r){return r.json()});function lue(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}fetch("/reference?page="+q).then(function(r){return r.json()});fetch("/assets/item/vendor?page="+jo).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}fetch("/reference/guide/reference?page="+c).then(function(r){return r.json()});k.getAttribute("href");function hn(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}fetch("/static/vendor?page="+cf).then(function(r){return r.json()});location.href="/settings";fetch("/settings/account?page="+h).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function fm(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}fetch("/vendor?page="+ka).then(function(r){return r.json()});var ngx=location.pathname.split("/");fetch("/module/item?page="+dj).then(function(r){return r.json()});function hv(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function dns(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}fetch("/user?page="+dtj).then(function(r){return r.json()});var cg=location.pathname.split("/");var wxk=location.pathname.split("/");if(window.location.pathname==="/account"){jel()}if(window.location.pathname==="/user/settings/settings"){y()}function d(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}var y=location.pathname.split("/");function ky(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function ta(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}if(window.location.pathname==="/chunk"){uy()}fetch("/reference/user?page="+f).then(function(r){return r.json()});fetch("/guide?page="+ik).then(function(r){return r.json()});var zre=location.pathname.split("/");if(window.location.pathname==="/search/vendor/settings"){r()}var xn=location.pathname.split("/");if(window.location.pathname==="/search/user/docs"){i()}if(window.location.pathname==="/static"){ld()}function npn(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}if(window.location.pathname==="/user"){ty()}function j(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function bc(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}if(window.location.pathname==="/guide/reference"){xai()}if(window.location.pathname==="/page"){itf()}fetch("/image/search?page="+hm).then(function(r){return r.json()});i.getAttribute("href");fetch("/user?page="+si).then(function(r){return r.json()});function h(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}fetch("/settings/guide/static?page="+upi).then(function(r){return r.json()});function xb(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}fetch("/item/image?page="+bc).then(function(r){return r.json()});fetch("/page/image?page="+qir).then(function(r){return r.json()});function ek(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}var fe=location.pathname.split("/");function th(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function dt(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}fx.getAttribute("href");fetch("/search?page="+eg).then(function(r){return r.json()});var fn=location.pathname.split("/");fetch("/page/user?page="+na).then(function(r){return r.json()});if(window.location.pathname==="/image/account/reference"){z()}if(window.location.pathname==="/api"){zi()}t.getAttribute("href");function vur(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}function sf(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}uuj.getAttribute("href");function ds(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function ykd(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}var co=location.pathname.split("/");function g(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}location.href="/chunk";function g(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}var lz=location.pathname.split("/");fetch("/api?page="+e).then(function(r){return r.json()});function jtx(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function pgb(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}fetch("/reference/image/search?page="+qci).then(function(r){return r.json()});fetch("/item/item/reference?page="+fs).then(function(r){return r.json()});function asw(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function hhw(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}fetch("/user/image?page="+dp).then(function(r){return r.json()});fetch("/account?page="+e).then(function(r){return r.json()});function xh(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}var ax=location.pathname.split("/");if(window.location.pathname==="/image/image/reference"){aw()}function t(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}z.getAttribute("href");fetch("/docs/account/vendor?page="+ud).then(function(r){return r.json()});var ens=location.pathname.split("/");location.href="/account/chunk/item";var n=location.pathname.split("/");function mow(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function ix(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function kjt(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}fetch("/vendor/item?page="+g).then(function(r){return r.json()});fetch("/page/page?page="+qrf).then(function(r){return r.json()});function mev(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function rvl(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function gp(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function zg(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}if(window.location.pathname==="/static/settings"){d()}function c(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}var e=location.pathname.split("/");function uji(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}j.getAttribute("href");fetch("/page/item?page="+za).then(function(r){return r.json()});fetch("/account/page?page="+wj).then(function(r){return r.json()});fetch("/assets/chunk/settings?page="+i).then(function(r){return r.json()});var kl=location.pathname.split("/");var mq=location.pathname.split("/");if(window.location.pathname==="/account/chunk"){n()}function l(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}var cj=location.pathname.split("/");function w(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}mb.getAttribute("href");fetch("/image/static/static?page="+k).then(function(r){return r.json()});var v=location.pathname.split("/");fetch("/item?page="+sjq).then(function(r){return r.json()});fetch("/user/static/user?page="+rf).then(function(r){return r.json()});function dtc(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function ab(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var bom=location.pathname.split("/");fetch("/module?page="+e).then(function(r){return r.json()});function p(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}var ij=location.pathname.split("/");fetch("/docs?page="+i).then(function(r){return r.json()});fetch("/vendor?page="+j).then(function(r){return r.json()});function fls(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}gku.getAttribute("href");yxt.getAttribute("href");var t=location.pathname.split("/");var sh=location.pathname.split("/");fetch("/guide?page="+x).then(function(r){return r.json()});fetch("/image/reference?page="+gs).then(function(r){return r.json()});fetch("/page/vendor?page="+pmj).then(function(r){return r.json()});var dqx=location.pathname.split("/");w.getAttribute("href");function gk(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}fetch("/api/assets/user?page="+pv).then(function(r){return r.json()});location.href="/item/api/image";var jcl=location.pathname.split("/");function lqt(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}wb.getAttribute("href");function hzm(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}var lg=location.pathname.split("/");fetch("/static/user?page="+gvq).then(function(r){return r.json()});function b(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function pkt(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}var u=location.pathname.split("/");fetch("/account/chunk/reference?page="+okg).then(function(r){return r.json()});function jms(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}var j=location.pathname.split("/");function tgy(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}var i=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}jxo.getAttribute("href");var ym=location.pathname.split("/");location.href="/guide";function qs(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}fetch("/module/image?page="+dnb).then(function(r){return r.json()});function rr(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function avk(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}fetch("/docs?page="+qfx).then(function(r){return r.json()});var d=location.pathname.split("/");b.getAttribute("href");fetch("/vendor/user/user?page="+uv).then(function(r){return r.json()});function ht(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}var fxs=location.pathname.split("/");fetch("/module?page="+o).then(function(r){return r.json()});function jba(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function vd(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}if(window.location.pathname==="/module/chunk/static"){vz()}function ds(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}fetch("/page?page="+s).then(function(r){return r.json()});function td(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}if(window.location.pathname==="/chunk"){rf()}var gmu=location.pathname.split("/");function bp(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}var hh=location.pathname.split("/");var iam=location.pathname.split("/");o.getAttribute("href");fetch("/item/assets?page="+owc).then(function(r){return r.json()});function urm(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}var ny=location.pathname.split("/");function bsa(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}fetch("/docs/page?page="+z).then(function(r){return r.json()});fetch("/guide/chunk?page="+m).then(function(r){return r.json()});function gn(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}bk.getAttribute("href");location.href="/page";location.href="/docs/settings";var xqf=location.pathname.split("/");function ghb(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}location.href="/assets/settings/item";function con(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function eeu(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}location.href="/reference/guide";fetch("/module/search/static?page="+td).then(function(r){return r.json()});if(window.location.pathname==="/chunk/search/item"){hav()}if(window.location.pathname==="/static"){cdm()}var t=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}if(window.location.pathname==="/chunk"){ti()}fetch("/docs/search/api?page="+u).then(function(r){return r.json()});var hk=location.pathname.split("/");wif.getAttribute("href");var q=location.pathname.split("/");fetch("/chunk/image?page="+c).then(function(r){return r.json()});function iu(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}if(window.location.pathname==="/static/static"){xb()}wc.getAttribute("href");var nh=location.pathname.split("/");function oy(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}acv.getAttribute("href");if(window.location.pathname==="/reference/guide"){hvi()}var zwd=location.pathname.split("/");var mad=location.pathname.split("/");function od(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}a.getAttribute("href");function i(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function jn(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}fetch("/docs/item?page="+mb).then(function(r){return r.json()});function arx(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}var va=location.pathname.split("/");y.getAttribute("href");function igc(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}fetch("/chunk/user?page="+ghj).then(function(r){return r.json()});fetch("/module?page="+b).then(function(r){return r.json()});location.href="/vendor/reference/assets";fetch("/settings/reference?page="+r).then(function(r){return r.json()});function dh(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}function sz(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}if(window.location.pathname==="/static"){qv()}location.href="/api/image";var auj=location.pathname.split("/");function kcz(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}var poc=location.pathname.split("/");var flj=location.pathname.split("/");function v(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}if(window.location.pathname==="/api/search"){qfc()}if(window.location.pathname==="/item"){tq()}function y(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function sd(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}var n=location.pathname.split("/");var x=location.pathname.split("/");fetch("/item?page="+v).then(function(r){return r.json()});function ms(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}fetch("/assets?page="+vf).then(function(r){return r.json()});fetch("/chunk?page="+gni).then(function(r){return r.json()});fetch("/account/api/user?page="+id).then(function(r){return r.json()});fetch("/static/search/item?page="+kl).then(function(r){return r.json()});var vb=location.pathname.split("/");var nd=location.pathname.split("/");function vyp(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}fetch("/settings/assets/account?page="+sfq).then(function(r){return r.json()});function d(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}var l=location.pathname.split("/");var n=location.pathname.split("/");location.href="/api/user";function rf(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}var erl=location.pathname.split("/");var qtn=location.pathname.split("/");if(window.location.pathname==="/chunk/vendor/item"){bb()}function n(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}if(window.location.pathname==="/static/docs"){uk()}function z(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function lpg(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}function sn(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}var gbe=location.pathname.split("/");function bs(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function xog(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}if(window.location.pathname==="/api"){bzr()}if(window.location.pathname==="/item"){hc()}var u=location.pathname.split("/");fetch("/chunk/guide?page="+pjc).then(function(r){return r.json()});function xk(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}function kq(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function jfb(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}var a=location.pathname.split("/");function bmc(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}del.getAttribute("href");function mac(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function ltg(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}var hju=location.pathname.split("/");function cf(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function oq(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}if(window.location.pathname==="/vendor"){jp()}var kj=location.pathname.split("/");location.href="/chunk/settings/item";fetch("/static?page="+yrz).then(function(r){return r.json()});function lrp(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}fetch("/guide/static/settings?page="+x).then(function(r){return r.json()});location.href="/module/page";qm.getAttribute("href");var spp=location.pathname.split("/");function s(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}fetch("/vendor/search/guide?page="+mg).then(function(r){return r.json()});fetch("/vendor/search/settings?page="+y).then(function(r){return r.json()});if(window.location.pathname==="/search/docs/guide"){bc()}fetch("/guide/static?page="+nv).then(function(r){return r.json()});fetch("/api/module/settings?page="+mn).then(function(r){return r.json()});function dcy(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function xnn(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}fetch("/docs/guide?page="+iu).then(function(r){return r.json()});fetch("/page/user/item?page="+v).then(function(r){return r.json()});function rnq(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}fetch("/docs?page="+kqo).then(function(r){return r.json()});fetch("/settings/settings?page="+o).then(function(r){return r.json()});var d=location.pathname.split("/");fetch("/settings/assets/module?page="+oq).then(function(r){return r.json()});function lt(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}var qz=location.pathname.split("/");function w(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function tr(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}location.href="/static/guide";function yes(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function gz(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}if(window.location.pathname==="/search/item"){njj()}function xiy(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}fetch("/vendor/reference?page="+ui).then(function(r){return r.json()});function b(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}fetch("/api/chunk?page="+z).then(function(r){return r.json()});function wba(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}var qmy=location.pathname.split("/");if(window.location.pathname==="/vendor/page/reference"){g()}fetch("/vendor/account/image?page="+mpx).then(function(r){return r.json()});location.href="/chunk/account/chunk";function wae(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}var n=location.pathname.split("/");fetch("/reference/settings?page="+h).then(function(r){return r.json()});var vwk=location.pathname.split("/");function zi(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function hrs(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function ea(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function aa(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function tdi(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}if(window.location.pathname==="/page/module/image"){h()}var eqj=location.pathname.split("/");function tv(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}var d=location.pathname.split("/");var xf=location.pathname.split("/");var aw=location.pathname.split("/");function p(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}function mq(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}fetch("/chunk/guide?page="+pz).then(function(r){return r.json()});function mm(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function tuu(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}location.href="/api/vendor/module";function wbn(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}jfb.getAttribute("href");function c(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function jm(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}location.href="/search/settings";var bmt=location.pathname.split("/");fetch("/user/module/static?page="+e).then(function(r){return r.json()});function ayl(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}var st=location.pathname.split("/");function zp(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}var d=location.pathname.split("/");if(window.location.pathname==="/docs"){e()}function bf(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}if(window.location.pathname==="/vendor/vendor/reference"){fc()}fetch("/search/chunk?page="+p).then(function(r){return r.json()});function mdu(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function wda(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}var h=location.pathname.split("/");var nlu=location.pathname.split("/");function ol(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}var us=location.pathname.split("/");function no(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}var dhn=location.pathname.split("/");fetch("/reference/user?page="+pl).then(function(r){return r.json()});if(window.location.pathname==="/assets"){rvd()}fetch("/static/page?page="+wlm).then(function(r){return r.json()});function kkj(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function uki(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}fetch("/page?page="+zm).then(function(r){return r.json()});fetch("/docs/static/module?page="+hre).then(function(r){return r.json()});function g(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}function ikc(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}location.href="/account/chunk/reference";location.href="/chunk/image/page";x.getAttribute("href");var u=location.pathname.split("/");fetch("/item/static?page="+s).then(function(r){return r.json()});function sip(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}if(window.location.pathname==="/reference"){ukn()}if(window.location.pathname==="/api/item"){yd()}var xu=location.pathname.split("/");var gr=location.pathname.split("/");function ra(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}fetch("/item/item/chunk?page="+kjj).then(function(r){return r.json()});function thy(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function clj(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}var y=location.pathname.split("/");var pxx=location.pathname.split("/");function mr(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function mn(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function nqn(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}if(window.location.pathname==="/module/item"){z()}fetch("/api?page="+bkr).then(function(r){return r.json()});function ni(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function qpc(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}if(window.location.pathname==="/page"){pe()}var b=location.pathname.split("/");location.href="/api/guide/module";function jso(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}function dr(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function eqm(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}location.href="/user";var ca=location.pathname.split("/");function qn(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function sr(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}fetch("/api/reference/docs?page="+wti).then(function(r){return r.json()});function i(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}function cea(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}if(window.location.pathname==="/static/guide"){h()}function m(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function nw(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function quq(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function tf(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/guide/page/module?page="+ug).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function kl(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function bws(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}var jx=location.pathname.split("/");function sph(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}location.href="/search/account";var oo=location.pathname.split("/");function us(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}if(window.location.pathname==="/docs/account/user"){csh()}function r(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}if(window.location.pathname==="/user/page/page"){b()}function wb(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}fetch("/settings/api/search?page="+wcq).then(function(r){return r.json()});location.href="/assets/account";var ytg=location.pathname.split("/");function c(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function why(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function le(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}var b=location.pathname.split("/");var rtm=location.pathname.split("/");var yv=location.pathname.split("/");if(window.location.pathname==="/chunk"){owo()}if(window.location.pathname==="/chunk"){h()}fetch("/user?page="+kr).then(function(r){return r.json()});function y(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}fetch("/reference/guide?page="+b).then(function(r){return r.json()});function ujk(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}var zja=location.pathname.split("/");fetch("/guide/vendor?page="+zy).then(function(r){return r.json()});zzf.getAttribute("href");function lvf(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}if(window.location.pathname==="/vendor/docs/image"){axk()}function tpn(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}var r=location.pathname.split("/");location.href="/vendor/account/page";function ye(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}fetch("/user?page="+g).then(function(r){return r.json()});function h(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function lfs(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}fetch("/settings/assets?page="+qa).then(function(r){return r.json()});fetch("/item?page="+nzp).then(function(r){return r.json()});var a=location.pathname.split("/");function xw(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}if(window.location.pathname==="/search"){b()}fetch("/page/chunk/item?page="+bhg).then(function(r){return r.json()});location.href="/chunk";fetch("/search?page="+wd).then(function(r){return r.json()});if(window.location.pathname==="/assets/item/search"){lc()}var f=location.pathname.split("/");function jaa(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}if(window.location.pathname==="/item/image"){da()}fetch("/vendor/reference/vendor?page="+y).then(function(r){return r.json()});var isq=location.pathname.split("/");var gy=location.pathname.split("/");var yjj=location.pathname.split("/");var rc=location.pathname.split("/");if(window.location.pathname==="/assets/docs/module"){q()}location.href="/settings/item/module";function xe(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}if(window.location.pathname==="/reference/guide"){j()}function d(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function ca(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var fjt=location.pathname.split("/");function xl(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}var nxq=location.pathname.split("/");function p(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}if(window.location.pathname==="/settings/settings/account"){y()}rvu.getAttribute("href");fetch("/settings/api/reference?page="+jk).then(function(r){return r.json()});var gp=location.pathname.split("/");var rbv=location.pathname.split("/");fetch("/chunk/user/guide?page="+pg).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}location.href="/search/static";var kg=location.pathname.split("/");if(window.location.pathname==="/chunk"){pvb()}var fjy=location.pathname.split("/");function ew(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}if(window.location.pathname==="/settings/vendor/account"){lih()}if(window.location.pathname==="/vendor/chunk/docs"){tby()}if(window.location.pathname==="/reference/api"){e()}var rsi=location.pathname.split("/");location.href="/settings";if(window.location.pathname==="/api/user/search"){njb()}fetch("/account/api?page="+h).then(function(r){return r.json()});function ljp(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function pqj(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}var nxj=location.pathname.split("/");function swu(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}location.href="/reference";function yt(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function lqt(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function la(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}if(window.location.pathname==="/account"){ae()}function ol(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function et(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}fetch("/settings/api?page="+b).then(function(r){return r.json()});location.href="/search";function yip(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}var ihh=location.pathname.split("/");function m(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function zku(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function twq(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}location.href="/guide";if(window.location.pathname==="/module"){hq()}fetch("/image/chunk/reference?page="+tit).then(function(r){return r.json()});xko.getAttribute("href");function ut(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}var pl=location.pathname.split("/");function xxa(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function xf(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}fetch("/image/search/module?page="+r).then(function(r){return r.json()});xpp.getAttribute("href");if(window.location.pathname==="/vendor/guide"){ef()}fetch("/module?page="+vk).then(function(r){return r.json()});function on(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function be(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}if(window.location.pathname==="/vendor/vendor"){xx()}fetch("/api/vendor/docs?page="+wf).then(function(r){return r.json()});fetch("/docs/image?page="+l).then(function(r){return r.json()});var stp=location.pathname.split("/");var j=location.pathname.split("/");fetch("/vendor/item?page="+b).then(function(r){return r.json()});fetch("/static/settings/settings?page="+vz).then(function(r){return r.json()});fetch("/module/settings/chunk?page="+q).then(function(r){return r.json()});if(window.location.pathname==="/module/module/account"){v()}fetch("/module?page="+rg).then(function(r){return r.json()});var v=location.pathname.split("/");fetch("/chunk?page="+tco).then(function(r){return r.json()});var akn=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}e.getAttribute("href");var wqk=location.pathname.split("/");fetch("/module/user?page="+t).then(function(r){return r.json()});fetch("/guide?page="+en).then(function(r){return r.json()});if(window.location.pathname==="/search/assets"){yk()}fetch("/item/static?page="+a).then(function(r){return r.json()});function n(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}c.getAttribute("href");fetch("/static/item/guide?page="+f).then(function(r){return r.json()});function lt(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}fetch("/chunk/item/page?page="+tda).then(function(r){return r.json()});function h(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}var s=location.pathname.split("/");if(window.location.pathname==="/item/search/image"){av()}function nf(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function yth(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}if(window.location.pathname==="/account/item/docs"){o()}function t(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function mc(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}var wdx=location.pathname.split("/");function iqz(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}fetch("/guide?page="+zt).then(function(r){return r.json()});if(window.location.pathname==="/item"){sk()}var rys=location.pathname.split("/");function zdj(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}uw.getAttribute("href");function z(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function vp(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/api?page="+dp).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}location.href="/reference/assets";location.href="/api";var nj=location.pathname.split("/");function i(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}var h=location.pathname.split("/");fetch("/settings/user/static?page="+rhx).then(function(r){return r.json()});fetch("/page/account/static?page="+y).then(function(r){return r.json()});function mb(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}var sw=location.pathname.split("/");fetch("/settings?page="+t).then(function(r){return r.json()});var c=location.pathname.split("/");function fq(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}var oe=location.pathname.split("/");fetch("/page/vendor/account?page="+y).then(function(r){return r.json()});function we(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}zpu.getAttribute("href");var jte=location.pathname.split("/");function i(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}fetch("/vendor/account/image?page="+jdn).then(function(r){return r.json()});function uwj(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}location.href="/guide";fetch("/docs?page="+c).then(function(r){return r.json()});function dl(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function rzi(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}var w=location.pathname.split("/");location.href="/chunk/guide";function ur(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function wdu(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function rtf(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}i.getAttribute("href");function c(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}var zn=location.pathname.split("/");if(window.location.pathname==="/search/api"){e()}function rfm(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}fetch("/vendor?page="+d).then(function(r){return r.json()});var f=location.pathname.split("/");function dt(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function dj(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}fetch("/assets/chunk?page="+qos).then(function(r){return r.json()});function xak(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}fetch("/guide/chunk?page="+m).then(function(r){return r.json()});fetch("/api?page="+xwl).then(function(r){return r.json()});function g(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}function kv(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}var csl=location.pathname.split("/");fetch("/item/reference/chunk?page="+xlu).then(function(r){return r.json()});var nkq=location.pathname.split("/");function lp(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}v.getAttribute("href");fetch("/page?page="+upt).then(function(r){return r.json()});function kgy(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}fetch("/module?page="+fz).then(function(r){return r.json()});if(window.location.pathname==="/api"){xc()}function ml(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}if(window.location.pathname==="/chunk/guide"){sgg()}tyj.getAttribute("href");var mas=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function xyp(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}var xe=location.pathname.split("/");fetch("/guide/guide/settings?page="+u).then(function(r){return r.json()});if(window.location.pathname==="/static"){kb()}fetch("/image/settings/item?page="+jgk).then(function(r){return r.json()});location.href="/static/search";function fw(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}var d=location.pathname.split("/");var yz=location.pathname.split("/");function ar(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}if(window.location.pathname==="/static/image"){u()}function ts(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}fetch("/search?page="+rk).then(function(r){return r.json()});g.getAttribute("href");var hjy=location.pathname.split("/");if(window.location.pathname==="/assets/settings/docs"){ki()}fetch("/reference/chunk/static?page="+rs).then(function(r){return r.json()});fetch("/chunk/assets/assets?page="+agp).then(function(r){return r.json()});var wv=location.pathname.split("/");function bzz(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}if(window.location.pathname==="/reference/account/api"){qkq()}location.href="/docs/assets/account";var r=location.pathname.split("/");if(window.location.pathname==="/vendor/search/module"){tfg()}function cca(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function hje(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}location.href="/chunk/reference/reference";c.getAttribute("href");fetch("/search/item/settings?page="+erg).then(function(r){return r.json()});oan.getAttribute("href");function chn(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}fetch("/settings/api/api?page="+d).then(function(r){return r.json()});location.href="/vendor/account";if(window.location.pathname==="/module/docs"){j()}function ih(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}fetch("/item/docs/vendor?page="+dzy).then(function(r){return r.json()});function h(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var g=location.pathname.split("/");function ie(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function frw(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}fetch("/user/image/module?page="+k).then(function(r){return r.json()});function kj(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}location.href="/account/assets/page";var a=location.pathname.split("/");fetch("/image/docs?page="+ts).then(function(r){return r.json()});function ff(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var r=location.pathname.split("/");var cry=location.pathname.split("/");function wt(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}var cmz=location.pathname.split("/");function ii(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}fetch("/page?page="+ytx).then(function(r){return r.json()});var yag=location.pathname.split("/");function u(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}var cc=location.pathname.split("/");function exh(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function vjl(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function md(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}function jkc(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}fetch("/page/page?page="+e).then(function(r){return r.json()});g.getAttribute("href");fetch("/static/module/docs?page="+as).then(function(r){return r.json()});fetch("/guide?page="+ph).then(function(r){return r.json()});var uo=location.pathname.split("/");function akg(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}fetch("/search/user?page="+li).then(function(r){return r.json()});function yeh(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}fetch("/search/item?page="+skx).then(function(r){return r.json()});fetch("/page/search?page="+vmo).then(function(r){return r.json()});if(window.location.pathname==="/vendor/reference"){om()}function b(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}var ot=location.pathname.split("/");function gii(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}var gu=location.pathname.split("/");if(window.location.pathname==="/user"){a()}if(window.location.pathname==="/module/module/module"){un()}if(window.location.pathname==="/image/page"){abk()}function m(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function rk(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}if(window.location.pathname==="/module/page/module"){b()}location.href="/user/item";fetch("/settings/assets/item?page="+sxl).then(function(r){return r.json()});if(window.location.pathname==="/page/image"){nk()}function cd(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}var iwz=location.pathname.split("/");iqw.getAttribute("href");function mbi(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}if(window.location.pathname==="/search/module/page"){qu()}var ry=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}var ucw=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function a(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}var l=location.pathname.split("/");if(window.location.pathname==="/vendor/item"){k()}function srb(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}var rt=location.pathname.split("/");function p(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}location.href="/api/reference";fetch("/image/search?page="+dp).then(function(r){return r.json()});if(window.location.pathname==="/search/reference"){s()}function mj(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function iz(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function ha(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}location.href="/guide/reference";function i(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}fetch("/account/assets/account?page="+m).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}fetch("/item?page="+wdw).then(function(r){return r.json()});fetch("/reference/static?page="+e).then(function(r){return r.json()});function b(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}var y=location.pathname.split("/");fetch("/chunk/search/api?page="+h).then(function(r){return r.json()});function bj(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}var m=location.pathname.split("/");if(window.location.pathname==="/chunk"){pr()}function oru(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}fetch("/settings/settings/chunk?page="+lar).then(function(r){return r.json()});var bru=location.pathname.split("/");if(window.location.pathname==="/assets/image/docs"){pqg()}function pi(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}fetch("/guide?page="+zrc).then(function(r){return r.json()});fetch("/static/settings/user?page="+czu).then(function(r){return r.json()});fetch("/api/item/assets?page="+tc).then(function(r){return r.json()});fetch("/user/page?page="+pit).then(function(r){return r.json()});if(window.location.pathname==="/assets"){ga()}fetch("/chunk/settings/settings?page="+io).then(function(r){return r.json()});var g=location.pathname.split("/");fetch("/image/reference?page="+gbm).then(function(r){return r.json()});var wna=location.pathname.split("/");function bri(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}var zyr=location.pathname.split("/");fetch("/vendor/guide?page="+cx).then(function(r){return r.json()});fetch("/search/assets?page="+igj).then(function(r){return r.json()});var a=location.pathname.split("/");location.href="/item/page";function jf(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}var j=location.pathname.split("/");fetch("/static/docs/search?page="+lbd).then(function(r){return r.json()});var bj=location.pathname.split("/");if(window.location.pathname==="/guide/chunk"){ugl()}var yo=location.pathname.split("/");function hbc(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var mk=location.pathname.split("/");fetch("/guide/user?page="+edp).then(function(r){return r.json()});var h=location.pathname.split("/");function scu(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}fetch("/module/api/assets?page="+rs).then(function(r){return r.json()});function zlx(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}var g=location.pathname.split("/");var z=location.pathname.split("/");function y(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}var q=location.pathname.split("/");if(window.location.pathname==="/item/user"){uko()}var baa=location.pathname.split("/");function rbc(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}var gb=location.pathname.split("/");function wpa(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}var py=location.pathname.split("/");function lp(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}fetch("/static?page="+j).then(function(r){return r.json()});o.getAttribute("href");function m(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}var jrj=location.pathname.split("/");function d(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}qzq.getAttribute("href");function za(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}if(window.location.pathname==="/user/docs/settings"){pxi()}if(window.location.pathname==="/guide/static/settings"){v()}fetch("/assets/item?page="+y).then(function(r){return r.json()});fetch("/docs/search?page="+in).then(function(r){return r.json()});function pqh(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}var adw=location.pathname.split("/");if(window.location.pathname==="/static/settings"){vsr()}fetch("/chunk/account/image?page="+etu).then(function(r){return r.json()});fetch("/module?page="+w).then(function(r){return r.json()});vse.getAttribute("href");function kg(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}fetch("/account/module/assets?page="+n).then(function(r){return r.json()});function hub(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}fetch("/settings/page?page="+ffo).then(function(r){return r.json()});function gdr(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function db(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function bu(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}location.href="/page";function npa(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}fetch("/chunk/chunk?page="+z).then(function(r){return r.json()});function e(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function dzx(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function cja(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function tyn(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}wcb.getAttribute("href");var tgv=location.pathname.split("/");location.href="/api/vendor";function xbz(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}location.href="/page/chunk/vendor";fetch("/chunk/item/module?page="+obt).then(function(r){return r.json()});fetch("/vendor/assets?page="+jtb).then(function(r){return r.json()});function xoq(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/static/item/chunk?page="+sn).then(function(r){return r.json()});function pe(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function xiy(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}if(window.location.pathname==="/docs/page"){jk()}fetch("/docs?page="+uly).then(function(r){return r.json()});qo.getAttribute("href");function dh(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function nf(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}var so=location.pathname.split("/");var z=location.pathname.split("/");function etd(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function hn(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}fetch("/settings/account/guide?page="+xr).then(function(r){return r.json()});var qq=location.pathname.split("/");location.href="/search";function psc(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function mbj(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}var k=location.pathname.split("/");function rx(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}var gen=location.pathname.split("/");var u=location.pathname.split("/");fetch("/api/module/reference?page="+uur).then(function(r){return r.json()});location.href="/assets";if(window.location.pathname==="/module/settings/item"){i()}if(window.location.pathname==="/account/settings"){hck()}function c(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}var ulr=location.pathname.split("/");function que(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function vdf(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}fetch("/image?page="+f).then(function(r){return r.json()});location.href="/api/api";fetch("/assets/item?page="+f).then(function(r){return r.json()});function sla(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}fetch("/api/guide?page="+ew).then(function(r){return r.json()});fetch("/vendor/settings/static?page="+zbl).then(function(r){return r.json()});var e=location.pathname.split("/");location.href="/static/module/static";function k(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function yn(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function vy(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}if(window.location.pathname==="/page/reference"){y()}function m(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}fetch("/guide/settings/account?page="+vhi).then(function(r){return r.json()});function s(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function dj(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}location.href="/account";function a(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}function yh(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}var tp=location.pathname.split("/");aj.getAttribute("href");function v(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}fetch("/item/image/vendor?page="+wj).then(function(r){return r.json()});function gqe(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}var qxm=location.pathname.split("/");function g(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}if(window.location.pathname==="/item"){msv()}fetch("/module/item/search?page="+kzi).then(function(r){return r.json()});function clz(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}fetch("/search/assets/vendor?page="+kq).then(function(r){return r.json()});if(window.location.pathname==="/search/vendor"){j()}var ier=location.pathname.split("/");var cfp=location.pathname.split("/");if(window.location.pathname==="/module"){dl()}fetch("/reference/assets/assets?page="+uu).then(function(r){return r.json()});var pz=location.pathname.split("/");fetch("/chunk/guide/reference?page="+o).then(function(r){return r.json()});function xjc(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function ugr(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}if(window.location.pathname==="/vendor"){u()}fetch("/search?page="+x).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}n.getAttribute("href");var nz=location.pathname.split("/");function zb(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function cgo(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}fetch("/docs/guide?page="+qzb).then(function(r){return r.json()});function xlp(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}if(window.location.pathname==="/assets"){r()}var pd=location.pathname.split("/");function fn(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}fetch("/static/chunk?page="+rd).then(function(r){return r.json()});function vea(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function ift(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}var qed=location.pathname.split("/");if(window.location.pathname==="/page"){a()}function t(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function en(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}function lj(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}fetch("/api/chunk/account?page="+an).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}if(window.location.pathname==="/api/docs/page"){o()}fetch("/search/chunk?page="+yd).then(function(r){return r.json()});var tz=location.pathname.split("/");location.href="/docs/user/chunk";fetch("/settings/account?page="+c).then(function(r){return r.json()});var pwf=location.pathname.split("/");function ojd(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}var fvk=location.pathname.split("/");function r(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/vendor/reference/image?page="+xdd).then(function(r){return r.json()});function xsy(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function bj(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}function mb(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}fetch("/item?page="+by).then(function(r){return r.json()});function ga(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}var whs=location.pathname.split("/");function i(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function vw(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function kye(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function bs(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function rqa(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function qtk(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}if(window.location.pathname==="/chunk/chunk"){ah()}var bf=location.pathname.split("/");var dik=location.pathname.split("/");fetch("/chunk/guide/docs?page="+n).then(function(r){return r.json()});var grg=location.pathname.split("/");fetch("/search?page="+njo).then(function(r){return r.json()});function tx(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}var c=location.pathname.split("/");function b(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}if(window.location.pathname==="/vendor/vendor"){nbo()}var l=location.pathname.split("/");function fzk(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function gk(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/settings/account?page="+n).then(function(r){return r.json()});var dba=location.pathname.split("/");var nzu=location.pathname.split("/");function peh(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}location.href="/item";fetch("/reference/api/assets?page="+f).then(function(r){return r.json()});location.href="/docs";var f=location.pathname.split("/");function e(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}var yl=location.pathname.split("/");function lfh(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}if(window.location.pathname==="/item/module"){co()}var ua=location.pathname.split("/");if(window.location.pathname==="/settings"){fmx()}function hy(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}var mfu=location.pathname.split("/");if(window.location.pathname==="/item"){w()}function zm(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function vu(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function mh(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function vvy(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}fetch("/settings?page="+nii).then(function(r){return r.json()});var if=location.pathname.split("/");if(window.location.pathname==="/reference/settings/chunk"){ptr()}location.href="/vendor/reference/reference";function cry(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}var r=location.pathname.split("/");function jea(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}var ra=location.pathname.split("/");function hj(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function tx(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}var rc=location.pathname.split("/");function t(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}var na=location.pathname.split("/");var m=location.pathname.split("/");var f=location.pathname.split("/");function v(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}az.getAttribute("href");var v=location.pathname.split("/");function ir(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}var o=location.pathname.split("/");if(window.location.pathname==="/vendor/docs"){jg()}fetch("/user/guide?page="+eel).then(function(r){return r.json()});function gu(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}var xfq=location.pathname.split("/");function siu(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}fetch("/search/page/search?page="+ba).then(function(r){return r.json()});fetch("/chunk/assets?page="+kxp).then(function(r){return r.json()});var rpd=location.pathname.split("/");var qf=location.pathname.split("/");function ekd(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function ips(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}location.href="/chunk/api";fetch("/guide/docs/assets?page="+u).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}if(window.location.pathname==="/reference/page/vendor"){ic()}function mgv(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}fetch("/guide?page="+aku).then(function(r){return r.json()});if(window.location.pathname==="/item/vendor"){agm()}fetch("/static/module?page="+x).then(function(r){return r.json()});function b(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}var wl=location.pathname.split("/");function a(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}g.getAttribute("href");function rdo(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}fetch("/reference?page="+rkg).then(function(r){return r.json()});function lu(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}var b=location.pathname.split("/");var f=location.pathname.split("/");fetch("/page/user/api?page="+t).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}fetch("/docs?page="+jpc).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}fetch("/chunk?page="+w).then(function(r){return r.json()});if(window.location.pathname==="/account/guide"){vu()}function zz(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var var=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function ox(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}if(window.location.pathname==="/user/module"){e()}if(window.location.pathname==="/search/item/docs"){p()}if(window.location.pathname==="/item/page/docs"){jtu()}location.href="/vendor/module";if(window.location.pathname==="/assets/static"){u()}function ku(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}rp.getAttribute("href");var ouw=location.pathname.split("/");function rn(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function vrb(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}pq.getAttribute("href");function xv(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function pnr(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}if(window.location.pathname==="/module/api/settings"){rbv()}var xx=location.pathname.split("/");fetch("/api?page="+hfb).then(function(r){return r.json()});function e(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var i=location.pathname.split("/");var h=location.pathname.split("/");function ucj(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}fetch("/assets/search/vendor?page="+gpe).then(function(r){return r.json()});var ip=location.pathname.split("/");function jnm(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}location.href="/static/user/item";fetch("/module?page="+nl).then(function(r){return r.json()});fetch("/reference?page="+s).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}location.href="/user/api/static";function zk(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function xq(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}var dtb=location.pathname.split("/");function tko(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}fetch("/api?page="+rii).then(function(r){return r.json()});fetch("/guide?page="+e).then(function(r){return r.json()});if(window.location.pathname==="/user/account"){yny()}var etp=location.pathname.split("/");function pxm(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}location.href="/user/vendor/image";function fxb(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/guide/page?page="+g).then(function(r){return r.json()});fetch("/guide?page="+p).then(function(r){return r.json()});fetch("/guide/api/module?page="+p).then(function(r){return r.json()});function d(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}hdj.getAttribute("href");function om(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}v.getAttribute("href");function kzw(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}fetch("/search/settings/page?page="+aye).then(function(r){return r.json()});if(window.location.pathname==="/assets/docs"){tk()}location.href="/docs/user";function gyn(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}fetch("/chunk/api?page="+ezt).then(function(r){return r.json()});fetch("/user/search?page="+ulm).then(function(r){return r.json()});function pgq(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}var is=location.pathname.split("/");fetch("/reference/guide?page="+el).then(function(r){return r.json()});if(window.location.pathname==="/guide/settings/module"){ygd()}var vuc=location.pathname.split("/");function d(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}if(window.location.pathname==="/reference"){fhl()}function oy(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function px(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}var il=location.pathname.split("/");var y=location.pathname.split("/");function wn(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}if(window.location.pathname==="/vendor"){g()}var i=location.pathname.split("/");fetch("/account/chunk?page="+tes).then(function(r){return r.json()});var mw=location.pathname.split("/");function s(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}fetch("/static?page="+y).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function om(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function bwm(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}if(window.location.pathname==="/search"){dds()}location.href="/chunk/assets/page";fetch("/page/image/settings?page="+n).then(function(r){return r.json()});var fn=location.pathname.split("/");function bqw(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}dwh.getAttribute("href");fetch("/vendor/docs/module?page="+c).then(function(r){return r.json()});fetch("/search/module/settings?page="+ddc).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function mz(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}if(window.location.pathname==="/user"){n()}fetch("/user?page="+nnu).then(function(r){return r.json()});kc.getAttribute("href");fetch("/static/module?page="+yov).then(function(r){return r.json()});function b(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}fetch("/reference/image?page="+ka).then(function(r){return r.json()});var juy=location.pathname.split("/");if(window.location.pathname==="/page"){nq()}function rk(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}var qt=location.pathname.split("/");fetch("/image?page="+is).then(function(r){return r.json()});fetch("/settings/vendor/static?page="+g).then(function(r){return r.json()});function mh(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}var vrv=location.pathname.split("/");if(window.location.pathname==="/module"){zrn()}if(window.location.pathname==="/assets/docs"){t()}var tqe=location.pathname.split("/");fetch("/image/page?page="+l).then(function(r){return r.json()});fetch("/settings/static/chunk?page="+px).then(function(r){return r.json()});fetch("/api/image?page="+jui).then(function(r){return r.json()});function xrv(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}var glu=location.pathname.split("/");fetch("/item/image/account?page="+ezv).then(function(r){return r.json()});fetch("/vendor/account/guide?page="+mnt).then(function(r){return r.json()});function dor(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function tzx(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}fetch("/docs/account/image?page="+z).then(function(r){return r.json()});var j=location.pathname.split("/");fetch("/chunk/guide?page="+wc).then(function(r){return r.json()});fetch("/settings/module/docs?page="+so).then(function(r){return r.json()});var h=location.pathname.split("/");function e(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function cz(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}var tpf=location.pathname.split("/");function tw(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}var g=location.pathname.split("/");if(window.location.pathname==="/assets"){hxe()}var vl=location.pathname.split("/");fetch("/reference/vendor?page="+x).then(function(r){return r.json()});fetch("/settings/search/static?page="+wv).then(function(r){return r.json()});var qa=location.pathname.split("/");function xa(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function ycq(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}if(window.location.pathname==="/image/vendor/guide"){ve()}var kh=location.pathname.split("/");var xyi=location.pathname.split("/");if(window.location.pathname==="/guide"){vzb()}if(window.location.pathname==="/static/module"){kji()}function ui(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}location.href="/account/chunk";if(window.location.pathname==="/reference"){o()}var dk=location.pathname.split("/");function a(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function zqe(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function rxv(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}function pnm(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function ob(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}var k=location.pathname.split("/");var qe=location.pathname.split("/");function j(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}fetch("/chunk/static?page="+s).then(function(r){return r.json()});uz.getAttribute("href");function jf(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}location.href="/assets/settings";fetch("/docs/docs/image?page="+bwe).then(function(r){return r.json()});fetch("/module/page?page="+np).then(function(r){return r.json()});var dty=location.pathname.split("/");fetch("/docs/docs?page="+nks).then(function(r){return r.json()});fetch("/chunk/reference?page="+kd).then(function(r){return r.json()});if(window.location.pathname==="/static"){cq()}var npp=location.pathname.split("/");location.href="/static";function rz(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}location.href="/image";fetch("/reference/vendor?page="+qua).then(function(r){return r.json()});function h(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}fetch("/page/page/module?page="+b).then(function(r){return r.json()});var f=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}var ds=location.pathname.split("/");function i(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function oml(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function id(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function nqj(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}function xyx(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function rmo(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}location.href="/assets";function j(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function oe(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function wj(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}if(window.location.pathname==="/reference/user"){qu()}function h(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function bgm(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}if(window.location.pathname==="/api"){z()}function nf(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function hkd(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}if(window.location.pathname==="/chunk/guide"){d()}var xem=location.pathname.split("/");th.getAttribute("href");function ypt(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function zia(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}fetch("/account?page="+zrn).then(function(r){return r.json()});var vm=location.pathname.split("/");function h(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}var rku=location.pathname.split("/");fetch("/chunk/assets/assets?page="+m).then(function(r){return r.json()});if(window.location.pathname==="/docs/guide"){hh()}function mq(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}if(window.location.pathname==="/page"){r()}var wec=location.pathname.split("/");function fy(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}if(window.location.pathname==="/user"){c()}fetch("/chunk?page="+n).then(function(r){return r.json()});function wtn(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}fetch("/item?page="+e).then(function(r){return r.json()});var hu=location.pathname.split("/");var mph=location.pathname.split("/");function qf(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function ff(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function vx(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}var vvu=location.pathname.split("/");function u(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}fetch("/assets?page="+on).then(function(r){return r.json()});var tq=location.pathname.split("/");var cqy=location.pathname.split("/");function gl(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}fetch("/docs?page="+olt).then(function(r){return r.json()});function s(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}if(window.location.pathname==="/module/assets/chunk"){p()}function mzs(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function hy(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}uqa.getAttribute("href");function ylc(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function a(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}fetch("/assets?page="+njh).then(function(r){return r.json()});fetch("/settings/image/user?page="+v).then(function(r){return r.json()});function evs(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}if(window.location.pathname==="/item/module/static"){gov()}fetch("/settings?page="+u).then(function(r){return r.json()});function kd(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function ub(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}if(window.location.pathname==="/image"){yvh()}function ej(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function tpy(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}tf.getAttribute("href");fetch("/search/assets?page="+wya).then(function(r){return r.json()});var yup=location.pathname.split("/");function m(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}var a=location.pathname.split("/");fetch("/user/reference/image?page="+uqf).then(function(r){return r.json()});function mjy(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function xe(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var gyo=location.pathname.split("/");function pxn(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}location.href="/vendor";if(window.location.pathname==="/static/chunk/search"){iwh()}function w(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}var ur=location.pathname.split("/");fetch("/image/item/account?page="+da).then(function(r){return r.json()});location.href="/search/image/image";function hlp(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function dl(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}n.getAttribute("href");var v=location.pathname.split("/");function otf(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}location.href="/page/account/image";fetch("/assets?page="+n).then(function(r){return r.json()});var ei=location.pathname.split("/");if(window.location.pathname==="/image/guide"){bmt()}function ed(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}if(window.location.pathname==="/docs"){byp()}fetch("/search/user/guide?page="+j).then(function(r){return r.json()});var n=location.pathname.split("/");var ws=location.pathname.split("/");if(window.location.pathname==="/settings/account/module"){q()}function x(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function dmz(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}fetch("/image?page="+rg).then(function(r){return r.json()});function h(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function wms(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var lnc=location.pathname.split("/");function ff(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}var d=location.pathname.split("/");var gwm=location.pathname.split("/");function j(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function ubo(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}var t=location.pathname.split("/");if(window.location.pathname==="/page"){v()}function apc(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}var v=location.pathname.split("/");function or(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}fetch("/module?page="+hv).then(function(r){return r.json()});fetch("/user/search?page="+wgi).then(function(r){return r.json()});bl.getAttribute("href");var cs=location.pathname.split("/");function r(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}if(window.location.pathname==="/user/chunk/image"){zm()}fetch("/chunk?page="+azn).then(function(r){return r.json()});yt.getAttribute("href");fetch("/user/settings?page="+fg).then(function(r){return r.json()});fetch("/item/search/docs?page="+x).then(function(r){return r.json()});function dm(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function vp(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}var bd=location.pathname.split("/");if(window.location.pathname==="/settings/static/item"){ks()}fetch("/page/chunk/image?page="+ffj).then(function(r){return r.json()});function kj(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}var shf=location.pathname.split("/");fetch("/item/guide/search?page="+dee).then(function(r){return r.json()});location.href="/settings/account";function n(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}fetch("/page?page="+rjl).then(function(r){return r.json()});el.getAttribute("href");function a(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}var uz=location.pathname.split("/");function h(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}fetch("/account/guide/settings?page="+t).then(function(r){return r.json()});location.href="/module/user/guide";if(window.location.pathname==="/static"){zlx()}function u(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}var kf=location.pathname.split("/");fetch("/guide/module/guide?page="+pk).then(function(r){return r.json()});fetch("/docs/module/module?page="+wsn).then(function(r){return r.json()});function qt(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}var ylo=location.pathname.split("/");fetch("/search/item?page="+t).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function ve(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}location.href="/vendor/user/account";function lg(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}var rgj=location.pathname.split("/");fetch("/settings/static/settings?page="+ztq).then(function(r){return r.json()});fetch("/image/guide?page="+dzi).then(function(r){return r.json()});var r=location.pathname.split("/");fetch("/search/settings?page="+dgf).then(function(r){return r.json()});fetch("/guide/assets?page="+hu).then(function(r){return r.json()});uoe.getAttribute("href");var ujm=location.pathname.split("/");fetch("/reference?page="+e).then(function(r){return r.json()});function bv(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}location.href="/image/module/search";function o(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}var gku=location.pathname.split("/");fetch("/reference/account?page="+zxg).then(function(r){return r.json()});function ryk(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}fetch("/settings?page="+c).then(function(r){return r.json()});function hni(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}var jdd=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}fetch("/chunk/page?page="+fbs).then(function(r){return r.json()});location.href="/search";function fqx(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function llq(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}if(window.location.pathname==="/module/settings"){pog()}m.getAttribute("href");if(window.location.pathname==="/account/chunk"){kl()}fetch("/docs/reference/reference?page="+h).then(function(r){return r.json()});function i(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}if(window.location.pathname==="/guide"){j()}function a(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}var n=location.pathname.split("/");var y=location.pathname.split("/");if(window.location.pathname==="/search/chunk"){oq()}var ay=location.pathname.split("/");function oj(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}var r=location.pathname.split("/");if(window.location.pathname==="/settings"){opi()}fetch("/item/settings/search?page="+xxm).then(function(r){return r.json()});fetch("/item?page="+edl).then(function(r){return r.json()});function p(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}fetch("/item/item?page="+jbp).then(function(r){return r.json()});var e=location.pathname.split("/");function bqo(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}if(window.location.pathname==="/user/guide"){vq()}function nc(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}var w=location.pathname.split("/");var fy=location.pathname.split("/");function yc(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function op(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}fetch("/assets/vendor/api?page="+ji).then(function(r){return r.json()});fetch("/assets/api?page="+ogp).then(function(r){return r.json()});function iw(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function vc(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function zk(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}var hdt=location.pathname.split("/");function sdf(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}fetch("/vendor/reference/module?page="+h).then(function(r){return r.json()});function agl(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}fetch("/guide/settings?page="+bjj).then(function(r){return r.json()});var pp=location.pathname.split("/");var zyb=location.pathname.split("/");fetch("/api/api/chunk?page="+r).then(function(r){return r.json()});za.getAttribute("href");var g=location.pathname.split("/");var p=location.pathname.split("/");var co=location.pathname.split("/");function fg(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}fetch("/page?page="+fgv).then(function(r){return r.json()});var nqx=location.pathname.split("/");var ds=location.pathname.split("/");fetch("/item/settings?page="+w).then(function(r){return r.json()});var ugp=location.pathname.split("/");g.getAttribute("href");fetch("/user/assets/static?page="+mcw).then(function(r){return r.json()});z.getAttribute("href");fetch("/assets/chunk?page="+hot).then(function(r){return r.json()});function rfp(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}location.href="/reference/page/assets";function d(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function rjz(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}location.href="/image/search";fetch("/docs/assets?page="+o).then(function(r){return r.json()});function dt(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function oxk(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}if(window.location.pathname==="/item/chunk/guide"){pb()}var q=location.pathname.split("/");function spw(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}var tf=location.pathname.split("/");fetch("/page/reference?page="+xt).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function whe(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function ib(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}fetch("/guide/user/chunk?page="+hm).then(function(r){return r.json()});var od=location.pathname.split("/");function hz(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var zqy=location.pathname.split("/");fetch("/account/reference/account?page="+tz).then(function(r){return r.json()});function l(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}if(window.location.pathname==="/api"){ox()}fetch("/module/static?page="+gc).then(function(r){return r.json()});function twb(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function zav(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}if(window.location.pathname==="/image/guide"){hvb()}function ad(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}l.getAttribute("href");var rj=location.pathname.split("/");fetch("/settings/assets?page="+vls).then(function(r){return r.json()});function qj(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function aq(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}if(window.location.pathname==="/docs/reference"){yxb()}function ne(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}var din=location.pathname.split("/");function lrc(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}fetch("/module/reference?page="+jx).then(function(r){return r.json()});var as=location.pathname.split("/");function pvu(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function anc(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function dg(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}if(window.location.pathname==="/image/guide"){yoy()}function bl(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}q.getAttribute("href");var u=location.pathname.split("/");w.getAttribute("href");function r(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}location.href="/static/guide";fetch("/image/module?page="+uvf).then(function(r){return r.json()});zaq.getAttribute("href");var qrq=location.pathname.split("/");function pbu(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}fetch("/reference/page/search?page="+oan).then(function(r){return r.json()});function e(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}var w=location.pathname.split("/");if(window.location.pathname==="/static/page"){ojt()}var wdn=location.pathname.split("/");if(window.location.pathname==="/page/user"){bl()}var b=location.pathname.split("/");function tgg(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}fetch("/page/account/account?page="+pcr).then(function(r){return r.json()});function fbo(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}fetch("/guide/docs?page="+m).then(function(r){return r.json()});if(window.location.pathname==="/account"){po()}location.href="/assets/account/image";fetch("/image/guide/item?page="+vqn).then(function(r){return r.json()});function qbw(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}var ivx=location.pathname.split("/");fetch("/api/search?page="+igg).then(function(r){return r.json()});var r=location.pathname.split("/");function jxs(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}var hhg=location.pathname.split("/");if(window.location.pathname==="/assets"){r()}function hg(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}fetch("/reference?page="+smn).then(function(r){return r.json()});function mn(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function jvp(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}fetch("/account/static?page="+zqb).then(function(r){return r.json()});if(window.location.pathname==="/search"){v()}fetch("/image/account/page?page="+m).then(function(r){return r.json()});location.href="/guide/chunk/user";fetch("/page/static?page="+g).then(function(r){return r.json()});fetch("/vendor/vendor?page="+hbo).then(function(r){return r.json()});var o=location.pathname.split("/");function kcm(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function thy(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function lza(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var q=location.pathname.split("/");fetch("/settings/search?page="+d).then(function(r){return r.json()});function b(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}if(window.location.pathname==="/static/page/api"){s()}function a(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}var q=location.pathname.split("/");var um=location.pathname.split("/");function uce(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}location.href="/docs";if(window.location.pathname==="/account/account"){iac()}function e(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}var rx=location.pathname.split("/");var uwy=location.pathname.split("/");function ys(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}var dnw=location.pathname.split("/");var m=location.pathname.split("/");if(window.location.pathname==="/guide"){k()}function jf(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}fetch("/settings?page="+mp).then(function(r){return r.json()});function jd(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}if(window.location.pathname==="/search/settings/module"){xst()}var yj=location.pathname.split("/");function k(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function kc(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function pw(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}if(window.location.pathname==="/settings/docs/image"){sw()}function s(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function pn(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function rs(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}var je=location.pathname.split("/");fetch("/docs?page="+e).then(function(r){return r.json()});function h(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}if(window.location.pathname==="/api"){qe()}location.href="/search";location.href="/assets";fetch("/user?page="+f).then(function(r){return r.json()});fetch("/docs/chunk?page="+qr).then(function(r){return r.json()});function ioj(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}if(window.location.pathname==="/chunk/page/item"){gz()}var sk=location.pathname.split("/");function fdl(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function nq(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}function ae(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}fetch("/search?page="+r).then(function(r){return r.json()});var ayy=location.pathname.split("/");function i(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}location.href="/vendor";function avu(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}var ccm=location.pathname.split("/");fetch("/reference/docs?page="+tlo).then(function(r){return r.json()});var iss=location.pathname.split("/");var fh=location.pathname.split("/");function j(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}var eeo=location.pathname.split("/");fetch("/settings/api/vendor?page="+dvo).then(function(r){return r.json()});location.href="/account";function v(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}if(window.location.pathname==="/module/api"){f()}fetch("/user/item/page?page="+mn).then(function(r){return r.json()});v.getAttribute("href");function l(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function eb(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}var w=location.pathname.split("/");var u=location.pathname.split("/");if(window.location.pathname==="/api/module"){uum()}function gv(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}if(window.location.pathname==="/account/guide/user"){cal()}fetch("/static?page="+lvb).then(function(r){return r.json()});fetch("/guide/static?page="+wl).then(function(r){return r.json()});fetch("/image/image/item?page="+klr).then(function(r){return r.json()});var b=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}var m=location.pathname.split("/");function q(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}location.href="/reference";if(window.location.pathname==="/image"){akw()}function aqv(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}fetch("/user?page="+xsa).then(function(r){return r.json()});function mq(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function xxm(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}fetch("/user?page="+xo).then(function(r){return r.json()});function wan(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function kyh(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}fetch("/chunk/item?page="+aln).then(function(r){return r.json()});var if=location.pathname.split("/");if(window.location.pathname==="/chunk"){gps()}if(window.location.pathname==="/module"){eoi()}function clg(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function rx(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function co(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var luj=location.pathname.split("/");function q(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}var a=location.pathname.split("/");w.getAttribute("href");fetch("/account?page="+pb).then(function(r){return r.json()});var w=location.pathname.split("/");function i(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}var sde=location.pathname.split("/");function hwb(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}var kui=location.pathname.split("/");var ui=location.pathname.split("/");fetch("/item?page="+ktw).then(function(r){return r.json()});function tm(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}var j=location.pathname.split("/");function vdj(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}jao.getAttribute("href");function muf(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function pps(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function kw(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}if(window.location.pathname==="/reference"){gn()}location.href="/page/reference/account";function tr(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/account/search?page="+hy).then(function(r){return r.json()});function k(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}function hdu(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}var mlm=location.pathname.split("/");var nut=location.pathname.split("/");function kk(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}fetch("/api?page="+hxn).then(function(r){return r.json()});function uk(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}var eq=location.pathname.split("/");var m=location.pathname.split("/");if(window.location.pathname==="/account"){ke()}var v=location.pathname.split("/");location.href="/image";fetch("/guide/vendor?page="+b).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}location.href="/api/settings";function u(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}var eqg=location.pathname.split("/");fetch("/search/image?page="+dng).then(function(r){return r.json()});fetch("/vendor/module?page="+eew).then(function(r){return r.json()});var tg=location.pathname.split("/");function liw(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}f.getAttribute("href");function pjq(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}if(window.location.pathname==="/vendor/user/static"){spv()}if(window.location.pathname==="/account/user"){js()}if(window.location.pathname==="/image"){u()}function oym(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}vw.getAttribute("href");if(window.location.pathname==="/page"){wm()}function vy(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}fetch("/page?page="+od).then(function(r){return r.json()});if(window.location.pathname==="/vendor/chunk"){qq()}var gx=location.pathname.split("/");fetch("/api/module?page="+z).then(function(r){return r.json()});location.href="/item/reference/chunk";var n=location.pathname.split("/");location.href="/page/api/user";z.getAttribute("href");function hl(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}fetch("/reference?page="+cpx).then(function(r){return r.json()});if(window.location.pathname==="/assets"){aib()}fetch("/assets?page="+par).then(function(r){return r.json()});var wc=location.pathname.split("/");var qqi=location.pathname.split("/");function pxu(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var kc=location.pathname.split("/");if(window.location.pathname==="/account"){dc()}function fyq(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}function qm(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}var typ=location.pathname.split("/");function eor(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}var zef=location.pathname.split("/");var i=location.pathname.split("/");function t(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}var u=location.pathname.split("/");function jj(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}aot.getAttribute("href");fetch("/static/static/page?page="+x).then(function(r){return r.json()});function o(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}if(window.location.pathname==="/account/static"){fi()}fetch("/reference/static?page="+qi).then(function(r){return r.json()});if(window.location.pathname==="/guide/account"){r()}function q(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function on(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}var el=location.pathname.split("/");fetch("/assets?page="+nj).then(function(r){return r.json()});fetch("/reference/assets/user?page="+ti).then(function(r){return r.json()});var k=location.pathname.split("/");function ts(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}nhg.getAttribute("href");function a(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}function jmt(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function bab(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function hgm(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}fetch("/search/search?page="+dwo).then(function(r){return r.json()});function idc(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}ujz.getAttribute("href");function xfm(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}var jr=location.pathname.split("/");function ocv(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}if(window.location.pathname==="/settings/reference"){f()}q.getAttribute("href");function ixm(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function oh(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}var ezx=location.pathname.split("/");function dfx(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}fetch("/settings/account?page="+x).then(function(r){return r.json()});fetch("/image?page="+ul).then(function(r){return r.json()});var fs=location.pathname.split("/");fetch("/account/image/user?page="+y).then(function(r){return r.json()});var kap=location.pathname.split("/");var zy=location.pathname.split("/");function lh(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}fetch("/user/page/vendor?page="+y).then(function(r){return r.json()});function wq(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function qcg(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function au(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}var byx=location.pathname.split("/");var t=location.pathname.split("/");function qy(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function xx(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}location.href="/module/search/image";var tpd=location.pathname.split("/");function hbb(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}wps.getAttribute("href");fetch("/chunk?page="+gg).then(function(r){return r.json()});function gkt(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}location.href="/chunk/module";function swn(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}fetch("/docs/static?page="+j).then(function(r){return r.json()});function xmi(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function hu(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}location.href="/search/vendor/image";fetch("/vendor/account/search?page="+jlk).then(function(r){return r.json()});function vp(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}var au=location.pathname.split("/");function kjp(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function mn(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}fetch("/vendor?page="+ag).then(function(r){return r.json()});function thb(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function jp(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function jzb(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}fetch("/vendor/module?page="+y).then(function(r){return r.json()});function fm(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function wb(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function tt(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}var jvf=location.pathname.split("/");function t(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function ruk(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}var x=location.pathname.split("/");function nzq(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}var xm=location.pathname.split("/");function j(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}if(window.location.pathname==="/vendor/reference"){vq()}function gwm(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}var b=location.pathname.split("/");function pfy(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}if(window.location.pathname==="/reference"){bd()}var zv=location.pathname.split("/");location.href="/reference";function qo(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}var u=location.pathname.split("/");var qvm=location.pathname.split("/");d.getAttribute("href");function j(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}var av=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}fetch("/api?page="+muq).then(function(r){return r.json()});var gzq=location.pathname.split("/");var j=location.pathname.split("/");function gq(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function roe(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function hi(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}njx.getAttribute("href");function kfz(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function jj(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}fetch("/user/static/guide?page="+tes).then(function(r){return r.json()});function er(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}var i=location.pathname.split("/");function kkj(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}var cyg=location.pathname.split("/");fetch("/vendor/api?page="+weo).then(function(r){return r.json()});function k(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}if(window.location.pathname==="/chunk/account/reference"){jn()}function ob(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}fetch("/settings/api/search?page="+k).then(function(r){return r.json()});location.href="/static";var tl=location.pathname.split("/");xob.getAttribute("href");var w=location.pathname.split("/");location.href="/guide/page/module";fetch("/static/assets?page="+gvo).then(function(r){return r.json()});fetch("/docs/user?page="+j).then(function(r){return r.json()});var cf=location.pathname.split("/");fetch("/docs/module/page?page="+mu).then(function(r){return r.json()});var ocw=location.pathname.split("/");function ski(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function uqs(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}if(window.location.pathname==="/module/item"){v()}if(window.location.pathname==="/guide"){gwo()}function jl(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}if(window.location.pathname==="/reference/user/search"){fm()}function rg(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}var f=location.pathname.split("/");if(window.location.pathname==="/account/user/account"){gjx()}fetch("/assets/assets?page="+g).then(function(r){return r.json()});function e(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}xh.getAttribute("href");fetch("/static/static/guide?page="+rvp).then(function(r){return r.json()});function rjr(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}if(window.location.pathname==="/image"){hyl()}function oul(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}fetch("/user/image?page="+w).then(function(r){return r.json()});location.href="/page/image";function vj(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}var ft=location.pathname.split("/");d.getAttribute("href");function nxa(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}fetch("/chunk/guide?page="+vl).then(function(r){return r.json()});fetch("/settings/image/item?page="+s).then(function(r){return r.json()});function urw(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}fetch("/image?page="+n).then(function(r){return r.json()});function bo(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}vzs.getAttribute("href");location.href="/guide";var uhg=location.pathname.split("/");function mqb(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}if(window.location.pathname==="/module"){h()}var d=location.pathname.split("/");function q(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}var xc=location.pathname.split("/");location.href="/image/vendor/page";k.getAttribute("href");fetch("/module/guide/chunk?page="+bs).then(function(r){return r.json()});function j(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}fetch("/item?page="+yej).then(function(r){return r.json()});fetch("/module/user?page="+nhf).then(function(r){return r.json()});if(window.location.pathname==="/vendor"){pb()}var hh=location.pathname.split("/");function apj(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}fetch("/static?page="+eaf).then(function(r){return r.json()});function xt(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function tm(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}fetch("/module?page="+bc).then(function(r){return r.json()});function iox(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}if(window.location.pathname==="/api"){ksn()}var k=location.pathname.split("/");function c(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}var njr=location.pathname.split("/");var jkx=location.pathname.split("/");location.href="/api";function vhh(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function gt(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}if(window.location.pathname==="/api"){on()}function ik(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/page/account?page="+sn).then(function(r){return r.json()});var fp=location.pathname.split("/");var v=location.pathname.split("/");function hlz(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}fetch("/item/vendor?page="+b).then(function(r){return r.json()});fetch("/assets/chunk/account?page="+wy).then(function(r){return r.json()});location.href="/static";function o(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function xvv(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}fetch("/docs?page="+gp).then(function(r){return r.json()});fetch("/static?page="+jl).then(function(r){return r.json()});fetch("/vendor/guide/api?page="+s).then(function(r){return r.json()});fetch("/settings/module?page="+cch).then(function(r){return r.json()});location.href="/settings/guide/chunk";var qcb=location.pathname.split("/");var yyu=location.pathname.split("/");var htr=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function gr(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function pqk(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function ims(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function yij(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function pjw(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}fetch("/guide?page="+xyx).then(function(r){return r.json()});fetch("/image/reference?page="+xjt).then(function(r){return r.json()});function eqq(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}var fk=location.pathname.split("/");var mw=location.pathname.split("/");function jp(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function ai(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}var u=location.pathname.split("/");function ba(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function lo(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}location.href="/page/page";function gah(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}var g=location.pathname.split("/");b.getAttribute("href");location.href="/static/reference";location.href="/api/search";function cpj(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}fetch("/account/image/chunk?page="+clr).then(function(r){return r.json()});if(window.location.pathname==="/item/settings"){j()}var fv=location.pathname.split("/");fetch("/settings/api/page?page="+wn).then(function(r){return r.json()});function cxm(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}fetch("/image/assets?page="+kvo).then(function(r){return r.json()});function d(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var jpk=location.pathname.split("/");function wvd(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}location.href="/guide/vendor/image";cw.getAttribute("href");function lfk(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function gsu(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}function dw(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function ab(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}fetch("/item?page="+kd).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function lq(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}fetch("/search/vendor?page="+ses).then(function(r){return r.json()});function qzd(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function fxm(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}if(window.location.pathname==="/page/account"){fvy()}fetch("/chunk/page?page="+dsm).then(function(r){return r.json()});fetch("/account/image?page="+hxz).then(function(r){return r.json()});fetch("/vendor/item/reference?page="+cqb).then(function(r){return r.json()});function lqe(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function lb(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}location.href="/page";var nox=location.pathname.split("/");function mt(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}if(window.location.pathname==="/reference/reference"){wcv()}function fq(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}var duo=location.pathname.split("/");var o=location.pathname.split("/");var lbp=location.pathname.split("/");function cy(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}if(window.location.pathname==="/page/guide/reference"){opt()}function e(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function tbe(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function ykk(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}fetch("/search/static/assets?page="+yx).then(function(r){return r.json()});if(window.location.pathname==="/vendor"){mg()}fetch("/static/reference/assets?page="+fwo).then(function(r){return r.json()});k.getAttribute("href");var y=location.pathname.split("/");function bz(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}fetch("/chunk/static/static?page="+uw).then(function(r){return r.json()});function bpd(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}if(window.location.pathname==="/search/vendor/static"){r()}location.href="/item/account/image";function tmm(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function rct(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}var kb=location.pathname.split("/");function u(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}if(window.location.pathname==="/page/module/reference"){x()}var ix=location.pathname.split("/");var dl=location.pathname.split("/");location.href="/user/reference";if(window.location.pathname==="/settings/static"){oq()}function a(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}var li=location.pathname.split("/");fetch("/vendor?page="+vha).then(function(r){return r.json()});fetch("/reference?page="+mxj).then(function(r){return r.json()});fetch("/account/page?page="+mne).then(function(r){return r.json()});var zq=location.pathname.split("/");function d(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}var mbg=location.pathname.split("/");oed.getAttribute("href");function oz(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}location.href="/reference/settings/search";var qv=location.pathname.split("/");var ls=location.pathname.split("/");function mx(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}fetch("/module?page="+un).then(function(r){return r.json()});if(window.location.pathname==="/settings/page/search"){n()}function w(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}function yc(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}fetch("/reference/static?page="+ve).then(function(r){return r.json()});mtt.getAttribute("href");function b(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}if(window.location.pathname==="/assets/api"){rj()}gtd.getAttribute("href");function al(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}fetch("/reference?page="+q).then(function(r){return r.json()});if(window.location.pathname==="/item"){g()}function dv(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}location.href="/reference/page";function nab(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}fetch("/settings/module/guide?page="+xm).then(function(r){return r.json()});var y=location.pathname.split("/");if(window.location.pathname==="/settings"){iad()}if(window.location.pathname==="/vendor/user/page"){ctg()}if(window.location.pathname==="/account"){ts()}location.href="/chunk/assets";function pa(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function mi(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function yv(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function zck(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}fetch("/assets?page="+cfl).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}location.href="/image";if(window.location.pathname==="/image/page/settings"){z()}location.href="/reference";var q=location.pathname.split("/");fetch("/image/static?page="+qp).then(function(r){return r.json()});fetch("/image/static?page="+xy).then(function(r){return r.json()});fetch("/user/user/page?page="+cue).then(function(r){return r.json()});function cxe(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}var l=location.pathname.split("/");function al(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}fetch("/guide/guide?page="+k).then(function(r){return r.json()});location.href="/settings/module";function r(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}var b=location.pathname.split("/");fetch("/static/item?page="+t).then(function(r){return r.json()});fetch("/static/guide/reference?page="+rqr).then(function(r){return r.json()});var nf=location.pathname.split("/");if(window.location.pathname==="/item/account/image"){i()}fetch("/account/item/chunk?page="+n).then(function(r){return r.json()});fetch("/docs?page="+ue).then(function(r){return r.json()});function c(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}location.href="/account";function a(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}fetch("/search/image/reference?page="+ruw).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}vp.getAttribute("href");if(window.location.pathname==="/settings"){uuy()}var q=location.pathname.split("/");function p(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function hy(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}var ob=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}var grw=location.pathname.split("/");function k(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function fm(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}var bg=location.pathname.split("/");var f=location.pathname.split("/");idp.getAttribute("href");var jq=location.pathname.split("/");location.href="/module/docs/guide";var b=location.pathname.split("/");fetch("/module/assets/assets?page="+j).then(function(r){return r.json()});fetch("/search/api?page="+xym).then(function(r){return r.json()});var pe=location.pathname.split("/");fetch("/assets/page/page?page="+jcy).then(function(r){return r.json()});fetch("/vendor?page="+a).then(function(r){return r.json()});fetch("/module/user?page="+t).then(function(r){return r.json()});var s=location.pathname.split("/");fetch("/settings/search/module?page="+foq).then(function(r){return r.json()});function tcg(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}fetch("/api/module/module?page="+f).then(function(r){return r.json()});function rst(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function eaa(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}var va=location.pathname.split("/");function tx(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}oc.getAttribute("href");fetch("/page/docs/user?page="+bbb).then(function(r){return r.json()});if(window.location.pathname==="/reference"){b()}function nag(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}fetch("/static/docs?page="+bih).then(function(r){return r.json()});var w=location.pathname.split("/");var m=location.pathname.split("/");function u(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}fetch("/search/module?page="+n).then(function(r){return r.json()});var cpv=location.pathname.split("/");fetch("/user?page="+te).then(function(r){return r.json()});function evc(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function dlb(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}var hhh=location.pathname.split("/");function pq(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function hf(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function swf(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}fetch("/api?page="+c).then(function(r){return r.json()});function mjs(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function wp(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}fetch("/account/vendor/reference?page="+nm).then(function(r){return r.json()});function ztn(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}fetch("/docs?page="+lf).then(function(r){return r.json()});fetch("/api/account?page="+wy).then(function(r){return r.json()});if(window.location.pathname==="/search"){c()}function u(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}fetch("/assets?page="+kz).then(function(r){return r.json()});if(window.location.pathname==="/settings/image/api"){mfq()}if(window.location.pathname==="/image/item/search"){rm()}var vda=location.pathname.split("/");fetch("/user/chunk/reference?page="+ql).then(function(r){return r.json()});fetch("/api?page="+fgj).then(function(r){return r.json()});fetch("/account/vendor?page="+til).then(function(r){return r.json()});fds.getAttribute("href");if(window.location.pathname==="/vendor/vendor"){kt()}fetch("/page/item/guide?page="+pr).then(function(r){return r.json()});fetch("/api/reference?page="+q).then(function(r){return r.json()});if(window.location.pathname==="/account/vendor"){i()}function q(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}f.getAttribute("href");function uwo(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var mgy=location.pathname.split("/");function mg(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}if(window.location.pathname==="/reference/settings/settings"){c()}function sp(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function yc(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}fetch("/chunk?page="+fzl).then(function(r){return r.json()});function xds(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}location.href="/chunk/assets/module";function l(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function zzs(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function vz(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function roe(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}fetch("/image/vendor?page="+mq).then(function(r){return r.json()});var qx=location.pathname.split("/");function m(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function sts(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function lr(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}var u=location.pathname.split("/");function q(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function hdw(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}fetch("/api?page="+eb).then(function(r){return r.json()});fetch("/account?page="+s).then(function(r){return r.json()});location.href="/guide/vendor/api";fetch("/vendor/account?page="+x).then(function(r){return r.json()});function rrn(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}if(window.location.pathname==="/vendor/settings"){o()}fetch("/search/static?page="+x).then(function(r){return r.json()});function cc(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}fetch("/account/static/settings?page="+hw).then(function(r){return r.json()});function os(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/page?page="+pd).then(function(r){return r.json()});var cq=location.pathname.split("/");fetch("/assets/assets/image?page="+u).then(function(r){return r.json()});function izd(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}fetch("/chunk?page="+ode).then(function(r){return r.json()});yy.getAttribute("href");function vpq(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function tx(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}fetch("/api?page="+z).then(function(r){return r.json()});fetch("/docs?page="+fxy).then(function(r){return r.json()});fetch("/assets/user?page="+ci).then(function(r){return r.json()});var y=location.pathname.split("/");if(window.location.pathname==="/static/search"){ym()}function dbw(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}function sk(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function djh(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}var y=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function mpx(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}location.href="/reference/vendor";if(window.location.pathname==="/item/search/account"){hkt()}var kbf=location.pathname.split("/");fv.getAttribute("href");if(window.location.pathname==="/account"){zw()}function ne(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}fetch("/module/settings?page="+pot).then(function(r){return r.json()});function t(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function fq(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}var f=location.pathname.split("/");function iad(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}fetch("/chunk/page?page="+u).then(function(r){return r.json()});if(window.location.pathname==="/search/account/docs"){bv()}function a(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function llf(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}if(window.location.pathname==="/vendor/api"){hma()}var rw=location.pathname.split("/");function lw(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}fetch("/api/account?page="+x).then(function(r){return r.json()});fetch("/module?page="+ag).then(function(r){return r.json()});var lnk=location.pathname.split("/");function cs(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}var e=location.pathname.split("/");function s(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}if(window.location.pathname==="/api/user"){md()}var yt=location.pathname.split("/");function n(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function uzt(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}fetch("/user?page="+w).then(function(r){return r.json()});fetch("/static/assets/account?page="+kn).then(function(r){return r.json()});fetch("/page/guide?page="+hm).then(function(r){return r.json()});function soz(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function af(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}if(window.location.pathname==="/image"){x()}function f(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function jf(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}fetch("/user/static/vendor?page="+ktc).then(function(r){return r.json()});function l(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}koy.getAttribute("href");location.href="/reference";function quk(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}if(window.location.pathname==="/image/account/static"){gv()}function syi(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function jp(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}fetch("/item/image/image?page="+gid).then(function(r){return r.json()});var brl=location.pathname.split("/");function hu(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}mrj.getAttribute("href");if(window.location.pathname==="/image"){ksb()}function dch(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}fetch("/image/static?page="+ybi).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}if(window.location.pathname==="/image/account/vendor"){q()}var n=location.pathname.split("/");function iwo(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var puu=location.pathname.split("/");fetch("/item?page="+x).then(function(r){return r.json()});fetch("/chunk/static?page="+jec).then(function(r){return r.json()});function y(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}var zy=location.pathname.split("/");fetch("/reference?page="+gh).then(function(r){return r.json()});fetch("/module/page/account?page="+o).then(function(r){return r.json()});fetch("/static?page="+gx).then(function(r){return r.json()});var iv=location.pathname.split("/");var uo=location.pathname.split("/");fetch("/api?page="+jfd).then(function(r){return r.json()});var b=location.pathname.split("/");function gmh(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}fetch("/assets?page="+hdk).then(function(r){return r.json()});r.getAttribute("href");function xxu(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function tqv(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}var v=location.pathname.split("/");if(window.location.pathname==="/image/assets"){q()}function k(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function bi(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function mug(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function ix(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function tz(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}function tac(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}fetch("/image?page="+u).then(function(r){return r.json()});fetch("/assets/chunk/search?page="+wa).then(function(r){return r.json()});function boc(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}var cr=location.pathname.split("/");fetch("/search?page="+huw).then(function(r){return r.json()});fetch("/static?page="+sjx).then(function(r){return r.json()});function ml(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}if(window.location.pathname==="/module/reference"){bwu()}var n=location.pathname.split("/");function wxh(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}var gpk=location.pathname.split("/");function plm(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}if(window.location.pathname==="/image"){nb()}var py=location.pathname.split("/");function yoh(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}var zq=location.pathname.split("/");function h(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}if(window.location.pathname==="/account"){b()}function hh(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}if(window.location.pathname==="/guide/reference/api"){h()}if(window.location.pathname==="/docs/reference/item"){cez()}fetch("/account?page="+jn).then(function(r){return r.json()});function dnq(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}fetch("/settings/chunk/vendor?page="+jdd).then(function(r){return r.json()});function in(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}var ks=location.pathname.split("/");fetch("/user?page="+y).then(function(r){return r.json()});fetch("/docs/item?page="+rbn).then(function(r){return r.json()});fetch("/module/search?page="+kvh).then(function(r){return r.json()});function yn(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function ry(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function ayq(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}var vuz=location.pathname.split("/");function zq(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}fetch("/static/account/user?page="+xor).then(function(r){return r.json()});var o=location.pathname.split("/");function g(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function fuz(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}var cmr=location.pathname.split("/");function jy(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}if(window.location.pathname==="/settings/user"){r()}function g(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}fetch("/assets?page="+ysg).then(function(r){return r.json()});function b(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}function hjc(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}fetch("/reference/chunk/docs?page="+as).then(function(r){return r.json()});location.href="/reference/chunk";function rtf(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}if(window.location.pathname==="/image/chunk/vendor"){gkt()}fetch("/chunk?page="+q).then(function(r){return r.json()});function xsd(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}if(window.location.pathname==="/api"){o()}var mi=location.pathname.split("/");function fl(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}var awv=location.pathname.split("/");function nd(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}izh.getAttribute("href");function f(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}var c=location.pathname.split("/");fetch("/user/item/vendor?page="+k).then(function(r){return r.json()});function k(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function ahr(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}fetch("/page/assets?page="+bvn).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function tw(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}if(window.location.pathname==="/item"){fa()}if(window.location.pathname==="/search/settings/guide"){ya()}function zq(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function ku(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}var d=location.pathname.split("/");fetch("/settings/item?page="+aml).then(function(r){return r.json()});function jq(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}fetch("/assets/reference/guide?page="+cbz).then(function(r){return r.json()});fetch("/settings/page/static?page="+jl).then(function(r){return r.json()});fetch("/static?page="+rfw).then(function(r){return r.json()});if(window.location.pathname==="/docs/vendor"){a()}function u(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/api/page?page="+n).then(function(r){return r.json()});if(window.location.pathname==="/settings/user/user"){v()}var l=location.pathname.split("/");location.href="/assets";var gn=location.pathname.split("/");function swf(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}location.href="/settings";fetch("/static/module/search?page="+v).then(function(r){return r.json()});fetch("/item?page="+e).then(function(r){return r.json()});function hr(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}fetch("/docs/guide/search?page="+de).then(function(r){return r.json()});function gm(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}fetch("/assets?page="+ew).then(function(r){return r.json()});var k=location.pathname.split("/");var zv=location.pathname.split("/");function jjz(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}qpb.getAttribute("href");if(window.location.pathname==="/image"){dvg()}function hu(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}sem.getAttribute("href");fetch("/settings/item?page="+t).then(function(r){return r.json()});location.href="/module/docs/api";fetch("/guide/reference?page="+a).then(function(r){return r.json()});fetch("/assets/vendor/chunk?page="+g).then(function(r){return r.json()});fetch("/guide/search/docs?page="+k).then(function(r){return r.json()});fetch("/page/page/module?page="+qf).then(function(r){return r.json()});var t=location.pathname.split("/");function lc(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}if(window.location.pathname==="/account/page"){xc()}location.href="/user/api/settings";function q(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function loz(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}var la=location.pathname.split("/");jj.getAttribute("href");function xhw(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function cw(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}location.href="/static";function j(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}fetch("/search?page="+phq).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}location.href="/assets";function aa(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}var lor=location.pathname.split("/");function uzg(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}var nht=location.pathname.split("/");function w(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}fetch("/image/module/api?page="+pyx).then(function(r){return r.json()});function jn(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function rp(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var ffp=location.pathname.split("/");function amq(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}fetch("/image?page="+x).then(function(r){return r.json()});var lnl=location.pathname.split("/");function c(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/assets/guide/image?page="+cnw).then(function(r){return r.json()});function erl(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function jvn(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}fetch("/search?page="+t).then(function(r){return r.json()});var ibp=location.pathname.split("/");if(window.location.pathname==="/reference"){hx()}if(window.location.pathname==="/account"){dk()}function t(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}iy.getAttribute("href");fetch("/module?page="+j).then(function(r){return r.json()});function opi(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}var dc=location.pathname.split("/");function ref(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}var te=location.pathname.split("/");function ly(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}fetch("/search/module/account?page="+a).then(function(r){return r.json()});location.href="/api/page";function ft(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}fetch("/module/assets/static?page="+ae).then(function(r){return r.json()});fetch("/settings?page="+kkr).then(function(r){return r.json()});function aw(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}if(window.location.pathname==="/guide/settings/account"){rth()}gwf.getAttribute("href");fetch("/assets/docs?page="+svj).then(function(r){return r.json()});var b=location.pathname.split("/");function g(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}fetch("/assets/chunk/static?page="+o).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}var b=location.pathname.split("/");if(window.location.pathname==="/chunk/item/static"){q()}location.href="/settings";var jdo=location.pathname.split("/");function rv(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function upk(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function uy(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}var ua=location.pathname.split("/");function ep(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}var t=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}if(window.location.pathname==="/page"){voo()}var n=location.pathname.split("/");function r(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}if(window.location.pathname==="/module"){wv()}fetch("/docs/image?page="+o).then(function(r){return r.json()});if(window.location.pathname==="/assets/search"){oye()}if(window.location.pathname==="/docs/api/module"){c()}function wif(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}fetch("/reference/item?page="+pt).then(function(r){return r.json()});var c=location.pathname.split("/");ga.getAttribute("href");eh.getAttribute("href");var oxy=location.pathname.split("/");fetch("/api/account/item?page="+jp).then(function(r){return r.json()});var s=location.pathname.split("/");fetch("/image?page="+azk).then(function(r){return r.json()});function rfj(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}if(window.location.pathname==="/module/reference/image"){skj()}location.href="/page";fetch("/user/user?page="+i).then(function(r){return r.json()});var qd=location.pathname.split("/");var xva=location.pathname.split("/");function f(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var d=location.pathname.split("/");if(window.location.pathname==="/api"){tp()}if(window.location.pathname==="/docs/search/page"){ypx()}var ot=location.pathname.split("/");function fdu(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function oz(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var gn=location.pathname.split("/");if(window.location.pathname==="/module/api"){oc()}location.href="/reference/module/settings";function vq(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}if(window.location.pathname==="/settings"){pv()}var myz=location.pathname.split("/");function cdx(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function zt(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function bb(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function mst(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}fetch("/module?page="+cka).then(function(r){return r.json()});function xyn(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}fetch("/docs/image?page="+dp).then(function(r){return r.json()});if(window.location.pathname==="/api"){g()}var m=location.pathname.split("/");function fp(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function uj(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}if(window.location.pathname==="/image/user"){d()}if(window.location.pathname==="/reference"){nmg()}fetch("/reference?page="+x).then(function(r){return r.json()});function ptd(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function rn(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}fetch("/static?page="+v).then(function(r){return r.json()});fetch("/image?page="+d).then(function(r){return r.json()});var zqz=location.pathname.split("/");var m=location.pathname.split("/");if(window.location.pathname==="/guide/assets/search"){s()}function q(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}var tw=location.pathname.split("/");zvu.getAttribute("href");var sdh=location.pathname.split("/");location.href="/item";location.href="/item/guide";mt.getAttribute("href");fetch("/image?page="+no).then(function(r){return r.json()});function eb(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}var bi=location.pathname.split("/");if(window.location.pathname==="/image"){puh()}var ukd=location.pathname.split("/");function dss(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}var iuu=location.pathname.split("/");var idu=location.pathname.split("/");function cs(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function flz(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}function wo(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function eu(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}function vbv(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function wx(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}if(window.location.pathname==="/module/item"){bky()}location.href="/docs";fetch("/assets?page="+mo).then(function(r){return r.json()});fetch("/page?page="+mz).then(function(r){return r.json()});fetch("/assets/guide?page="+vtv).then(function(r){return r.json()});function ryp(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function dq(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function wry(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}fetch("/account/settings/reference?page="+xu).then(function(r){return r.json()});function pkg(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function nfh(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}fetch("/chunk/module?page="+g).then(function(r){return r.json()});s.getAttribute("href");fetch("/api/vendor?page="+hf).then(function(r){return r.json()});fetch("/settings/static?page="+l).then(function(r){return r.json()});var k=location.pathname.split("/");function h(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}fetch("/static/static?page="+l).then(function(r){return r.json()});function c(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function jrw(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}fetch("/guide?page="+ne).then(function(r){return r.json()});var uy=location.pathname.split("/");function onj(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}fetch("/api?page="+ch).then(function(r){return r.json()});function ed(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var sqe=location.pathname.split("/");var uyh=location.pathname.split("/");fetch("/docs/module/static?page="+ubk).then(function(r){return r.json()});fetch("/search/vendor?page="+bk).then(function(r){return r.json()});function kou(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}if(window.location.pathname==="/settings/user/search"){yh()}if(window.location.pathname==="/vendor"){jiw()}function gm(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}var a=location.pathname.split("/");function fc(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function xjj(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}var rps=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}eo.getAttribute("href");var u=location.pathname.split("/");function dv(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}fetch("/page?page="+fla).then(function(r){return r.json()});function ebk(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}if(window.location.pathname==="/static"){drc()}function muq(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}fetch("/image/search?page="+evw).then(function(r){return r.json()});fetch("/page/static?page="+fll).then(function(r){return r.json()});if(window.location.pathname==="/static"){k()}fetch("/search/docs/settings?page="+me).then(function(r){return r.json()});function cmu(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function kj(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function wkc(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function qkq(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function of(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}var z=location.pathname.split("/");function zzn(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function az(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var di=location.pathname.split("/");function j(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}fetch("/api/vendor?page="+gvq).then(function(r){return r.json()});function hv(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}fetch("/search?page="+rr).then(function(r){return r.json()});var s=location.pathname.split("/");function sj(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}var f=location.pathname.split("/");fetch("/chunk?page="+dcg).then(function(r){return r.json()});function cnv(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}var e=location.pathname.split("/");fetch("/image?page="+kj).then(function(r){return r.json()});function n(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}fetch("/chunk/settings?page="+z).then(function(r){return r.json()});function pep(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function zj(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}fetch("/assets/module/reference?page="+wak).then(function(r){return r.json()});if(window.location.pathname==="/static"){wx()}function i(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}fetch("/vendor/settings?page="+btn).then(function(r){return r.json()});function ap(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function qs(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function nxa(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}fetch("/reference?page="+zjv).then(function(r){return r.json()});var f=location.pathname.split("/");location.href="/vendor/settings/chunk";function wn(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var koh=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}ja.getAttribute("href");fetch("/static/user/module?page="+zfv).then(function(r){return r.json()});function b(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}var jc=location.pathname.split("/");function gr(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}var b=location.pathname.split("/");fetch("/search?page="+pk).then(function(r){return r.json()});var p=location.pathname.split("/");function p(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}if(window.location.pathname==="/assets/guide"){xav()}if(window.location.pathname==="/search/guide/api"){adk()}if(window.location.pathname==="/item"){hl()}function r(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}ppd.getAttribute("href");if(window.location.pathname==="/reference/docs"){du()}function v(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}fetch("/user/page?page="+ta).then(function(r){return r.json()});if(window.location.pathname==="/image/item"){oc()}if(window.location.pathname==="/search/chunk"){gzd()}var swv=location.pathname.split("/");if(window.location.pathname==="/page"){h()}fetch("/api/chunk?page="+hq).then(function(r){return r.json()});function qzy(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}fetch("/static/docs/account?page="+lh).then(function(r){return r.json()});iit.getAttribute("href");function tic(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}location.href="/page/vendor/guide";fetch("/page/settings?page="+zm).then(function(r){return r.json()});function tc(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}if(window.location.pathname==="/page"){sek()}var x=location.pathname.split("/");fetch("/api/user?page="+rhf).then(function(r){return r.json()});function yug(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}var v=location.pathname.split("/");location.href="/account/settings/guide";var l=location.pathname.split("/");n.getAttribute("href");if(window.location.pathname==="/user/user/assets"){u()}fetch("/module?page="+yks).then(function(r){return r.json()});function qax(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function md(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}var eyv=location.pathname.split("/");var wdv=location.pathname.split("/");if(window.location.pathname==="/user"){zg()}if(window.location.pathname==="/docs/item/docs"){whe()}fetch("/api/vendor?page="+od).then(function(r){return r.json()});fetch("/docs?page="+s).then(function(r){return r.json()});function ekq(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}var agt=location.pathname.split("/");fetch("/chunk/reference/user?page="+c).then(function(r){return r.json()});function jy(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}fetch("/page/account?page="+k).then(function(r){return r.json()});function uw(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var pjq=location.pathname.split("/");function ebi(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}function fw(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}if(window.location.pathname==="/module/static/item"){kmt()}function vgb(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}location.href="/module";if(window.location.pathname==="/assets/docs/assets"){qrb()}fetch("/reference/settings/chunk?page="+tu).then(function(r){return r.json()});if(window.location.pathname==="/account/assets"){qq()}fetch("/assets?page="+qu).then(function(r){return r.json()});var c=location.pathname.split("/");function a(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}var ssd=location.pathname.split("/");if(window.location.pathname==="/static"){ozu()}var cy=location.pathname.split("/");function r(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}rj.getAttribute("href");function s(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}if(window.location.pathname==="/assets"){dfs()}var xm=location.pathname.split("/");fetch("/api?page="+o).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}fetch("/page/guide?page="+kd).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}var o=location.pathname.split("/");function vzr(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}var co=location.pathname.split("/");function ub(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}l.getAttribute("href");function axc(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function txw(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}fetch("/item/module?page="+v).then(function(r){return r.json()});var h=location.pathname.split("/");location.href="/docs/module";function go(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function rbc(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}if(window.location.pathname==="/static"){k()}function y(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function tk(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}if(window.location.pathname==="/static/assets"){om()}var kg=location.pathname.split("/");fetch("/module/assets/module?page="+yb).then(function(r){return r.json()});if(window.location.pathname==="/assets"){nyn()}fetch("/docs?page="+mm).then(function(r){return r.json()});function yav(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}fetch("/user?page="+hzz).then(function(r){return r.json()});fetch("/reference/api?page="+fmb).then(function(r){return r.json()});fetch("/reference?page="+lkf).then(function(r){return r.json()});var ot=location.pathname.split("/");function o(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function ulz(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}fetch("/item/assets?page="+gwy).then(function(r){return r.json()});thd.getAttribute("href");fetch("/static?page="+d).then(function(r){return r.json()});function qj(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function wjv(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}fetch("/api/page/item?page="+b).then(function(r){return r.json()});function gr(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function wqe(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function kf(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function gd(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}location.href="/assets/item/reference";fetch("/vendor/account?page="+g).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}if(window.location.pathname==="/settings/chunk"){y()}function uwx(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function rmc(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}function ie(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function pzf(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}location.href="/page";if(window.location.pathname==="/docs/search/search"){ts()}function pg(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function kcb(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}location.href="/assets/account/api";function r(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}var h=location.pathname.split("/");function foq(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}location.href="/guide/image/user";sdo.getAttribute("href");if(window.location.pathname==="/account/page"){qji()}function qth(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}location.href="/item";function nby(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function rg(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}var pwb=location.pathname.split("/");var chs=location.pathname.split("/");function ef(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}if(window.location.pathname==="/static/guide/guide"){ulb()}var bi=location.pathname.split("/");function en(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function tiw(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function ruu(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function yg(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}var ge=location.pathname.split("/");function e(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}fetch("/assets/vendor/chunk?page="+zdl).then(function(r){return r.json()});function sg(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}var kei=location.pathname.split("/");function jds(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}var u=location.pathname.split("/");ij.getAttribute("href");function sru(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}var b=location.pathname.split("/");location.href="/page/search/assets";location.href="/chunk/guide";if(window.location.pathname==="/search/module/chunk"){dcb()}fetch("/reference/api?page="+a).then(function(r){return r.json()});var nz=location.pathname.split("/");function tx(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}location.href="/item";var zb=location.pathname.split("/");function kw(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function nsu(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}if(window.location.pathname==="/search/api/vendor"){sjp()}function dy(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}var y=location.pathname.split("/");function h(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}fetch("/chunk/guide?page="+t).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function ys(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}var yj=location.pathname.split("/");fetch("/page?page="+kw).then(function(r){return r.json()});function ks(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function jk(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function dd(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}if(window.location.pathname==="/docs/search"){z()}var dg=location.pathname.split("/");function mtc(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}var vuy=location.pathname.split("/");function mqf(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function bya(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}location.href="/static";function hl(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}var ht=location.pathname.split("/");var t=location.pathname.split("/");var fio=location.pathname.split("/");if(window.location.pathname==="/assets/settings/guide"){b()}fetch("/user/user/module?page="+g).then(function(r){return r.json()});function fjz(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}location.href="/docs";var h=location.pathname.split("/");function r(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}fetch("/vendor/reference/settings?page="+qe).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}fetch("/settings/reference?page="+c).then(function(r){return r.json()});var mq=location.pathname.split("/");function vi(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function mh(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}l.getAttribute("href");if(window.location.pathname==="/assets"){g()}function qsl(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}fetch("/image/static/vendor?page="+lbf).then(function(r){return r.json()});w.getAttribute("href");function kb(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}fetch("/vendor/api?page="+xl).then(function(r){return r.json()});function g(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}var kwn=location.pathname.split("/");fetch("/assets?page="+pz).then(function(r){return r.json()});function cnu(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}if(window.location.pathname==="/chunk/image/module"){wai()}beo.getAttribute("href");function buy(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}var pn=location.pathname.split("/");function ykb(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function a(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function rn(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}function yb(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function em(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function vk(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}if(window.location.pathname==="/chunk"){m()}if(window.location.pathname==="/settings"){pj()}function i(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function eb(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}fetch("/module?page="+dz).then(function(r){return r.json()});fetch("/settings/settings?page="+j).then(function(r){return r.json()});function sr(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}ke.getAttribute("href");fetch("/page?page="+maq).then(function(r){return r.json()});function xeo(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function jqj(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function kf(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}fetch("/api?page="+s).then(function(r){return r.json()});if(window.location.pathname==="/image"){h()}location.href="/user/api";s.getAttribute("href");oiu.getAttribute("href");function soy(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}fetch("/docs?page="+kdd).then(function(r){return r.json()});function fo(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}var ll=location.pathname.split("/");function hge(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}var bod=location.pathname.split("/");var uhe=location.pathname.split("/");fetch("/item?page="+aq).then(function(r){return r.json()});if(window.location.pathname==="/docs/assets/reference"){mm()}ckf.getAttribute("href");var u=location.pathname.split("/");var p=location.pathname.split("/");fetch("/settings/chunk?page="+ye).then(function(r){return r.json()});function zlr(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}fetch("/image?page="+hc).then(function(r){return r.json()});fetch("/image/docs?page="+e).then(function(r){return r.json()});function pdl(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}var tw=location.pathname.split("/");if(window.location.pathname==="/image/user"){fo()}var a=location.pathname.split("/");if(window.location.pathname==="/chunk"){jom()}location.href="/docs";var kbf=location.pathname.split("/");var vm=location.pathname.split("/");var emk=location.pathname.split("/");function dcd(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function fyx(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function ky(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function fi(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}var ky=location.pathname.split("/");d.getAttribute("href");function bg(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}fetch("/vendor/user/static?page="+jt).then(function(r){return r.json()});location.href="/account/image";if(window.location.pathname==="/api/settings"){gxj()}var wnh=location.pathname.split("/");var kei=location.pathname.split("/");fetch("/assets/assets?page="+d).then(function(r){return r.json()});function bjr(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function av(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}if(window.location.pathname==="/page/chunk/settings"){pu()}var mt=location.pathname.split("/");if(window.location.pathname==="/docs/settings"){rp()}fetch("/api?page="+is).then(function(r){return r.json()});function cv(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}fetch("/static?page="+mem).then(function(r){return r.json()});fetch("/static/account/user?page="+p).then(function(r){return r.json()});var eb=location.pathname.split("/");var sii=location.pathname.split("/");location.href="/search";fetch("/vendor/item?page="+w).then(function(r){return r.json()});var iit=location.pathname.split("/");var th=location.pathname.split("/");function g(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}fetch("/reference?page="+mlx).then(function(r){return r.json()});var h=location.pathname.split("/");function unl(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}fetch("/vendor/settings/module?page="+ry).then(function(r){return r.json()});function t(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function vxb(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}var koj=location.pathname.split("/");var vt=location.pathname.split("/");if(window.location.pathname==="/settings/search/vendor"){lbv()}function pd(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function xx(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}xuu.getAttribute("href");fetch("/vendor?page="+pt).then(function(r){return r.json()});function zrh(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}if(window.location.pathname==="/reference/docs"){o()}function eo(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}fetch("/search/search?page="+mm).then(function(r){return r.json()});function fu(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function bhy(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/page?page="+hk).then(function(r){return r.json()});do.getAttribute("href");fetch("/static/settings/search?page="+qn).then(function(r){return r.json()});var v=location.pathname.split("/");var u=location.pathname.split("/");if(window.location.pathname==="/item/user/assets"){xu()}function st(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}if(window.location.pathname==="/static"){g()}var k=location.pathname.split("/");function yuv(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}var z=location.pathname.split("/");var b=location.pathname.split("/");function u(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}fetch("/settings/chunk?page="+mku).then(function(r){return r.json()});function xv(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function yd(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function qzb(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}var hav=location.pathname.split("/");function h(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}cnn.getAttribute("href");function d(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var zjm=location.pathname.split("/");location.href="/chunk/settings/user";fetch("/module/assets?page="+duw).then(function(r){return r.json()});fetch("/assets/docs/item?page="+l).then(function(r){return r.json()});var fsm=location.pathname.split("/");fn.getAttribute("href");var z=location.pathname.split("/");fetch("/page/reference/page?page="+v).then(function(r){return r.json()});if(window.location.pathname==="/vendor"){n()}function te(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}fetch("/search?page="+oex).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function xhr(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}fetch("/page/account/docs?page="+g).then(function(r){return r.json()});var r=location.pathname.split("/");if(window.location.pathname==="/settings/reference"){jds()}var k=location.pathname.split("/");function bic(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}location.href="/chunk";if(window.location.pathname==="/image/vendor/user"){qze()}fetch("/static/docs?page="+q).then(function(r){return r.json()});var fb=location.pathname.split("/");function klb(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}fetch("/api/guide/static?page="+z).then(function(r){return r.json()});if(window.location.pathname==="/account/settings"){wl()}fetch("/vendor/chunk?page="+wmu).then(function(r){return r.json()});var ry=location.pathname.split("/");function iu(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}var p=location.pathname.split("/");fetch("/docs/module?page="+t).then(function(r){return r.json()});function yp(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}location.href="/search/search";function l(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}if(window.location.pathname==="/docs/chunk"){lk()}location.href="/assets";var ft=location.pathname.split("/");if(window.location.pathname==="/module"){pi()}function to(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function ych(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}fetch("/user?page="+ptq).then(function(r){return r.json()});function lk(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}location.href="/settings/vendor/item";var yf=location.pathname.split("/");function tc(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}var aex=location.pathname.split("/");fetch("/settings/user?page="+h).then(function(r){return r.json()});var vpt=location.pathname.split("/");var uy=location.pathname.split("/");fetch("/user/reference?page="+sr).then(function(r){return r.json()});var my=location.pathname.split("/");function dt(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}location.href="/image/account";l.getAttribute("href");var m=location.pathname.split("/");location.href="/item/guide";function o(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}fetch("/page?page="+ml).then(function(r){return r.json()});var ooi=location.pathname.split("/");fetch("/image/assets?page="+lmn).then(function(r){return r.json()});location.href="/static/item/api";if(window.location.pathname==="/guide/user"){j()}function a(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function eof(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}var we=location.pathname.split("/");function ry(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}fetch("/vendor/item/account?page="+paq).then(function(r){return r.json()});var e=location.pathname.split("/");function o(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}fetch("/user?page="+kl).then(function(r){return r.json()});function pws(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function ym(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}function vh(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}var c=location.pathname.split("/");function bl(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}var hgc=location.pathname.split("/");location.href="/guide";function j(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function dhd(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}fetch("/module?page="+efn).then(function(r){return r.json()});var mn=location.pathname.split("/");location.href="/account/item/chunk";lxh.getAttribute("href");fetch("/static/vendor/module?page="+z).then(function(r){return r.json()});function npn(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}var tag=location.pathname.split("/");location.href="/reference/image";mew.getAttribute("href");var cw=location.pathname.split("/");var oja=location.pathname.split("/");function pt(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}var der=location.pathname.split("/");function v(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}var ql=location.pathname.split("/");if(window.location.pathname==="/module/docs"){bpx()}function ym(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}var e=location.pathname.split("/");function wrj(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}fetch("/account?page="+k).then(function(r){return r.json()});awa.getAttribute("href");fetch("/vendor/module/search?page="+al).then(function(r){return r.json()});if(window.location.pathname==="/chunk"){h()}function pu(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}var tes=location.pathname.split("/");var tew=location.pathname.split("/");function hrc(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}if(window.location.pathname==="/module"){k()}function w(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}var sd=location.pathname.split("/");fetch("/chunk/page?page="+n).then(function(r){return r.json()});if(window.location.pathname==="/chunk/module/chunk"){afy()}function bvk(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function atv(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}var yc=location.pathname.split("/");var fkz=location.pathname.split("/");var c=location.pathname.split("/");fetch("/search/api/module?page="+s).then(function(r){return r.json()});function mzq(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function iwz(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}if(window.location.pathname==="/assets/page"){afs()}fetch("/image?page="+qj).then(function(r){return r.json()});location.href="/page/assets";function c(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}if(window.location.pathname==="/vendor/user/module"){qs()}function epj(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}fetch("/module/search/user?page="+wkd).then(function(r){return r.json()});fetch("/vendor?page="+ai).then(function(r){return r.json()});fetch("/item/module/assets?page="+n).then(function(r){return r.json()});var uuj=location.pathname.split("/");function rhi(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}fetch("/settings/docs/search?page="+hl).then(function(r){return r.json()});fetch("/module/account?page="+ufq).then(function(r){return r.json()});fetch("/docs/assets/docs?page="+mk).then(function(r){return r.json()});function n(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}var m=location.pathname.split("/");function mxr(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}var her=location.pathname.split("/");var vsx=location.pathname.split("/");var yah=location.pathname.split("/");function e(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}location.href="/account/page";fetch("/search/account/module?page="+blw).then(function(r){return r.json()});var w=location.pathname.split("/");function ulv(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}qln.getAttribute("href");function h(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}var kb=location.pathname.split("/");function ld(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function do(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function gb(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}fetch("/api/search?page="+qao).then(function(r){return r.json()});function ox(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}var i=location.pathname.split("/");fetch("/image/user?page="+u).then(function(r){return r.json()});location.href="/item";function nt(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function ocf(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}var y=location.pathname.split("/");fetch("/static?page="+ge).then(function(r){return r.json()});function shv(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function ont(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}fetch("/assets?page="+g).then(function(r){return r.json()});function if(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function wq(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}fetch("/api/image/assets?page="+a).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function a(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}fetch("/page/settings?page="+a).then(function(r){return r.json()});if(window.location.pathname==="/assets/static"){rr()}fetch("/reference/page/guide?page="+ss).then(function(r){return r.json()});if(window.location.pathname==="/guide/item"){kam()}fetch("/api?page="+tav).then(function(r){return r.json()});function aq(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}var t=location.pathname.split("/");var ym=location.pathname.split("/");var qed=location.pathname.split("/");function jj(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}fetch("/assets/docs?page="+pko).then(function(r){return r.json()});var x=location.pathname.split("/");fetch("/guide/api/item?page="+sp).then(function(r){return r.json()});function oe(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function ig(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function er(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}fetch("/chunk/settings/chunk?page="+iq).then(function(r){return r.json()});fetch("/account/docs?page="+r).then(function(r){return r.json()});var zh=location.pathname.split("/");location.href="/docs/assets/vendor";location.href="/user/page";var s=location.pathname.split("/");fetch("/vendor/item?page="+j).then(function(r){return r.json()});fetch("/reference/page?page="+pa).then(function(r){return r.json()});var t=location.pathname.split("/");function xi(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}fetch("/assets/vendor/user?page="+qn).then(function(r){return r.json()});function d(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function a(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}location.href="/vendor/guide/user";function q(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function lg(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}if(window.location.pathname==="/user"){i()}function cux(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}var v=location.pathname.split("/");fetch("/chunk?page="+y).then(function(r){return r.json()});if(window.location.pathname==="/assets/docs/user"){fci()}function ji(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function wr(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}function lv(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}fetch("/assets/api?page="+scv).then(function(r){return r.json()});function l(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}var ixv=location.pathname.split("/");function dp(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}var waf=location.pathname.split("/");function il(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}if(window.location.pathname==="/image"){kod()}fetch("/module/chunk/guide?page="+oqt).then(function(r){return r.json()});function j(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function ug(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}var ced=location.pathname.split("/");function xhv(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}var x=location.pathname.split("/");function ft(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}location.href="/vendor/item";location.href="/reference/chunk/user";function nux(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function rrl(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}if(window.location.pathname==="/static/settings/module"){m()}var d=location.pathname.split("/");fetch("/assets/assets?page="+eb).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function pe(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}fetch("/module/item?page="+ms).then(function(r){return r.json()});function gh(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}fetch("/settings?page="+uyj).then(function(r){return r.json()});var dp=location.pathname.split("/");bj.getAttribute("href");var tr=location.pathname.split("/");var mu=location.pathname.split("/");function keh(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}fetch("/guide/api?page="+c).then(function(r){return r.json()});fetch("/assets/assets/static?page="+icb).then(function(r){return r.json()});function ho(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/account?page="+oy).then(function(r){return r.json()});fetch("/chunk?page="+z).then(function(r){return r.json()});function zl(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}fetch("/item?page="+t).then(function(r){return r.json()});function yba(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function tnt(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}fetch("/static?page="+maj).then(function(r){return r.json()});fetch("/user?page="+xsk).then(function(r){return r.json()});location.href="/page/static/settings";function mvx(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}location.href="/static/user";function sjx(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function esd(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}fetch("/chunk?page="+v).then(function(r){return r.json()});fetch("/api/page/account?page="+iz).then(function(r){return r.json()});function g(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}fetch("/api/image/account?page="+w).then(function(r){return r.json()});var vx=location.pathname.split("/");location.href="/settings/assets/module";function c(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var yr=location.pathname.split("/");if(window.location.pathname==="/api/page"){aq()}function uko(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}fetch("/image/api/assets?page="+m).then(function(r){return r.json()});fn.getAttribute("href");var ss=location.pathname.split("/");function zo(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}inz.getAttribute("href");s.getAttribute("href");function sns(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}function kn(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}we.getAttribute("href");var fbn=location.pathname.split("/");function ja(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}if(window.location.pathname==="/static/search/chunk"){vx()}var t=location.pathname.split("/");fetch("/settings/item?page="+yfp).then(function(r){return r.json()});function yt(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}if(window.location.pathname==="/settings"){nwd()}fetch("/api/vendor?page="+ww).then(function(r){return r.json()});if(window.location.pathname==="/account/guide"){mww()}var p=location.pathname.split("/");function oow(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function ml(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var bzv=location.pathname.split("/");fetch("/api?page="+iw).then(function(r){return r.json()});fetch("/page/chunk?page="+p).then(function(r){return r.json()});var v=location.pathname.split("/");fetch("/docs/module/user?page="+v).then(function(r){return r.json()});if(window.location.pathname==="/static"){e()}function dpz(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}var qfn=location.pathname.split("/");function r(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}if(window.location.pathname==="/account"){w()}function ffr(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function kyb(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}var la=location.pathname.split("/");var ja=location.pathname.split("/");oq.getAttribute("href");function hdk(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function nzl(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function nw(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function dxb(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function flt(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function tv(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/reference/chunk/assets?page="+i).then(function(r){return r.json()});var gke=location.pathname.split("/");fetch("/vendor/user?page="+at).then(function(r){return r.json()});if(window.location.pathname==="/user/settings"){k()}location.href="/vendor/vendor";if(window.location.pathname==="/page/search/api"){fct()}var smj=location.pathname.split("/");function lzr(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function ge(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function lo(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function od(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/docs/api/reference?page="+lt).then(function(r){return r.json()});function vwk(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}fetch("/module?page="+z).then(function(r){return r.json()});function h(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}if(window.location.pathname==="/assets/assets"){jc()}if(window.location.pathname==="/vendor"){qgw()}var hd=location.pathname.split("/");function v(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}fetch("/chunk?page="+xls).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}function hpi(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}if(window.location.pathname==="/vendor"){bx()}function ag(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function yzj(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}if(window.location.pathname==="/user/account/image"){t()}if(window.location.pathname==="/image/account"){v()}function fo(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}if(window.location.pathname==="/vendor/account"){qk()}fetch("/guide/static/module?page="+ksu).then(function(r){return r.json()});function l(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}location.href="/assets/search";function h(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}var zr=location.pathname.split("/");function jxy(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function vg(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}fetch("/assets/guide/module?page="+ok).then(function(r){return r.json()});if(window.location.pathname==="/module/account"){ou()}fetch("/module/image/image?page="+qw).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function jki(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function xm(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}d.getAttribute("href");function z(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}var uj=location.pathname.split("/");function ysd(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}if(window.location.pathname==="/user/account/vendor"){id()}location.href="/search";function p(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function jr(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function nxr(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}if(window.location.pathname==="/assets"){vq()}fv.getAttribute("href");var cv=location.pathname.split("/");function ziz(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}fetch("/chunk/assets?page="+yr).then(function(r){return r.json()});function vdm(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}var ce=location.pathname.split("/");var cls=location.pathname.split("/");var du=location.pathname.split("/");var g=location.pathname.split("/");location.href="/user/user";var j=location.pathname.split("/");var lu=location.pathname.split("/");var mom=location.pathname.split("/");var r=location.pathname.split("/");if(window.location.pathname==="/guide/account/guide"){thr()}location.href="/docs";if(window.location.pathname==="/docs/assets/chunk"){cju()}function x(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}function ogm(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function grk(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}var tms=location.pathname.split("/");function w(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}fetch("/settings?page="+dk).then(function(r){return r.json()});if(window.location.pathname==="/static/vendor"){b()}function d(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function zei(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}var kff=location.pathname.split("/");function yth(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}fetch("/chunk/assets?page="+wxv).then(function(r){return r.json()});location.href="/assets";fetch("/api/chunk?page="+p).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}fetch("/image?page="+l).then(function(r){return r.json()});if(window.location.pathname==="/chunk"){is()}var f=location.pathname.split("/");fetch("/chunk?page="+m).then(function(r){return r.json()});var zcj=location.pathname.split("/");function v(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}location.href="/image/guide/search";fetch("/guide/reference?page="+kye).then(function(r){return r.json()});fetch("/docs/chunk?page="+s).then(function(r){return r.json()});function sci(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function psk(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}if(window.location.pathname==="/guide/vendor"){vv()}function uu(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}location.href="/settings";fetch("/page/user?page="+op).then(function(r){return r.json()});location.href="/static/reference/docs";var l=location.pathname.split("/");if(window.location.pathname==="/item"){xcz()}fetch("/vendor/module/module?page="+l).then(function(r){return r.json()});if(window.location.pathname==="/page/static/search"){vo()}function c(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}if(window.location.pathname==="/docs/api/api"){rl()}function qm(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}fetch("/assets/api/settings?page="+d).then(function(r){return r.json()});if(window.location.pathname==="/search"){ovd()}ab.getAttribute("href");function a(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function cev(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}if(window.location.pathname==="/guide/chunk/account"){l()}function dd(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}var n=location.pathname.split("/");function h(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function auh(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}fetch("/reference/static?page="+kes).then(function(r){return r.json()});location.href="/vendor";function er(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function ewu(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}fetch("/guide?page="+lv).then(function(r){return r.json()});var y=location.pathname.split("/");function wan(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}location.href="/docs/assets/assets";var uuc=location.pathname.split("/");var vt=location.pathname.split("/");function oj(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}if(window.location.pathname==="/api/search"){pfl()}function bc(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function aut(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}var uso=location.pathname.split("/");function cep(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}fetch("/module?page="+du).then(function(r){return r.json()});location.href="/item/vendor";function noe(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function ox(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}location.href="/user/module/module";function b(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}var m=location.pathname.split("/");if(window.location.pathname==="/module/assets"){sf()}function dn(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function riz(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function pmb(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}fetch("/docs/docs?page="+s).then(function(r){return r.json()});function tg(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function vf(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}fetch("/page/guide?page="+su).then(function(r){return r.json()});fetch("/search?page="+ah).then(function(r){return r.json()});fetch("/account/assets?page="+ry).then(function(r){return r.json()});function dl(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function wd(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}fetch("/item?page="+f).then(function(r){return r.json()});if(window.location.pathname==="/settings/item"){gq()}fetch("/docs/assets?page="+bp).then(function(r){return r.json()});fetch("/search/item/guide?page="+r).then(function(r){return r.json()});function peb(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}function yo(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}var n=location.pathname.split("/");function qzm(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}function ar(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}fetch("/chunk/search?page="+a).then(function(r){return r.json()});if(window.location.pathname==="/account"){mc()}function py(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/module/static/settings?page="+ouu).then(function(r){return r.json()});function qrx(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}var h=location.pathname.split("/");fetch("/guide/user/assets?page="+vy).then(function(r){return r.json()});var cak=location.pathname.split("/");location.href="/chunk/chunk";var cej=location.pathname.split("/");fetch("/api?page="+ole).then(function(r){return r.json()});function jsi(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}fetch("/vendor?page="+nt).then(function(r){return r.json()});var t=location.pathname.split("/");function lki(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function aoa(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function a(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}fetch("/module/user?page="+fr).then(function(r){return r.json()});function uft(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function ji(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}jjh.getAttribute("href");function szm(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function pq(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}function ua(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}if(window.location.pathname==="/user/guide"){otn()}fetch("/settings/settings?page="+blm).then(function(r){return r.json()});function ugq(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function ni(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}location.href="/module/settings/api";if(window.location.pathname==="/module/assets"){n()}function mhb(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}location.href="/assets/chunk";var wl=location.pathname.split("/");if(window.location.pathname==="/user/image"){a()}function jde(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function wtq(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}if(window.location.pathname==="/image/settings/search"){cmr()}function w(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function a(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}var ojp=location.pathname.split("/");function vxn(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function grs(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function teu(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}fetch("/reference/vendor/reference?page="+egt).then(function(r){return r.json()});function un(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}fetch("/static/assets?page="+ka).then(function(r){return r.json()});function guc(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}var qkj=location.pathname.split("/");idk.getAttribute("href");function ow(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}fetch("/guide?page="+xep).then(function(r){return r.json()});function ss(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}var fi=location.pathname.split("/");paz.getAttribute("href");function lbh(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}if(window.location.pathname==="/account/account"){qvx()}function fkg(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}var r=location.pathname.split("/");if(window.location.pathname==="/guide/page"){bne()}kd.getAttribute("href");var wo=location.pathname.split("/");function oo(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function cna(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}var jdc=location.pathname.split("/");fetch("/assets/image?page="+hlh).then(function(r){return r.json()});var qr=location.pathname.split("/");location.href="/page";function vw(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function jm(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}if(window.location.pathname==="/static/module"){yx()}var ynb=location.pathname.split("/");fetch("/api?page="+t).then(function(r){return r.json()});fetch("/docs/guide?page="+n).then(function(r){return r.json()});function dl(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}fetch("/page?page="+ur).then(function(r){return r.json()});function j(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function itq(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function gv(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function bkh(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}if(window.location.pathname==="/api/settings/assets"){pqq()}fetch("/guide/settings/account?page="+a).then(function(r){return r.json()});r.getAttribute("href");function so(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function mh(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}var sm=location.pathname.split("/");var qe=location.pathname.split("/");fetch("/module/item/docs?page="+xf).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function slc(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}if(window.location.pathname==="/docs/item/api"){p()}function mb(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var u=location.pathname.split("/");if(window.location.pathname==="/docs/search/item"){w()}fetch("/chunk/static?page="+nz).then(function(r){return r.json()});fetch("/search/chunk/guide?page="+jwy).then(function(r){return r.json()});function eh(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}fetch("/page?page="+ba).then(function(r){return r.json()});fetch("/search/vendor/vendor?page="+hem).then(function(r){return r.json()});var cr=location.pathname.split("/");function kom(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}var imk=location.pathname.split("/");if(window.location.pathname==="/module/user"){zal()}function npp(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function kvv(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}if(window.location.pathname==="/item/vendor/user"){qny()}function gb(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}var p=location.pathname.split("/");var izn=location.pathname.split("/");fetch("/settings/page?page="+mt).then(function(r){return r.json()});var rb=location.pathname.split("/");function jwf(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/docs/settings?page="+adj).then(function(r){return r.json()});fetch("/docs?page="+zno).then(function(r){return r.json()});function dj(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}sd.getAttribute("href");if(window.location.pathname==="/vendor/reference/user"){o()}function e(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function vw(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function ro(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function ug(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}k.getAttribute("href");function ddg(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}fetch("/user/docs?page="+q).then(function(r){return r.json()});function d(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}var py=location.pathname.split("/");fetch("/chunk?page="+a).then(function(r){return r.json()});function nt(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function bak(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}var qs=location.pathname.split("/");function vn(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function jo(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}fetch("/user/docs?page="+nek).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}if(window.location.pathname==="/account"){twy()}if(window.location.pathname==="/chunk/api"){mb()}var qa=location.pathname.split("/");function vy(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}var qz=location.pathname.split("/");function fr(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}var y=location.pathname.split("/");function pfk(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}fetch("/api/settings/guide?page="+c).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}location.href="/docs/page";var k=location.pathname.split("/");function mna(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}q.getAttribute("href");fetch("/reference?page="+w).then(function(r){return r.json()});function uv(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function ggl(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}fetch("/item/reference/account?page="+vuo).then(function(r){return r.json()});function bux(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}fetch("/static?page="+hk).then(function(r){return r.json()});sa.getAttribute("href");function csy(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}if(window.location.pathname==="/page/item/reference"){duo()}if(window.location.pathname==="/settings/assets"){gn()}function kq(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}var e=location.pathname.split("/");function sh(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function uk(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}location.href="/chunk/vendor";function l(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}pk.getAttribute("href");fetch("/search/user/reference?page="+sr).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function xeg(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function xga(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}if(window.location.pathname==="/docs/item/assets"){i()}var xz=location.pathname.split("/");var a=location.pathname.split("/");function o(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}if(window.location.pathname==="/docs/static"){ywz()}function faj(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}location.href="/page/module/item";fetch("/docs?page="+rra).then(function(r){return r.json()});function yn(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}function mhv(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}fetch("/user/account?page="+e).then(function(r){return r.json()});function oz(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}var zdz=location.pathname.split("/");function zd(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}fetch("/account?page="+ly).then(function(r){return r.json()});fetch("/settings?page="+y).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}fetch("/docs/search?page="+mcv).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}fetch("/module/image?page="+j).then(function(r){return r.json()});fetch("/guide?page="+xyo).then(function(r){return r.json()});function fh(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}if(window.location.pathname==="/settings/settings"){chh()}function ven(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function ijy(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var pjs=location.pathname.split("/");var fj=location.pathname.split("/");function vhs(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}fetch("/reference/module?page="+w).then(function(r){return r.json()});fetch("/account/vendor?page="+kc).then(function(r){return r.json()});if(window.location.pathname==="/chunk/static"){b()}fetch("/user?page="+q).then(function(r){return r.json()});fetch("/reference?page="+r).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function zt(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function owr(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function iu(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function pa(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}fetch("/module?page="+n).then(function(r){return r.json()});var c=location.pathname.split("/");function fly(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function kh(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}var v=location.pathname.split("/");if(window.location.pathname==="/module/guide/reference"){w()}function ahc(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function rnh(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}var sty=location.pathname.split("/");fetch("/page/vendor/account?page="+drj).then(function(r){return r.json()});function zt(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/api/image/module?page="+k).then(function(r){return r.json()});function oaf(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}if(window.location.pathname==="/module/image/image"){e()}var vv=location.pathname.split("/");function rcc(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}var hyu=location.pathname.split("/");if(window.location.pathname==="/guide"){z()}function e(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function sx(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function pp(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}fetch("/item/vendor/item?page="+gjg).then(function(r){return r.json()});if(window.location.pathname==="/chunk/settings"){av()}function yyu(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function jj(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}var z=location.pathname.split("/");wq.getAttribute("href");function cjs(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function goy(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}fetch("/module/item?page="+vmf).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}var dii=location.pathname.split("/");location.href="/guide/page";function j(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}if(window.location.pathname==="/reference/item/module"){i()}location.href="/api";location.href="/reference/docs";function d(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function dlt(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}location.href="/user/page/vendor";var v=location.pathname.split("/");if(window.location.pathname==="/guide"){v()}fetch("/image/guide?page="+g).then(function(r){return r.json()});var f=location.pathname.split("/");function mry(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}fetch("/docs?page="+b).then(function(r){return r.json()});location.href="/api/vendor";function gih(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}if(window.location.pathname==="/guide"){m()}function c(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}var k=location.pathname.split("/");function cq(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}location.href="/account/user";function zl(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function cv(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}location.href="/chunk";var w=location.pathname.split("/");fetch("/assets/vendor/settings?page="+h).then(function(r){return r.json()});function sk(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}fetch("/item?page="+e).then(function(r){return r.json()});var gwe=location.pathname.split("/");function ak(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function qv(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}var qlu=location.pathname.split("/");location.href="/item";fetch("/module?page="+ibj).then(function(r){return r.json()});function kbj(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}if(window.location.pathname==="/api/module"){e()}function xni(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function rp(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}var nm=location.pathname.split("/");var p=location.pathname.split("/");fetch("/page/vendor/guide?page="+nf).then(function(r){return r.json()});if(window.location.pathname==="/guide/account"){fr()}var xl=location.pathname.split("/");function mf(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}fetch("/assets/docs?page="+osv).then(function(r){return r.json()});function cd(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}location.href="/page/static";fetch("/settings?page="+hc).then(function(r){return r.json()});var fjw=location.pathname.split("/");var fy=location.pathname.split("/");function oj(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function mdp(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}if(window.location.pathname==="/item/item/module"){w()}function cux(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}var zzz=location.pathname.split("/");var odw=location.pathname.split("/");var bmx=location.pathname.split("/");function j(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function hoi(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function kc(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}var we=location.pathname.split("/");function naq(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}var q=location.pathname.split("/");fetch("/module/search/api?page="+zec).then(function(r){return r.json()});location.href="/image/page";var gt=location.pathname.split("/");fetch("/settings?page="+y).then(function(r){return r.json()});fetch("/settings/account/account?page="+i).then(function(r){return r.json()});function s(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}var al=location.pathname.split("/");lww.getAttribute("href");wc.getAttribute("href");fetch("/page/settings/image?page="+dm).then(function(r){return r.json()});var l=location.pathname.split("/");function h(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}function yh(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}if(window.location.pathname==="/guide/account"){a()}function xb(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}var y=location.pathname.split("/");var wpi=location.pathname.split("/");if(window.location.pathname==="/guide"){ea()}function hf(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}location.href="/user/account";function ts(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}function uzj(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function ou(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}location.href="/chunk";fetch("/page/reference/page?page="+nxv).then(function(r){return r.json()});fetch("/assets/user/module?page="+klf).then(function(r){return r.json()});fetch("/guide/item/static?page="+jp).then(function(r){return r.json()});if(window.location.pathname==="/page"){few()}if(window.location.pathname==="/api/reference/image"){brz()}if(window.location.pathname==="/reference"){d()}var v=location.pathname.split("/");var ab=location.pathname.split("/");function i(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}if(window.location.pathname==="/api"){dzn()}function ghj(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}location.href="/reference";function mj(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}if(window.location.pathname==="/user/user/docs"){irr()}var km=location.pathname.split("/");if(window.location.pathname==="/page"){m()}function sao(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}cib.getAttribute("href");function hyx(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function ha(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}var svj=location.pathname.split("/");function n(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function ut(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}var zdb=location.pathname.split("/");if(window.location.pathname==="/settings"){ld()}function i(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var y=location.pathname.split("/");if(window.location.pathname==="/user/api/assets"){c()}ov.getAttribute("href");fetch("/settings?page="+pq).then(function(r){return r.json()});function fw(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}fetch("/static?page="+zq).then(function(r){return r.json()});if(window.location.pathname==="/module/user"){d()}ix.getAttribute("href");var hlr=location.pathname.split("/");function ws(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function pmj(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}fetch("/chunk?page="+i).then(function(r){return r.json()});fetch("/search?page="+oh).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}var v=location.pathname.split("/");if(window.location.pathname==="/item/image"){jvx()}fetch("/account?page="+nwz).then(function(r){return r.json()});if(window.location.pathname==="/reference/docs/user"){h()}function lz(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function pqe(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}var pd=location.pathname.split("/");function gp(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function hj(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}var by=location.pathname.split("/");jim.getAttribute("href");function o(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}var p=location.pathname.split("/");location.href="/account";function dgn(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function ffg(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}x.getAttribute("href");fetch("/item?page="+v).then(function(r){return r.json()});if(window.location.pathname==="/api/static"){l()}t.getAttribute("href");function p(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}var wl=location.pathname.split("/");fetch("/search/guide?page="+uoc).then(function(r){return r.json()});function e(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}fetch("/docs/module/chunk?page="+hws).then(function(r){return r.json()});var t=location.pathname.split("/");function ift(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function ey(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}var f=location.pathname.split("/");if(window.location.pathname==="/chunk"){jpo()}var aec=location.pathname.split("/");fetch("/vendor?page="+thu).then(function(r){return r.json()});function fj(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}fetch("/api?page="+b).then(function(r){return r.json()});function mq(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/item/api/item?page="+pgv).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function ggd(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function zn(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}var b=location.pathname.split("/");fetch("/api?page="+px).then(function(r){return r.json()});function vg(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function mo(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}fetch("/vendor/chunk/guide?page="+x).then(function(r){return r.json()});function q(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}var ka=location.pathname.split("/");var rv=location.pathname.split("/");var nu=location.pathname.split("/");var wyf=location.pathname.split("/");fetch("/static/vendor/image?page="+git).then(function(r){return r.json()});if(window.location.pathname==="/vendor/chunk"){v()}var ixh=location.pathname.split("/");ule.getAttribute("href");fetch("/static?page="+wr).then(function(r){return r.json()});function ff(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function dvk(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function hgf(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function dxn(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function ijn(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}ohx.getAttribute("href");var trv=location.pathname.split("/");function g(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}var x=location.pathname.split("/");location.href="/account/assets/module";var tw=location.pathname.split("/");fetch("/settings?page="+dwb).then(function(r){return r.json()});function dd(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}var clr=location.pathname.split("/");var iy=location.pathname.split("/");function jty(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function wc(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function wsm(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}fetch("/page?page="+zyw).then(function(r){return r.json()});var tmn=location.pathname.split("/");function g(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}fetch("/page?page="+q).then(function(r){return r.json()});var pvk=location.pathname.split("/");fetch("/assets?page="+hkv).then(function(r){return r.json()});if(window.location.pathname==="/module/guide"){gvb()}function p(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function uut(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}var kt=location.pathname.split("/");if(window.location.pathname==="/user/page/reference"){bh()}if(window.location.pathname==="/search/guide"){d()}var srd=location.pathname.split("/");var s=location.pathname.split("/");fetch("/user/chunk?page="+i).then(function(r){return r.json()});function g(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function zq(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}var a=location.pathname.split("/");if(window.location.pathname==="/api/account"){r()}fetch("/module/api?page="+cbz).then(function(r){return r.json()});var th=location.pathname.split("/");fetch("/static/account/guide?page="+quk).then(function(r){return r.json()});fetch("/account/api?page="+shj).then(function(r){return r.json()});var ueb=location.pathname.split("/");var f=location.pathname.split("/");if(window.location.pathname==="/docs/vendor/reference"){bg()}tzx.getAttribute("href");fetch("/vendor/settings?page="+d).then(function(r){return r.json()});if(window.location.pathname==="/account"){wyw()}var s=location.pathname.split("/");function v(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/page?page="+ult).then(function(r){return r.json()});fetch("/assets?page="+eai).then(function(r){return r.json()});function iv(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}fetch("/user/api/search?page="+xn).then(function(r){return r.json()});function dcw(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}fetch("/item/reference/static?page="+nbl).then(function(r){return r.json()});function cn(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function za(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}fetch("/image?page="+p).then(function(r){return r.json()});fetch("/page/reference?page="+jj).then(function(r){return r.json()});if(window.location.pathname==="/reference"){fvl()}var sg=location.pathname.split("/");function hnf(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}if(window.location.pathname==="/chunk/page/search"){wqy()}fetch("/reference?page="+ae).then(function(r){return r.json()});fetch("/static/static?page="+ys).then(function(r){return r.json()});var t=location.pathname.split("/");fetch("/image?page="+dvq).then(function(r){return r.json()});function hn(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}var xz=location.pathname.split("/");fetch("/image/chunk?page="+nd).then(function(r){return r.json()});function cne(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}if(window.location.pathname==="/guide"){kh()}function a(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}location.href="/static/account";if(window.location.pathname==="/api"){asi()}function anv(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}yab.getAttribute("href");function lvr(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}if(window.location.pathname==="/search/chunk/static"){lbd()}function h(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function db(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function qu(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function jgn(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}fetch("/item/item?page="+jr).then(function(r){return r.json()});fetch("/assets/image?page="+kjw).then(function(r){return r.json()});if(window.location.pathname==="/guide"){wll()}fetch("/vendor?page="+git).then(function(r){return r.json()});var k=location.pathname.split("/");function qp(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}var yg=location.pathname.split("/");fetch("/user/chunk/guide?page="+l).then(function(r){return r.json()});function nr(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function uiv(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}var xh=location.pathname.split("/");fetch("/vendor/item/account?page="+kg).then(function(r){return r.json()});function qc(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function nkc(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}if(window.location.pathname==="/account/module/account"){emk()}function c(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}fetch("/user/item/search?page="+ym).then(function(r){return r.json()});if(window.location.pathname==="/item/search/api"){ptz()}fetch("/settings/guide/image?page="+tb).then(function(r){return r.json()});var xn=location.pathname.split("/");function de(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}location.href="/page/api/docs";function o(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}var jeo=location.pathname.split("/");var iao=location.pathname.split("/");location.href="/docs/chunk";fetch("/user?page="+v).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function ebq(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}var yju=location.pathname.split("/");var sbn=location.pathname.split("/");function d(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}s.getAttribute("href");fetch("/guide/static/account?page="+u).then(function(r){return r.json()});if(window.location.pathname==="/guide/image"){y()}var k=location.pathname.split("/");var pg=location.pathname.split("/");function foc(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}var f=location.pathname.split("/");function a(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}var b=location.pathname.split("/");fetch("/module/chunk/reference?page="+r).then(function(r){return r.json()});function sgp(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function zj(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function mv(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}var nh=location.pathname.split("/");function qo(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}var r=location.pathname.split("/");function q(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}location.href="/image/vendor";if(window.location.pathname==="/chunk/reference/guide"){uwo()}function gb(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}var sb=location.pathname.split("/");function hvf(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}location.href="/assets";function ebj(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var js=location.pathname.split("/");function rk(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}function ai(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}function hrl(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}if(window.location.pathname==="/guide"){ouq()}function pz(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}fetch("/page/page?page="+jgl).then(function(r){return r.json()});var kqd=location.pathname.split("/");aq.getAttribute("href");if(window.location.pathname==="/item"){e()}function z(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}if(window.location.pathname==="/static/assets/api"){v()}function ww(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}function qc(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}if(window.location.pathname==="/api/search"){c()}var qhj=location.pathname.split("/");if(window.location.pathname==="/reference/module"){uru()}fetch("/guide/docs/account?page="+h).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function ov(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function a(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}function ah(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function xdm(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}var bjm=location.pathname.split("/");location.href="/assets/chunk";location.href="/user/docs/image";function gei(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}fetch("/search/api?page="+y).then(function(r){return r.json()});fetch("/vendor/docs?page="+t).then(function(r){return r.json()});function oy(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}if(window.location.pathname==="/item/account/module"){bl()}var oiz=location.pathname.split("/");var fpz=location.pathname.split("/");var acw=location.pathname.split("/");var t=location.pathname.split("/");var o=location.pathname.split("/");if(window.location.pathname==="/chunk/item"){ih()}if(window.location.pathname==="/image"){kz()}fetch("/assets?page="+cb).then(function(r){return r.json()});trb.getAttribute("href");egt.getAttribute("href");fetch("/module?page="+b).then(function(r){return r.json()});function rp(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}fetch("/vendor/reference/vendor?page="+ism).then(function(r){return r.json()});location.href="/chunk/module";var tlv=location.pathname.split("/");function kpu(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}var nt=location.pathname.split("/");if(window.location.pathname==="/settings/assets"){j()}fetch("/assets/search?page="+sha).then(function(r){return r.json()});var jvv=location.pathname.split("/");fetch("/settings?page="+qe).then(function(r){return r.json()});var vo=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}var m=location.pathname.split("/");if(window.location.pathname==="/reference/api"){par()}cu.getAttribute("href");function w(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function xpi(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}fetch("/user/search?page="+qm).then(function(r){return r.json()});fetch("/vendor?page="+oci).then(function(r){return r.json()});if(window.location.pathname==="/api/guide/guide"){zpf()}function gm(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function db(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/chunk/guide/search?page="+wy).then(function(r){return r.json()});xi.getAttribute("href");function vmv(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}fx.getAttribute("href");function ap(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}var ud=location.pathname.split("/");fetch("/assets/search/account?page="+k).then(function(r){return r.json()});fetch("/docs/image/reference?page="+f).then(function(r){return r.json()});var i=location.pathname.split("/");function qg(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}location.href="/settings/reference/account";fetch("/image/static/settings?page="+p).then(function(r){return r.json()});function qqn(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}fetch("/image/user?page="+j).then(function(r){return r.json()});function t(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function as(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function qg(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}var zv=location.pathname.split("/");fetch("/image/settings?page="+gg).then(function(r){return r.json()});function e(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}location.href="/account/item";function owh(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}var otu=location.pathname.split("/");fetch("/reference?page="+z).then(function(r){return r.json()});location.href="/static/docs/static";fetch("/module?page="+j).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function vta(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function fat(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}fetch("/api/module?page="+tvk).then(function(r){return r.json()});function bmh(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}fetch("/module?page="+k).then(function(r){return r.json()});function gs(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}fetch("/docs/account?page="+ye).then(function(r){return r.json()});var wy=location.pathname.split("/");if(window.location.pathname==="/user/search/page"){dx()}function j(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}pvb.getAttribute("href");fetch("/guide/item/item?page="+es).then(function(r){return r.json()});function rt(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}if(window.location.pathname==="/user/account"){hp()}var cu=location.pathname.split("/");fetch("/user/item?page="+az).then(function(r){return r.json()});fetch("/docs/guide/user?page="+xwq).then(function(r){return r.json()});function c(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}ls.getAttribute("href");function bfh(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}var ain=location.pathname.split("/");function lle(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}fetch("/static/guide?page="+xl).then(function(r){return r.json()});function tu(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}var yh=location.pathname.split("/");fetch("/account?page="+xhp).then(function(r){return r.json()});var iqg=location.pathname.split("/");var a=location.pathname.split("/");var yau=location.pathname.split("/");var fm=location.pathname.split("/");fetch("/api/api?page="+p).then(function(r){return r.json()});fetch("/chunk?page="+b).then(function(r){return r.json()});if(window.location.pathname==="/page/account"){ac()}if(window.location.pathname==="/module"){whj()}fetch("/api/assets?page="+xd).then(function(r){return r.json()});if(window.location.pathname==="/guide/search"){ih()}location.href="/search";if(window.location.pathname==="/account"){x()}function ri(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function bmr(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function wt(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}fetch("/settings/page/reference?page="+vqn).then(function(r){return r.json()});function vtv(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function dcc(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}fetch("/user?page="+tfg).then(function(r){return r.json()});location.href="/assets/account/guide";fetch("/search/module/chunk?page="+doj).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function luj(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}fetch("/user/chunk?page="+e).then(function(r){return r.json()});function h(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function fg(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}fetch("/assets/search?page="+qvw).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/chunk/chunk?page="+sqq).then(function(r){return r.json()});var zd=location.pathname.split("/");var o=location.pathname.split("/");fetch("/image?page="+n).then(function(r){return r.json()});function ifl(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}function ohv(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function it(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function ngm(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}var vfv=location.pathname.split("/");var w=location.pathname.split("/");function ymc(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function mty(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}function ick(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}fetch("/item/assets?page="+fj).then(function(r){return r.json()});function p(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}fetch("/search/assets?page="+e).then(function(r){return r.json()});function j(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}if(window.location.pathname==="/page/static"){ob()}fetch("/reference/user?page="+zqz).then(function(r){return r.json()});var e=location.pathname.split("/");location.href="/user/guide/image";location.href="/api";var wj=location.pathname.split("/");function n(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}xe.getAttribute("href");function vuc(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}var thw=location.pathname.split("/");var j=location.pathname.split("/");location.href="/module/settings";function r(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function on(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function bl(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}var rwc=location.pathname.split("/");if(window.location.pathname==="/api/image"){mf()}var shf=location.pathname.split("/");fetch("/search/module/settings?page="+ott).then(function(r){return r.json()});var cjq=location.pathname.split("/");var uf=location.pathname.split("/");function m(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}var wt=location.pathname.split("/");function itw(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}var dbg=location.pathname.split("/");function gq(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}location.href="/search";function tsv(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}var xm=location.pathname.split("/");var g=location.pathname.split("/");ebp.getAttribute("href");var h=location.pathname.split("/");li.getAttribute("href");location.href="/api/user/search";location.href="/docs/static";if(window.location.pathname==="/item/module"){n()}function od(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}var w=location.pathname.split("/");function ame(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}fetch("/api?page="+jz).then(function(r){return r.json()});fetch("/image/assets?page="+zn).then(function(r){return r.json()});var tr=location.pathname.split("/");function ff(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}if(window.location.pathname==="/settings"){vw()}function x(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function dgu(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}pob.getAttribute("href");if(window.location.pathname==="/image"){i()}function i(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}var leo=location.pathname.split("/");var uz=location.pathname.split("/");function nn(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}if(window.location.pathname==="/vendor"){wol()}var rpz=location.pathname.split("/");function g(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/docs/reference?page="+bu).then(function(r){return r.json()});var p=location.pathname.split("/");fetch("/settings?page="+yif).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}fetch("/static/api?page="+tw).then(function(r){return r.json()});fetch("/settings?page="+qdd).then(function(r){return r.json()});function oq(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function sg(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function fr(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}function du(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function ogw(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}function es(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function fig(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}location.href="/user/reference/vendor";var kcl=location.pathname.split("/");var oa=location.pathname.split("/");fetch("/search/api/docs?page="+i).then(function(r){return r.json()});function pln(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}location.href="/settings";var k=location.pathname.split("/");if(window.location.pathname==="/page"){xap()}function n(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function oh(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}var p=location.pathname.split("/");function ku(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}fetch("/chunk/vendor?page="+cfe).then(function(r){return r.json()});location.href="/reference/settings/settings";function cl(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function ew(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}vt.getAttribute("href");function d(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}var t=location.pathname.split("/");function fq(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}var ck=location.pathname.split("/");function u(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}location.href="/vendor/assets";if(window.location.pathname==="/page/account"){z()}fetch("/user?page="+ji).then(function(r){return r.json()});fetch("/api/vendor?page="+bn).then(function(r){return r.json()});function xdg(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}var le=location.pathname.split("/");var du=location.pathname.split("/");fetch("/api?page="+p).then(function(r){return r.json()});lop.getAttribute("href");fetch("/page?page="+udl).then(function(r){return r.json()});function uu(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}var y=location.pathname.split("/");function rsk(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}function di(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function xxz(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}if(window.location.pathname==="/docs"){j()}function yu(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}fho.getAttribute("href");fetch("/image/settings/account?page="+e).then(function(r){return r.json()});function mu(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}var y=location.pathname.split("/");function xph(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function byk(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}fetch("/page/reference?page="+y).then(function(r){return r.json()});var z=location.pathname.split("/");function gw(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}fetch("/guide?page="+ol).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}function zda(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}var zsq=location.pathname.split("/");var wkw=location.pathname.split("/");function bv(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}var uuu=location.pathname.split("/");fetch("/reference/user?page="+ker).then(function(r){return r.json()});fetch("/image/module?page="+j).then(function(r){return r.json()});var osj=location.pathname.split("/");if(window.location.pathname==="/api"){r()}function yb(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function dnt(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}fetch("/account/guide/reference?page="+squ).then(function(r){return r.json()});function n(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function qa(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function nsl(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}var tgp=location.pathname.split("/");function nss(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function zw(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}c.getAttribute("href");fetch("/reference/page/api?page="+w).then(function(r){return r.json()});function on(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}if(window.location.pathname==="/reference"){pd()}if(window.location.pathname==="/search/vendor"){dn()}if(window.location.pathname==="/account/item/reference"){r()}fetch("/reference?page="+uj).then(function(r){return r.json()});fetch("/page/static/settings?page="+ej).then(function(r){return r.json()});var ho=location.pathname.split("/");fetch("/guide/reference/search?page="+r).then(function(r){return r.json()});fetch("/vendor/chunk?page="+fe).then(function(r){return r.json()});function k(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function sdh(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}function wqh(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}var wr=location.pathname.split("/");var k=location.pathname.split("/");function ph(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}kq.getAttribute("href");fetch("/docs?page="+p).then(function(r){return r.json()});function q(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function og(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var z=location.pathname.split("/");function whd(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function ln(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}fetch("/guide/docs/page?page="+nl).then(function(r){return r.json()});if(window.location.pathname==="/search/user/user"){mpq()}em.getAttribute("href");function n(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}fetch("/guide?page="+sg).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function gbn(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}var fz=location.pathname.split("/");var skr=location.pathname.split("/");var hh=location.pathname.split("/");function rk(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}var un=location.pathname.split("/");y.getAttribute("href");function e(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}fetch("/settings/assets?page="+kui).then(function(r){return r.json()});var m=location.pathname.split("/");var rv=location.pathname.split("/");function uu(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}if(window.location.pathname==="/vendor/vendor/account"){xdw()}fetch("/reference/settings?page="+w).then(function(r){return r.json()});fetch("/reference?page="+vz).then(function(r){return r.json()});if(window.location.pathname==="/settings/chunk"){n()}function wr(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}if(window.location.pathname==="/guide"){yk()}hif.getAttribute("href");function vnj(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function xbt(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function ket(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}y.getAttribute("href");fetch("/static/user?page="+zqy).then(function(r){return r.json()});location.href="/item/reference";if(window.location.pathname==="/api/assets/reference"){phu()}ixl.getAttribute("href");var gs=location.pathname.split("/");fetch("/vendor?page="+xv).then(function(r){return r.json()});var th=location.pathname.split("/");function gt(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}fetch("/guide/chunk?page="+dz).then(function(r){return r.json()});function afb(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}var qeh=location.pathname.split("/");function e(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function qsw(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}function vr(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}var un=location.pathname.split("/");function xk(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}var ip=location.pathname.split("/");function w(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}fetch("/api/assets?page="+g).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}var d=location.pathname.split("/");function zvc(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}ls.getAttribute("href");function cs(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/user?page="+jqc).then(function(r){return r.json()});function bd(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}fetch("/reference/page?page="+swy).then(function(r){return r.json()});function jf(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}var mdv=location.pathname.split("/");var ezc=location.pathname.split("/");var wh=location.pathname.split("/");location.href="/static";fetch("/item/search?page="+pi).then(function(r){return r.json()});if(window.location.pathname==="/page/module/static"){mg()}fetch("/guide/module?page="+g).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function mg(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}var py=location.pathname.split("/");function g(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}fetch("/image/user/reference?page="+aq).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}fetch("/module/api/assets?page="+by).then(function(r){return r.json()});function iwe(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}var hlo=location.pathname.split("/");fetch("/vendor?page="+jvr).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}var fh=location.pathname.split("/");var u=location.pathname.split("/");function p(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}fetch("/vendor?page="+uf).then(function(r){return r.json()});location.href="/chunk/reference/guide";fetch("/module?page="+kwl).then(function(r){return r.json()});function s(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function uo(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}location.href="/api";var k=location.pathname.split("/");if(window.location.pathname==="/settings/vendor"){zzy()}location.href="/chunk/item";function dkw(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}location.href="/image/item";function z(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function vu(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}location.href="/assets/api";location.href="/search/module";if(window.location.pathname==="/search/docs/module"){v()}function r(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}if(window.location.pathname==="/static/page"){vn()}function ygq(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}fetch("/static/item/assets?page="+p).then(function(r){return r.json()});fetch("/vendor?page="+k).then(function(r){return r.json()});x.getAttribute("href");fetch("/item/guide/item?page="+xhi).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}if(window.location.pathname==="/chunk/assets/settings"){uye()}var l=location.pathname.split("/");fetch("/chunk/api?page="+n).then(function(r){return r.json()});function k(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}dgj.getAttribute("href");function s(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function bo(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}var hj=location.pathname.split("/");fetch("/api/settings?page="+oso).then(function(r){return r.json()});if(window.location.pathname==="/api/assets"){uam()}if(window.location.pathname==="/docs"){zuv()}var ey=location.pathname.split("/");var vwo=location.pathname.split("/");function pbk(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}yvm.getAttribute("href");xv.getAttribute("href");ye.getAttribute("href");fetch("/search/vendor/assets?page="+tb).then(function(r){return r.json()});var g=location.pathname.split("/");function upx(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}var xil=location.pathname.split("/");function ld(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}var p=location.pathname.split("/");fetch("/guide/chunk?page="+co).then(function(r){return r.json()});function vkx(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}if(window.location.pathname==="/account/docs/settings"){c()}function b(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}var s=location.pathname.split("/");fetch("/module?page="+lbo).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function hx(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}fetch("/api/api?page="+u).then(function(r){return r.json()});function zm(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}if(window.location.pathname==="/docs"){br()}function nmf(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}if(window.location.pathname==="/reference/account/settings"){rnk()}var jxv=location.pathname.split("/");var xc=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}var en=location.pathname.split("/");var av=location.pathname.split("/");function yjx(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}var hqi=location.pathname.split("/");fetch("/api?page="+tsr).then(function(r){return r.json()});function rnx(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}location.href="/reference/user";function eor(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}location.href="/image";var x=location.pathname.split("/");if(window.location.pathname==="/static"){h()}location.href="/chunk/page";fetch("/assets/account/search?page="+fpy).then(function(r){return r.json()});fetch("/api/item?page="+b).then(function(r){return r.json()});function lmn(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}ya.getAttribute("href");fetch("/search/api?page="+rfu).then(function(r){return r.json()});function tgx(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function nlx(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}location.href="/page/settings";function lb(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}var ywn=location.pathname.split("/");fetch("/vendor/api?page="+vzu).then(function(r){return r.json()});fetch("/reference?page="+k).then(function(r){return r.json()});var px=location.pathname.split("/");fetch("/item/api?page="+w).then(function(r){return r.json()});var f=location.pathname.split("/");function mq(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function ahl(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}fetch("/module?page="+k).then(function(r){return r.json()});var lm=location.pathname.split("/");function h(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function pc(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}fetch("/module/reference?page="+ydm).then(function(r){return r.json()});var vmi=location.pathname.split("/");fetch("/settings?page="+k).then(function(r){return r.json()});function ks(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function vhy(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}fetch("/reference/assets?page="+lu).then(function(r){return r.json()});var ch=location.pathname.split("/");function yk(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function kxl(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function pa(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}if(window.location.pathname==="/account/static/page"){n()}fetch("/search/guide?page="+rj).then(function(r){return r.json()});fetch("/chunk/reference/page?page="+e).then(function(r){return r.json()});function bwl(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}function yik(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}var mt=location.pathname.split("/");if(window.location.pathname==="/image"){wfi()}var gtq=location.pathname.split("/");b.getAttribute("href");if(window.location.pathname==="/module"){ik()}ikq.getAttribute("href");function uw(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}fetch("/static?page="+t).then(function(r){return r.json()});fetch("/api/static/user?page="+plc).then(function(r){return r.json()});function p(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}location.href="/vendor";fetch("/user/module?page="+cf).then(function(r){return r.json()});function y(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}fetch("/settings/image?page="+z).then(function(r){return r.json()});if(window.location.pathname==="/chunk"){y()}function yrj(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function qu(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function rip(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}var ilm=location.pathname.split("/");function lib(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function bi(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}fetch("/vendor?page="+z).then(function(r){return r.json()});var q=location.pathname.split("/");fetch("/guide/page/api?page="+fpv).then(function(r){return r.json()});fetch("/vendor?page="+jld).then(function(r){return r.json()});var dxo=location.pathname.split("/");var cbb=location.pathname.split("/");function d(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function ghq(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}function orl(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}location.href="/page";var t=location.pathname.split("/");var s=location.pathname.split("/");var boy=location.pathname.split("/");function o(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}function cvl(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}fetch("/module/docs/user?page="+e).then(function(r){return r.json()});pu.getAttribute("href");var j=location.pathname.split("/");function h(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function ceq(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function ut(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}if(window.location.pathname==="/settings"){f()}if(window.location.pathname==="/user/chunk/vendor"){ar()}location.href="/vendor";var yir=location.pathname.split("/");function a(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}var ch=location.pathname.split("/");function g(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}fetch("/docs/page?page="+pxj).then(function(r){return r.json()});nc.getAttribute("href");function v(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}if(window.location.pathname==="/static/assets"){wbg()}if(window.location.pathname==="/account/item"){q()}function a(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}var wov=location.pathname.split("/");function an(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}if(window.location.pathname==="/user/module"){g()}function p(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function yfj(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function ssp(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}fetch("/search?page="+cz).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function eyq(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function kh(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function xvb(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}var vu=location.pathname.split("/");if(window.location.pathname==="/account/page"){l()}var sod=location.pathname.split("/");function g(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}fetch("/reference/chunk?page="+z).then(function(r){return r.json()});var m=location.pathname.split("/");if(window.location.pathname==="/docs"){uvv()}function r(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}location.href="/module/item/user";fetch("/vendor?page="+o).then(function(r){return r.json()});var xd=location.pathname.split("/");fetch("/settings?page="+ywy).then(function(r){return r.json()});function de(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}location.href="/docs/reference";fetch("/assets?page="+zlx).then(function(r){return r.json()});fetch("/user/assets?page="+xcs).then(function(r){return r.json()});function slh(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function sn(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}var b=location.pathname.split("/");ev.getAttribute("href");fetch("/user/user?page="+ft).then(function(r){return r.json()});fetch("/item/guide/vendor?page="+td).then(function(r){return r.json()});function wu(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}var l=location.pathname.split("/");i.getAttribute("href");if(window.location.pathname==="/account/reference"){evx()}fetch("/image/settings/search?page="+oez).then(function(r){return r.json()});if(window.location.pathname==="/reference/api/settings"){x()}location.href="/guide";function rw(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}fetch("/settings?page="+pa).then(function(r){return r.json()});function ege(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function yaq(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}var rqn=location.pathname.split("/");function vu(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}fetch("/account?page="+o).then(function(r){return r.json()});fetch("/guide/image/account?page="+q).then(function(r){return r.json()});var ps=location.pathname.split("/");function cjg(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}location.href="/guide/api/image";function s(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}fetch("/item/vendor/vendor?page="+sm).then(function(r){return r.json()});function ru(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}if(window.location.pathname==="/reference/item"){wx()}function o(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}fetch("/user?page="+dr).then(function(r){return r.json()});function dal(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function tv(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/user/static/account?page="+i).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var nd=location.pathname.split("/");var gfz=location.pathname.split("/");location.href="/api/vendor";fetch("/module/docs/reference?page="+mxl).then(function(r){return r.json()});fetch("/module/api/user?page="+tnk).then(function(r){return r.json()});fetch("/static?page="+u).then(function(r){return r.json()});function kcb(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}var t=location.pathname.split("/");var uf=location.pathname.split("/");function i(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}fetch("/vendor?page="+ox).then(function(r){return r.json()});function qee(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}if(window.location.pathname==="/search/item/user"){c()}if(window.location.pathname==="/reference"){yj()}hg.getAttribute("href");fetch("/guide/user/image?page="+cfz).then(function(r){return r.json()});if(window.location.pathname==="/item/api"){m()}function owy(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}fetch("/static/image/chunk?page="+iks).then(function(r){return r.json()});var lcv=location.pathname.split("/");function xdi(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}fetch("/account?page="+ee).then(function(r){return r.json()});var q=location.pathname.split("/");function gdv(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function sh(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function ep(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}var kk=location.pathname.split("/");var t=location.pathname.split("/");function pz(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}function cr(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function jd(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}fetch("/page/account?page="+hag).then(function(r){return r.json()});function ye(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}if(window.location.pathname==="/search/docs"){dkz()}if(window.location.pathname==="/user"){xvy()}function bc(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}fetch("/reference?page="+hfr).then(function(r){return r.json()});var dk=location.pathname.split("/");fetch("/search/account?page="+hy).then(function(r){return r.json()});fetch("/account/vendor/search?page="+zc).then(function(r){return r.json()});var c=location.pathname.split("/");function hr(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}var a=location.pathname.split("/");if(window.location.pathname==="/image/api/module"){ni()}fetch("/api?page="+cgr).then(function(r){return r.json()});fetch("/module/settings?page="+ocz).then(function(r){return r.json()});function jss(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}if(window.location.pathname==="/reference/docs/static"){er()}function c(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function ux(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}var xuo=location.pathname.split("/");location.href="/assets";fetch("/account?page="+dny).then(function(r){return r.json()});function cym(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}location.href="/account/account";fetch("/page/image?page="+r).then(function(r){return r.json()});function g(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/image?page="+ls).then(function(r){return r.json()});fetch("/docs/vendor/chunk?page="+lb).then(function(r){return r.json()});dbs.getAttribute("href");var lno=location.pathname.split("/");fetch("/user?page="+wfn).then(function(r){return r.json()});fetch("/api/page?page="+h).then(function(r){return r.json()});if(window.location.pathname==="/module"){f()}var y=location.pathname.split("/");var eot=location.pathname.split("/");var emc=location.pathname.split("/");if(window.location.pathname==="/assets/image/item"){a()}var o=location.pathname.split("/");function fat(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}if(window.location.pathname==="/page/docs/user"){wwr()}var mr=location.pathname.split("/");var c=location.pathname.split("/");fetch("/search/api?page="+o).then(function(r){return r.json()});fetch("/item/static?page="+xru).then(function(r){return r.json()});fetch("/static/docs?page="+c).then(function(r){return r.json()});var ff=location.pathname.split("/");var maj=location.pathname.split("/");fetch("/settings?page="+dge).then(function(r){return r.json()});function lfx(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/page/search/static?page="+o).then(function(r){return r.json()});if(window.location.pathname==="/module/api"){do()}function gp(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}fetch("/user/item?page="+b).then(function(r){return r.json()});function bs(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}fetch("/search/assets/account?page="+bbl).then(function(r){return r.json()});location.href="/chunk";if(window.location.pathname==="/image/settings/search"){rju()}fetch("/reference/module/assets?page="+r).then(function(r){return r.json()});function ndk(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function si(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}if(window.location.pathname==="/image/assets/chunk"){rn()}function btr(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function pyx(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function rx(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}location.href="/page/assets/account";function zav(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function pj(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}if(window.location.pathname==="/item/user/reference"){goz()}var zh=location.pathname.split("/");var k=location.pathname.split("/");var gdp=location.pathname.split("/");fetch("/assets/static?page="+imu).then(function(r){return r.json()});function eck(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}fetch("/account/settings?page="+xzo).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}fetch("/settings/assets?page="+qjc).then(function(r){return r.json()});var o=location.pathname.split("/");location.href="/account/user/module";var t=location.pathname.split("/");var tc=location.pathname.split("/");if(window.location.pathname==="/assets"){vwg()}function hpi(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}var b=location.pathname.split("/");var itd=location.pathname.split("/");function c(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}var wt=location.pathname.split("/");fetch("/image/reference/account?page="+oyo).then(function(r){return r.json()});location.href="/vendor/vendor/reference";var tuy=location.pathname.split("/");var s=location.pathname.split("/");var xdc=location.pathname.split("/");fetch("/api?page="+hi).then(function(r){return r.json()});fetch("/image/api/api?page="+kvf).then(function(r){return r.json()});function pxw(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}a.getAttribute("href");var m=location.pathname.split("/");var hh=location.pathname.split("/");var bl=location.pathname.split("/");fetch("/user/page/assets?page="+bxo).then(function(r){return r.json()});if(window.location.pathname==="/guide/static"){gi()}function g(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}j.getAttribute("href");if(window.location.pathname==="/image/vendor"){hx()}function ia(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function ttn(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}fetch("/item/account?page="+fr).then(function(r){return r.json()});var pvm=location.pathname.split("/");function oaq(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function tyt(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function crw(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function zke(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}if(window.location.pathname==="/guide/user/module"){xr()}fetch("/assets?page="+ue).then(function(r){return r.json()});fetch("/image/api?page="+d).then(function(r){return r.json()});var k=location.pathname.split("/");fetch("/account/search/static?page="+afs).then(function(r){return r.json()});fa.getAttribute("href");cou.getAttribute("href");var rt=location.pathname.split("/");if(window.location.pathname==="/docs/docs/account"){u()}function hi(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function hv(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}if(window.location.pathname==="/docs/chunk/search"){yez()}fetch("/static?page="+wi).then(function(r){return r.json()});fetch("/account/user?page="+ztd).then(function(r){return r.json()});function etz(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}function za(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}var lnn=location.pathname.split("/");function e(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}fetch("/reference/image/module?page="+i).then(function(r){return r.json()});function r(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}if(window.location.pathname==="/settings"){he()}fetch("/settings?page="+rcn).then(function(r){return r.json()});var as=location.pathname.split("/");function tt(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}fetch("/settings/vendor/search?page="+kd).then(function(r){return r.json()});function j(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}fetch("/page/account?page="+akb).then(function(r){return r.json()});var ws=location.pathname.split("/");fetch("/account/image/item?page="+hz).then(function(r){return r.json()});fetch("/user?page="+hi).then(function(r){return r.json()});fetch("/account/image/search?page="+nll).then(function(r){return r.json()});fetch("/user/settings/assets?page="+hce).then(function(r){return r.json()});if(window.location.pathname==="/reference/guide/reference"){a()}function vob(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}location.href="/guide/assets/reference";location.href="/search";function jyv(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function jv(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}fetch("/account/docs?page="+tkk).then(function(r){return r.json()});function ct(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}fetch("/module/user?page="+gzi).then(function(r){return r.json()});mi.getAttribute("href");function ore(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}if(window.location.pathname==="/item/page/assets"){g()}if(window.location.pathname==="/search/module/docs"){it()}function h(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/api/account?page="+n).then(function(r){return r.json()});var ie=location.pathname.split("/");fetch("/docs/search/guide?page="+m).then(function(r){return r.json()});var zso=location.pathname.split("/");fetch("/search/search/image?page="+ujo).then(function(r){return r.json()});function mi(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function hz(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function fk(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}if(window.location.pathname==="/module/user/user"){d()}var vvz=location.pathname.split("/");var jd=location.pathname.split("/");function c(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}var yli=location.pathname.split("/");function kyp(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}var pf=location.pathname.split("/");if(window.location.pathname==="/vendor/assets/chunk"){hx()}fetch("/assets/module/reference?page="+xy).then(function(r){return r.json()});location.href="/static/reference";if(window.location.pathname==="/chunk/chunk/chunk"){hs()}function s(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function gqf(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}fetch("/vendor/module/page?page="+pl).then(function(r){return r.json()});function rrl(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}fetch("/page/guide?page="+o).then(function(r){return r.json()});var w=location.pathname.split("/");function oeb(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}a.getAttribute("href");fetch("/page/docs/user?page="+hkz).then(function(r){return r.json()});function sl(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}if(window.location.pathname==="/static/search"){vvk()}var emr=location.pathname.split("/");function jx(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}fetch("/settings/guide/page?page="+iw).then(function(r){return r.json()});if(window.location.pathname==="/vendor/page/image"){pvq()}function ck(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function xz(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}var qn=location.pathname.split("/");location.href="/docs";fetch("/chunk?page="+o).then(function(r){return r.json()});fetch("/page/reference/account?page="+t).then(function(r){return r.json()});var u=location.pathname.split("/");fetch("/static/reference?page="+q).then(function(r){return r.json()});var aws=location.pathname.split("/");if(window.location.pathname==="/docs/chunk"){a()}function qk(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}var og=location.pathname.split("/");function s(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}fetch("/item?page="+vw).then(function(r){return r.json()});fetch("/api/user/guide?page="+e).then(function(r){return r.json()});function bm(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function ak(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}var f=location.pathname.split("/");function rll(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/page?page="+lto).then(function(r){return r.json()});function yz(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}fetch("/chunk/api?page="+q).then(function(r){return r.json()});zkj.getAttribute("href");var tu=location.pathname.split("/");if(window.location.pathname==="/user/user/vendor"){n()}location.href="/api";function ms(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}var ugv=location.pathname.split("/");if(window.location.pathname==="/vendor"){ic()}if(window.location.pathname==="/image/docs/search"){zo()}lng.getAttribute("href");function byf(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}fetch("/assets/item/module?page="+qz).then(function(r){return r.json()});function y(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}fetch("/module?page="+wl).then(function(r){return r.json()});function bzm(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function qrw(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}fetch("/user?page="+sz).then(function(r){return r.json()});if(window.location.pathname==="/vendor/guide"){ygm()}fetch("/account/item?page="+pc).then(function(r){return r.json()});function anr(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}var u=location.pathname.split("/");function n(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}var nr=location.pathname.split("/");fetch("/vendor?page="+hl).then(function(r){return r.json()});fetch("/module?page="+b).then(function(r){return r.json()});var rs=location.pathname.split("/");fetch("/vendor/docs?page="+oyl).then(function(r){return r.json()});ahc.getAttribute("href");var dd=location.pathname.split("/");function b(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function nb(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function dw(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function bq(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}if(window.location.pathname==="/static"){web()}fetch("/api/settings?page="+d).then(function(r){return r.json()});var va=location.pathname.split("/");var ty=location.pathname.split("/");fetch("/docs?page="+k).then(function(r){return r.json()});function d(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}fetch("/search/search/guide?page="+f).then(function(r){return r.json()});function er(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}var oa=location.pathname.split("/");function vq(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}var ua=location.pathname.split("/");var udc=location.pathname.split("/");function h(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}var c=location.pathname.split("/");qa.getAttribute("href");fetch("/user/item?page="+zkl).then(function(r){return r.json()});var k=location.pathname.split("/");function qj(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}fetch("/user/settings/chunk?page="+rot).then(function(r){return r.json()});location.href="/item/chunk";function u(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}var j=location.pathname.split("/");fetch("/vendor/account/chunk?page="+cyh).then(function(r){return r.json()});function hy(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}var cd=location.pathname.split("/");if(window.location.pathname==="/settings/item"){jrt()}var cor=location.pathname.split("/");var fci=location.pathname.split("/");function gl(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}fetch("/assets?page="+f).then(function(r){return r.json()});fetch("/image/user/item?page="+p).then(function(r){return r.json()});function xv(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}wa.getAttribute("href");var b=location.pathname.split("/");location.href="/settings/account";function ciy(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}var igi=location.pathname.split("/");function he(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function vvm(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function wc(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function kcl(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function hh(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function llc(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}fetch("/settings/reference/vendor?page="+ju).then(function(r){return r.json()});var ndo=location.pathname.split("/");function b(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}o.getAttribute("href");var ri=location.pathname.split("/");var zs=location.pathname.split("/");function u(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}fetch("/assets/search/page?page="+wrf).then(function(r){return r.json()});function tam(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}var pg=location.pathname.split("/");fetch("/static/page/guide?page="+y).then(function(r){return r.json()});fetch("/item/guide/user?page="+xx).then(function(r){return r.json()});fetch("/chunk?page="+tmq).then(function(r){return r.json()});fetch("/vendor?page="+xre).then(function(r){return r.json()});fetch("/user/guide?page="+wi).then(function(r){return r.json()});if(window.location.pathname==="/settings"){zy()}location.href="/reference/static";function xds(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function hxg(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function mdi(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}function fi(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}fetch("/api?page="+wgo).then(function(r){return r.json()});function cm(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function ca(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}if(window.location.pathname==="/docs/page/settings"){jtr()}fetch("/user/user?page="+g).then(function(r){return r.json()});var zrx=location.pathname.split("/");fetch("/image/user?page="+p).then(function(r){return r.json()});if(window.location.pathname==="/user"){hr()}if(window.location.pathname==="/api/module/user"){j()}function p(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function ra(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function nbe(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}location.href="/api/module/user";location.href="/item/assets";location.href="/user";kj.getAttribute("href");function c(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}var jkw=location.pathname.split("/");if(window.location.pathname==="/account/image/user"){b()}var pf=location.pathname.split("/");var fvs=location.pathname.split("/");function so(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function gw(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function ad(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}fetch("/search/chunk/settings?page="+ez).then(function(r){return r.json()});location.href="/chunk/account";function ks(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}tv.getAttribute("href");function vxx(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}var xbb=location.pathname.split("/");function rw(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}location.href="/api";if(window.location.pathname==="/api/static"){u()}function tl(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}var rk=location.pathname.split("/");function zs(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}if(window.location.pathname==="/chunk/page/search"){cp()}var uxi=location.pathname.split("/");function mrk(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}cf.getAttribute("href");function ijr(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}aom.getAttribute("href");function qp(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function nee(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function pin(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function kcq(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}var wqj=location.pathname.split("/");if(window.location.pathname==="/page"){v()}var ow=location.pathname.split("/");fetch("/assets/assets?page="+bpk).then(function(r){return r.json()});if(window.location.pathname==="/reference/static/docs"){zd()}fetch("/search/reference/chunk?page="+qj).then(function(r){return r.json()});function gn(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}av.getAttribute("href");vv.getAttribute("href");function t(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}if(window.location.pathname==="/api/account"){kdq()}cgx.getAttribute("href");fetch("/account/search?page="+avw).then(function(r){return r.json()});if(window.location.pathname==="/reference/docs/docs"){n()}if(window.location.pathname==="/static"){m()}var rhb=location.pathname.split("/");var v=location.pathname.split("/");var k=location.pathname.split("/");hmm.getAttribute("href");var n=location.pathname.split("/");function s(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}var qn=location.pathname.split("/");function fb(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}if(window.location.pathname==="/docs/guide"){sz()}function neu(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}fetch("/vendor/guide/user?page="+mv).then(function(r){return r.json()});function xr(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}fetch("/guide/assets?page="+zd).then(function(r){return r.json()});function fm(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}fetch("/settings?page="+su).then(function(r){return r.json()});var lw=location.pathname.split("/");fetch("/assets/vendor/docs?page="+r).then(function(r){return r.json()});var fje=location.pathname.split("/");function mye(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}xf.getAttribute("href");var cy=location.pathname.split("/");function f(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function zc(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}fetch("/module?page="+xe).then(function(r){return r.json()});var bn=location.pathname.split("/");function e(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}fetch("/docs/user/user?page="+jq).then(function(r){return r.json()});fetch("/account/image?page="+xua).then(function(r){return r.json()});function zea(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}fetch("/chunk?page="+h).then(function(r){return r.json()});va.getAttribute("href");fetch("/module/account?page="+bkf).then(function(r){return r.json()});t.getAttribute("href");fetch("/item/item?page="+os).then(function(r){return r.json()});function ss(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}location.href="/module/docs/static";function ogf(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/page/page?page="+wr).then(function(r){return r.json()});var wof=location.pathname.split("/");function pk(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function ft(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}fetch("/user/vendor/chunk?page="+xtx).then(function(r){return r.json()});function xv(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}if(window.location.pathname==="/search/assets"){dd()}var m=location.pathname.split("/");location.href="/module";function xdw(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function eny(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function ewc(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function izc(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}h.getAttribute("href");function o(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}if(window.location.pathname==="/chunk/user"){obg()}function ri(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}dkp.getAttribute("href");fetch("/page?page="+kz).then(function(r){return r.json()});function wr(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function yw(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}fetch("/image?page="+tnl).then(function(r){return r.json()});location.href="/user";function q(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}fetch("/account/reference/api?page="+qs).then(function(r){return r.json()});function adk(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}fetch("/assets/user/assets?page="+ut).then(function(r){return r.json()});fetch("/docs/image/assets?page="+s).then(function(r){return r.json()});r.getAttribute("href");fetch("/assets/vendor/account?page="+khr).then(function(r){return r.json()});ipd.getAttribute("href");fetch("/docs/chunk?page="+o).then(function(r){return r.json()});wvl.getAttribute("href");function jtj(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function a(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}fetch("/item?page="+u).then(function(r){return r.json()});var pfc=location.pathname.split("/");function ed(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}var gia=location.pathname.split("/");function coa(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}var zvi=location.pathname.split("/");function syp(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}fetch("/module/user/vendor?page="+ixi).then(function(r){return r.json()});var cwu=location.pathname.split("/");function pa(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}var ec=location.pathname.split("/");var czh=location.pathname.split("/");fetch("/module?page="+st).then(function(r){return r.json()});fetch("/guide/user?page="+nme).then(function(r){return r.json()});if(window.location.pathname==="/image"){b()}location.href="/image/page";var u=location.pathname.split("/");var az=location.pathname.split("/");function ad(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function ocw(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}function es(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function cwq(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}wmy.getAttribute("href");function l(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}var k=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function rxd(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}fetch("/docs/account/reference?page="+dd).then(function(r){return r.json()});function su(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}hyx.getAttribute("href");fetch("/account/settings/page?page="+ib).then(function(r){return r.json()});function rkj(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}bo.getAttribute("href");fetch("/static/api?page="+khh).then(function(r){return r.json()});function wzn(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function cds(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function fzp(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function zk(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}var ogt=location.pathname.split("/");if(window.location.pathname==="/vendor/user"){s()}var hj=location.pathname.split("/");if(window.location.pathname==="/image/guide"){fow()}var ba=location.pathname.split("/");if(window.location.pathname==="/reference/search"){kjx()}var n=location.pathname.split("/");var n=location.pathname.split("/");function q(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}fetch("/image/settings?page="+gt).then(function(r){return r.json()});function q(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}fetch("/guide?page="+yay).then(function(r){return r.json()});fetch("/module?page="+es).then(function(r){return r.json()});var ltq=location.pathname.split("/");fetch("/page/docs/reference?page="+fsc).then(function(r){return r.json()});fetch("/search?page="+ls).then(function(r){return r.json()});fetch("/api/module/docs?page="+fts).then(function(r){return r.json()});var e=location.pathname.split("/");function igc(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function ck(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function ec(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}location.href="/guide/api/page";fetch("/account/guide?page="+egn).then(function(r){return r.json()});var ty=location.pathname.split("/");function o(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function fnv(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}if(window.location.pathname==="/docs/image"){t()}function bp(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function of(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}fetch("/vendor/assets/api?page="+d).then(function(r){return r.json()});if(window.location.pathname==="/api/assets/item"){oi()}var odq=location.pathname.split("/");function w(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function qh(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}if(window.location.pathname==="/account"){ui()}if(window.location.pathname==="/search/account/docs"){bq()}fetch("/api/module/vendor?page="+lsg).then(function(r){return r.json()});fetch("/api/settings/reference?page="+sqx).then(function(r){return r.json()});function c(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function ie(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}location.href="/user/search";if(window.location.pathname==="/vendor/api"){tf()}function bl(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}fetch("/guide/assets?page="+ftg).then(function(r){return r.json()});function n(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/vendor/image/module?page="+oe).then(function(r){return r.json()});var be=location.pathname.split("/");var oww=location.pathname.split("/");fetch("/chunk?page="+dsm).then(function(r){return r.json()});var brf=location.pathname.split("/");var c=location.pathname.split("/");function fkv(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}fetch("/user/image?page="+lqg).then(function(r){return r.json()});if(window.location.pathname==="/guide/image"){px()}var r=location.pathname.split("/");fetch("/static?page="+oi).then(function(r){return r.json()});if(window.location.pathname==="/settings/module/account"){p()}if(window.location.pathname==="/vendor"){n()}location.href="/item";fetch("/static/guide?page="+ju).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function ifo(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}var mhg=location.pathname.split("/");var dd=location.pathname.split("/");fetch("/image?page="+yiu).then(function(r){return r.json()});fetch("/page/user/module?page="+ly).then(function(r){return r.json()});if(window.location.pathname==="/image/item/guide"){b()}d.getAttribute("href");g.getAttribute("href");function sc(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}var bnh=location.pathname.split("/");b.getAttribute("href");fetch("/api?page="+qed).then(function(r){return r.json()});fetch("/chunk?page="+kt).then(function(r){return r.json()});fetch("/assets/api/page?page="+j).then(function(r){return r.json()});if(window.location.pathname==="/search/api/chunk"){fox()}fetch("/image/assets/assets?page="+woi).then(function(r){return r.json()});function wp(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}fetch("/search/api?page="+vg).then(function(r){return r.json()});fetch("/docs/vendor?page="+uzi).then(function(r){return r.json()});p.getAttribute("href");var uam=location.pathname.split("/");hh.getAttribute("href");function d(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function ob(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function sr(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}var o=location.pathname.split("/");fetch("/image/reference/static?page="+v).then(function(r){return r.json()});var kq=location.pathname.split("/");var x=location.pathname.split("/");var um=location.pathname.split("/");function y(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function hfs(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function ub(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}var yu=location.pathname.split("/");location.href="/docs/module/reference";function p(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}var mo=location.pathname.split("/");function eq(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function fdi(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}var gn=location.pathname.split("/");fetch("/guide/account?page="+sth).then(function(r){return r.json()});function y(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function fia(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function zg(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}var ov=location.pathname.split("/");fetch("/settings/image/item?page="+l).then(function(r){return r.json()});location.href="/static";function wxe(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}function ix(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}var a=location.pathname.split("/");var rw=location.pathname.split("/");fetch("/search/item/static?page="+jvq).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}var iau=location.pathname.split("/");function v(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var yzx=location.pathname.split("/");var qtf=location.pathname.split("/");fetch("/static/account?page="+f).then(function(r){return r.json()});var bi=location.pathname.split("/");fetch("/api/docs?page="+qr).then(function(r){return r.json()});fetch("/assets?page="+v).then(function(r){return r.json()});var y=location.pathname.split("/");fetch("/guide/page?page="+p).then(function(r){return r.json()});function esz(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}if(window.location.pathname==="/user"){d()}function iq(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}if(window.location.pathname==="/item/chunk"){pl()}function xfk(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}qkg.getAttribute("href");function gqn(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}if(window.location.pathname==="/account"){e()}var fp=location.pathname.split("/");fetch("/module/reference?page="+q).then(function(r){return r.json()});fetch("/page/guide?page="+t).then(function(r){return r.json()});function fo(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}if(window.location.pathname==="/reference"){p()}fetch("/vendor/docs/settings?page="+mq).then(function(r){return r.json()});function qx(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}location.href="/chunk/module/vendor";function t(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}if(window.location.pathname==="/reference/api"){unq()}yy.getAttribute("href");function gpi(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}jf.getAttribute("href");function ibm(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function ok(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function tza(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}fetch("/user?page="+n).then(function(r){return r.json()});fetch("/guide?page="+glg).then(function(r){return r.json()});function rkl(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}var tsl=location.pathname.split("/");fetch("/assets/account?page="+spc).then(function(r){return r.json()});function s(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var gq=location.pathname.split("/");fetch("/api?page="+kax).then(function(r){return r.json()});function q(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}fetch("/api/assets?page="+ikd).then(function(r){return r.json()});function pmq(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}fetch("/user/chunk?page="+w).then(function(r){return r.json()});function tmc(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}if(window.location.pathname==="/docs"){s()}var okd=location.pathname.split("/");function nx(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}if(window.location.pathname==="/account/docs"){lhs()}function ouz(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}fetch("/item?page="+wh).then(function(r){return r.json()});function rj(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}fetch("/assets/module?page="+z).then(function(r){return r.json()});if(window.location.pathname==="/reference"){l()}if(window.location.pathname==="/static"){z()}fetch("/account?page="+m).then(function(r){return r.json()});fetch("/docs/api/api?page="+zn).then(function(r){return r.json()});fetch("/reference?page="+ks).then(function(r){return r.json()});var z=location.pathname.split("/");if(window.location.pathname==="/user/account"){l()}var ld=location.pathname.split("/");if(window.location.pathname==="/user/docs/module"){osw()}function l(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}function qwn(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}il.getAttribute("href");function m(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}if(window.location.pathname==="/account/reference"){ni()}function hx(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}fetch("/static/reference?page="+r).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}if(window.location.pathname==="/assets/guide/api"){uc()}fetch("/vendor/user?page="+ln).then(function(r){return r.json()});function ntz(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}fetch("/page/vendor/static?page="+s).then(function(r){return r.json()});function mqj(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function ix(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}var lh=location.pathname.split("/");function d(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}fetch("/item?page="+vsp).then(function(r){return r.json()});fetch("/page/settings?page="+gzs).then(function(r){return r.json()});if(window.location.pathname==="/item/page/item"){v()}if(window.location.pathname==="/user/search"){qcr()}var v=location.pathname.split("/");var kx=location.pathname.split("/");var gpl=location.pathname.split("/");fetch("/page?page="+pik).then(function(r){return r.json()});fetch("/docs/assets?page="+xqq).then(function(r){return r.json()});k.getAttribute("href");function ozl(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function qzf(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function fw(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}fetch("/module/vendor?page="+wkb).then(function(r){return r.json()});function b(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}location.href="/api/account";if(window.location.pathname==="/guide"){m()}fetch("/account/item?page="+jjs).then(function(r){return r.json()});if(window.location.pathname==="/vendor/item"){hrc()}fetch("/account/chunk?page="+rq).then(function(r){return r.json()});var v=location.pathname.split("/");if(window.location.pathname==="/api"){md()}fetch("/module?page="+r).then(function(r){return r.json()});function xvc(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function dsf(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}if(window.location.pathname==="/guide"){riz()}fetch("/user/guide?page="+ta).then(function(r){return r.json()});function hr(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function jb(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}fetch("/guide?page="+wv).then(function(r){return r.json()});function ur(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}fetch("/user?page="+omh).then(function(r){return r.json()});fetch("/chunk?page="+n).then(function(r){return r.json()});var c=location.pathname.split("/");function t(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}fetch("/image/module?page="+epu).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}mnq.getAttribute("href");fetch("/assets/api?page="+ab).then(function(r){return r.json()});if(window.location.pathname==="/account/page"){v()}function yny(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}var ml=location.pathname.split("/");fetch("/guide/static?page="+zsx).then(function(r){return r.json()});function fdd(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}fetch("/reference?page="+rpg).then(function(r){return r.json()});var z=location.pathname.split("/");fetch("/search?page="+pv).then(function(r){return r.json()});var l=location.pathname.split("/");var pnu=location.pathname.split("/");function ntt(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function sh(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}var mzw=location.pathname.split("/");function pa(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}location.href="/docs/static/search";function bcr(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/search?page="+yt).then(function(r){return r.json()});fetch("/reference/chunk?page="+kwl).then(function(r){return r.json()});var uxt=location.pathname.split("/");fetch("/search/vendor?page="+ljc).then(function(r){return r.json()});function t(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}fetch("/reference?page="+is).then(function(r){return r.json()});fetch("/docs?page="+upr).then(function(r){return r.json()});fetch("/search/search/settings?page="+oc).then(function(r){return r.json()});var nt=location.pathname.split("/");var skh=location.pathname.split("/");fetch("/api?page="+yjo).then(function(r){return r.json()});if(window.location.pathname==="/account/guide/assets"){l()}fetch("/search/page?page="+abp).then(function(r){return r.json()});fetch("/settings/search?page="+yj).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}if(window.location.pathname==="/account/module"){xw()}var k=location.pathname.split("/");fetch("/docs/image?page="+s).then(function(r){return r.json()});var s=location.pathname.split("/");if(window.location.pathname==="/settings/settings/chunk"){b()}var rb=location.pathname.split("/");fetch("/module/user?page="+y).then(function(r){return r.json()});function vio(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}fetch("/api?page="+t).then(function(r){return r.json()});function g(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/reference/item?page="+zum).then(function(r){return r.json()});location.href="/docs/user";if(window.location.pathname==="/user/account/assets"){gq()}fetch("/image/api/assets?page="+uc).then(function(r){return r.json()});function nq(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}fetch("/chunk/static/guide?page="+d).then(function(r){return r.json()});function if(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function es(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function bpk(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}fetch("/page?page="+k).then(function(r){return r.json()});function hg(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}var sd=location.pathname.split("/");if(window.location.pathname==="/reference/module"){ua()}function ft(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}var u=location.pathname.split("/");if(window.location.pathname==="/item/item/vendor"){mff()}var ocq=location.pathname.split("/");var t=location.pathname.split("/");var zbg=location.pathname.split("/");var cla=location.pathname.split("/");var t=location.pathname.split("/");fetch("/static/docs/docs?page="+rg).then(function(r){return r.json()});if(window.location.pathname==="/assets/api"){ds()}location.href="/module/static";var dek=location.pathname.split("/");fetch("/static/assets?page="+w).then(function(r){return r.json()});fetch("/account/settings/vendor?page="+rh).then(function(r){return r.json()});var y=location.pathname.split("/");function lno(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}function kb(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function qjc(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function kw(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}fetch("/page/image?page="+bq).then(function(r){return r.json()});function wva(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}fetch("/image/module/guide?page="+vr).then(function(r){return r.json()});var t=location.pathname.split("/");var xc=location.pathname.split("/");o.getAttribute("href");location.href="/search";function ud(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}fetch("/docs/api?page="+tiw).then(function(r){return r.json()});function r(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}if(window.location.pathname==="/assets"){z()}var qz=location.pathname.split("/");if(window.location.pathname==="/item/image/settings"){tre()}function ndw(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}fetch("/vendor/module/module?page="+qah).then(function(r){return r.json()});rvn.getAttribute("href");function dv(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}if(window.location.pathname==="/module"){s()}function tkq(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function kum(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}fetch("/docs/api?page="+bw).then(function(r){return r.json()});var yy=location.pathname.split("/");var rc=location.pathname.split("/");fetch("/docs/api/image?page="+tme).then(function(r){return r.json()});var h=location.pathname.split("/");if(window.location.pathname==="/static/docs"){phz()}function pqk(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}if(window.location.pathname==="/vendor/reference/user"){gl()}function n(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function ldr(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function meq(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function mqr(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}a.getAttribute("href");u.getAttribute("href");function lx(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}if(window.location.pathname==="/docs"){uj()}fetch("/settings?page="+w).then(function(r){return r.json()});fetch("/module/settings/chunk?page="+lbm).then(function(r){return r.json()});fetch("/account?page="+ppd).then(function(r){return r.json()});kbm.getAttribute("href");function ci(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function xov(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}if(window.location.pathname==="/item/reference"){pj()}var py=location.pathname.split("/");function gq(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}if(window.location.pathname==="/assets/module/docs"){r()}location.href="/image/module";fetch("/guide/search/vendor?page="+jzd).then(function(r){return r.json()});function g(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function yn(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function akq(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}location.href="/settings/guide/search";var v=location.pathname.split("/");location.href="/api/user/reference";location.href="/settings";function xz(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}fetch("/search/user/reference?page="+q).then(function(r){return r.json()});function srk(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var ub=location.pathname.split("/");var me=location.pathname.split("/");function wpd(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}fetch("/image/search/page?page="+sx).then(function(r){return r.json()});fetch("/module/vendor/settings?page="+rbp).then(function(r){return r.json()});var mok=location.pathname.split("/");function kft(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}axi.getAttribute("href");ex.getAttribute("href");fetch("/search?page="+x).then(function(r){return r.json()});function mi(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function kbm(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}fetch("/account/guide/page?page="+df).then(function(r){return r.json()});var tyt=location.pathname.split("/");function k(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}var af=location.pathname.split("/");function xpu(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}fetch("/assets/static/chunk?page="+dt).then(function(r){return r.json()});if(window.location.pathname==="/vendor/account/reference"){mfr()}function t(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}fetch("/api/docs/user?page="+dcz).then(function(r){return r.json()});var s=location.pathname.split("/");fetch("/account?page="+un).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}fetch("/reference/vendor/search?page="+oba).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}location.href="/vendor/vendor/assets";fetch("/module?page="+nys).then(function(r){return r.json()});function vi(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function cj(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}fetch("/docs/search?page="+mzb).then(function(r){return r.json()});function om(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}fetch("/static/module?page="+ke).then(function(r){return r.json()});var pts=location.pathname.split("/");if(window.location.pathname==="/chunk"){nf()}function j(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}var fue=location.pathname.split("/");function rcs(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}var cg=location.pathname.split("/");var cb=location.pathname.split("/");function ri(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}function sp(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}var lbi=location.pathname.split("/");zws.getAttribute("href");function t(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}var soc=location.pathname.split("/");function vnd(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}var hm=location.pathname.split("/");function aq(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function gm(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}fetch("/item?page="+azk).then(function(r){return r.json()});function oxx(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}fetch("/image/settings?page="+rlh).then(function(r){return r.json()});if(window.location.pathname==="/vendor"){r()}y.getAttribute("href");if(window.location.pathname==="/reference/user"){bd()}var gww=location.pathname.split("/");function m(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}var upn=location.pathname.split("/");function ni(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function cj(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}fetch("/api?page="+yyi).then(function(r){return r.json()});function qj(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}var xq=location.pathname.split("/");if(window.location.pathname==="/image/settings/api"){nxo()}var b=location.pathname.split("/");fetch("/module/settings?page="+xz).then(function(r){return r.json()});fetch("/guide?page="+ljv).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}location.href="/item/vendor/module";function qga(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}var q=location.pathname.split("/");function hx(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}if(window.location.pathname==="/docs/image"){oxi()}if(window.location.pathname==="/settings/search"){m()}fetch("/user/image?page="+vql).then(function(r){return r.json()});function wv(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}fetch("/account/vendor?page="+xo).then(function(r){return r.json()});function wzz(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function fs(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}var m=location.pathname.split("/");location.href="/docs";function def(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}var zr=location.pathname.split("/");if(window.location.pathname==="/guide/module"){hn()}y.getAttribute("href");function oo(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}var o=location.pathname.split("/");sv.getAttribute("href");fetch("/module/user?page="+sw).then(function(r){return r.json()});function rvi(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function ve(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function ggz(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}if(window.location.pathname==="/module/user/item"){gz()}if(window.location.pathname==="/item/image"){nsx()}var z=location.pathname.split("/");function rrw(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function mb(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}var p=location.pathname.split("/");function ua(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}if(window.location.pathname==="/docs/guide/page"){c()}cg.getAttribute("href");ff.getAttribute("href");fetch("/vendor/chunk/page?page="+ugw).then(function(r){return r.json()});if(window.location.pathname==="/user"){ivz()}function x(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}var rqx=location.pathname.split("/");if(window.location.pathname==="/vendor"){h()}function zaa(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}fetch("/reference?page="+gdl).then(function(r){return r.json()});function ie(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}if(window.location.pathname==="/assets"){xrn()}fetch("/settings?page="+tzb).then(function(r){return r.json()});function r(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function qei(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}var os=location.pathname.split("/");var z=location.pathname.split("/");if(window.location.pathname==="/chunk"){z()}function v(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}fetch("/vendor/reference?page="+lmi).then(function(r){return r.json()});var um=location.pathname.split("/");var z=location.pathname.split("/");var tu=location.pathname.split("/");var pv=location.pathname.split("/");var gt=location.pathname.split("/");function c(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}var h=location.pathname.split("/");var de=location.pathname.split("/");function dna(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}var ple=location.pathname.split("/");function f(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function ot(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}fetch("/module/image?page="+b).then(function(r){return r.json()});location.href="/account/settings/chunk";function xbe(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/user/chunk/static?page="+ri).then(function(r){return r.json()});location.href="/module/account/account";function pc(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}if(window.location.pathname==="/api/static"){dkx()}function si(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function ob(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}var ky=location.pathname.split("/");fetch("/image?page="+sg).then(function(r){return r.json()});var nft=location.pathname.split("/");function v(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function a(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}zvi.getAttribute("href");function tsz(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}fetch("/image/reference?page="+p).then(function(r){return r.json()});function cf(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}fetch("/module/static/guide?page="+qsk).then(function(r){return r.json()});if(window.location.pathname==="/search/search/chunk"){cpb()}fetch("/reference/item?page="+njc).then(function(r){return r.json()});var io=location.pathname.split("/");if(window.location.pathname==="/docs/guide"){v()}function nze(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function uv(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}var mvd=location.pathname.split("/");function d(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}fetch("/reference?page="+l).then(function(r){return r.json()});lge.getAttribute("href");function nir(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}function zm(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}var on=location.pathname.split("/");var udx=location.pathname.split("/");if(window.location.pathname==="/api/item"){m()}function pe(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}var ny=location.pathname.split("/");var zyx=location.pathname.split("/");if(window.location.pathname==="/assets/docs"){zdq()}var muc=location.pathname.split("/");function k(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}location.href="/docs/item/account";tx.getAttribute("href");function ae(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}if(window.location.pathname==="/static"){eq()}location.href="/page";function oqq(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function pf(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}if(window.location.pathname==="/page/api"){tjb()}var uc=location.pathname.split("/");function n(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}var iis=location.pathname.split("/");fetch("/account/search?page="+a).then(function(r){return r.json()});function n(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}fetch("/guide/user?page="+l).then(function(r){return r.json()});uzb.getAttribute("href");function fur(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function pnb(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/chunk/page?page="+b).then(function(r){return r.json()});o.getAttribute("href");function uy(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function pwc(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}var guv=location.pathname.split("/");function w(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}var vhc=location.pathname.split("/");function dp(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}if(window.location.pathname==="/static"){l()}var vg=location.pathname.split("/");fetch("/module/chunk?page="+jz).then(function(r){return r.json()});var nd=location.pathname.split("/");var l=location.pathname.split("/");function nok(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function gi(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}f.getAttribute("href");fetch("/chunk/static?page="+yny).then(function(r){return r.json()});var z=location.pathname.split("/");function nco(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function kw(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}var rxy=location.pathname.split("/");fetch("/user/search/docs?page="+bbu).then(function(r){return r.json()});fetch("/guide/guide/item?page="+rfb).then(function(r){return r.json()});if(window.location.pathname==="/module"){k()}function v(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}function cqy(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}function bfn(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function eix(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function usa(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function jrx(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}xsm.getAttribute("href");fetch("/module?page="+ni).then(function(r){return r.json()});function hx(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}var r=location.pathname.split("/");function m(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}fetch("/static/module/docs?page="+m).then(function(r){return r.json()});fetch("/api/item?page="+nr).then(function(r){return r.json()});location.href="/api/page/settings";fetch("/page/search/api?page="+wg).then(function(r){return r.json()});function cq(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function yon(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}fetch("/static/chunk/static?page="+ksb).then(function(r){return r.json()});var cgt=location.pathname.split("/");fetch("/user?page="+eud).then(function(r){return r.json()});fetch("/static?page="+cs).then(function(r){return r.json()});fetch("/page/vendor/image?page="+gdb).then(function(r){return r.json()});function xti(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}var dv=location.pathname.split("/");var ysw=location.pathname.split("/");function c(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}var knk=location.pathname.split("/");fetch("/image/assets/image?page="+cos).then(function(r){return r.json()});location.href="/reference/settings";function h(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function cgf(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function dg(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/docs/settings/settings?page="+jwm).then(function(r){return r.json()});fetch("/chunk/chunk?page="+ab).then(function(r){return r.json()});fetch("/user/user/chunk?page="+k).then(function(r){return r.json()});function qo(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}fetch("/page/user?page="+vu).then(function(r){return r.json()});fetch("/static?page="+s).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function sb(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}fetch("/api/page?page="+i).then(function(r){return r.json()});function e(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}fetch("/vendor/account?page="+b).then(function(r){return r.json()});var ft=location.pathname.split("/");fetch("/item?page="+k).then(function(r){return r.json()});fetch("/user/api?page="+mm).then(function(r){return r.json()});var fo=location.pathname.split("/");var mo=location.pathname.split("/");fetch("/settings?page="+zd).then(function(r){return r.json()});if(window.location.pathname==="/api"){dy()}if(window.location.pathname==="/api/guide"){d()}function aru(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}fetch("/search/reference/module?page="+j).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}if(window.location.pathname==="/search/settings/api"){e()}function zr(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}fetch("/docs?page="+r).then(function(r){return r.json()});function ads(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}location.href="/image/reference/account";fetch("/chunk/user/user?page="+rkk).then(function(r){return r.json()});var s=location.pathname.split("/");if(window.location.pathname==="/search/image/page"){dr()}var tp=location.pathname.split("/");var xdx=location.pathname.split("/");var ur=location.pathname.split("/");function mk(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}if(window.location.pathname==="/account/search"){t()}fetch("/vendor/docs/reference?page="+uz).then(function(r){return r.json()});fetch("/image/item?page="+bln).then(function(r){return r.json()});fetch("/image/chunk/image?page="+a).then(function(r){return r.json()});function vg(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}if(window.location.pathname==="/assets"){ifl()}if(window.location.pathname==="/user/user"){o()}if(window.location.pathname==="/user/page/account"){idu()}function yqf(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/page/settings?page="+eet).then(function(r){return r.json()});location.href="/api";a.getAttribute("href");function ve(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}if(window.location.pathname==="/docs"){nhf()}function r(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function aln(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}var yr=location.pathname.split("/");if(window.location.pathname==="/assets/page"){uf()}var r=location.pathname.split("/");fetch("/search/reference/static?page="+qeg).then(function(r){return r.json()});var xk=location.pathname.split("/");function lw(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}fetch("/guide/assets?page="+ybr).then(function(r){return r.json()});location.href="/vendor/image/user";var daf=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}fetch("/guide/vendor/chunk?page="+i).then(function(r){return r.json()});function arl(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}function fvg(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}fetch("/image/chunk/image?page="+jvc).then(function(r){return r.json()});fetch("/chunk/settings?page="+iil).then(function(r){return r.json()});if(window.location.pathname==="/chunk/reference/module"){of()}if(window.location.pathname==="/item/search/module"){kz()}function ci(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}var b=location.pathname.split("/");fetch("/image/user/account?page="+y).then(function(r){return r.json()});fetch("/chunk/reference?page="+aep).then(function(r){return r.json()});var zpl=location.pathname.split("/");fetch("/static?page="+buj).then(function(r){return r.json()});var j=location.pathname.split("/");location.href="/image/search";function kqp(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}fetch("/static/page/user?page="+qs).then(function(r){return r.json()});fetch("/assets?page="+vr).then(function(r){return r.json()});var q=location.pathname.split("/");function hpf(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}location.href="/account/account/account";function ah(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}var cb=location.pathname.split("/");function tzv(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function xw(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}var uh=location.pathname.split("/");fetch("/assets/vendor/search?page="+tka).then(function(r){return r.json()});var ye=location.pathname.split("/");ae.getAttribute("href");if(window.location.pathname==="/vendor"){x()}function qvg(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}var z=location.pathname.split("/");var w=location.pathname.split("/");var m=location.pathname.split("/");function bbi(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function apv(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}fetch("/static?page="+qlz).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function ayd(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}jh.getAttribute("href");fetch("/page/settings?page="+vq).then(function(r){return r.json()});fetch("/api/account/guide?page="+ow).then(function(r){return r.json()});var uk=location.pathname.split("/");function rq(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}if(window.location.pathname==="/user"){j()}var crf=location.pathname.split("/");fetch("/settings/page/docs?page="+fpw).then(function(r){return r.json()});fetch("/search/reference?page="+jy).then(function(r){return r.json()});function ace(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}var ku=location.pathname.split("/");function e(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}if(window.location.pathname==="/chunk/vendor"){g()}function g(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}fetch("/static?page="+wn).then(function(r){return r.json()});function ju(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}fetch("/image?page="+tx).then(function(r){return r.json()});fetch("/account?page="+eni).then(function(r){return r.json()});var w=location.pathname.split("/");aej.getAttribute("href");var ze=location.pathname.split("/");function le(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}if(window.location.pathname==="/image/item/api"){q()}var zy=location.pathname.split("/");v.getAttribute("href");location.href="/image/assets";var j=location.pathname.split("/");fetch("/static?page="+j).then(function(r){return r.json()});var tdx=location.pathname.split("/");var vas=location.pathname.split("/");var nti=location.pathname.split("/");fetch("/reference/reference/assets?page="+o).then(function(r){return r.json()});var zyk=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}var aeg=location.pathname.split("/");var dv=location.pathname.split("/");function jb(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var af=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}var t=location.pathname.split("/");function im(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}fetch("/static/module?page="+rsj).then(function(r){return r.json()});var e=location.pathname.split("/");function r(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function ek(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}var b=location.pathname.split("/");location.href="/guide/guide/item";var r=location.pathname.split("/");var h=location.pathname.split("/");fetch("/settings/reference/item?page="+ajf).then(function(r){return r.json()});l.getAttribute("href");function kgb(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}var cmy=location.pathname.split("/");var ekp=location.pathname.split("/");function uma(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function jt(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}var t=location.pathname.split("/");function tr(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}fetch("/vendor?page="+xb).then(function(r){return r.json()});var bt=location.pathname.split("/");var asw=location.pathname.split("/");var lx=location.pathname.split("/");if(window.location.pathname==="/search/api/assets"){r()}location.href="/reference/module/search";function ff(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function rzj(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function cbo(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}var jxn=location.pathname.split("/");var k=location.pathname.split("/");function w(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}location.href="/search/search";location.href="/module";function jc(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}function vq(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}fetch("/settings/settings?page="+pjv).then(function(r){return r.json()});function na(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}fetch("/search/user/item?page="+wo).then(function(r){return r.json()});function gsp(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}var yf=location.pathname.split("/");function qfk(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function tc(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}fetch("/module/docs/item?page="+l).then(function(r){return r.json()});function dq(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}var hv=location.pathname.split("/");fetch("/account/item/page?page="+bop).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}if(window.location.pathname==="/reference/docs"){o()}if(window.location.pathname==="/account/settings"){vbj()}var rkx=location.pathname.split("/");function vs(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}var q=location.pathname.split("/");if(window.location.pathname==="/assets/api/item"){fd()}function nbp(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function vi(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}var wu=location.pathname.split("/");function au(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}fetch("/guide/vendor/vendor?page="+l).then(function(r){return r.json()});function cg(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function yo(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}var d=location.pathname.split("/");var xdj=location.pathname.split("/");location.href="/static";if(window.location.pathname==="/vendor"){ft()}fetch("/module?page="+mjl).then(function(r){return r.json()});if(window.location.pathname==="/assets/user/item"){fof()}fetch("/module/account?page="+i).then(function(r){return r.json()});fetch("/image/user/account?page="+umv).then(function(r){return r.json()});function kt(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}fetch("/account/guide/assets?page="+yyw).then(function(r){return r.json()});fetch("/item/guide?page="+fxo).then(function(r){return r.json()});location.href="/user/guide/static";function cu(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function alw(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}var qnc=location.pathname.split("/");fetch("/module/guide?page="+kd).then(function(r){return r.json()});fetch("/docs/page/chunk?page="+o).then(function(r){return r.json()});var lay=location.pathname.split("/");fetch("/vendor/item/docs?page="+hrh).then(function(r){return r.json()});location.href="/item/guide/assets";fetch("/user/user?page="+h).then(function(r){return r.json()});if(window.location.pathname==="/assets/user"){n()}function o(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}var q=location.pathname.split("/");fetch("/user/assets/chunk?page="+u).then(function(r){return r.json()});var ymq=location.pathname.split("/");location.href="/module/api/user";function n(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}oq.getAttribute("href");function jm(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}fetch("/user?page="+ry).then(function(r){return r.json()});if(window.location.pathname==="/guide/search"){hvc()}fetch("/chunk/search?page="+wm).then(function(r){return r.json()});var ioe=location.pathname.split("/");var fbt=location.pathname.split("/");function xn(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function qz(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}var fz=location.pathname.split("/");function qsx(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}if(window.location.pathname==="/docs"){r()}if(window.location.pathname==="/module/reference"){b()}function eps(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}fetch("/module/account/reference?page="+l).then(function(r){return r.json()});fetch("/static/static?page="+pta).then(function(r){return r.json()});fetch("/chunk?page="+lgt).then(function(r){return r.json()});fetch("/vendor/account?page="+tdc).then(function(r){return r.json()});fetch("/api?page="+n).then(function(r){return r.json()});var ls=location.pathname.split("/");var gxc=location.pathname.split("/");var mam=location.pathname.split("/");function xys(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}fetch("/image?page="+fj).then(function(r){return r.json()});fetch("/page/api/vendor?page="+uwm).then(function(r){return r.json()});var xm=location.pathname.split("/");function uhs(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}m.getAttribute("href");function of(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/page/settings?page="+le).then(function(r){return r.json()});function h(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function ftn(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}fetch("/static?page="+g).then(function(r){return r.json()});function np(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}var gd=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}if(window.location.pathname==="/reference/assets"){kqv()}fetch("/static?page="+uk).then(function(r){return r.json()});function i(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function vc(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}var x=location.pathname.split("/");fetch("/search?page="+b).then(function(r){return r.json()});function zas(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function atj(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}var uer=location.pathname.split("/");fetch("/user/api?page="+mp).then(function(r){return r.json()});function o(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}fetch("/search/vendor/settings?page="+zq).then(function(r){return r.json()});function g(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function xhm(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}if(window.location.pathname==="/api/settings"){nd()}function l(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}if(window.location.pathname==="/settings"){b()}var eyj=location.pathname.split("/");fetch("/api?page="+g).then(function(r){return r.json()});fetch("/item?page="+p).then(function(r){return r.json()});fetch("/settings/search/page?page="+txe).then(function(r){return r.json()});fetch("/search/static?page="+pw).then(function(r){return r.json()});if(window.location.pathname==="/item"){yz()}fetch("/user/static?page="+j).then(function(r){return r.json()});fetch("/user/image?page="+uap).then(function(r){return r.json()});if(window.location.pathname==="/settings/docs/user"){lk()}var dtz=location.pathname.split("/");fetch("/api/chunk/item?page="+uz).then(function(r){return r.json()});function ot(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}function ho(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}fetch("/search/reference?page="+w).then(function(r){return r.json()});if(window.location.pathname==="/account/item/api"){ddh()}if(window.location.pathname==="/docs/static/user"){gq()}function lx(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}fetch("/guide?page="+q).then(function(r){return r.json()});var vzz=location.pathname.split("/");var ufo=location.pathname.split("/");if(window.location.pathname==="/vendor/settings/account"){tss()}var api=location.pathname.split("/");function tl(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/page?page="+ir).then(function(r){return r.json()});function ayp(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}function ejy(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}function ah(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function bjr(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}if(window.location.pathname==="/image/static/account"){yvm()}location.href="/settings";fetch("/chunk/settings/static?page="+n).then(function(r){return r.json()});var ppg=location.pathname.split("/");fetch("/guide/assets/vendor?page="+qwq).then(function(r){return r.json()});zre.getAttribute("href");fetch("/api/user?page="+q).then(function(r){return r.json()});function j(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function xmp(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}if(window.location.pathname==="/guide/vendor"){g()}location.href="/user/item";var i=location.pathname.split("/");if(window.location.pathname==="/account/module"){woo()}function wpq(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}fetch("/guide/api/api?page="+neo).then(function(r){return r.json()});fetch("/static?page="+w).then(function(r){return r.json()});fetch("/static/account?page="+ihx).then(function(r){return r.json()});if(window.location.pathname==="/module"){do()}var pc=location.pathname.split("/");function ozt(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}o.getAttribute("href");var dvs=location.pathname.split("/");var kfl=location.pathname.split("/");function yg(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}fetch("/user?page="+b).then(function(r){return r.json()});function bgt(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var qa=location.pathname.split("/");fetch("/vendor/user/assets?page="+tn).then(function(r){return r.json()});fetch("/reference/account/docs?page="+nqc).then(function(r){return r.json()});if(window.location.pathname==="/chunk/page/docs"){o()}fetch("/api/image/search?page="+oh).then(function(r){return r.json()});var kth=location.pathname.split("/");fetch("/search/image/docs?page="+qg).then(function(r){return r.json()});function whu(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}fetch("/vendor/chunk/chunk?page="+gcx).then(function(r){return r.json()});function cte(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function pf(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}var qol=location.pathname.split("/");function a(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function fvl(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}var u=location.pathname.split("/");fetch("/chunk/page?page="+fzp).then(function(r){return r.json()});if(window.location.pathname==="/account/reference"){g()}function fvt(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}var u=location.pathname.split("/");location.href="/chunk/page/static";function p(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function sle(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function iqu(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}var dc=location.pathname.split("/");n.getAttribute("href");function qym(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function wma(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}var bo=location.pathname.split("/");fetch("/guide/assets/page?page="+zy).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function od(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}var o=location.pathname.split("/");var fzb=location.pathname.split("/");fetch("/page/account?page="+xqf).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}var uqt=location.pathname.split("/");function yh(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}var lt=location.pathname.split("/");if(window.location.pathname==="/assets"){l()}fetch("/user?page="+h).then(function(r){return r.json()});fetch("/assets?page="+jl).then(function(r){return r.json()});if(window.location.pathname==="/search/static"){vr()}location.href="/chunk";function ybe(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}fetch("/guide?page="+isj).then(function(r){return r.json()});function e(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}var ws=location.pathname.split("/");function ci(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function qaq(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function rf(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}var mm=location.pathname.split("/");function xuu(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}fetch("/static/user/reference?page="+e).then(function(r){return r.json()});function o(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}var l=location.pathname.split("/");fetch("/search/docs?page="+f).then(function(r){return r.json()});function tc(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}var nl=location.pathname.split("/");function n(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function fgy(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}fetch("/static?page="+ou).then(function(r){return r.json()});function s(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}var nbg=location.pathname.split("/");fetch("/image/docs?page="+wu).then(function(r){return r.json()});var tue=location.pathname.split("/");function t(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}if(window.location.pathname==="/module"){vj()}function im(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}var y=location.pathname.split("/");function g(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var x=location.pathname.split("/");function uye(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function iog(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}fetch("/user/account/page?page="+ulu).then(function(r){return r.json()});hda.getAttribute("href");function gn(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}g.getAttribute("href");var b=location.pathname.split("/");function d(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}fetch("/api/search/account?page="+e).then(function(r){return r.json()});function r(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}var ou=location.pathname.split("/");var de=location.pathname.split("/");function f(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}var wy=location.pathname.split("/");function czr(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}fetch("/search?page="+saw).then(function(r){return r.json()});function ymn(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}var a=location.pathname.split("/");fetch("/account/api?page="+ws).then(function(r){return r.json()});if(window.location.pathname==="/image/guide/page"){q()}var pmf=location.pathname.split("/");function woh(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}if(window.location.pathname==="/docs"){ol()}function zg(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}fetch("/docs/api/docs?page="+osw).then(function(r){return r.json()});function ibu(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}location.href="/settings";yn.getAttribute("href");function ftf(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}wqn.getAttribute("href");var j=location.pathname.split("/");var trh=location.pathname.split("/");if(window.location.pathname==="/search/reference/user"){yfc()}function vnt(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function nw(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}var s=location.pathname.split("/");function nco(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}location.href="/user/static";function omp(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function tv(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}var ic=location.pathname.split("/");if(window.location.pathname==="/assets/api/vendor"){cum()}var k=location.pathname.split("/");function bwa(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function jq(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}fetch("/settings/guide?page="+ko).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function iyk(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}fetch("/guide?page="+x).then(function(r){return r.json()});function i(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}if(window.location.pathname==="/chunk/settings"){o()}fetch("/api?page="+sl).then(function(r){return r.json()});function twe(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}var njz=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}function uz(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function dc(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}if(window.location.pathname==="/module/api"){ols()}function x(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}fetch("/settings/module?page="+bf).then(function(r){return r.json()});var n=location.pathname.split("/");fetch("/item?page="+rny).then(function(r){return r.json()});location.href="/image/guide/account";if(window.location.pathname==="/user/reference"){vz()}function wp(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}var uuz=location.pathname.split("/");fetch("/module/page?page="+dk).then(function(r){return r.json()});if(window.location.pathname==="/chunk/account/vendor"){qs()}var hdt=location.pathname.split("/");location.href="/assets";var f=location.pathname.split("/");var ey=location.pathname.split("/");fetch("/module/search?page="+d).then(function(r){return r.json()});fetch("/static/chunk?page="+pi).then(function(r){return r.json()});fetch("/static/chunk/static?page="+xsz).then(function(r){return r.json()});var q=location.pathname.split("/");var ysj=location.pathname.split("/");var i=location.pathname.split("/");fetch("/api/module/static?page="+ni).then(function(r){return r.json()});function cyy(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function pv(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}var j=location.pathname.split("/");fetch("/guide/docs/static?page="+fx).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}function nt(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}fetch("/assets/settings?page="+tvd).then(function(r){return r.json()});function yyf(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function opp(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}fetch("/account/guide?page="+bbo).then(function(r){return r.json()});fetch("/docs/reference?page="+t).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function obl(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/api?page="+rw).then(function(r){return r.json()});function hm(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var yt=location.pathname.split("/");if(window.location.pathname==="/guide/image"){mp()}function cll(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}function kjg(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function gu(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function a(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}j.getAttribute("href");function f(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}fetch("/reference?page="+ayk).then(function(r){return r.json()});function vem(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}fetch("/vendor/api?page="+z).then(function(r){return r.json()});function tcj(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}ux.getAttribute("href");function nr(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}fetch("/image/vendor?page="+kx).then(function(r){return r.json()});md.getAttribute("href");fetch("/settings/guide/assets?page="+msy).then(function(r){return r.json()});location.href="/image";function kfd(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}pxi.getAttribute("href");tx.getAttribute("href");ph.getAttribute("href");function str(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function yk(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}fetch("/vendor/user?page="+z).then(function(r){return r.json()});if(window.location.pathname==="/vendor/vendor"){fb()}location.href="/item/static/image";var ty=location.pathname.split("/");var j=location.pathname.split("/");eav.getAttribute("href");var n=location.pathname.split("/");var jn=location.pathname.split("/");var mz=location.pathname.split("/");fetch("/docs/settings/module?page="+o).then(function(r){return r.json()});function hl(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function ltl(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}fetch("/search?page="+do).then(function(r){return r.json()});fetch("/module?page="+pk).then(function(r){return r.json()});fetch("/item?page="+zw).then(function(r){return r.json()});fetch("/guide/user?page="+w).then(function(r){return r.json()});var v=location.pathname.split("/");fetch("/user/module?page="+k).then(function(r){return r.json()});var udm=location.pathname.split("/");fetch("/account?page="+nl).then(function(r){return r.json()});fetch("/static?page="+yxg).then(function(r){return r.json()});if(window.location.pathname==="/chunk"){kmb()}function jsr(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function gv(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}if(window.location.pathname==="/module"){el()}fetch("/reference?page="+xxq).then(function(r){return r.json()});function bdz(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function rd(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function ko(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}var owk=location.pathname.split("/");function tkq(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}fetch("/static/item/module?page="+hwk).then(function(r){return r.json()});function ds(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function kdj(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}var cj=location.pathname.split("/");location.href="/vendor/assets";function fis(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}var voi=location.pathname.split("/");jtg.getAttribute("href");function r(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function agf(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function vq(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function gsp(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function wr(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}var n=location.pathname.split("/");function jdf(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}var zrv=location.pathname.split("/");var y=location.pathname.split("/");function a(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function hz(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}var jmr=location.pathname.split("/");fetch("/vendor/chunk?page="+y).then(function(r){return r.json()});y.getAttribute("href");function js(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function djn(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function bco(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function wr(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}fetch("/guide/user/assets?page="+vwo).then(function(r){return r.json()});function now(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}var mln=location.pathname.split("/");fetch("/static/image?page="+bs).then(function(r){return r.json()});function ju(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}if(window.location.pathname==="/search"){rh()}function izw(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function pf(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function gyf(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var exh=location.pathname.split("/");fetch("/reference/static/settings?page="+dyu).then(function(r){return r.json()});function brb(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}var b=location.pathname.split("/");function pc(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}fetch("/guide/chunk/chunk?page="+te).then(function(r){return r.json()});function ek(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function hf(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}fetch("/account/vendor?page="+e).then(function(r){return r.json()});var g=location.pathname.split("/");fetch("/api/guide?page="+qeq).then(function(r){return r.json()});fetch("/page/settings/docs?page="+g).then(function(r){return r.json()});fetch("/reference?page="+zvp).then(function(r){return r.json()});function tji(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function jm(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}if(window.location.pathname==="/item/static/vendor"){mui()}function o(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}var ead=location.pathname.split("/");fetch("/search?page="+gh).then(function(r){return r.json()});var b=location.pathname.split("/");location.href="/assets/assets/module";tn.getAttribute("href");function vo(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function nho(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}if(window.location.pathname==="/chunk/account"){dan()}fetch("/account?page="+ru).then(function(r){return r.json()});var lvw=location.pathname.split("/");if(window.location.pathname==="/image"){iwr()}var b=location.pathname.split("/");function k(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function zx(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}fetch("/user/chunk/user?page="+hf).then(function(r){return r.json()});fetch("/api?page="+ez).then(function(r){return r.json()});var lb=location.pathname.split("/");function n(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function yu(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function bv(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}fetch("/static/docs?page="+k).then(function(r){return r.json()});var b=location.pathname.split("/");function dfx(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}fetch("/search?page="+cda).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/reference/docs/settings?page="+tgh).then(function(r){return r.json()});var v=location.pathname.split("/");fetch("/page/settings/vendor?page="+ota).then(function(r){return r.json()});fetch("/page?page="+mj).then(function(r){return r.json()});function de(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}var bj=location.pathname.split("/");fetch("/assets?page="+c).then(function(r){return r.json()});s.getAttribute("href");if(window.location.pathname==="/page/static"){p()}if(window.location.pathname==="/reference/api/static"){qie()}var a=location.pathname.split("/");function okd(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function qlc(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}fetch("/static/item?page="+e).then(function(r){return r.json()});function grb(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function ddv(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function wht(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}var p=location.pathname.split("/");if(window.location.pathname==="/static"){ikr()}fetch("/api/chunk?page="+nih).then(function(r){return r.json()});if(window.location.pathname==="/api/user"){ewr()}p.getAttribute("href");fetch("/user?page="+so).then(function(r){return r.json()});var giw=location.pathname.split("/");if(window.location.pathname==="/assets"){v()}g.getAttribute("href");fetch("/image?page="+uk).then(function(r){return r.json()});function n(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}fetch("/user?page="+xl).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function dnq(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}if(window.location.pathname==="/settings/static"){wqs()}function ir(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function yjf(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/module/vendor/reference?page="+o).then(function(r){return r.json()});if(window.location.pathname==="/docs/static"){u()}fetch("/item/docs?page="+pn).then(function(r){return r.json()});function u(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}fetch("/reference/guide?page="+bg).then(function(r){return r.json()});fetch("/module?page="+wx).then(function(r){return r.json()});fetch("/reference/guide?page="+qo).then(function(r){return r.json()});function vs(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}if(window.location.pathname==="/assets/item/module"){vri()}fetch("/search?page="+ds).then(function(r){return r.json()});function es(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}var at=location.pathname.split("/");function g(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}var yo=location.pathname.split("/");function dk(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}location.href="/chunk";function dlz(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}fetch("/account/reference/image?page="+aoz).then(function(r){return r.json()});fetch("/chunk/image?page="+ug).then(function(r){return r.json()});fetch("/image/search/chunk?page="+l).then(function(r){return r.json()});function d(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}if(window.location.pathname==="/api/vendor/settings"){es()}function d(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}fetch("/vendor/module?page="+mc).then(function(r){return r.json()});if(window.location.pathname==="/item/vendor"){m()}y.getAttribute("href");var sl=location.pathname.split("/");if(window.location.pathname==="/account/reference/assets"){p()}function jbu(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}location.href="/docs";function n(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}var dp=location.pathname.split("/");if(window.location.pathname==="/assets"){rwt()}fetch("/reference/guide?page="+xi).then(function(r){return r.json()});if(window.location.pathname==="/user"){y()}if(window.location.pathname==="/assets/chunk/search"){k()}function zme(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}fetch("/api/vendor?page="+n).then(function(r){return r.json()});function shs(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function mys(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}fetch("/assets?page="+xzv).then(function(r){return r.json()});function l(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}fetch("/vendor/image?page="+lan).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}fetch("/vendor/user/image?page="+f).then(function(r){return r.json()});function us(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function elo(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/item?page="+tw).then(function(r){return r.json()});function xy(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}if(window.location.pathname==="/search"){gfa()}function u(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}function tl(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/account/settings?page="+mgu).then(function(r){return r.json()});function ikw(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}function co(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}location.href="/vendor/reference/module";if(window.location.pathname==="/search/docs"){vk()}function jgl(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}fetch("/guide/static?page="+xys).then(function(r){return r.json()});hj.getAttribute("href");function vg(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}var bz=location.pathname.split("/");var xp=location.pathname.split("/");fetch("/image/api?page="+qx).then(function(r){return r.json()});if(window.location.pathname==="/static/vendor/docs"){q()}function zv(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function az(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/page?page="+v).then(function(r){return r.json()});if(window.location.pathname==="/api"){n()}function uoj(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}function peb(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function ko(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function ig(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}location.href="/guide/api/assets";fetch("/settings/search/image?page="+yum).then(function(r){return r.json()});if(window.location.pathname==="/module/static/reference"){jya()}ukw.getAttribute("href");var zmf=location.pathname.split("/");fetch("/docs?page="+nay).then(function(r){return r.json()});if(window.location.pathname==="/item/vendor/guide"){gdr()}n.getAttribute("href");fetch("/settings?page="+m).then(function(r){return r.json()});var cx=location.pathname.split("/");function d(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function jxf(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}var bt=location.pathname.split("/");if(window.location.pathname==="/user/module"){rfr()}if(window.location.pathname==="/guide"){g()}function qbd(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function go(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}fetch("/item?page="+zxh).then(function(r){return r.json()});function byt(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}ufo.getAttribute("href");fetch("/vendor?page="+ew).then(function(r){return r.json()});var sc=location.pathname.split("/");function yqp(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}ge.getAttribute("href");bjr.getAttribute("href");var ycb=location.pathname.split("/");function av(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}var wu=location.pathname.split("/");var p=location.pathname.split("/");fetch("/module?page="+mwo).then(function(r){return r.json()});var dz=location.pathname.split("/");function yjw(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}fetch("/page/api?page="+r).then(function(r){return r.json()});fetch("/reference/api?page="+la).then(function(r){return r.json()});function rgj(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function jr(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}fetch("/settings/api?page="+jz).then(function(r){return r.json()});fetch("/page/image/reference?page="+nmj).then(function(r){return r.json()});location.href="/account";function ki(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}var b=location.pathname.split("/");fetch("/assets/module?page="+o).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}if(window.location.pathname==="/vendor/module/guide"){wa()}function mp(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function lnf(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}var c=location.pathname.split("/");var lp=location.pathname.split("/");t.getAttribute("href");var pi=location.pathname.split("/");if(window.location.pathname==="/account/page"){yy()}function f(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}fetch("/api/item/chunk?page="+gt).then(function(r){return r.json()});function gu(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}var p=location.pathname.split("/");var zn=location.pathname.split("/");var u=location.pathname.split("/");var ijc=location.pathname.split("/");function yw(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}fetch("/user/chunk?page="+rk).then(function(r){return r.json()});function mcr(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function tov(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}if(window.location.pathname==="/reference/item"){ooy()}var kd=location.pathname.split("/");if(window.location.pathname==="/static"){sn()}fetch("/search?page="+hov).then(function(r){return r.json()});fetch("/account/item?page="+b).then(function(r){return r.json()});var jf=location.pathname.split("/");function j(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}var yzj=location.pathname.split("/");if(window.location.pathname==="/docs/module"){mk()}function q(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}if(window.location.pathname==="/account/settings/static"){ewu()}fetch("/item?page="+x).then(function(r){return r.json()});var ald=location.pathname.split("/");location.href="/module/docs/chunk";var dri=location.pathname.split("/");fetch("/account/assets?page="+zcm).then(function(r){return r.json()});if(window.location.pathname==="/item/user"){zpi()}function g(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}if(window.location.pathname==="/item/static"){td()}location.href="/search/api/module";var dc=location.pathname.split("/");function uh(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}function at(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}var e=location.pathname.split("/");function mq(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}fetch("/settings?page="+lmc).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}var pcn=location.pathname.split("/");var gi=location.pathname.split("/");location.href="/guide/assets";if(window.location.pathname==="/image/guide"){d()}function ub(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}fetch("/page/reference/user?page="+zk).then(function(r){return r.json()});fetch("/api/guide?page="+any).then(function(r){return r.json()});function o(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}ram.getAttribute("href");function uyl(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function xi(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function jza(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}location.href="/user/item/docs";fetch("/account/module?page="+jvz).then(function(r){return r.json()});var h=location.pathname.split("/");fetch("/search/reference?page="+e).then(function(r){return r.json()});function qbt(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}var n=location.pathname.split("/");var mvl=location.pathname.split("/");function tvg(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function kcx(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function rc(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}var zii=location.pathname.split("/");l.getAttribute("href");fetch("/docs/assets/user?page="+h).then(function(r){return r.json()});fetch("/guide/api?page="+qji).then(function(r){return r.json()});if(window.location.pathname==="/static/settings/image"){vt()}function g(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}fetch("/assets?page="+qd).then(function(r){return r.json()});fetch("/api/user/docs?page="+e).then(function(r){return r.json()});function vp(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}var amk=location.pathname.split("/");var xji=location.pathname.split("/");function gyx(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function es(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}var u=location.pathname.split("/");fetch("/module?page="+o).then(function(r){return r.json()});function l(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}location.href="/settings/account/assets";zx.getAttribute("href");var tr=location.pathname.split("/");location.href="/user/guide/page";var x=location.pathname.split("/");var ey=location.pathname.split("/");function pcb(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}if(window.location.pathname==="/search/docs/account"){ef()}function b(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}var nv=location.pathname.split("/");function f(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}fetch("/page/item/settings?page="+m).then(function(r){return r.json()});fetch("/chunk?page="+nwg).then(function(r){return r.json()});if(window.location.pathname==="/reference"){emz()}function e(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}if(window.location.pathname==="/module/static"){ucx()}fetch("/reference?page="+b).then(function(r){return r.json()});d.getAttribute("href");function g(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}fetch("/item?page="+lmi).then(function(r){return r.json()});function fck(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var a=location.pathname.split("/");fetch("/account/user?page="+nka).then(function(r){return r.json()});fetch("/module/docs/settings?page="+ril).then(function(r){return r.json()});fetch("/page/vendor/user?page="+brm).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}fetch("/reference/user/static?page="+k).then(function(r){return r.json()});function zde(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}if(window.location.pathname==="/api/api/account"){mtd()}function x(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var n=location.pathname.split("/");function t(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}var bxo=location.pathname.split("/");function qs(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}var x=location.pathname.split("/");fetch("/account?page="+ilv).then(function(r){return r.json()});fetch("/docs/page?page="+fyz).then(function(r){return r.json()});function ze(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}var v=location.pathname.split("/");function bt(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}var ti=location.pathname.split("/");function b(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function zuw(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}var k=location.pathname.split("/");var gxx=location.pathname.split("/");function tr(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}gcy.getAttribute("href");var hpc=location.pathname.split("/");function vwr(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}fetch("/image/module/item?page="+a).then(function(r){return r.json()});function nba(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}fetch("/search/api/item?page="+pq).then(function(r){return r.json()});if(window.location.pathname==="/user/page/assets"){qmg()}var f=location.pathname.split("/");var t=location.pathname.split("/");fetch("/item/search/account?page="+fw).then(function(r){return r.json()});q.getAttribute("href");var uh=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}fetch("/reference?page="+kzk).then(function(r){return r.json()});function nbe(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}if(window.location.pathname==="/reference/docs"){jwd()}fetch("/page/settings?page="+g).then(function(r){return r.json()});function zbz(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function btk(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function qqa(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function mh(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}var f=location.pathname.split("/");function ogv(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function uct(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}if(window.location.pathname==="/reference"){z()}function cwh(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}var h=location.pathname.split("/");var ee=location.pathname.split("/");var b=location.pathname.split("/");var lp=location.pathname.split("/");function v(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}fetch("/page?page="+vd).then(function(r){return r.json()});zbl.getAttribute("href");if(window.location.pathname==="/vendor/docs/chunk"){k()}fetch("/page/search/settings?page="+ig).then(function(r){return r.json()});location.href="/user";var h=location.pathname.split("/");if(window.location.pathname==="/api/settings/page"){idp()}var xgk=location.pathname.split("/");fetch("/static?page="+wb).then(function(r){return r.json()});var vmk=location.pathname.split("/");if(window.location.pathname==="/static/reference"){fh()}var yi=location.pathname.split("/");var yio=location.pathname.split("/");function txq(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function daf(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function zn(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}var zlh=location.pathname.split("/");fetch("/item/docs?page="+rqe).then(function(r){return r.json()});location.href="/api/static/assets";fetch("/chunk/reference/api?page="+ud).then(function(r){return r.json()});function s(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}fetch("/account?page="+gi).then(function(r){return r.json()});function p(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}var ymg=location.pathname.split("/");if(window.location.pathname==="/assets/static/vendor"){am()}fetch("/api?page="+iw).then(function(r){return r.json()});var gw=location.pathname.split("/");var lvu=location.pathname.split("/");function uej(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}fetch("/chunk?page="+j).then(function(r){return r.json()});fetch("/chunk/docs/item?page="+q).then(function(r){return r.json()});function q(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}if(window.location.pathname==="/user/user"){yfb()}dm.getAttribute("href");function u(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}fetch("/api/vendor?page="+p).then(function(r){return r.json()});function s(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}z.getAttribute("href");var b=location.pathname.split("/");function zye(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}var mts=location.pathname.split("/");function sxb(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}location.href="/reference";fetch("/reference?page="+m).then(function(r){return r.json()});location.href="/module/settings";function hbg(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function ece(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}if(window.location.pathname==="/user/settings/vendor"){ba()}function sfy(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}if(window.location.pathname==="/search/docs"){kq()}function qdc(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}fetch("/module?page="+s).then(function(r){return r.json()});if(window.location.pathname==="/vendor/reference"){m()}var ns=location.pathname.split("/");fetch("/search/assets?page="+b).then(function(r){return r.json()});fetch("/item/account/assets?page="+pjx).then(function(r){return r.json()});fetch("/api/settings?page="+rt).then(function(r){return r.json()});fetch("/assets?page="+g).then(function(r){return r.json()});var d=location.pathname.split("/");fetch("/vendor/user?page="+nm).then(function(r){return r.json()});var oq=location.pathname.split("/");function bo(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}fetch("/image/image/account?page="+rkv).then(function(r){return r.json()});function ht(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}fetch("/module/vendor?page="+kkv).then(function(r){return r.json()});function vn(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}si.getAttribute("href");fetch("/vendor/assets/vendor?page="+v).then(function(r){return r.json()});location.href="/page";location.href="/vendor/module";function xn(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function je(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}fetch("/settings/docs/chunk?page="+yhd).then(function(r){return r.json()});function qo(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}if(window.location.pathname==="/page/search/account"){tce()}g.getAttribute("href");location.href="/module/user/api";function ena(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}if(window.location.pathname==="/reference/chunk"){vkb()}function p(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}function om(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}fetch("/page/static?page="+cwn).then(function(r){return r.json()});fetch("/item/item/image?page="+av).then(function(r){return r.json()});var x=location.pathname.split("/");function dvd(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function epq(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}fetch("/docs/settings?page="+p).then(function(r){return r.json()});location.href="/docs";if(window.location.pathname==="/docs"){k()}fetch("/settings/settings?page="+jar).then(function(r){return r.json()});if(window.location.pathname==="/api/page/chunk"){z()}if(window.location.pathname==="/guide"){uk()}var bo=location.pathname.split("/");function vb(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}var z=location.pathname.split("/");fetch("/docs/user/image?page="+r).then(function(r){return r.json()});zwt.getAttribute("href");fetch("/api/image/static?page="+ol).then(function(r){return r.json()});location.href="/item/static/image";function z(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}fetch("/item?page="+yl).then(function(r){return r.json()});location.href="/chunk/image";fetch("/page?page="+eg).then(function(r){return r.json()});if(window.location.pathname==="/user/module"){b()}function zhq(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}mij.getAttribute("href");function ilf(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}location.href="/settings";tp.getAttribute("href");fetch("/user?page="+mk).then(function(r){return r.json()});var uhy=location.pathname.split("/");fetch("/static?page="+g).then(function(r){return r.json()});function hli(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}function zo(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}if(window.location.pathname==="/guide"){dx()}if(window.location.pathname==="/chunk"){fs()}fetch("/image?page="+xa).then(function(r){return r.json()});fetch("/api/module/chunk?page="+x).then(function(r){return r.json()});function n(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function mja(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}fetch("/page/settings?page="+lnb).then(function(r){return r.json()});function ox(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function xrg(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}fetch("/reference/chunk/reference?page="+dnb).then(function(r){return r.json()});location.href="/settings";var h=location.pathname.split("/");fetch("/assets/module/docs?page="+etg).then(function(r){return r.json()});function rhy(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function bz(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function jm(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}var ffg=location.pathname.split("/");var qgq=location.pathname.split("/");function uzq(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var ahx=location.pathname.split("/");fetch("/image/chunk/api?page="+zwm).then(function(r){return r.json()});function t(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}if(window.location.pathname==="/api/search/static"){ykx()}function tpa(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}var jo=location.pathname.split("/");if(window.location.pathname==="/page"){k()}var a=location.pathname.split("/");var ani=location.pathname.split("/");fetch("/guide/search?page="+ca).then(function(r){return r.json()});function thb(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var h=location.pathname.split("/");z.getAttribute("href");fetch("/vendor/static?page="+ksk).then(function(r){return r.json()});var kx=location.pathname.split("/");function m(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}if(window.location.pathname==="/item/reference"){pxf()}fetch("/chunk/search/module?page="+zj).then(function(r){return r.json()});g.getAttribute("href");fetch("/settings/account?page="+mbq).then(function(r){return r.json()});function jl(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}var fm=location.pathname.split("/");function nug(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}location.href="/vendor/reference/assets";fetch("/guide?page="+b).then(function(r){return r.json()});fetch("/chunk/guide?page="+wxj).then(function(r){return r.json()});location.href="/api/api";function xjy(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function ia(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}fetch("/reference/api?page="+uj).then(function(r){return r.json()});av.getAttribute("href");function za(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}fetch("/docs/static/page?page="+m).then(function(r){return r.json()});fetch("/api/settings?page="+p).then(function(r){return r.json()});var h=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function md(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function sbv(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}var p=location.pathname.split("/");var ua=location.pathname.split("/");function fip(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function mox(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}var e=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}fetch("/reference?page="+lxw).then(function(r){return r.json()});fetch("/search?page="+g).then(function(r){return r.json()});fetch("/settings/assets?page="+c).then(function(r){return r.json()});location.href="/api/vendor";function wt(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/api?page="+d).then(function(r){return r.json()});function ao(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}var e=location.pathname.split("/");location.href="/account/module/static";fetch("/module/account/image?page="+zlj).then(function(r){return r.json()});si.getAttribute("href");if(window.location.pathname==="/account/assets"){t()}function n(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}location.href="/docs/api";function iah(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}if(window.location.pathname==="/static/docs"){z()}var itd=location.pathname.split("/");function y(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function nxo(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}fetch("/assets?page="+e).then(function(r){return r.json()});fetch("/api/api/guide?page="+x).then(function(r){return r.json()});var w=location.pathname.split("/");var wul=location.pathname.split("/");xj.getAttribute("href");fetch("/page/static?page="+ux).then(function(r){return r.json()});var qm=location.pathname.split("/");var sgi=location.pathname.split("/");function ib(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}location.href="/module/page/assets";if(window.location.pathname==="/account/settings"){ujn()}function imr(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}bp.getAttribute("href");location.href="/page";var iwz=location.pathname.split("/");var llu=location.pathname.split("/");var w=location.pathname.split("/");location.href="/page/chunk/docs";function qky(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}fetch("/module/search?page="+d).then(function(r){return r.json()});var m=location.pathname.split("/");location.href="/docs";function d(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function ip(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}fetch("/search/settings/search?page="+ip).then(function(r){return r.json()});function ns(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}var a=location.pathname.split("/");location.href="/settings";function ovn(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function pyy(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function xe(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}location.href="/reference/guide";fetch("/vendor/account?page="+zqt).then(function(r){return r.json()});function yh(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}location.href="/settings/assets";fetch("/docs/reference/page?page="+e).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function cx(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}function ujx(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}if(window.location.pathname==="/api/guide"){jdx()}var p=location.pathname.split("/");function m(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}location.href="/guide/image";fetch("/module/page?page="+im).then(function(r){return r.json()});if(window.location.pathname==="/search/static"){yo()}function b(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}fetch("/chunk/account/image?page="+sc).then(function(r){return r.json()});function lo(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function run(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}var rod=location.pathname.split("/");function ryy(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}location.href="/image/static";function bk(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function fad(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}fetch("/docs/guide/image?page="+l).then(function(r){return r.json()});fetch("/page?page="+v).then(function(r){return r.json()});function qtu(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}var qmb=location.pathname.split("/");fetch("/search/assets/page?page="+b).then(function(r){return r.json()});if(window.location.pathname==="/settings/api/reference"){hv()}fetch("/settings/reference?page="+eb).then(function(r){return r.json()});function yk(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}fetch("/reference/account?page="+bj).then(function(r){return r.json()});location.href="/guide/settings/module";zpv.getAttribute("href");i.getAttribute("href");function rmt(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}if(window.location.pathname==="/docs"){n()}function oy(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function etd(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/assets/user?page="+voy).then(function(r){return r.json()});fetch("/guide/assets/account?page="+xb).then(function(r){return r.json()});function wg(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}fetch("/item?page="+fbj).then(function(r){return r.json()});function wa(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function wuj(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}iw.getAttribute("href");function ap(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}fetch("/search?page="+vlv).then(function(r){return r.json()});fetch("/assets?page="+xcn).then(function(r){return r.json()});function efd(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function vki(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}location.href="/page/chunk/reference";function g(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}var n=location.pathname.split("/");function wq(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/settings/module/image?page="+qbt).then(function(r){return r.json()});var tdn=location.pathname.split("/");function p(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}kp.getAttribute("href");function ud(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function mbt(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}fetch("/account/api/settings?page="+zwt).then(function(r){return r.json()});function is(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function og(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}fetch("/guide/search/reference?page="+ac).then(function(r){return r.json()});function wvp(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}fetch("/settings/static/item?page="+x).then(function(r){return r.json()});fetch("/reference?page="+tus).then(function(r){return r.json()});var au=location.pathname.split("/");if(window.location.pathname==="/page/reference"){dja()}if(window.location.pathname==="/item/chunk"){r()}if(window.location.pathname==="/user/user"){gyx()}function mb(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}location.href="/reference";function fx(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}if(window.location.pathname==="/settings/reference"){fsg()}function it(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function mzw(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}if(window.location.pathname==="/docs"){z()}var lk=location.pathname.split("/");fetch("/vendor/page/static?page="+il).then(function(r){return r.json()});function rg(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}if(window.location.pathname==="/reference/guide/docs"){ntr()}function x(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function kjz(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}fetch("/static/chunk?page="+ouz).then(function(r){return r.json()});fetch("/item/user?page="+inx).then(function(r){return r.json()});var lae=location.pathname.split("/");if(window.location.pathname==="/item/settings"){ff()}fetch("/guide/module/assets?page="+c).then(function(r){return r.json()});location.href="/chunk/user/chunk";fetch("/search/account?page="+w).then(function(r){return r.json()});var h=location.pathname.split("/");var gj=location.pathname.split("/");v.getAttribute("href");location.href="/assets/static";fetch("/vendor?page="+pkf).then(function(r){return r.json()});function nd(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}fetch("/vendor/search?page="+fq).then(function(r){return r.json()});var tqv=location.pathname.split("/");var qr=location.pathname.split("/");var a=location.pathname.split("/");fetch("/reference?page="+yb).then(function(r){return r.json()});function ge(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}if(window.location.pathname==="/page"){dzj()}fetch("/item/settings/item?page="+uf).then(function(r){return r.json()});location.href="/page/assets";if(window.location.pathname==="/page/user/vendor"){efm()}function u(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function bj(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function kph(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}fetch("/guide/settings/user?page="+q).then(function(r){return r.json()});if(window.location.pathname==="/module/module"){w()}function zhu(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}fetch("/module/user/page?page="+kgs).then(function(r){return r.json()});fetch("/docs/guide/assets?page="+zlm).then(function(r){return r.json()});var dw=location.pathname.split("/");function pw(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}njq.getAttribute("href");function ivp(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}function dql(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}fetch("/module/account/page?page="+qvg).then(function(r){return r.json()});var g=location.pathname.split("/");w.getAttribute("href");function n(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}fetch("/module/image?page="+f).then(function(r){return r.json()});var i=location.pathname.split("/");fetch("/docs/vendor?page="+v).then(function(r){return r.json()});function mf(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}function cqx(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}var ee=location.pathname.split("/");if(window.location.pathname==="/static"){ie()}var y=location.pathname.split("/");fetch("/settings/search/module?page="+y).then(function(r){return r.json()});var j=location.pathname.split("/");fetch("/search?page="+k).then(function(r){return r.json()});function t(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}if(window.location.pathname==="/image"){jf()}location.href="/assets/search";vea.getAttribute("href");function r(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function qge(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}fetch("/page?page="+enx).then(function(r){return r.json()});location.href="/settings/image/user";var f=location.pathname.split("/");fetch("/reference/chunk/account?page="+d).then(function(r){return r.json()});function hw(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}fetch("/settings/vendor/search?page="+d).then(function(r){return r.json()});var zfh=location.pathname.split("/");fetch("/page/settings/account?page="+gjm).then(function(r){return r.json()});hz.getAttribute("href");if(window.location.pathname==="/account/chunk"){l()}fetch("/account?page="+tsb).then(function(r){return r.json()});fetch("/chunk?page="+a).then(function(r){return r.json()});fetch("/vendor?page="+gxo).then(function(r){return r.json()});var ot=location.pathname.split("/");function s(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}if(window.location.pathname==="/settings/api"){cjp()}function mbq(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function blg(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}fetch("/static?page="+q).then(function(r){return r.json()});function zbl(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}ey.getAttribute("href");fetch("/module/guide?page="+q).then(function(r){return r.json()});var v=location.pathname.split("/");function di(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}fetch("/vendor/settings?page="+nt).then(function(r){return r.json()});function mj(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function oe(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}fetch("/settings/docs/vendor?page="+cj).then(function(r){return r.json()});fetch("/chunk?page="+nh).then(function(r){return r.json()});location.href="/chunk/item/assets";aes.getAttribute("href");function vg(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}fetch("/item?page="+od).then(function(r){return r.json()});var qvg=location.pathname.split("/");var ln=location.pathname.split("/");function e(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}fetch("/api/user?page="+pe).then(function(r){return r.json()});var a=location.pathname.split("/");function lp(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function z(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function nd(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}fetch("/assets/assets?page="+i).then(function(r){return r.json()});var hc=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}fetch("/search/assets/api?page="+eqk).then(function(r){return r.json()});var xeh=location.pathname.split("/");var hfx=location.pathname.split("/");function f(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function lcw(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function g(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}if(window.location.pathname==="/image"){nm()}fetch("/static?page="+li).then(function(r){return r.json()});hf.getAttribute("href");fetch("/search/vendor?page="+fw).then(function(r){return r.json()});fetch("/docs/static?page="+ei).then(function(r){return r.json()});var z=location.pathname.split("/");function psz(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}var yu=location.pathname.split("/");function o(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}if(window.location.pathname==="/item/guide/settings"){atl()}var iz=location.pathname.split("/");var qxv=location.pathname.split("/");function acf(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}var bky=location.pathname.split("/");function u(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}fetch("/docs/docs?page="+mlu).then(function(r){return r.json()});function ek(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function yj(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function lwm(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}n.getAttribute("href");function w(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}function ad(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}var i=location.pathname.split("/");function ae(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}fetch("/static?page="+ig).then(function(r){return r.json()});function evt(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function ie(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function cb(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function ocu(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}location.href="/user/image/docs";location.href="/guide";function ec(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function k(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function xsg(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}var pl=location.pathname.split("/");location.href="/image/item/api";fetch("/account/guide/user?page="+y).then(function(r){return r.json()});if(window.location.pathname==="/settings/docs/vendor"){r()}fetch("/image/user/image?page="+a).then(function(r){return r.json()});fetch("/user/static/settings?page="+h).then(function(r){return r.json()});function wxp(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}if(window.location.pathname==="/reference"){txs()}function rpm(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}fetch("/assets/account?page="+rl).then(function(r){return r.json()});function dmn(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}function idx(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function xb(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}var r=location.pathname.split("/");var f=location.pathname.split("/");ozs.getAttribute("href");fetch("/reference?page="+ybc).then(function(r){return r.json()});fetch("/vendor/account/reference?page="+e).then(function(r){return r.json()});function q(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function yue(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function om(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}var xaf=location.pathname.split("/");fetch("/user?page="+kwb).then(function(r){return r.json()});function ui(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/reference?page="+wdf).then(function(r){return r.json()});fetch("/search?page="+sfh).then(function(r){return r.json()});function ehc(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}function jk(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function sb(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}fetch("/module?page="+qje).then(function(r){return r.json()});o.getAttribute("href");fetch("/item/docs?page="+nb).then(function(r){return r.json()});function ech(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}if(window.location.pathname==="/assets/docs"){ft()}function i(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function fyu(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function bv(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}if(window.location.pathname==="/guide/guide"){wgr()}function elg(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function ky(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}var ht=location.pathname.split("/");miq.getAttribute("href");fetch("/api/api?page="+y).then(function(r){return r.json()});function bwf(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}var wq=location.pathname.split("/");fetch("/item/chunk/guide?page="+i).then(function(r){return r.json()});if(window.location.pathname==="/static/search"){gc()}fetch("/api/static/item?page="+fy).then(function(r){return r.json()});fetch("/chunk/image/image?page="+ktm).then(function(r){return r.json()});if(window.location.pathname==="/item/page/reference"){of()}var eqv=location.pathname.split("/");if(window.location.pathname==="/vendor"){pk()}function s(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function vba(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}if(window.location.pathname==="/settings/page"){w()}function t(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function uxz(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}var x=location.pathname.split("/");function ax(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function nhb(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var lk=location.pathname.split("/");function bzu(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}var qw=location.pathname.split("/");var rz=location.pathname.split("/");function ua(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/settings?page="+mw).then(function(r){return r.json()});var jbr=location.pathname.split("/");fetch("/guide?page="+dye).then(function(r){return r.json()});fetch("/docs?page="+zaz).then(function(r){return r.json()});location.href="/static/module/account";function tr(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function ewg(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}function kb(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}var jn=location.pathname.split("/");function c(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}if(window.location.pathname==="/search/image/settings"){n()}function u(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}location.href="/search";fetch("/assets/module?page="+y).then(function(r){return r.json()});fetch("/assets/page?page="+ge).then(function(r){return r.json()});if(window.location.pathname==="/search"){si()}var u=location.pathname.split("/");function vl(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}fetch("/item/search/user?page="+lgv).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}var ev=location.pathname.split("/");fetch("/page?page="+b).then(function(r){return r.json()});if(window.location.pathname==="/guide/api"){s()}location.href="/chunk";function hcd(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}location.href="/item";if(window.location.pathname==="/api/docs"){bc()}function xre(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function sa(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}j.getAttribute("href");location.href="/user";function dyu(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}if(window.location.pathname==="/static/user"){h()}if(window.location.pathname==="/user"){qor()}function t(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}function og(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}fetch("/settings/search?page="+t).then(function(r){return r.json()});var qz=location.pathname.split("/");sf.getAttribute("href");function j(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function pnh(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}if(window.location.pathname==="/api/settings/guide"){fel()}var fv=location.pathname.split("/");fetch("/reference/chunk?page="+nz).then(function(r){return r.json()});function lv(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}fetch("/settings/static?page="+n).then(function(r){return r.json()});function vjd(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var du=location.pathname.split("/");fetch("/user/assets?page="+uwi).then(function(r){return r.json()});location.href="/module";function cxa(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}var eca=location.pathname.split("/");var v=location.pathname.split("/");function iud(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}var v=location.pathname.split("/");var db=location.pathname.split("/");function qfs(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function jxv(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}if(window.location.pathname==="/static"){l()}if(window.location.pathname==="/docs"){rtw()}function k(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}var vza=location.pathname.split("/");fetch("/assets/search?page="+hu).then(function(r){return r.json()});fetch("/module/page/page?page="+sn).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}fetch("/image/image/item?page="+qld).then(function(r){return r.json()});var g=location.pathname.split("/");function epd(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}fetch("/settings/docs?page="+ld).then(function(r){return r.json()});function g(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}fetch("/chunk/image?page="+r).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function hun(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}var s=location.pathname.split("/");function wmg(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}fetch("/settings?page="+qa).then(function(r){return r.json()});function km(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}fetch("/page?page="+y).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}if(window.location.pathname==="/account/page/user"){yj()}function csz(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function bq(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}var rs=location.pathname.split("/");function b(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function ypl(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}if(window.location.pathname==="/page/module/module"){jsp()}fetch("/user/guide/settings?page="+b).then(function(r){return r.json()});var p=location.pathname.split("/");if(window.location.pathname==="/settings/account"){ko()}fetch("/item?page="+wrl).then(function(r){return r.json()});fetch("/chunk/vendor/page?page="+sok).then(function(r){return r.json()});t.getAttribute("href");function gzj(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}location.href="/page";if(window.location.pathname==="/page"){z()}var d=location.pathname.split("/");n.getAttribute("href");kpm.getAttribute("href");if(window.location.pathname==="/module/assets/item"){hdj()}if(window.location.pathname==="/static/vendor"){hx()}var a=location.pathname.split("/");var oq=location.pathname.split("/");fetch("/vendor/chunk?page="+lzu).then(function(r){return r.json()});fetch("/account/page?page="+tba).then(function(r){return r.json()});function il(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}fetch("/account?page="+t).then(function(r){return r.json()});location.href="/guide";function vj(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}var xa=location.pathname.split("/");function dp(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}if(window.location.pathname==="/assets"){z()}function q(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}location.href="/docs";var x=location.pathname.split("/");var ok=location.pathname.split("/");if(window.location.pathname==="/vendor/user"){h()}v.getAttribute("href");function bds(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}var h=location.pathname.split("/");fetch("/vendor/settings?page="+nyp).then(function(r){return r.json()});fetch("/settings/module?page="+j).then(function(r){return r.json()});function rp(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}if(window.location.pathname==="/module"){o()}function jn(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}if(window.location.pathname==="/docs"){fyd()}function oq(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function ys(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function cr(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}fetch("/guide?page="+lw).then(function(r){return r.json()});t.getAttribute("href");fetch("/api/static/image?page="+u).then(function(r){return r.json()});function lgb(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}var u=location.pathname.split("/");su.getAttribute("href");fetch("/chunk/docs?page="+amg).then(function(r){return r.json()});function p(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}if(window.location.pathname==="/settings"){gnz()}if(window.location.pathname==="/item/guide"){rq()}var fj=location.pathname.split("/");if(window.location.pathname==="/static/static"){u()}function x(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}if(window.location.pathname==="/reference/assets/image"){at()}var tz=location.pathname.split("/");function gac(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}var rwz=location.pathname.split("/");location.href="/module";function vv(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function st(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}fetch("/account/user/image?page="+p).then(function(r){return r.json()});function e(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function dc(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}var atk=location.pathname.split("/");var t=location.pathname.split("/");fetch("/vendor/guide?page="+udf).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}t.getAttribute("href");var svf=location.pathname.split("/");fetch("/static/chunk?page="+gff).then(function(r){return r.json()});fetch("/api/page/assets?page="+yt).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}fetch("/user/vendor?page="+ade).then(function(r){return r.json()});fetch("/account/static/static?page="+a).then(function(r){return r.json()});var z=location.pathname.split("/");if(window.location.pathname==="/search/user/chunk"){h()}function si(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}fetch("/chunk/guide?page="+jiz).then(function(r){return r.json()});fetch("/item/vendor?page="+d).then(function(r){return r.json()});fetch("/image?page="+cu).then(function(r){return r.json()});function and(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function qg(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function rd(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function vf(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}function fp(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function zc(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var sl=location.pathname.split("/");var bd=location.pathname.split("/");fetch("/image?page="+hq).then(function(r){return r.json()});var x=location.pathname.split("/");function mg(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}if(window.location.pathname==="/api"){o()}function lr(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}a.getAttribute("href");function g(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}fetch("/vendor/account?page="+n).then(function(r){return r.json()});function tez(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}if(window.location.pathname==="/user/settings/module"){fxs()}var w=location.pathname.split("/");location.href="/docs";fetch("/reference?page="+taq).then(function(r){return r.json()});fetch("/item?page="+xcz).then(function(r){return r.json()});var iov=location.pathname.split("/");var rm=location.pathname.split("/");function en(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function qbp(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function pl(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}if(window.location.pathname==="/guide/chunk/vendor"){ud()}var qls=location.pathname.split("/");var ai=location.pathname.split("/");fetch("/docs/account?page="+obb).then(function(r){return r.json()});var snt=location.pathname.split("/");function ebn(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}var l=location.pathname.split("/");var hni=location.pathname.split("/");fetch("/search/search/search?page="+cn).then(function(r){return r.json()});fetch("/reference/user/module?page="+b).then(function(r){return r.json()});fetch("/search?page="+k).then(function(r){return r.json()});var pt=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function ir(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}fetch("/user/module?page="+ybx).then(function(r){return r.json()});if(window.location.pathname==="/account/guide"){w()}var yco=location.pathname.split("/");var aj=location.pathname.split("/");if(window.location.pathname==="/guide"){dl()}function cm(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function yd(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}if(window.location.pathname==="/api/page"){zkz()}fetch("/docs/docs?page="+vlb).then(function(r){return r.json()});function cg(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}var vp=location.pathname.split("/");function ym(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}if(window.location.pathname==="/page"){g()}function ldn(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function ts(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function cag(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}fetch("/image/page/chunk?page="+fu).then(function(r){return r.json()});var s=location.pathname.split("/");location.href="/api/vendor/assets";function it(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}if(window.location.pathname==="/settings/module/guide"){bur()}function mp(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}e.getAttribute("href");function pi(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}fetch("/search?page="+ea).then(function(r){return r.json()});function jb(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}ens.getAttribute("href");var ys=location.pathname.split("/");fetch("/user?page="+puf).then(function(r){return r.json()});function h(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}var ga=location.pathname.split("/");function o(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}fetch("/guide/item?page="+wq).then(function(r){return r.json()});var ma=location.pathname.split("/");function f(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}location.href="/guide/static";var zaj=location.pathname.split("/");function rty(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}fetch("/user/chunk/static?page="+ldh).then(function(r){return r.json()});fetch("/chunk/api?page="+a).then(function(r){return r.json()});function lrv(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}var ctf=location.pathname.split("/");var xd=location.pathname.split("/");location.href="/settings/guide";function h(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function iz(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}var yo=location.pathname.split("/");function rj(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function abl(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}function ld(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function tyg(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}fetch("/reference?page="+fm).then(function(r){return r.json()});if(window.location.pathname==="/settings/vendor/user"){sun()}function l(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}if(window.location.pathname==="/module/reference/guide"){vm()}fetch("/account?page="+x).then(function(r){return r.json()});fetch("/guide/image/search?page="+a).then(function(r){return r.json()});function e(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}var nrw=location.pathname.split("/");mua.getAttribute("href");function hb(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}fetch("/page?page="+epe).then(function(r){return r.json()});var qsa=location.pathname.split("/");location.href="/vendor";function iy(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}var k=location.pathname.split("/");location.href="/static/chunk";function te(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function mss(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}var osw=location.pathname.split("/");var zlh=location.pathname.split("/");var zxk=location.pathname.split("/");var bn=location.pathname.split("/");function t(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}fetch("/docs/module/account?page="+yi).then(function(r){return r.json()});function gzv(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}function d(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}var rf=location.pathname.split("/");function y(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}fetch("/user?page="+d).then(function(r){return r.json()});function b(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}var qvk=location.pathname.split("/");function lc(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}fetch("/vendor/search?page="+a).then(function(r){return r.json()});function v(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}fetch("/account/settings?page="+s).then(function(r){return r.json()});function y(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function sc(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}var n=location.pathname.split("/");function dko(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function gji(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}function rq(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}var wzy=location.pathname.split("/");fetch("/docs?page="+p).then(function(r){return r.json()});location.href="/api/reference/settings";function ky(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}ql.getAttribute("href");if(window.location.pathname==="/reference"){l()}if(window.location.pathname==="/api/page"){leu()}var xzu=location.pathname.split("/");fetch("/account/module/api?page="+t).then(function(r){return r.json()});fetch("/settings?page="+keq).then(function(r){return r.json()});var uzx=location.pathname.split("/");gjh.getAttribute("href");function bf(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}if(window.location.pathname==="/guide"){l()}if(window.location.pathname==="/reference"){cpk()}function i(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}var dj=location.pathname.split("/");function epp(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function btt(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}fetch("/page/item/image?page="+s).then(function(r){return r.json()});if(window.location.pathname==="/page/search"){vyk()}function r(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function ddj(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function x(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}if(window.location.pathname==="/user/assets"){l()}function xd(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function ydh(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}var p=location.pathname.split("/");fetch("/account/settings?page="+fb).then(function(r){return r.json()});fetch("/reference/guide?page="+vp).then(function(r){return r.json()});function dp(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function fc(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function bf(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function yqi(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function o(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}var i=location.pathname.split("/");function ybq(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}if(window.location.pathname==="/settings"){nh()}fetch("/reference/reference/vendor?page="+b).then(function(r){return r.json()});if(window.location.pathname==="/settings/reference/guide"){yd()}fetch("/account/search/search?page="+m).then(function(r){return r.json()});location.href="/settings/user/account";fetch("/account/settings/guide?page="+n).then(function(r){return r.json()});var y=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function nbm(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}var i=location.pathname.split("/");location.href="/image";if(window.location.pathname==="/image/settings"){y()}function sar(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function nk(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}uoy.getAttribute("href");location.href="/reference/static/guide";function g(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}if(window.location.pathname==="/guide/module"){ms()}function jvf(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function rl(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function pmh(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}e.getAttribute("href");function lk(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}var p=location.pathname.split("/");fetch("/vendor/page/settings?page="+p).then(function(r){return r.json()});if(window.location.pathname==="/image/guide/image"){tdn()}gx.getAttribute("href");location.href="/reference";function t(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}function vni(e,t){return e&&t?e.map(function(n){return n[t]||5}):[]}location.href="/api/item/module";function sph(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}var k=location.pathname.split("/");var k=location.pathname.split("/");if(window.location.pathname==="/static/item/module"){dpb()}location.href="/guide";fetch("/user/docs/user?page="+tah).then(function(r){return r.json()});function diy(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}var hr=location.pathname.split("/");function i(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}var ieq=location.pathname.split("/");fetch("/docs?page="+ozq).then(function(r){return r.json()});function bo(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}var aj=location.pathname.split("/");function i(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}fetch("/vendor/item?page="+db).then(function(r){return r.json()});fetch("/docs/static?page="+a).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}fetch("/settings?page="+fer).then(function(r){return r.json()});location.href="/image";if(window.location.pathname==="/settings"){r()}var yav=location.pathname.split("/");var vp=location.pathname.split("/");var i=location.pathname.split("/");if(window.location.pathname==="/guide/assets"){f()}var mb=location.pathname.split("/");function s(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}fetch("/search/account?page="+i).then(function(r){return r.json()});function piw(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function uks(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}fetch("/account/image/account?page="+cg).then(function(r){return r.json()});var g=location.pathname.split("/");function hvv(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function sya(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}fetch("/settings/static?page="+m).then(function(r){return r.json()});function o(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function trs(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}fetch("/module/vendor/vendor?page="+o).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function vjd(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}fetch("/api/user/guide?page="+ba).then(function(r){return r.json()});function xx(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function pis(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function vv(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function lcc(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}fetch("/search/api/reference?page="+p).then(function(r){return r.json()});var u=location.pathname.split("/");function lf(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}function c(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}location.href="/search/account/settings";function h(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}r.getAttribute("href");var v=location.pathname.split("/");if(window.location.pathname==="/user/module"){d()}fetch("/image?page="+z).then(function(r){return r.json()});function pop(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}fetch("/search?page="+ov).then(function(r){return r.json()});function vdk(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}location.href="/item";location.href="/settings";d.getAttribute("href");var kh=location.pathname.split("/");dl.getAttribute("href");var or=location.pathname.split("/");function guc(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}location.href="/assets/api";function ktz(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}var pmf=location.pathname.split("/");fetch("/static?page="+hc).then(function(r){return r.json()});function t(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}fetch("/assets/account/guide?page="+l).then(function(r){return r.json()});fetch("/static?page="+zxj).then(function(r){return r.json()});location.href="/static/account/reference";function fca(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}var nmy=location.pathname.split("/");if(window.location.pathname==="/assets/docs/user"){cz()}function pwp(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}var jeo=location.pathname.split("/");var x=location.pathname.split("/");var ilw=location.pathname.split("/");function jx(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}if(window.location.pathname==="/user"){dly()}var urm=location.pathname.split("/");function pmz(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function xj(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}fetch("/page/search/item?page="+klx).then(function(r){return r.json()});var clk=location.pathname.split("/");fetch("/search/static?page="+x).then(function(r){return r.json()});var w=location.pathname.split("/");var dr=location.pathname.split("/");var asw=location.pathname.split("/");if(window.location.pathname==="/api/assets"){d()}var d=location.pathname.split("/");fetch("/chunk/page?page="+uo).then(function(r){return r.json()});var tnm=location.pathname.split("/");function gw(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}fetch("/page/guide?page="+j).then(function(r){return r.json()});function a(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}nhc.getAttribute("href");location.href="/guide/page";var p=location.pathname.split("/");fetch("/guide?page="+gpl).then(function(r){return r.json()});function og(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}var a=location.pathname.split("/");fetch("/module/static/settings?page="+qw).then(function(r){return r.json()});fetch("/guide/chunk?page="+lxd).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}fetch("/vendor/image?page="+mx).then(function(r){return r.json()});function h(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}fetch("/guide/user?page="+jrp).then(function(r){return r.json()});function eh(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}if(window.location.pathname==="/module/docs"){p()}function bdp(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}var ky=location.pathname.split("/");function w(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}if(window.location.pathname==="/item"){of()}pt.getAttribute("href");var qsw=location.pathname.split("/");fetch("/page?page="+oh).then(function(r){return r.json()});if(window.location.pathname==="/static/account"){z()}function yi(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}function r(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function wzr(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}function fcy(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}var wi=location.pathname.split("/");fetch("/assets/static/search?page="+ew).then(function(r){return r.json()});var h=location.pathname.split("/");function ov(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}function uyd(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function qx(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function dqd(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}var rdv=location.pathname.split("/");function r(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function fou(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}var zo=location.pathname.split("/");function rvj(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}var tb=location.pathname.split("/");function vt(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}if(window.location.pathname==="/module"){h()}w.getAttribute("href");fetch("/account?page="+apc).then(function(r){return r.json()});fetch("/item?page="+wkt).then(function(r){return r.json()});if(window.location.pathname==="/user/settings/page"){yi()}function ah(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}function jp(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}var s=location.pathname.split("/");function xt(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}function dvt(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function av(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}fetch("/item?page="+nds).then(function(r){return r.json()});fetch("/docs/static/chunk?page="+ync).then(function(r){return r.json()});function bi(e,t){return e&&t?e.map(function(n){return n[t]||56}):[]}if(window.location.pathname==="/account/item/assets"){caq()}fetch("/api/module?page="+egb).then(function(r){return r.json()});function bp(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function vua(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}if(window.location.pathname==="/user/module/settings"){aph()}fetch("/item?page="+uv).then(function(r){return r.json()});function dis(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}fetch("/chunk/item/docs?page="+lyd).then(function(r){return r.json()});fetch("/reference?page="+g).then(function(r){return r.json()});fetch("/guide/user/page?page="+ib).then(function(r){return r.json()});fetch("/account/guide?page="+od).then(function(r){return r.json()});function c(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}var k=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}var bn=location.pathname.split("/");location.href="/chunk/guide/guide";location.href="/reference/image/vendor";function cat(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}var u=location.pathname.split("/");var t=location.pathname.split("/");var qnb=location.pathname.split("/");function r(e,t){return e&&t?e.map(function(n){return n[t]||54}):[]}location.href="/guide";var ju=location.pathname.split("/");var fc=location.pathname.split("/");function ui(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function xf(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function yy(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}var dzp=location.pathname.split("/");fetch("/docs/search?page="+ec).then(function(r){return r.json()});function ile(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}fetch("/module?page="+sg).then(function(r){return r.json()});function mt(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}fetch("/search/image/image?page="+zqp).then(function(r){return r.json()});function mn(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var wnr=location.pathname.split("/");function p(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}fetch("/vendor/settings?page="+u).then(function(r){return r.json()});function x(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}fetch("/api?page="+ofu).then(function(r){return r.json()});function nbr(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}fetch("/account/assets/api?page="+n).then(function(r){return r.json()});var f=location.pathname.split("/");function p(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}if(window.location.pathname==="/chunk"){vd()}fetch("/page/item?page="+cyy).then(function(r){return r.json()});location.href="/api/page";function ib(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function qf(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function mse(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function yx(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}var tmp=location.pathname.split("/");function k(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}function b(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}var j=location.pathname.split("/");location.href="/page/module/docs";location.href="/account/vendor/docs";var f=location.pathname.split("/");var d=location.pathname.split("/");var lo=location.pathname.split("/");location.href="/reference/guide/page";function uh(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}var duw=location.pathname.split("/");ju.getAttribute("href");function vd(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}var s=location.pathname.split("/");var whz=location.pathname.split("/");var j=location.pathname.split("/");function gc(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}fetch("/user/reference/search?page="+v).then(function(r){return r.json()});var bb=location.pathname.split("/");function pc(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function zgx(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}var s=location.pathname.split("/");location.href="/search/settings/search";location.href="/assets/user";var vj=location.pathname.split("/");function wm(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}if(window.location.pathname==="/chunk"){fj()}var aai=location.pathname.split("/");function r(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function ymz(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}function i(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function jw(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function q(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}var lej=location.pathname.split("/");fetch("/reference/assets?page="+e).then(function(r){return r.json()});fetch("/settings?page="+xfw).then(function(r){return r.json()});d.getAttribute("href");function egy(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}if(window.location.pathname==="/image/assets"){w()}if(window.location.pathname==="/chunk/image/vendor"){zzo()}fetch("/chunk/api?page="+cpz).then(function(r){return r.json()});function fs(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}fetch("/user/module/item?page="+got).then(function(r){return r.json()});var lvj=location.pathname.split("/");function xj(e,t){return e&&t?e.map(function(n){return n[t]||15}):[]}function kl(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}function ys(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||94}):[]}var fp=location.pathname.split("/");function jk(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}location.href="/static/user";function i(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}var q=location.pathname.split("/");if(window.location.pathname==="/item/search"){lab()}fetch("/account/assets/guide?page="+bh).then(function(r){return r.json()});ic.getAttribute("href");var m=location.pathname.split("/");var tkn=location.pathname.split("/");function pg(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}function w(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}if(window.location.pathname==="/item/settings"){d()}fetch("/static?page="+u).then(function(r){return r.json()});fetch("/search?page="+ptu).then(function(r){return r.json()});fetch("/module/vendor?page="+abp).then(function(r){return r.json()});var z=location.pathname.split("/");var ncc=location.pathname.split("/");if(window.location.pathname==="/vendor/page/static"){r()}var zpa=location.pathname.split("/");var ij=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||99}):[]}fetch("/module/account/account?page="+k).then(function(r){return r.json()});function bgd(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}var t=location.pathname.split("/");function ep(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}var zs=location.pathname.split("/");fetch("/vendor/guide?page="+k).then(function(r){return r.json()});kh.getAttribute("href");function ns(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}function do(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}var sjt=location.pathname.split("/");function ov(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}var uw=location.pathname.split("/");function xlu(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/api/static?page="+h).then(function(r){return r.json()});function lol(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}function od(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}location.href="/account";function y(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}fetch("/vendor/docs?page="+x).then(function(r){return r.json()});fetch("/assets/search?page="+w).then(function(r){return r.json()});var sm=location.pathname.split("/");function sef(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}function rqo(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}var xs=location.pathname.split("/");var pvg=location.pathname.split("/");function z(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}function vae(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function ew(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}fetch("/vendor?page="+mm).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}qlu.getAttribute("href");fetch("/search?page="+f).then(function(r){return r.json()});function p(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}fetch("/image/module?page="+qgh).then(function(r){return r.json()});fetch("/vendor/reference?page="+qix).then(function(r){return r.json()});function wrr(e,t){return e&&t?e.map(function(n){return n[t]||59}):[]}if(window.location.pathname==="/guide/reference/assets"){ek()}function r(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}function dsv(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}function el(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/assets/module?page="+gnz).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}if(window.location.pathname==="/account/item"){hs()}function as(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function nbp(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}fetch("/docs/chunk?page="+eor).then(function(r){return r.json()});var qo=location.pathname.split("/");if(window.location.pathname==="/search/search/chunk"){ry()}function r(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function mfg(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}var yx=location.pathname.split("/");function dt(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function wqr(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}n.getAttribute("href");fetch("/reference?page="+x).then(function(r){return r.json()});var vr=location.pathname.split("/");function ccf(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}if(window.location.pathname==="/docs/assets"){e()}function x(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}if(window.location.pathname==="/docs/chunk/static"){maw()}function a(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var oq=location.pathname.split("/");function x(e,t){return e&&t?e.map(function(n){return n[t]||52}):[]}var m=location.pathname.split("/");fetch("/search/static?page="+ns).then(function(r){return r.json()});function dz(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}fetch("/docs/account/api?page="+oh).then(function(r){return r.json()});fetch("/guide/static/api?page="+ad).then(function(r){return r.json()});fetch("/reference/user/image?page="+ka).then(function(r){return r.json()});function be(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}var r=location.pathname.split("/");function u(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}function re(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}var gk=location.pathname.split("/");fetch("/vendor?page="+lwd).then(function(r){return r.json()});var z=location.pathname.split("/");function cln(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}fetch("/image/search?page="+p).then(function(r){return r.json()});fetch("/item?page="+i).then(function(r){return r.json()});var w=location.pathname.split("/");var xgv=location.pathname.split("/");function vy(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}function sqb(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}var pt=location.pathname.split("/");function pes(e,t){return e&&t?e.map(function(n){return n[t]||31}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}qj.getAttribute("href");fetch("/assets/image?page="+xc).then(function(r){return r.json()});function bz(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}ur.getAttribute("href");var wz=location.pathname.split("/");fetch("/image/module?page="+t).then(function(r){return r.json()});function udx(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}function eo(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function py(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}ri.getAttribute("href");function vz(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}location.href="/reference";var maa=location.pathname.split("/");function y(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function tn(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}var w=location.pathname.split("/");var ccw=location.pathname.split("/");location.href="/account/reference/docs";var x=location.pathname.split("/");location.href="/image/image/user";var g=location.pathname.split("/");function l(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}fetch("/guide/reference/module?page="+b).then(function(r){return r.json()});function w(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}fetch("/user?page="+zu).then(function(r){return r.json()});function hu(e,t){return e&&t?e.map(function(n){return n[t]||53}):[]}fetch("/page/account/docs?page="+u).then(function(r){return r.json()});swq.getAttribute("href");if(window.location.pathname==="/chunk/docs"){ub()}function lpx(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}fetch("/static?page="+k).then(function(r){return r.json()});function yao(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}function s(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function fc(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var r=location.pathname.split("/");fetch("/search?page="+op).then(function(r){return r.json()});function k(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function igj(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}function hbn(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function df(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function qih(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}fetch("/reference/chunk/image?page="+ndz).then(function(r){return r.json()});fetch("/guide/user?page="+gse).then(function(r){return r.json()});fetch("/guide/api?page="+q).then(function(r){return r.json()});var z=location.pathname.split("/");function d(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function byg(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function he(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}function bb(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}var gvh=location.pathname.split("/");function y(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}var mt=location.pathname.split("/");function ndg(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function bwc(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}if(window.location.pathname==="/search/assets"){v()}var i=location.pathname.split("/");function zmn(e,t){return e&&t?e.map(function(n){return n[t]||7}):[]}var ix=location.pathname.split("/");if(window.location.pathname==="/chunk/assets"){hb()}location.href="/user/api";function aaf(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function in(e,t){return e&&t?e.map(function(n){return n[t]||96}):[]}var nfr=location.pathname.split("/");location.href="/vendor";function yn(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}fetch("/static?page="+z).then(function(r){return r.json()});function pcj(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}if(window.location.pathname==="/account"){hu()}function ng(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}fetch("/item/account?page="+qew).then(function(r){return r.json()});function xs(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}var rs=location.pathname.split("/");n.getAttribute("href");function de(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}var hm=location.pathname.split("/");fetch("/guide/docs?page="+w).then(function(r){return r.json()});function k(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}var m=location.pathname.split("/");g.getAttribute("href");function x(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}fetch("/reference/docs/image?page="+bmr).then(function(r){return r.json()});var eed=location.pathname.split("/");function ee(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}fetch("/item/reference/account?page="+dut).then(function(r){return r.json()});function f(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}location.href="/static/search";if(window.location.pathname==="/item"){t()}function n(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}var b=location.pathname.split("/");var i=location.pathname.split("/");function nvq(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}function kz(e,t){return e&&t?e.map(function(n){return n[t]||14}):[]}fetch("/reference/account/item?page="+jjt).then(function(r){return r.json()});function ae(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}function ss(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}fetch("/static/docs/module?page="+ujk).then(function(r){return r.json()});if(window.location.pathname==="/account/chunk"){kcn()}function ws(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}fetch("/module?page="+zas).then(function(r){return r.json()});function vai(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||30}):[]}fetch("/user?page="+y).then(function(r){return r.json()});function n(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}function wdf(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}var ofw=location.pathname.split("/");function d(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}var ze=location.pathname.split("/");function xpc(e,t){return e&&t?e.map(function(n){return n[t]||36}):[]}fetch("/settings/static?page="+bn).then(function(r){return r.json()});if(window.location.pathname==="/image/static/guide"){w()}fetch("/vendor/settings/account?page="+pa).then(function(r){return r.json()});function va(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}fetch("/account?page="+u).then(function(r){return r.json()});fetch("/image?page="+v).then(function(r){return r.json()});location.href="/module/image";function ufc(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function rrb(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}h.getAttribute("href");if(window.location.pathname==="/settings/settings/item"){b()}location.href="/account/page";function enc(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}fetch("/guide?page="+ya).then(function(r){return r.json()});cte.getAttribute("href");function cw(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}function zyb(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function au(e,t){return e&&t?e.map(function(n){return n[t]||89}):[]}var y=location.pathname.split("/");var ee=location.pathname.split("/");function m(e,t){return e&&t?e.map(function(n){return n[t]||29}):[]}function qg(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}var pv=location.pathname.split("/");fetch("/chunk?page="+pky).then(function(r){return r.json()});fetch("/search/page/docs?page="+oim).then(function(r){return r.json()});fetch("/docs/static/chunk?page="+n).then(function(r){return r.json()});function pnk(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}location.href="/account";function qd(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}var dca=location.pathname.split("/");function vn(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function izy(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}var usi=location.pathname.split("/");function gbq(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}function wmb(e,t){return e&&t?e.map(function(n){return n[t]||32}):[]}var gpj=location.pathname.split("/");function ekz(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}fetch("/account/chunk/search?page="+rhi).then(function(r){return r.json()});location.href="/settings/reference/docs";function use(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function l(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}var q=location.pathname.split("/");function pt(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}location.href="/settings";function v(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}function dco(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}fetch("/page/api/settings?page="+z).then(function(r){return r.json()});yu.getAttribute("href");function jxe(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}var rda=location.pathname.split("/");function ic(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function mk(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}location.href="/search/search";location.href="/settings/user/guide";fetch("/module/static/guide?page="+hp).then(function(r){return r.json()});function io(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}var l=location.pathname.split("/");fetch("/search/page?page="+h).then(function(r){return r.json()});var uf=location.pathname.split("/");var pqq=location.pathname.split("/");if(window.location.pathname==="/api/settings"){ltr()}function cxi(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}fetch("/page/module?page="+q).then(function(r){return r.json()});var yh=location.pathname.split("/");location.href="/module";var kst=location.pathname.split("/");function yss(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}fetch("/account/static/account?page="+fkv).then(function(r){return r.json()});if(window.location.pathname==="/reference/guide"){fdr()}if(window.location.pathname==="/image/assets"){feo()}var fei=location.pathname.split("/");var twz=location.pathname.split("/");function ak(e,t){return e&&t?e.map(function(n){return n[t]||26}):[]}function ck(e,t){return e&&t?e.map(function(n){return n[t]||17}):[]}fetch("/item/user?page="+kph).then(function(r){return r.json()});i.getAttribute("href");location.href="/vendor/chunk/search";if(window.location.pathname==="/vendor/docs"){un()}function d(e,t){return e&&t?e.map(function(n){return n[t]||95}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||19}):[]}function v(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}fetch("/page/guide?page="+p).then(function(r){return r.json()});if(window.location.pathname==="/assets/item"){xk()}fetch("/search/account?page="+r).then(function(r){return r.json()});var q=location.pathname.split("/");function xa(e,t){return e&&t?e.map(function(n){return n[t]||8}):[]}var yx=location.pathname.split("/");function k(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}var j=location.pathname.split("/");function xr(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}var kv=location.pathname.split("/");function hma(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function kcw(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}function cs(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}function bf(e,t){return e&&t?e.map(function(n){return n[t]||51}):[]}function vs(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}var ct=location.pathname.split("/");function avq(e,t){return e&&t?e.map(function(n){return n[t]||21}):[]}fetch("/image/page/docs?page="+sqs).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||27}):[]}function nqy(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}fetch("/user?page="+tl).then(function(r){return r.json()});if(window.location.pathname==="/module/api"){mi()}function dcw(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}if(window.location.pathname==="/account/settings"){rdx()}fetch("/docs/static/image?page="+fwe).then(function(r){return r.json()});function an(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}var udw=location.pathname.split("/");var kw=location.pathname.split("/");function xdn(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}function zt(e,t){return e&&t?e.map(function(n){return n[t]||67}):[]}zd.getAttribute("href");function pig(e,t){return e&&t?e.map(function(n){return n[t]||11}):[]}fetch("/user/vendor?page="+qv).then(function(r){return r.json()});function uev(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}var l=location.pathname.split("/");function kq(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}location.href="/assets/vendor/page";function hxy(e,t){return e&&t?e.map(function(n){return n[t]||62}):[]}function qcc(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}var ax=location.pathname.split("/");if(window.location.pathname==="/docs/account"){zh()}fetch("/assets/user/item?page="+gl).then(function(r){return r.json()});if(window.location.pathname==="/page/user/static"){qfv()}fetch("/page/search?page="+cxs).then(function(r){return r.json()});function c(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}fetch("/module/account/guide?page="+at).then(function(r){return r.json()});fetch("/item/search?page="+mf).then(function(r){return r.json()});function nk(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}var lno=location.pathname.split("/");function b(e,t){return e&&t?e.map(function(n){return n[t]||2}):[]}fetch("/module?page="+tz).then(function(r){return r.json()});var k=location.pathname.split("/");fetch("/image/vendor/user?page="+cma).then(function(r){return r.json()});fetch("/vendor?page="+wf).then(function(r){return r.json()});var rd=location.pathname.split("/");fetch("/assets?page="+owg).then(function(r){return r.json()});var a=location.pathname.split("/");if(window.location.pathname==="/guide"){a()}function h(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}function fy(e,t){return e&&t?e.map(function(n){return n[t]||78}):[]}function cp(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function p(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}var d=location.pathname.split("/");function sej(e,t){return e&&t?e.map(function(n){return n[t]||1}):[]}var kph=location.pathname.split("/");var uhe=location.pathname.split("/");fetch("/vendor?page="+glj).then(function(r){return r.json()});if(window.location.pathname==="/module"){va()}var ytm=location.pathname.split("/");qp.getAttribute("href");function wc(e,t){return e&&t?e.map(function(n){return n[t]||6}):[]}function ako(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}fetch("/docs/account?page="+ys).then(function(r){return r.json()});fetch("/docs?page="+n).then(function(r){return r.json()});if(window.location.pathname==="/reference/search/settings"){qq()}fetch("/assets/api?page="+soy).then(function(r){return r.json()});var sk=location.pathname.split("/");yb.getAttribute("href");location.href="/account/image";function udu(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}fetch("/module?page="+m).then(function(r){return r.json()});fetch("/docs/user?page="+i).then(function(r){return r.json()});fetch("/user/chunk/item?page="+wzh).then(function(r){return r.json()});var u=location.pathname.split("/");function zl(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}fetch("/assets/image?page="+o).then(function(r){return r.json()});fetch("/static/search?page="+y).then(function(r){return r.json()});location.href="/user/user/guide";function ebk(e,t){return e&&t?e.map(function(n){return n[t]||47}):[]}w.getAttribute("href");if(window.location.pathname==="/reference"){ybk()}function kok(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function u(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}fetch("/api/docs/module?page="+lvu).then(function(r){return r.json()});var wp=location.pathname.split("/");var tp=location.pathname.split("/");function k(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}fetch("/settings/page/user?page="+vom).then(function(r){return r.json()});function jvv(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}function jx(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}function rcs(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}function vdw(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}location.href="/reference/page";var ikb=location.pathname.split("/");fetch("/vendor/vendor/search?page="+yx).then(function(r){return r.json()});var zdr=location.pathname.split("/");function ptw(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}fetch("/api/search?page="+a).then(function(r){return r.json()});if(window.location.pathname==="/assets/account/page"){wk()}function iiq(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}var nwd=location.pathname.split("/");function dup(e,t){return e&&t?e.map(function(n){return n[t]||71}):[]}function j(e,t){return e&&t?e.map(function(n){return n[t]||60}):[]}function uv(e,t){return e&&t?e.map(function(n){return n[t]||69}):[]}var fn=location.pathname.split("/");fetch("/item/item?page="+re).then(function(r){return r.json()});function y(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function ag(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}function ixq(e,t){return e&&t?e.map(function(n){return n[t]||66}):[]}fetch("/vendor?page="+ay).then(function(r){return r.json()});function d(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}if(window.location.pathname==="/page/page"){k()}if(window.location.pathname==="/user/reference/module"){zon()}function acl(e,t){return e&&t?e.map(function(n){return n[t]||20}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}location.href="/static";function wou(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function m(e,t){return e&&t?e.map(function(n){return n[t]||90}):[]}fetch("/item/account?page="+le).then(function(r){return r.json()});fetch("/chunk/guide/docs?page="+ia).then(function(r){return r.json()});function kb(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}if(window.location.pathname==="/page"){apj()}fetch("/module?page="+cc).then(function(r){return r.json()});function dye(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}e.getAttribute("href");function qa(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}var cn=location.pathname.split("/");if(window.location.pathname==="/item/chunk/image"){ygi()}location.href="/api/guide/item";if(window.location.pathname==="/page/reference/chunk"){mr()}nni.getAttribute("href");function qw(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}var hv=location.pathname.split("/");fetch("/reference/user/settings?page="+bl).then(function(r){return r.json()});location.href="/vendor/image/account";var ekp=location.pathname.split("/");fetch("/static?page="+wud).then(function(r){return r.json()});cf.getAttribute("href");location.href="/module";var bk=location.pathname.split("/");function ive(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}fetch("/settings/assets/module?page="+lmp).then(function(r){return r.json()});function zkr(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}function th(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}fetch("/module/vendor?page="+y).then(function(r){return r.json()});var j=location.pathname.split("/");function rap(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}fetch("/docs/user?page="+nm).then(function(r){return r.json()});fetch("/static/search?page="+oc).then(function(r){return r.json()});function bgh(e,t){return e&&t?e.map(function(n){return n[t]||9}):[]}var o=location.pathname.split("/");var n=location.pathname.split("/");function hcw(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}function hie(e,t){return e&&t?e.map(function(n){return n[t]||25}):[]}var g=location.pathname.split("/");function scb(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}fetch("/image/api?page="+stl).then(function(r){return r.json()});var uh=location.pathname.split("/");location.href="/assets/item/settings";fetch("/docs/api/user?page="+xjg).then(function(r){return r.json()});fetch("/guide?page="+rz).then(function(r){return r.json()});location.href="/guide";fetch("/api/vendor/account?page="+we).then(function(r){return r.json()});var qj=location.pathname.split("/");function mi(e,t){return e&&t?e.map(function(n){return n[t]||49}):[]}fetch("/vendor/reference?page="+t).then(function(r){return r.json()});function h(e,t){return e&&t?e.map(function(n){return n[t]||65}):[]}var qen=location.pathname.split("/");function cur(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||37}):[]}fpo.getAttribute("href");function n(e,t){return e&&t?e.map(function(n){return n[t]||46}):[]}function buv(e,t){return e&&t?e.map(function(n){return n[t]||70}):[]}function zw(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}if(window.location.pathname==="/assets/item/search"){in()}var pqd=location.pathname.split("/");vji.getAttribute("href");fetch("/item/module?page="+u).then(function(r){return r.json()});ubq.getAttribute("href");var mne=location.pathname.split("/");if(window.location.pathname==="/page"){b()}function fb(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}var e=location.pathname.split("/");function fwy(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}function xi(e,t){return e&&t?e.map(function(n){return n[t]||85}):[]}function aa(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}if(window.location.pathname==="/item"){sba()}fetch("/reference/user/api?page="+wr).then(function(r){return r.json()});location.href="/module/vendor/guide";function l(e,t){return e&&t?e.map(function(n){return n[t]||45}):[]}function e(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}function nu(e,t){return e&&t?e.map(function(n){return n[t]||93}):[]}fetch("/docs?page="+ke).then(function(r){return r.json()});fetch("/api/vendor?page="+tyj).then(function(r){return r.json()});var d=location.pathname.split("/");function pcr(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}var qo=location.pathname.split("/");if(window.location.pathname==="/vendor/search/module"){t()}function hcn(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}var zq=location.pathname.split("/");fetch("/api?page="+df).then(function(r){return r.json()});fetch("/api/module/chunk?page="+wlm).then(function(r){return r.json()});var t=location.pathname.split("/");var m=location.pathname.split("/");function wm(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}location.href="/api/assets";function x(e,t){return e&&t?e.map(function(n){return n[t]||48}):[]}fetch("/static/page/settings?page="+oz).then(function(r){return r.json()});function ln(e,t){return e&&t?e.map(function(n){return n[t]||41}):[]}var wt=location.pathname.split("/");if(window.location.pathname==="/user/settings/search"){v()}fetch("/user/module/item?page="+o).then(function(r){return r.json()});var cxk=location.pathname.split("/");if(window.location.pathname==="/settings/user/api"){n()}var fas=location.pathname.split("/");location.href="/settings";fetch("/chunk?page="+det).then(function(r){return r.json()});function c(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}var fbu=location.pathname.split("/");fetch("/assets?page="+t).then(function(r){return r.json()});var mu=location.pathname.split("/");fetch("/page/reference/page?page="+mp).then(function(r){return r.json()});function tw(e,t){return e&&t?e.map(function(n){return n[t]||80}):[]}location.href="/docs/vendor";if(window.location.pathname==="/image"){ofa()}if(window.location.pathname==="/page/account"){zh()}fetch("/item/assets/item?page="+sq).then(function(r){return r.json()});fetch("/static/vendor?page="+lbe).then(function(r){return r.json()});function pb(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}fetch("/vendor/reference?page="+oo).then(function(r){return r.json()});function m(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function vu(e,t){return e&&t?e.map(function(n){return n[t]||64}):[]}function t(e,t){return e&&t?e.map(function(n){return n[t]||81}):[]}location.href="/module";var pap=location.pathname.split("/");fetch("/assets/user?page="+u).then(function(r){return r.json()});if(window.location.pathname==="/page/docs"){erm()}if(window.location.pathname==="/page/static"){z()}var ztx=location.pathname.split("/");fetch("/image/account/static?page="+hpj).then(function(r){return r.json()});fetch("/api/vendor/user?page="+c).then(function(r){return r.json()});fetch("/assets?page="+lj).then(function(r){return r.json()});function wsf(e,t){return e&&t?e.map(function(n){return n[t]||68}):[]}if(window.location.pathname==="/chunk/assets/guide"){meo()}fetch("/image/guide/chunk?page="+gul).then(function(r){return r.json()});fetch("/guide/settings/user?page="+wpi).then(function(r){return r.json()});function z(e,t){return e&&t?e.map(function(n){return n[t]||57}):[]}function h(e,t){return e&&t?e.map(function(n){return n[t]||16}):[]}q.getAttribute("href");fetch("/api?page="+vs).then(function(r){return r.json()});fetch("/image?page="+jvn).then(function(r){return r.json()});function szt(e,t){return e&&t?e.map(function(n){return n[t]||44}):[]}fetch("/search/api?page="+c).then(function(r){return r.json()});function c(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}location.href="/item";var kr=location.pathname.split("/");var uzu=location.pathname.split("/");function b(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}fetch("/vendor/user/static?page="+mia).then(function(r){return r.json()});fetch("/assets/page?page="+r).then(function(r){return r.json()});function hzo(e,t){return e&&t?e.map(function(n){return n[t]||82}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||23}):[]}function lv(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}function vm(e,t){return e&&t?e.map(function(n){return n[t]||86}):[]}function sjk(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}var sh=location.pathname.split("/");function np(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}function mnw(e,t){return e&&t?e.map(function(n){return n[t]||92}):[]}if(window.location.pathname==="/account/docs/docs"){ma()}function o(e,t){return e&&t?e.map(function(n){return n[t]||34}):[]}fetch("/vendor/api/search?page="+mzu).then(function(r){return r.json()});fetch("/api/page?page="+yr).then(function(r){return r.json()});function clw(e,t){return e&&t?e.map(function(n){return n[t]||74}):[]}var puz=location.pathname.split("/");fetch("/module?page="+n).then(function(r){return r.json()});fetch("/image/item?page="+iyq).then(function(r){return r.json()});if(window.location.pathname==="/settings/account/api"){gug()}var o=location.pathname.split("/");fetch("/page/vendor?page="+ujz).then(function(r){return r.json()});function wiz(e,t){return e&&t?e.map(function(n){return n[t]||12}):[]}fetch("/docs?page="+k).then(function(r){return r.json()});function yo(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}if(window.location.pathname==="/search/image"){h()}function yq(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}if(window.location.pathname==="/image/static"){tz()}var ua=location.pathname.split("/");fetch("/module/page?page="+zzn).then(function(r){return r.json()});function t(e,t){return e&&t?e.map(function(n){return n[t]||39}):[]}fetch("/settings/settings/page?page="+q).then(function(r){return r.json()});function ln(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}function qb(e,t){return e&&t?e.map(function(n){return n[t]||72}):[]}var lm=location.pathname.split("/");function asn(e,t){return e&&t?e.map(function(n){return n[t]||58}):[]}fetch("/assets/settings/module?page="+j).then(function(r){return r.json()});fetch("/account?page="+i).then(function(r){return r.json()});function vde(e,t){return e&&t?e.map(function(n){return n[t]||63}):[]}var xkd=location.pathname.split("/");bu.getAttribute("href");function ol(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}if(window.location.pathname==="/assets/page/module"){f()}function jcz(e,t){return e&&t?e.map(function(n){return n[t]||75}):[]}function nmp(e,t){return e&&t?e.map(function(n){return n[t]||76}):[]}fetch("/page/account/search?page="+g).then(function(r){return r.json()});var uro=location.pathname.split("/");function fte(e,t){return e&&t?e.map(function(n){return n[t]||28}):[]}fetch("/item/module?page="+e).then(function(r){return r.json()});function y(e,t){return e&&t?e.map(function(n){return n[t]||24}):[]}var ml=location.pathname.split("/");var kib=location.pathname.split("/");if(window.location.pathname==="/search"){tc()}function x(e,t){return e&&t?e.map(function(n){return n[t]||0}):[]}var md=location.pathname.split("/");function uye(e,t){return e&&t?e.map(function(n){return n[t]||55}):[]}function en(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}var wep=location.pathname.split("/");if(window.location.pathname==="/static/page"){ju()}function zju(e,t){return e&&t?e.map(function(n){return n[t]||97}):[]}var qmd=location.pathname.split("/");function bv(e,t){return e&&t?e.map(function(n){return n[t]||98}):[]}location.href="/docs";if(window.location.pathname==="/guide"){m()}fetch("/page?page="+h).then(function(r){return r.json()});i.getAttribute("href");var l=location.pathname.split("/");var jh=location.pathname.split("/");fetch("/item?page="+m).then(function(r){return r.json()});fetch("/docs?page="+bb).then(function(r){return r.json()});function uh(e,t){return e&&t?e.map(function(n){return n[t]||38}):[]}function n(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}var awl=location.pathname.split("/");function rv(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}function orx(e,t){return e&&t?e.map(function(n){return n[t]||35}):[]}fetch("/account/docs/guide?page="+x).then(function(r){return r.json()});fetch("/search/settings?page="+xe).then(function(r){return r.json()});fetch("/reference/guide/docs?page="+o).then(function(r){return r.json()});var qp=location.pathname.split("/");fetch("/reference/reference?page="+tt).then(function(r){return r.json()});function n(e,t){return e&&t?e.map(function(n){return n[t]||42}):[]}fetch("/guide/guide?page="+lhg).then(function(r){return r.json()});if(window.location.pathname==="/search/chunk/item"){dwf()}function he(e,t){return e&&t?e.map(function(n){return n[t]||61}):[]}function ihj(e,t){return e&&t?e.map(function(n){return n[t]||84}):[]}var ipl=location.pathname.split("/");location.href="/item/chunk/static";function ccu(e,t){return e&&t?e.map(function(n){return n[t]||43}):[]}xc.getAttribute("href");function g(e,t){return e&&t?e.map(function(n){return n[t]||3}):[]}location.href="/settings/api/chunk";if(window.location.pathname==="/guide/settings/search"){t()}var i=location.pathname.split("/");function p(e,t){return e&&t?e.map(function(n){return n[t]||79}):[]}fetch("/settings/vendor?page="+zju).then(function(r){return r.json()});fetch("/assets/reference/vendor?page="+e).then(function(r){return r.json()});var dc=location.pathname.split("/");if(window.location.pathname==="/item/account"){b()}if(window.location.pathname==="/guide/user"){o()}var miq=location.pathname.split("/");var bsm=location.pathname.split("/");fetch("/item/assets?page="+c).then(function(r){return r.json()});function mwk(e,t){return e&&t?e.map(function(n){return n[t]||87}):[]}function kb(e,t){return e&&t?e.map(function(n){return n[t]||4}):[]}fetch("/page/search?page="+l).then(function(r){return r.json()});fetch("/reference/module/user?page="+ywn).then(function(r){return r.json()});function rjm(e,t){return e&&t?e.map(function(n){return n[t]||88}):[]}function tip(e,t){return e&&t?e.map(function(n){return n[t]||10}):[]}var x=location.pathname.split("/");function gp(e,t){return e&&t?e.map(function(n){return n[t]||13}):[]}function imh(e,t){return e&&t?e.map(function(n){return n[t]||18}):[]}function f(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}xjw.getAttribute("href");function v(e,t){return e&&t?e.map(function(n){return n[t]||73}):[]}function y(e,t){return e&&t?e.map(function(n){return n[t]||77}):[]}var l=location.pathname.split("/");function zyi(e,t){return e&&t?e.map(function(n){return n[t]||40}):[]}if(window.location.pathname==="/settings/vendor/module"){pne()}if(window.location.pathname==="/reference/image"){wde()}if(window.location.pathname==="/image"){dnx()}function qe(e,t){return e&&t?e.map(function(n){return n[t]||91}):[]}var zrg=location.pathname.split("/");function wdh(e,t){return e&&t?e.map(function(n){return n[t]||22}):[]}function pjq(e,t){return e&&t?e.map(function(n){return n[t]||33}):[]}function yns(e,t){return e&&t?e.map(function(n){return n[t]||50}):[]}function sw(e,t){return e&&t?e.map(function(n){return n[t]||83}):[]}fetch("/chunk/guide?page="+ixv).then(function(r){return r.json()});m.getAttribute("href");var y=location.pathname.split("/");
\ No newline at end of file
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Generate the rewrite benchmark corpus (bench/corpus/).
+
+The output is checked in; rerun only to change the corpus, then save a new
+baseline. A fixed seed keeps the files identical between runs.
+"""
+import json
+import os
+import random
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+
+WORDS = ('docs', 'guide', 'api', 'reference', 'user', 'settings', 'assets', 'static',
+         'image', 'module', 'chunk', 'vendor', 'search', 'item', 'page', 'account')
+
+
+def _path(rng, depth=3):
+    return '/' + '/'.join(rng.choice(WORDS) for _ in range(rng.randint(1, depth)))
+
+
+def spa_html(rng, size=400 * 1024):
+    """Large single-page-app shell: nav links, scripts, inline state, images."""
+    parts = ['<!DOCTYPE html><html><head><meta charset="utf-8"><base href="/">',
+             '<link rel="stylesheet" href="/static/app.css"><script src="/static/runtime.js"></script></head><body>']
+    while sum(map(len, parts)) < size:
+        kind = rng.random()
+        if kind < 0.4:
+            parts.append(f'<li class="nav-item"><a href="{_path(rng)}" data-id="{rng.randint(1, 9999)}">'
+                         f'{rng.choice(WORDS).title()} {rng.choice(WORDS)}</a></li>\n')
+        elif kind < 0.6:
+            parts.append(f'<img src="{_path(rng)}.png" alt="{rng.choice(WORDS)}" width="64" height="64">\n')
+        elif kind < 0.7:
+            parts.append(f'<a href="https://cdn.example.com{_path(rng)}">external</a>'
+                         f'<a href="//cdn.example.com{_path(rng)}.js">cdn</a>\n')
+        elif kind < 0.8:
+            parts.append(f'<form action="{_path(rng)}" method="post"><input name="q"></form>\n')
+        else:
+            parts.append('<p>' + ' '.join(rng.choice(WORDS) for _ in range(rng.randint(20, 60))) + '</p>\n')
+    parts.append('<script>window.__STATE__={"route":window.location.pathname};</script></body></html>')
+    return ''.join(parts)
+
+
+def bundle_js(rng, size=600 * 1024):
+    """Minified JS bundle with many pathname reads, fetches and navigations."""
+    parts = []
+    while sum(map(len, parts)) < size:
+        kind = rng.random()
+        name = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(1, 3)))
+        if kind < 0.2:
+            parts.append(f'var {name}=location.pathname.split("/");')
+        elif kind < 0.3:
+            parts.append(f'if(window.location.pathname==="{_path(rng)}"){{{name}()}}')
+        elif kind < 0.5:
+            parts.append(f'fetch("{_path(rng)}?page="+{name}).then(function(r){{return r.json()}});')
+        elif kind < 0.55:
+            parts.append(f'location.href="{_path(rng)}";')
+        elif kind < 0.6:
+            parts.append(f'{name}.getAttribute("href");')
+        else:
+            parts.append(f'function {name}(e,t){{return e&&t?e.map(function(n){{return n[t]||{rng.randint(0, 99)}}}):[]}}')
+    return ''.join(parts)
+
+
+def styles_css(rng, size=200 * 1024):
+    """Stylesheet with many url() references (quoted, unquoted, data: and absolute)."""
+    parts = []
+    while sum(map(len, parts)) < size:
+        kind = rng.random()
+        selector = f'.{rng.choice(WORDS)}-{rng.randint(1, 999)}'
+        if kind < 0.4:
+            parts.append(f'{selector}{{background:url({_path(rng)}.svg) no-repeat}}\n')
+        elif kind < 0.6:
+            parts.append(f'@font-face{{font-family:f{rng.randint(1, 99)};src:url("{_path(rng)}.woff2")}}\n')
+        elif kind < 0.7:
+            parts.append(f'{selector}{{background:url(data:image/png;base64,iVBORw0KGgo=)}}\n')
+        elif kind < 0.75:
+            parts.append(f'{selector}{{background:url(https://cdn.example.com{_path(rng)}.png)}}\n')
+        else:
+            parts.append(f'{selector}{{margin:{rng.randint(0, 40)}px;color:#{rng.randint(0, 0xffffff):06x}}}\n')
+    return ''.join(parts)
+
+
+def api_items(rng, count):
+    """JSON API items with relative links, absolute links and plain fields."""
+    return [{
+        'id': rng.randint(1, 10 ** 6),
+        'title': ' '.join(rng.choice(WORDS) for _ in range(4)),
+        'href': _path(rng),
+        'avatar': f'https://images.example.com{_path(rng)}.jpg',
+        'tags': rng.sample(WORDS, 3),
+        'score': round(rng.random() * 100, 2),
+    } for _ in range(count)]
+
+
+def main():
+    rng = random.Random(18)
+    os.makedirs(CORPUS_DIR, exist_ok=True)
+    files = {
+        'spa.html': spa_html(rng),
+        'bundle.min.js': bundle_js(rng),
+        'styles.css': styles_css(rng),
+        'api.json': json.dumps({'items': api_items(rng, 55)}),
+    }
+    for name, content in files.items():
+        with open(os.path.join(CORPUS_DIR, name), 'w', encoding='utf-8') as f:
+            f.write(content)
+        print(f"{name}: {len(content.encode('utf-8')) / 1024:.0f} KB")
+
+
+if __name__ == '__main__':
+    main()
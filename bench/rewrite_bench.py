@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Rewrite benchmark: throughput, memory and allocations of rewrite_content.
+
+Run with: python bench/rewrite_bench.py            (compare with baseline.json)
+          python bench/rewrite_bench.py --save     (record a new baseline)
+
+Speed is gated on the speedup over the multipass reference, timed in the same
+run, so the baseline holds on any machine; absolute MB/s is only reported. A
+case whose speedup drops, or whose peak memory grows, by more than --threshold
+percent fails the run.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from utils.rewrite import rewrite_content, rewrite_content_multipass
+
+CORPUS_DIR = os.path.join(BENCH_DIR, 'corpus')
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baseline.json')
+SERVICE = 'bench'
+TARGET = 'example.com'
+
+
+def _read(name):
+    with open(os.path.join(CORPUS_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def _scaled_json(size):
+    """The API payload with its items repeated up to about size bytes."""
+    items = json.loads(_read('api.json'))['items']
+    per_item = len(json.dumps(items)) / len(items)
+    return json.dumps({'items': items * max(int(size / per_item / len(items)), 1)})
+
+
+def load_cases(include_large=True):
+    """Benchmark cases: name -> text body."""
+    cases = {
+        'spa.html': _read('spa.html'),
+        'bundle.min.js': _read('bundle.min.js'),
+        'styles.css': _read('styles.css'),
+        'api-10k.json': _read('api.json'),
+        'api-1m.json': _scaled_json(1024 * 1024),
+    }
+    if include_large:
+        cases['api-10m.json'] = _scaled_json(10 * 1024 * 1024)
+    return cases
+
+
+def throughput(content, min_time):
+    """
+    Best MB/s of rewrite_content and of the multipass reference on content.
+
+    Runs alternate between the two for at least min_time seconds, so both see
+    the same machine noise; the fastest run of each is the least disturbed.
+    """
+    size = len(content.encode('utf-8')) / (1024 * 1024)
+    engines = (rewrite_content, rewrite_content_multipass)
+    best = [float('inf')] * len(engines)
+    for rewrite in engines:
+        rewrite(content, SERVICE, TARGET)  # warm up (rules, regex caches)
+    runs = 0
+    started = time.perf_counter()
+    while runs < 5 or time.perf_counter() - started < min_time:
+        for index, rewrite in enumerate(engines):
+            start = time.perf_counter()
+            rewrite(content, SERVICE, TARGET)
+            best[index] = min(best[index], time.perf_counter() - start)
+        runs += 1
+    return [size / seconds for seconds in best]
+
+
+def _allocations(snapshot):
+    """Traced blocks of snapshot, leaving out tracemalloc's own bookkeeping."""
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    return sum(stat.count for stat in snapshot.statistics('filename'))
+
+
+def memory(content):
+    """
+    Peak memory allocated during one rewrite (bytes), the memory its result
+    keeps, and the number of blocks still allocated once it returns.
+    """
+    tracemalloc.start()
+    try:
+        before = _allocations(tracemalloc.take_snapshot())
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        kept = [rewrite_content(content, SERVICE, TARGET)]
+        after, peak = tracemalloc.get_traced_memory()
+        blocks = _allocations(tracemalloc.take_snapshot()) - before
+        kept.clear()
+    finally:
+        tracemalloc.stop()
+    return peak - start, after - start, blocks
+
+
+def run(cases, min_time):
+    results = {}
+    for name, content in cases.items():
+        size = len(content.encode('utf-8'))
+        mb_s, reference = throughput(content, min_time)
+        peak, kept, blocks = memory(content)
+        results[name] = {
+            'bytes': size,
+            'mb_s': round(mb_s, 2),
+            'multipass_mb_s': round(reference, 2),
+            'speedup': round(mb_s / reference, 2),
+            'peak_kb': round(peak / 1024, 1),
+            'kept_kb': round(kept / 1024, 1),
+            'blocks': blocks,
+        }
+        print(f"{name:<15} {size / 1024:>9.0f} KB {mb_s:>9.1f} MB/s "
+              f"(x{mb_s / reference:.2f} vs multipass) "
+              f"peak {peak / 1024:>7.0f} KB ({peak / size:.1f}x input), result {kept / 1024:.0f} KB "
+              f"in {blocks} blocks")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return the regressions of results against baseline (percent limit)."""
+    failures = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        slower = (base['speedup'] - result['speedup']) / base['speedup'] * 100
+        if slower > threshold:
+            failures.append(f"{name}: x{result['speedup']} vs multipass is {slower:.0f}% below "
+                            f"baseline x{base['speedup']}")
+        if base['peak_kb']:
+            bigger = (result['peak_kb'] - base['peak_kb']) / base['peak_kb'] * 100
+            if bigger > threshold:
+                failures.append(f"{name}: peak {result['peak_kb']} KB is {bigger:.0f}% above baseline {base['peak_kb']} KB")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--save', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=float(os.environ.get('BENCH_THRESHOLD', '30')),
+                        help='allowed regression in percent (default: 30)')
+    parser.add_argument('--min-time', type=float, default=1.0, help='seconds spent timing each case')
+    parser.add_argument('--quick', action='store_true', help='skip the 10 MB payload')
+    args = parser.parse_args()
+
+    results = run(load_cases(include_large=not args.quick), args.min_time)
+
+    if args.save:
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baseline saved to {BASELINE_PATH}")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        print("No baseline yet, run with --save to record one")
+        return 0
+    with open(BASELINE_PATH) as f:
+        baseline = json.load(f)
+    failures = compare(results, baseline, args.threshold)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    if not failures:
+        print(f"OK: within {args.threshold:.0f}% of baseline")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: how long a fresh worker takes until it can serve.
+
+Run with: python bench/startup_bench.py [--runs 10] [--max-ms 1500]
+
+Each run starts a new interpreter that imports the WSGI app (Django setup
+plus startup.warm()) and serves the homepage once. Reported per phase as the
+median over all runs; --max-ms fails the run when the total is slower.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r'''
+import json, os, time
+started = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'settings')
+import django
+django.setup()
+setup = time.perf_counter()
+import wsgi
+ready = time.perf_counter()
+from django.test import Client
+Client(HTTP_X_FORWARDED_PROTO='https').get('/')
+served = time.perf_counter()
+print(json.dumps({
+    'django_setup': setup - started,
+    'app_import_and_warm': ready - setup,
+    'first_request': served - ready,
+    'total': served - started,
+}))
+'''
+
+
+def measure(runs):
+    """Phase timings (ms) of each run, plus interpreter start-up."""
+    results = []
+    for _ in range(runs):
+        before = time.perf_counter()
+        output = subprocess.run([sys.executable, '-c', PROBE], cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+        wall = time.perf_counter() - before
+        phases = json.loads(output.stdout.strip().splitlines()[-1])
+        phases = {name: seconds * 1000 for name, seconds in phases.items()}
+        phases['process_wall'] = wall * 1000
+        results.append(phases)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--max-ms', type=float, default=None, help='fail when the median total is slower')
+    args = parser.parse_args()
+
+    results = measure(args.runs)
+    for name in results[0]:
+        values = [run[name] for run in results]
+        print(f"{name:<22} median {statistics.median(values):>7.1f} ms   min {min(values):>7.1f} ms")
+
+    total = statistics.median(run['total'] for run in results)
+    if args.max_ms is not None and total > args.max_ms:
+        print(f"SLOW startup: {total:.0f} ms > {args.max_ms:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
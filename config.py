@@ -1,96 +1,213 @@
 """Simple configuration - load service mappings from environment."""
 import os
-import glob
+import tempfile
 
 # Load service mappings from environment variables
 # Format: SERVICE_name=target.domain.com or SERVICE_name=target.domain.com/base/path
-# Optional: SERVICE_name_DESC=description, SERVICE_name_RANK=number
-SERVICES = {}
-SERVICE_BASE_PATHS = {}
-SERVICE_DESCRIPTIONS = {}
-SERVICE_RANKS = {}
-SERVICE_HIDDEN = {}
-LOCAL_TEMPLATES = {}  # Maps service name to template filename
+# Optional: SERVICE_name_DESC=description, SERVICE_name_RANK=number, ... (see SERVICE_OPTIONS)
+
+def _flag(value):
+    return value.lower() == 'true'
+
+
+def _count(value):
+    return max(int(value), 0)
+
+
+def _seconds(value):
+    return max(float(value), 0)
+
+
+def _path(value):
+    return '/' + value.lstrip('/') if value else ''
+
+
+# Per-service options: SERVICE_<name><suffix> -> (Route field, parser).
+# Invalid values are ignored with a warning, missing ones use the Route defaults.
+SERVICE_OPTIONS = {
+    '_DESC': ('description', str),
+    '_RANK': ('rank', int),
+    '_HIDE': ('hidden', _flag),
+    '_CACHE_TTL': ('cache_ttl', _count),  # 0 = never cache
+    '_SERVER_TIMING': ('server_timing', _flag),
+    '_BREAKER_THRESHOLD': ('breaker_threshold', _count),  # 0 = never trip
+    '_BREAKER_COOLDOWN': ('breaker_cooldown', _seconds),
+    '_HEALTH': ('health_path', _path),  # probed while the circuit is open
+    '_TIMEOUT': ('timeout', float),
+    '_CONNECT_TIMEOUT': ('connect_timeout', float),
+    '_HEDGE': ('hedge', _flag),
+}
+# SERVICE_<name><suffix> keys that can be per-service options rather than service mappings
+SERVICE_OPTION_SUFFIXES = tuple(SERVICE_OPTIONS)
+
+
+def _is_service_option(key, environ):
+    """
+    Whether SERVICE_<name><suffix> is an option of SERVICE_<name>.
+
+    Only when that service is set: otherwise the key is a service whose name
+    happens to end like an option (SERVICE_app_HEALTH), kept with a warning.
+    """
+    suffixes = [suffix for suffix in SERVICE_OPTION_SUFFIXES if key.upper().endswith(suffix)]
+    if not suffixes:
+        return False
+    if any(key[:-len(suffix)] in environ for suffix in suffixes):
+        return True
+    print(f"[WARNING] {key} looks like a service option but {key[:-len(suffixes[0])]} is not set, "
+          f"treating it as a service")
+    return False
 
 # Auto-detect local templates
 def load_local_templates():
     """Scan templates folder for .html files (excluding home, 404, error)."""
     templates_dir = os.path.join(os.path.dirname(__file__), 'templates')
     excluded = ['home.html', '404.html', 'error.html']
+    local_templates = {}  # Maps service name to template filename
+    
+    # One directory read (no glob pattern matching, no per-file stat beyond the entry)
+    try:
+        entries = list(os.scandir(templates_dir))
+    except OSError:
+        return local_templates
+    
+    for entry in entries:
+        filename = entry.name
+        if filename.endswith('.html') and filename not in excluded and entry.is_file():
+            # Extract service name from filename (e.g., about.html -> about)
+            service_name = os.path.splitext(filename)[0]
+            local_templates[service_name] = filename
+    return local_templates
+
+
+def load_services(environ, local_templates):
+    """
+    Parse SERVICE_* settings into {name: options} (keyword arguments of utils.routes.compile_route).
+
+    Called by utils.routes at import with os.environ, and again on reload.
+    """
+    services = {}
+    local_templates = dict(local_templates)
+    
+    for key, value in environ.items():
+        # Only treat SERVICE_<name> keys as service mappings.
+        # Skip SERVICE_<name>_DESC, SERVICE_<name>_RANK, SERVICE_<name>_HIDE, ... options of set services.
+        if key.startswith('SERVICE_') and not _is_service_option(key, environ):
+            service_name = key.replace('SERVICE_', '')
+            
+            # If this service has an env var, it overrides any local template
+            if service_name in local_templates:
+                print(f"[INFO] SERVICE_{service_name} env var overrides local template {local_templates[service_name]}")
+                del local_templates[service_name]
+            
+            # Skip duplicates (take first occurrence)
+            if service_name in services:
+                print(f"[WARNING] Duplicate service '{service_name}' ignored (keeping first: {services[service_name]['target']})")
+                continue
+            
+            # Split domain and base path
+            if '/' in value:
+                parts = value.split('/', 1)
+                options = {'target': parts[0], 'base_path': '/' + parts[1]}
+            else:
+                options = {'target': value, 'base_path': ''}
+            
+            # Load optional settings (description, rank, hide flag, cache, breaker, timeouts...)
+            for suffix, (field, parse) in SERVICE_OPTIONS.items():
+                option_key = f'SERVICE_{service_name}{suffix}'
+                if option_key in environ:
+                    try:
+                        options[field] = parse(environ[option_key])
+                    except ValueError:
+                        print(f"[WARNING] Invalid {option_key} ignored: {environ[option_key]}")
+            services[service_name] = options
+    
+    # Add local templates as services with lower priority (rank 1000)
+    for service_name, template_file in local_templates.items():
+        services[service_name] = {
+            'target': f'local-template:{template_file}',
+            'rank': 1000,
+            # Local templates default to visible unless overridden
+            'hidden': environ.get(f'SERVICE_{service_name}_HIDE', 'false').lower() == 'true',
+            # Description defaults to empty unless there's a comment in the template
+        }
     
-    if os.path.exists(templates_dir):
-        for template_file in glob.glob(os.path.join(templates_dir, '*.html')):
-            filename = os.path.basename(template_file)
-            if filename not in excluded:
-                # Extract service name from filename (e.g., about.html -> about)
-                service_name = os.path.splitext(filename)[0]
-                LOCAL_TEMPLATES[service_name] = filename
-
-# Load templates first
-load_local_templates()
-
-# Load environment-based services
-for key, value in os.environ.items():
-    # Only treat plain SERVICE_<name> keys as service mappings.
-    # Ignore SERVICE_<name>_DESC, SERVICE_<name>_RANK, SERVICE_<name>_HIDE flags.
-    if key.startswith('SERVICE_') and not key.upper().endswith('_DESC') and not key.upper().endswith('_RANK') and not key.upper().endswith('_HIDE'):
-        service_name = key.replace('SERVICE_', '')
-        
-        # If this service has an env var, it overrides any local template
-        if service_name in LOCAL_TEMPLATES:
-            print(f"[INFO] SERVICE_{service_name} env var overrides local template {LOCAL_TEMPLATES[service_name]}")
-            del LOCAL_TEMPLATES[service_name]
-        
-        # Skip duplicates (take first occurrence)
-        if service_name in SERVICES:
-            print(f"[WARNING] Duplicate service '{service_name}' ignored (keeping first: {SERVICES[service_name]})")
-            continue
-        
-        # Split domain and base path
-        if '/' in value:
-            parts = value.split('/', 1)
-            SERVICES[service_name] = parts[0]
-            SERVICE_BASE_PATHS[service_name] = '/' + parts[1]
-        else:
-            SERVICES[service_name] = value
-            SERVICE_BASE_PATHS[service_name] = ''
-        
-        # Load optional description
-        desc_key = f'SERVICE_{service_name}_DESC'
-        if desc_key in os.environ:
-            SERVICE_DESCRIPTIONS[service_name] = os.environ[desc_key]
-        
-        # Load optional rank (default to 999 for unranked)
-        rank_key = f'SERVICE_{service_name}_RANK'
-        if rank_key in os.environ:
-            try:
-                SERVICE_RANKS[service_name] = int(os.environ[rank_key])
-            except ValueError:
-                SERVICE_RANKS[service_name] = 999
-        else:
-            SERVICE_RANKS[service_name] = 999
-        # Load optional hide flag (default: visible)
-        hide_key = f'SERVICE_{service_name}_HIDE'
-        # If set to 'true' (case-insensitive) the service will be hidden from homepage
-        SERVICE_HIDDEN[service_name] = os.environ.get(hide_key, 'false').lower() == 'true'
-
-# Add local templates as services with lower priority (rank 1000)
-for service_name, template_file in LOCAL_TEMPLATES.items():
-    SERVICES[service_name] = f'local-template:{template_file}'
-    SERVICE_BASE_PATHS[service_name] = ''
-    SERVICE_RANKS[service_name] = 1000
-    # Local templates default to visible unless overridden
-    SERVICE_HIDDEN[service_name] = os.environ.get(f'SERVICE_{service_name}_HIDE', 'false').lower() == 'true'
-    # Description defaults to empty unless there's a comment in the template
+    return services
+
 
 SECRET_KEY = os.environ.get('SECRET_KEY', 'change-me-in-production')
 DEBUG = os.environ.get('DEBUG', 'False').lower() == 'true'
+ASGI = os.environ.get('ASGI', 'false').lower() == 'true'  # set by asgi.py
 ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', '*').split(',')
 
 # Coffee button settings
 COFFEE_USERNAME = os.environ.get('COFFEE_USERNAME', 'vicnas')
 SHOW_COFFEE = os.environ.get('COFFEE', 'true').lower() == 'true'
 
-BLOCKED_SERVICES = ['www', 'mail', 'ftp', 'ssh']
+# Upstream connection pools (one keep-alive pool per service)
+POOL_SIZE = int(os.environ.get('POOL_SIZE', '10'))  # max connections kept per backend host
+POOL_MAX_IDLE = float(os.environ.get('POOL_MAX_IDLE', '60'))  # seconds before an idle pool is recycled
+
+# Bodies that are not rewritten (images, fonts, archives...) are streamed in chunks of this size
+STREAM_CHUNK_SIZE = int(os.environ.get('STREAM_CHUNK_SIZE', str(64 * 1024)))
+# Text bodies larger than this (bytes) are rewritten chunk by chunk instead of in one piece
+REWRITE_STREAM_MIN = int(os.environ.get('REWRITE_STREAM_MIN', str(1024 * 1024)))
+# Uploads that may be resent (retries) are spooled to a temp file beyond this many bytes
+UPLOAD_SPOOL_MEMORY = int(os.environ.get('UPLOAD_SPOOL_MEMORY', str(1024 * 1024)))
+# Memory cap (bytes) for already-rewritten bodies kept per worker, 0 disables
+REWRITE_MEMO_BYTES = int(os.environ.get('REWRITE_MEMO_BYTES', str(32 * 1024 * 1024)))
+
+# Shared response cache (one SQLite file for all workers), always bypassed in DEBUG
+CACHE_ENABLED = os.environ.get('CACHE', 'true').lower() == 'true' and not DEBUG
+CACHE_PATH = os.environ.get('CACHE_PATH', os.path.join(tempfile.gettempdir(), 'flashy-cache.sqlite3'))
+CACHE_MAX_BYTES = int(os.environ.get('CACHE_MAX_BYTES', str(256 * 1024 * 1024)))
+# Streamed (non-rewritten) bodies up to this size are stored too, once fully sent
+CACHE_MAX_ENTRY_BYTES = int(os.environ.get('CACHE_MAX_ENTRY_BYTES', str(8 * 1024 * 1024)))
+# POST /_cache purges only with this token (X-Purge-Token header), '' disables purging
+CACHE_PURGE_TOKEN = os.environ.get('CACHE_PURGE_TOKEN', '')
+
+# Compression of rewritten text sent to clients (gzip, brotli if installed)
+COMPRESS = os.environ.get('COMPRESS', 'true').lower() == 'true'
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', '1024'))  # smaller bodies are sent as-is
+COMPRESS_CACHE_BYTES = int(os.environ.get('COMPRESS_CACHE_BYTES', str(32 * 1024 * 1024)))  # compressed copies kept per worker
+
+# Rendered error / not-found pages kept per worker, keyed by their arguments
+PAGE_CACHE_BYTES = int(os.environ.get('PAGE_CACHE_BYTES', str(4 * 1024 * 1024)))
+
+# Identical concurrent GETs wait for one backend fetch instead of each making their own
+COALESCE = os.environ.get('COALESCE', 'true').lower() == 'true'
+COALESCE_WAIT = float(os.environ.get('COALESCE_WAIT', '10'))  # seconds a follower waits before fetching itself
+
+# Prometheus metrics at /_metrics, merged from per-worker snapshot files
+METRICS_DIR = os.environ.get('METRICS_DIR', os.path.join(tempfile.gettempdir(), 'flashy-metrics'))
+METRICS_INTERVAL = float(os.environ.get('METRICS_INTERVAL', '2'))  # seconds between worker snapshots
+
+# Phase timings of proxied requests: Server-Timing header and/or the log summaries
+SERVER_TIMING = os.environ.get('SERVER_TIMING', 'false').lower() == 'true'
+SERVER_TIMING_LOG = os.environ.get('SERVER_TIMING_LOG', 'false').lower() == 'true'
+
+# Optional file of SERVICE_* lines (same format as the env vars) layered over the
+# environment; edits are picked up without restarting (also on SIGHUP)
+SERVICES_FILE = os.environ.get('SERVICES_FILE', '')
+SERVICES_FILE_CHECK = float(os.environ.get('SERVICES_FILE_CHECK', '5'))  # seconds between mtime checks
+
+# Circuit breakers (per service and worker): after this many timeouts / connection
+# failures in a row, requests fail fast with a 503 until the cooldown is over
+BREAKER_THRESHOLD = int(os.environ.get('BREAKER_THRESHOLD', '5'))  # 0 disables the breakers
+BREAKER_COOLDOWN = float(os.environ.get('BREAKER_COOLDOWN', '30'))  # seconds before one trial request
+BREAKER_PROBE_INTERVAL = float(os.environ.get('BREAKER_PROBE_INTERVAL', '5'))  # seconds between health probes
+
+# Backend timeouts (seconds), overridable per service
+UPSTREAM_CONNECT_TIMEOUT = float(os.environ.get('UPSTREAM_CONNECT_TIMEOUT', '10'))
+UPSTREAM_TIMEOUT = float(os.environ.get('UPSTREAM_TIMEOUT', '30'))  # wait for each read of the response
+# Idempotent requests are retried this many times when the connection fails
+UPSTREAM_RETRIES = int(os.environ.get('UPSTREAM_RETRIES', '1'))
+# Retries and hedges may add at most this fraction of extra backend requests (per worker),
+# plus a reserve of RETRY_BUDGET_RESERVE for quiet periods, so they can't amplify an outage
+RETRY_BUDGET = float(os.environ.get('RETRY_BUDGET', '0.1'))
+RETRY_BUDGET_RESERVE = float(os.environ.get('RETRY_BUDGET_RESERVE', '10'))
+# Hedged GETs: a second request when the first is slower than the service's p95
+HEDGE = os.environ.get('HEDGE', 'false').lower() == 'true'
+# Threads per worker running hedged GETs; when all are busy, GETs go out unhedged
+HEDGE_THREADS = int(os.environ.get('HEDGE_THREADS', '32'))
 
 BLOCKED_SERVICES = ['www', 'mail', 'ftp', 'ssh']
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""Gunicorn settings picked up automatically from the working directory."""
+
+
+def post_worker_init(worker):
+    """Let each worker reload its routes on SIGHUP (kill -HUP <worker pid>)."""
+    from utils.routes import install_reload_signal
+
+    install_reload_signal()
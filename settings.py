@@ -44,4 +44,10 @@ LOGGING = {
         'handlers': ['console'],
         'level': 'INFO',
     },
+    'loggers': {
+        # httpx (async backend client) logs every request at INFO
+        'httpx': {
+            'level': 'WARNING',
+        },
+    },
 }
\ No newline at end of file
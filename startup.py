@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Startup pipeline: do the one-time work before workers start serving.
+
+With gunicorn --preload the WSGI module, and so warm(), runs once in the
+master; forked workers inherit the resolved version, service table, routes,
+rewrite rules and pre-rendered pages instead of rebuilding them.
+
+Build step: python startup.py --write-version   (records APP_VERSION, else the git tag, in .version)
+"""
+import os
+import sys
+import time
+
+from utils.version import VERSION_FILE, _git_version
+
+
+def warm():
+    """Import the URL conf (views, rewrite rules, pre-rendered pages) and resolve the version."""
+    from django.urls import get_resolver
+    from utils.version import get_version
+
+    started = time.perf_counter()
+    get_version()
+    # Loading the patterns imports urls.py and views.py, which do their startup work
+    get_resolver().url_patterns
+    return time.perf_counter() - started
+
+
+def write_version():
+    """Store the build's version (APP_VERSION, else the git tag) for images that ship without git."""
+    version = os.environ.get('APP_VERSION', '').strip().lstrip('v') or _git_version()
+    if not version:
+        print("No APP_VERSION or git tag found, .version not written (version.py is used)")
+        return
+    with open(VERSION_FILE, 'w') as f:
+        f.write(version + '\n')
+    print(f"Version {version} written to {VERSION_FILE}")
+
+
+if __name__ == '__main__':
+    if '--write-version' in sys.argv:
+        write_version()
+    else:
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'settings')
+        import django
+        django.setup()
+        print(f"Warm-up took {warm() * 1000:.0f} ms")
@@ -7,8 +7,43 @@ Run with: python test.py
 import unittest
 import sys
 sys.path.insert(0, '/home/claude')
+import os
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'settings')
+import django
+django.setup()
 
-from utils.rewrite import rewrite_content
+from utils.rewrite import rewrite_content, rewrite_content_multipass, rewrite_stream, get_rewrite_rules, needs_rewrite
+from utils.memo import RewriteMemo
+from utils import rewrite
+import random
+from utils.cache import freshness_lifetime
+from utils import cache
+from utils import coalesce
+from django.http import HttpResponse
+import threading
+import time
+import asyncio
+from utils.compression import parse_accept_encoding
+from utils.proxy import RequestBody, process_response_content, prepare_headers, read_text_body
+import io
+from unittest.mock import patch
+from utils import logging as proxy_logging
+from utils.logring import LogRing
+from utils import logring
+from utils import metrics
+from utils import timing
+from utils import routes
+from utils import breaker
+from utils import retries
+import json
+import tempfile
+import os
+from requests.structures import CaseInsensitiveDict
+from types import SimpleNamespace
+import requests
+import urllib3
+from django.test import RequestFactory
+import views
 
 
 class TestURLRewriting(unittest.TestCase):
@@ -99,6 +134,592 @@ class TestURLRewriting(unittest.TestCase):
         result = rewrite_content(js, 'club', 'example.com')
         self.assertIn('getAttribute("href")?.replace(/^\\/club\\//, "/")', result)
 
+    def test_rules_built_once_per_service(self):
+        """Rewrite rules are cached per service, not rebuilt per call"""
+        self.assertIs(get_rewrite_rules('club'), get_rewrite_rules('club'))
+        self.assertIsNot(get_rewrite_rules('club'), get_rewrite_rules('app'))
+
+
+class TestSinglePassEngine(unittest.TestCase):
+
+    snippets = [
+        '<a href="/about">About</a>',
+        '<script src="https://cdn.example.com/script.js"></script>',
+        '<script src="/mathjax/tex-chtml.js"></script>',
+        '<a href="/myapp/about">About</a>',
+        'if (window.location.pathname === "/about") { }',
+        'const p = location.pathname; document.location.pathname;',
+        'fetch("/api/data"); location.href = "/login";',
+        '<BASE href="/"><img src="data:image/png;base64,iVBORw0KGg==">',
+        '<script src="//cdn.jsdelivr.net/lib.js"></script>',
+        '<form action="/submit"><use href="/static/sprite.svg#icon"></use></form>',
+        'background-image: url("/static/icon.svg"); src: url(/font.woff2);',
+        'link.getAttribute("href") === link.getAttribute( \'href\' )',
+    ]
+
+    def test_matches_multipass_reference(self):
+        """Single-pass engine output is identical to one re.sub per rule"""
+        for snippet in self.snippets:
+            self.assertEqual(
+                rewrite_content(snippet, 'myapp', 'example.com'),
+                rewrite_content_multipass(snippet, 'myapp', 'example.com')
+            )
+
+    def test_differential_fuzz_against_multipass(self):
+        """Random snippets rewrite the same as the multipass reference, unless its rules interact"""
+        tokens = ['href=', 'src=', 'action=', '"', "'", '`', '/', '//', '/myapp/', 'a', 'x', ' ', '\n', '>', ')',
+                  '<base href="/"', 'fetch(', 'location.href = ', 'location.pathname', 'window.location.pathname',
+                  'document.', 'url(', 'getAttribute(', 'href', '?u=', '#']
+        rng = random.Random(1234)
+        differences = 0
+        for _ in range(20000):
+            snippet = ''.join(rng.choice(tokens) for _ in range(rng.randint(1, 10)))
+            if rewrite_content(snippet, 'myapp', 'example.com') != rewrite_content_multipass(snippet, 'myapp', 'example.com'):
+                differences += 1
+                self.assertTrue(self.rules_interact(snippet), snippet)
+        self.assertGreater(differences, 0)
+
+    def rules_interact(self, snippet):
+        """Do rule matches overlap, or does one multipass step create or remove matches of a later one?"""
+        steps = [
+            (rewrite.WINDOW_PATHNAME_RE, 'window_pathname'), (rewrite.PATHNAME_RE, 'pathname'),
+            (rewrite.BASE_TAG_RE, 'base_tag'), (rewrite.ATTR_URL_RE, 'rewrite_url'),
+            (rewrite.FETCH_URL_RE, 'rewrite_url'), (rewrite.LOCATION_HREF_RE, 'rewrite_url'),
+            (rewrite.CSS_URL_RE, 'rewrite_css_url'), (rewrite.GET_ATTRIBUTE_RE, 'rewrite_get_attribute'),
+        ]
+        spans = sorted(match.span() for pattern, _ in steps for match in pattern.finditer(snippet))
+        if any(first[1] > second[0] for first, second in zip(spans, spans[1:])):
+            return True
+        rules, text = get_rewrite_rules('myapp'), snippet
+        for pattern, replacement in steps:
+            text, count = pattern.subn(getattr(rules, replacement), text)
+            if count != len(pattern.findall(snippet)):
+                return True
+        return False
+
+    def test_prescan_finds_every_rewritable_snippet(self):
+        """Bodies the byte prescan would skip are never changed by a rewrite"""
+        for snippet in self.snippets + ['url (/x.png)', '<base  href="/">']:
+            if rewrite_content(snippet, 'myapp', 'example.com') != snippet:
+                self.assertTrue(needs_rewrite(snippet.encode('utf-8')), snippet)
+
+    def test_body_without_urls_is_passed_through(self):
+        """A JSON body with nothing to rewrite comes back as the very same bytes"""
+        body = json.dumps({'items': [{'id': n, 'name': f'item {n}'} for n in range(100)]}).encode('utf-8')
+        self.assertFalse(needs_rewrite(body))
+        content, is_text = process_response_content(body, 'application/json', 'myapp', 'example.com', '/api')
+        self.assertIs(content, body)
+        self.assertTrue(is_text)
+
+
+class TestStreamingRewrite(unittest.TestCase):
+
+    def test_matches_split_across_chunks(self):
+        """A URL cut in half by a chunk boundary is still rewritten"""
+        html = '<nav>\n<a href="/meets">R</a>\n<a href="/events">E</a>\n</nav>'
+        chunks = [html[i:i + 7].encode() for i in range(0, len(html), 7)]
+        result = b''.join(rewrite_stream(chunks, 'club', 'example.com')).decode()
+        self.assertEqual(result, rewrite_content(html, 'club', 'example.com'))
+
+    def test_multibyte_characters_split_across_chunks(self):
+        """UTF-8 sequences split between chunks are decoded intact"""
+        data = '<a href="/events">Événements</a>'.encode()
+        chunks = [data[i:i + 1] for i in range(len(data))]
+        result = b''.join(rewrite_stream(chunks, 'club', 'example.com')).decode()
+        self.assertEqual(result, '<a href="/club/events">Événements</a>')
+
+    def test_every_cut_matches_whole_document(self):
+        """Cutting a body at any two offsets gives the same output as rewriting it whole"""
+        bodies = [
+            '<script>fetch(\n  "/api/items")</script>',
+            'location.href =\n "/x";',
+            'a { background: url(\n"/img.png") }',
+            '<base\nhref="/"><a href="/a">x</a>',
+            'fetch(`/api/${id}/items`); el.getAttribute( "href" );',
+            'document.location.pathname; window.location.pathname; location.pathname',
+        ]
+        for body in bodies:
+            whole = rewrite_content(body, 'club', 'example.com').encode()
+            data = body.encode()
+            for i in range(len(data) + 1):
+                for j in range(i, len(data) + 1):
+                    chunks = [data[:i], data[i:j], data[j:]]
+                    with self.subTest(body=body, cuts=(i, j)):
+                        self.assertEqual(b''.join(rewrite_stream(chunks, 'club', 'example.com')), whole)
+
+    def test_body_without_length_is_streamed_once_large(self):
+        """A chunked body is buffered only up to REWRITE_STREAM_MIN, then streamed whole"""
+        def backend(*chunks):
+            return SimpleNamespace(iter_content=lambda chunk_size: iter(chunks), close=lambda: None)
+        with patch('utils.proxy.REWRITE_STREAM_MIN', 20):
+            content, chunks = read_text_body(backend(b'<a href=', b'"/x">'))
+            self.assertEqual((content, chunks), (b'<a href="/x">', None))
+            content, chunks = read_text_body(backend(b'<a href="/x">', b'<a href="/y">', b'.'))
+            self.assertIsNone(content)
+            self.assertEqual(b''.join(chunks), b'<a href="/x"><a href="/y">.')
+
+
+class TestRewriteMemo(unittest.TestCase):
+
+    def test_evicts_least_recently_used_over_cap(self):
+        """Memo stays under its byte cap, dropping the oldest unused body"""
+        memo = RewriteMemo(max_bytes=10)
+        memo.put('a', b'12345')
+        memo.put('b', b'12345')
+        memo.get('a')
+        memo.put('c', b'12345')
+        self.assertEqual(memo.get('a'), b'12345')
+        self.assertIsNone(memo.get('b'))
+        self.assertEqual(memo.stats()['evictions'], 1)
+
+
+class TestCacheFreshness(unittest.TestCase):
+
+    def backend(self, **headers):
+        return SimpleNamespace(headers=CaseInsensitiveDict(
+            {k.replace('_', '-'): v for k, v in headers.items()}
+        ))
+
+    def test_max_age_and_s_maxage(self):
+        """s-maxage wins over max-age for a shared cache"""
+        self.assertEqual(freshness_lifetime(self.backend(cache_control='max-age=60'), 'app'), 60)
+        self.assertEqual(freshness_lifetime(self.backend(cache_control='max-age=60, s-maxage=5'), 'app'), 5)
+
+    def test_uncacheable_responses(self):
+        """no-store, private and Vary: * are never stored"""
+        self.assertIsNone(freshness_lifetime(self.backend(cache_control='no-store'), 'app'))
+        self.assertIsNone(freshness_lifetime(self.backend(cache_control='private, max-age=60'), 'app'))
+        self.assertIsNone(freshness_lifetime(self.backend(cache_control='max-age=60', vary='*'), 'app'))
+
+    def test_no_cache_is_stored_stale(self):
+        """no-cache responses are kept but must be revalidated before reuse"""
+        self.assertEqual(freshness_lifetime(self.backend(cache_control='no-cache'), 'app'), 0)
+
+
+class TestSharedCache(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.patches = [
+            patch.object(cache, 'CACHE_ENABLED', True),
+            patch.object(cache, 'CACHE_PATH', os.path.join(self.dir.name, 'cache.sqlite3')),
+            patch.object(cache, '_local', threading.local()),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.dir.cleanup()
+
+    def request(self, **headers):
+        return SimpleNamespace(method='GET', headers=CaseInsensitiveDict(headers))
+
+    def store(self, request, body, **headers):
+        resp = SimpleNamespace(status_code=200, headers=CaseInsensitiveDict(
+            {k.replace('_', '-'): v for k, v in headers.items()}
+        ))
+        cache.cache_store('app', request, '/page', resp, HttpResponse(body))
+
+    def test_cookie_responses_are_not_shared(self):
+        """A page fetched with cookies is not served to other clients"""
+        self.store(self.request(Cookie='session=alice'), b'Hello alice', cache_control='max-age=60')
+        self.assertIsNone(cache.cache_lookup('app', self.request(), '/page'))
+
+    def test_cookie_responses_shared_when_backend_allows(self):
+        """Vary: Cookie keys the entry on the cookie, public marks it as shared"""
+        self.store(self.request(Cookie='session=alice'), b'Hello alice', cache_control='max-age=60', vary='Cookie')
+        self.assertIsNone(cache.cache_lookup('app', self.request(Cookie='session=bob'), '/page'))
+        self.assertEqual(cache.cache_lookup('app', self.request(Cookie='session=alice'), '/page')['body'], b'Hello alice')
+        self.store(self.request(Cookie='session=alice'), b'Hello', cache_control='public, max-age=60')
+        self.assertEqual(cache.cache_lookup('app', self.request(), '/page')['body'], b'Hello')
+
+    def test_anonymous_entries_not_served_to_cookie_requests(self):
+        """A request with cookies may get a personalised page, never an anonymous copy"""
+        self.store(self.request(), b'Hello guest', cache_control='max-age=60')
+        self.assertIsNone(cache.cache_lookup('app', self.request(Cookie='session=alice'), '/page'))
+        self.assertEqual(cache.cache_lookup('app', self.request(), '/page')['body'], b'Hello guest')
+
+
+class TestCoalescing(unittest.TestCase):
+
+    def run_concurrently(self, leader_response):
+        """Start a leader and a follower on the same key, return (backend calls, responses)."""
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(5)
+                return leader_response
+            return HttpResponse(b'own copy')
+
+        key = ('coalesce-test', 'GET', '/page', id(release))
+        results = {}
+        leader = threading.Thread(target=lambda: results.__setitem__('leader', coalesce.coalesce(key, fetch)))
+        leader.start()
+        while key not in coalesce._flights:
+            pass
+        follower = threading.Thread(target=lambda: results.__setitem__('follower', coalesce.coalesce(key, fetch)))
+        follower.start()
+        follower.join(0.1)
+        release.set()
+        leader.join()
+        follower.join()
+        return calls, results
+
+    def test_follower_gets_copy_of_leader_response(self):
+        """Concurrent identical GETs make one backend fetch"""
+        calls, results = self.run_concurrently(HttpResponse(b'shared'))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results['follower'].content, b'shared')
+        self.assertIsNot(results['follower'], results['leader'])
+
+    def test_not_modified_is_not_shared(self):
+        """A leader's 304 is never handed to a follower, which fetches its own body"""
+        calls, results = self.run_concurrently(HttpResponse(status=304))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(results['follower'].status_code, 200)
+        self.assertEqual(results['follower'].content, b'own copy')
+
+    def test_conditional_requests_are_not_coalesced(self):
+        """Requests with validators or ranges get no coalescing key"""
+        for header in ('If-None-Match', 'If-Modified-Since', 'Range'):
+            request = SimpleNamespace(method='GET', headers=CaseInsensitiveDict({header: 'x'}))
+            self.assertIsNone(coalesce.coalesce_key('app', request, '/page'))
+        request = SimpleNamespace(method='GET', headers=CaseInsensitiveDict())
+        self.assertIsNotNone(coalesce.coalesce_key('app', request, '/page'))
+
+
+class TestCompression(unittest.TestCase):
+
+    def test_parse_accept_encoding(self):
+        """q-values are parsed and q=0 means refused"""
+        accepted = parse_accept_encoding('gzip;q=0.8, br, identity;q=0')
+        self.assertEqual(accepted, {'gzip': 0.8, 'br': 1.0, 'identity': 0.0})
+
+    def test_cached_hits_compressed_by_content_type(self):
+        """Fresh cache hits are compressed for text only: a PNG comes back as stored"""
+        route = routes.compile_route('media', 'example.com')
+        fetch = getattr(views, '__fetch_proxy_response')
+        for content_type, body, encoded in (('image/png', b'\x89PNG' * 1000, False), ('text/css', b'a{}' * 1000, True)):
+            entry = {'fresh': True, 'status': 200, 'body': body, 'stored': time.time(),
+                     'headers': [('Content-Type', content_type)]}
+            request = RequestFactory().get('/media/file', HTTP_ACCEPT_ENCODING='gzip')
+            with patch('views.cache_lookup', return_value=entry):
+                response = fetch(route, '/file', request, 'https://example.com/file')
+            with self.subTest(content_type=content_type):
+                self.assertEqual(response.has_header('Content-Encoding'), encoded)
+                self.assertEqual(response.content == body, not encoded)
+
+
+class TestRequestBody(unittest.TestCase):
+
+    def test_spooled_body_can_be_resent(self):
+        """A spooled upload replays from the first byte after rewind()"""
+        body = RequestBody(io.BytesIO(b'a' * 100), length=100, spool=True)
+        first = b''.join(body)
+        body.rewind()
+        self.assertEqual(b''.join(body), first)
+        self.assertEqual(len(first), 100)
+
+
+class TestRangeRequests(unittest.TestCase):
+
+    def request(self, **headers):
+        return SimpleNamespace(headers=headers, get_host=lambda: 'proxy.test', is_secure=lambda: True)
+
+    def test_ranges_are_forwarded_unencoded(self):
+        """Range and If-Range go upstream, asking for identity so offsets match the file"""
+        route = routes.compile_route('media', 'example.com')
+        headers = prepare_headers(self.request(Range='bytes=0-99,200-299', **{'If-Range': '"v1"'}), route)
+        self.assertEqual(headers['Range'], 'bytes=0-99,200-299')
+        self.assertEqual(headers['If-Range'], '"v1"')
+        self.assertEqual(headers['Accept-Encoding'], 'identity')
+        self.assertNotEqual(prepare_headers(self.request(), route)['Accept-Encoding'], 'identity')
+
+    def fetch(self, status, headers, body, **request_headers):
+        """Run the sync view on a canned backend response"""
+        resp = requests.Response()
+        resp.status_code = status
+        resp.raw = urllib3.HTTPResponse(io.BytesIO(body), headers=headers, status=status, preload_content=False)
+        resp.headers = CaseInsensitiveDict(headers)
+        route = routes.compile_route('media', 'example.com')
+        request = RequestFactory().get('/media/page.html', **request_headers)
+        with patch('views.make_proxy_request', return_value=resp), \
+                patch('views.cache_lookup', return_value=None), patch('views.cache_store'):
+            return getattr(views, '__fetch_proxy_response')(route, '/page.html', request, 'https://example.com/page.html')
+
+    def test_partial_content_is_streamed_unchanged(self):
+        """A 206 text body is streamed byte for byte with its Content-Range and Content-Length"""
+        body = b'<a href="/next">'
+        headers = {'Content-Type': 'text/html', 'Content-Range': 'bytes 100-115/2000', 'Content-Length': '16'}
+        response = self.fetch(206, headers, body, HTTP_RANGE='bytes=100-115')
+        self.assertEqual(response.status_code, 206)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Range'], 'bytes 100-115/2000')
+        self.assertEqual(response['Content-Length'], '16')
+        self.assertEqual(b''.join(response.streaming_content), body)
+
+    def test_rewritten_body_offers_no_ranges(self):
+        """A rewritten page drops Accept-Ranges and weakens the ETag, so If-Range can't match it"""
+        headers = {'Content-Type': 'text/html', 'Accept-Ranges': 'bytes', 'ETag': '"v1"', 'Content-Length': '16'}
+        response = self.fetch(200, headers, b'<a href="/next">')
+        self.assertEqual(response.content, b'<a href="/media/next">')
+        self.assertFalse(response.has_header('Accept-Ranges'))
+        self.assertEqual(response['ETag'], 'W/"v1"')
+
+
+class TestLogEvents(unittest.TestCase):
+
+    def test_events_are_counted_per_service(self):
+        """Structured proxy/rewrite events aggregate without parsing messages"""
+        proxy_logging._flush_window(force=True)
+        proxy_logging.log_event('proxy', 'app', method='GET', path='x', url='https://example.com/x')
+        proxy_logging.log_event('rewrite', 'app', url='https://example.com/x')
+        counts = proxy_logging._activity_window['services']['app']
+        self.assertEqual((counts['proxy'], counts['rewrite']), (1, 1))
+
+    def test_background_writer_flushes_counted_events(self):
+        """With LOG_WRITER=background, counter-only traffic still gets its summary line"""
+        proxy_logging._flush_window(force=True)
+        with patch('sys.stdout', new_callable=io.StringIO) as out, \
+                patch.object(proxy_logging, 'BACKGROUND_WRITER', True), \
+                patch.object(proxy_logging, 'WINDOW_DURATION', 0), \
+                patch.object(proxy_logging, 'LOG_FLUSH_INTERVAL', 0.05), \
+                patch.dict(proxy_logging._writer, pid=None, thread=None):
+            for _ in range(5):
+                proxy_logging.log_event('proxy', 'writer-test', method='GET', path='x', url='https://example.com/x')
+            deadline = time.monotonic() + 5
+            while '📊 writer-test: 5 requests' not in out.getvalue() and time.monotonic() < deadline:
+                time.sleep(0.05)
+        self.assertIn('📊 writer-test: 5 requests', out.getvalue())
+
+    def test_emit_batches_lines_into_buffer(self):
+        """Batched lines keep their own timestamps in the log buffer"""
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            proxy_logging._emit([(0.5, 'first'), (1.25, 'second')])
+        self.assertEqual(out.getvalue(), 'first\nsecond\n')
+        self.assertEqual(list(proxy_logging.LOG_BUFFER)[-2:], [
+            '1970-01-01T00:00:00.500000Z [inf] first',
+            '1970-01-01T00:00:01.250000Z [inf] second',
+        ])
+
+
+class TestLogRing(unittest.TestCase):
+
+    def test_ring_keeps_latest_lines_in_time_order(self):
+        """Lines from several writers come back merged by time, each writer dropping its oldest"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'logs.ring')
+            first, second = LogRing(path, slots=4, writers=2), LogRing(path, slots=4, writers=2)
+            first.append([(1.0, 'a'), (3.0, 'c')])
+            second.append([(2.0, 'b'), (4.0, 'd'), (5.0, 'e')])
+            self.assertEqual(first.read(), ['a', 'c', 'd', 'e'])
+            self.assertEqual(second.read(limit=2), ['d', 'e'])
+
+    def test_regions_of_dead_writers_are_reused(self):
+        """A writer gets a region only when its owner is gone, and keeps its lines"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'logs.ring')
+            LogRing(path, slots=4, writers=1).append([(1.0, 'a')])
+            late = LogRing(path, slots=4, writers=1)
+            with self.assertRaises(OSError):
+                late.append([(2.0, 'b')])
+            with patch.object(logring, '_alive', return_value=False):
+                late.append([(2.0, 'b')])
+            self.assertEqual(late.read(), ['a', 'b'])
+
+
+class TestMetrics(unittest.TestCase):
+
+    def test_histograms_merge_across_workers(self):
+        """Other workers' snapshot files are added to this worker's histograms"""
+        with tempfile.TemporaryDirectory() as tmp, patch.object(metrics, 'METRICS_DIR', tmp):
+            metrics.observe('proxy_upstream_ttfb_seconds', 'metrics-test', 0.02)
+            other = {'counters': [], 'histograms': [
+                ['proxy_upstream_ttfb_seconds', 'metrics-test', [0, 0, 0, 1] + [0] * 8, 0.03],
+            ]}
+            with open(os.path.join(tmp, f'{os.getppid()}.json'), 'w') as f:
+                json.dump(other, f)
+            text = metrics.render_metrics()
+        self.assertIn('proxy_upstream_ttfb_seconds_bucket{service="metrics-test",le="0.025"} 1', text)
+        self.assertIn('proxy_upstream_ttfb_seconds_bucket{service="metrics-test",le="0.05"} 2', text)
+        self.assertIn('proxy_upstream_ttfb_seconds_count{service="metrics-test"} 2', text)
+
+
+class TestServerTiming(unittest.TestCase):
+
+    def test_phases_become_server_timing_header(self):
+        """Marked phases are listed in order, followed by the total"""
+        with patch.object(timing, 'SERVER_TIMING', True):
+            request = SimpleNamespace()
+            timer = timing.start_timing(request, 'app')
+            timer.mark('routing')
+            timer.mark('upstream')
+            response = timer.finish({})
+        names = [metric.split(';')[0] for metric in response['Server-Timing'].split(', ')]
+        self.assertEqual(names, ['routing', 'upstream', 'total'])
+
+    def test_disabled_timing_is_a_no_op(self):
+        """Without the flag no header is added"""
+        request = SimpleNamespace()
+        self.assertEqual(timing.start_timing(request, 'app').finish({}), {})
+
+
+class TestRoutes(unittest.TestCase):
+
+    def test_compiled_route(self):
+        """URLs and patterns are derived once from the service settings"""
+        route = routes.compile_route('app', 'example.com', base_path='/v2')
+        self.assertEqual(route.base_url, 'https://example.com/v2/')
+        self.assertEqual(route.origin, 'https://example.com')
+        self.assertTrue(route.referer_re.match('https://proxy.test/app/page'))
+        self.assertEqual(routes.compile_route('docs', 'local-template:docs.html').template, 'docs.html')
+
+    def test_service_options_become_route_fields(self):
+        """SERVICE_<name>_<OPTION> settings are parsed once into the route (bad values ignored)"""
+        services = routes.load_services({
+            'SERVICE_app': 'example.com/v2', 'SERVICE_app_RANK': '3', 'SERVICE_app_HEALTH': 'up',
+            'SERVICE_app_TIMEOUT': 'soon', 'SERVICE_app_HEDGE': 'true',
+        }, {})
+        self.assertEqual(services, {'app': {
+            'target': 'example.com', 'base_path': '/v2', 'rank': 3, 'health_path': '/up', 'hedge': True,
+        }})
+        route = routes.compile_routes(services)['app']
+        self.assertEqual((route.rank, route.timeout, route.hidden), (3, None, False))
+
+    def test_option_suffix_without_its_service_is_a_service(self):
+        """SERVICE_<name>_HEALTH is only an option when SERVICE_<name> is set, else a service (with a warning)"""
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            services = routes.load_services({
+                'SERVICE_app_HEALTH': 'health.example.com', 'SERVICE_app_HEALTH_DESC': 'Health board',
+                'SERVICE_api': 'api.example.com', 'SERVICE_api_CONNECT_TIMEOUT': '2',
+            }, {})
+        self.assertEqual(services, {
+            'app_HEALTH': {'target': 'health.example.com', 'base_path': '', 'description': 'Health board'},
+            'api': {'target': 'api.example.com', 'base_path': '', 'connect_timeout': 2.0},
+        })
+        self.assertIn('[WARNING] SERVICE_app_HEALTH looks like a service option', out.getvalue())
+
+    def test_services_file_is_layered_over_environment(self):
+        """A reload picks up services added to the services file"""
+        with tempfile.NamedTemporaryFile('w', suffix='.env', delete=False) as f:
+            f.write('# extra services\nSERVICE_reloaded=example.org/base\n')
+        try:
+            with patch.object(routes, 'SERVICES_FILE', f.name), patch.object(routes, '_routes', routes.get_routes()):
+                routes.reload_routes()
+                self.assertEqual(routes.get_route('reloaded').base_url, 'https://example.org/base/')
+        finally:
+            os.remove(f.name)
+
+    def test_reload_due_without_touching_the_file(self):
+        """The async view only hands check_reload to a thread after a signal or once the interval is up"""
+        watch = {'requested': False, 'checked': time.monotonic(), 'mtime': None}
+        with patch.object(routes, 'SERVICES_FILE', '/nonexistent/services.env'), patch.object(routes, '_watch', watch):
+            self.assertFalse(routes.reload_due())
+            watch['requested'] = True
+            self.assertTrue(routes.reload_due())
+            watch['requested'] = False
+            watch['checked'] -= routes.SERVICES_FILE_CHECK
+            self.assertTrue(routes.reload_due())
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_open_half_open_closed(self):
+        """Repeated failures open the circuit, one trial after the cooldown, a success closes it"""
+        with patch.object(breaker, 'BREAKER_THRESHOLD', 2), patch.object(breaker, 'BREAKER_COOLDOWN', 60):
+            breaker.record_failure('breaker-test', 'timeout')
+            self.assertTrue(breaker.allow_request('breaker-test'))
+            breaker.record_failure('breaker-test', 'timeout')
+            self.assertFalse(breaker.allow_request('breaker-test'))
+            with patch.object(breaker, 'BREAKER_COOLDOWN', 0):
+                self.assertTrue(breaker.allow_request('breaker-test'))
+            self.assertFalse(breaker.allow_request('breaker-test'))
+            breaker.record_success('breaker-test')
+            self.assertTrue(breaker.allow_request('breaker-test'))
+
+
+class TestRetries(unittest.TestCase):
+
+    def test_budget_limits_extra_requests(self):
+        """Retries spend the reserve, then one per 1 / RETRY_BUDGET first attempts"""
+        with patch.dict(retries._budget, tokens=1.0):
+            self.assertTrue(retries.spend_retry('retry-test'))
+            self.assertFalse(retries.spend_retry('retry-test'))
+            for _ in range(10):
+                retries.earn_retry()
+            self.assertTrue(retries.spend_retry('retry-test'))
+
+    def test_hedge_waits_for_p95(self):
+        """No hedge before enough samples, then after the p95 bucket bound"""
+        route = routes.compile_route('hedge-test', 'example.com', hedge=True)
+        request = SimpleNamespace(method='GET')
+        self.assertIsNone(retries.hedge_delay(route, request, None))
+        for seconds in [0.02] * 19 + [3.0]:
+            metrics.observe('proxy_upstream_ttfb_seconds', 'hedge-test', seconds)
+        self.assertEqual(retries.hedge_delay(route, request, None), 0.025)
+        self.assertIsNone(retries.hedge_delay(route, SimpleNamespace(method='POST'), None))
+
+    def test_per_service_timeouts(self):
+        """SERVICE_*_TIMEOUT / _CONNECT_TIMEOUT override the global timeouts"""
+        default = routes.compile_route('timeout-test', 'example.com')
+        slow = routes.compile_route('timeout-test', 'example.com', timeout=120, connect_timeout=2)
+        self.assertEqual(retries.upstream_timeout(default), (retries.UPSTREAM_CONNECT_TIMEOUT, retries.UPSTREAM_TIMEOUT))
+        self.assertEqual(retries.upstream_timeout(slow), (2, 120))
+
+    def backend(self, delays):
+        """send() whose n-th call answers after delays[n] seconds, with the responses it made"""
+        made = []
+        calls = iter(delays)
+
+        def send():
+            delay = next(calls)
+            time.sleep(delay)
+            resp = SimpleNamespace(delay=delay, closed=False, thread=threading.current_thread())
+            resp.close = lambda: setattr(resp, 'closed', True)
+            made.append(resp)
+            return resp
+        return send, made
+
+    def test_hedge_wins_and_slow_response_is_closed(self):
+        """A second request is sent after the delay; the loser's connection is released"""
+        send, made = self.backend([0.3, 0])
+        with patch.dict(retries._budget, tokens=5.0):
+            resp = retries.hedged(send, 0.02, 'hedge-test')
+            self.assertEqual(resp.delay, 0)
+            self.assertEqual(retries._budget['tokens'], 4.0)
+        time.sleep(0.4)
+        self.assertEqual([r.closed for r in made], [False, True])
+
+    def test_no_hedge_without_free_thread(self):
+        """With every hedging thread busy the request runs on the caller's thread, counted as rejected"""
+        send, made = self.backend([0])
+        with patch.dict(retries._budget, tokens=5.0, rejected=0), patch.object(retries, 'HEDGE_THREADS', 0):
+            retries.hedged(send, 0.02, 'hedge-test')
+            self.assertEqual(retries._budget['rejected'], 1)
+        self.assertIs(made[0].thread, threading.current_thread())
+
+    def test_async_hedge_cancels_slow_request(self):
+        """hedged_async() returns the faster response and cancels the other request"""
+        cancelled = []
+
+        async def send():
+            delay = delays.pop(0)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return delay
+        delays = [0.3, 0]
+        with patch.dict(retries._budget, tokens=5.0):
+            self.assertEqual(asyncio.run(retries.hedged_async(send, 0.02, 'hedge-test')), 0)
+        self.assertEqual(cancelled, [0.3])
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
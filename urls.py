@@ -1,12 +1,16 @@
 from django.urls import path, re_path
 from django.http import HttpResponse
-from views import proxy_view, home
+from config import ASGI
+from views import proxy_view, proxy_view_async, home
+
+# Under asgi.py backend calls are awaited instead of blocking a worker
+proxy = proxy_view_async if ASGI else proxy_view
 
 urlpatterns = [
     path('favicon.ico', lambda r: HttpResponse(status=204)),
     # Match /service/ (root of service)
-    re_path(r'^(?P<service>[a-zA-Z0-9-_]+)/?$', proxy_view),
+    re_path(r'^(?P<service>[a-zA-Z0-9-_]+)/?$', proxy),
     # Match /service/path
-    re_path(r'^(?P<service>[a-zA-Z0-9-_]+)/(?P<path>.*)$', proxy_view),
+    re_path(r'^(?P<service>[a-zA-Z0-9-_]+)/(?P<path>.*)$', proxy),
     path('', home),
 ]
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""Async proxy request handling for the ASGI entry point (httpx)."""
+import asyncio
+import time
+import weakref
+from http.cookiejar import DefaultCookiePolicy
+
+import httpx
+
+from config import POOL_SIZE, POOL_MAX_IDLE, STREAM_CHUNK_SIZE, UPSTREAM_TIMEOUT, REWRITE_STREAM_MIN
+from utils.logging import log_event
+from utils.metrics import observe, upstream_started, upstream_finished, connect_tracer
+from utils.timing import timing_of
+from utils.proxy import prepare_headers, should_log_request, request_body
+from utils.retries import retries_allowed, upstream_timeout, earn_retry, spend_retry, hedge_delay, hedged_async
+from utils.rewrite import StreamRewriter
+
+# Failures where the backend sent nothing back (read timeouts are not retried)
+RETRYABLE_ERRORS = (httpx.ConnectTimeout, httpx.NetworkError, httpx.RemoteProtocolError)
+
+# Clients are bound to the event loop they were created on: loop -> {service: client}
+_clients = weakref.WeakKeyDictionary()
+
+
+def get_client(service):
+    """Get the pooled async client for a service on the running event loop."""
+    clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(service)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=None,
+                max_keepalive_connections=POOL_SIZE,
+                keepalive_expiry=POOL_MAX_IDLE,
+            ),
+            timeout=UPSTREAM_TIMEOUT,
+            follow_redirects=False,
+        )
+        # Clients are shared by every visitor: never keep backend cookies
+        client.cookies.jar.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        clients[service] = client
+    return client
+
+
+async def make_proxy_request_async(route, path, request, url, validators=None):
+    """Make request to backend service (body is streamed, read it or close the response)."""
+    service = route.name
+    timing = timing_of(request)
+    headers = prepare_headers(request, route, validators)
+    timing.mark('headers')
+
+    if should_log_request(path):
+        log_event('proxy', service, method=request.method, path=path, url=url)
+
+    # Cookies travel in the forwarded Cookie header
+    client = get_client(service)
+    retries = retries_allowed(request)
+    body = request_body(request, spool=retries > 0)
+    connect, read = upstream_timeout(route)
+    
+    async def send():
+        upstream = client.build_request(
+            request.method, url, headers=headers,
+            content=_iter_body(body) if body is not None else None,
+            timeout=httpx.Timeout(read, connect=connect),
+            extensions={'trace': connect_tracer(service, httpx.URL(url).scheme)},
+        )
+        start = time.perf_counter()
+        resp = await client.send(upstream, stream=True)
+        upstream_started(resp, service, start)
+        return resp
+    
+    earn_retry()
+    delay = hedge_delay(route, request, body)
+    attempt = 0
+    while True:
+        try:
+            resp = await (send() if delay is None else hedged_async(send, delay, service))
+            break
+        except RETRYABLE_ERRORS as e:
+            # Nothing came back: idempotent requests are sent again, within the budget
+            if attempt >= retries or not spend_retry(service):
+                raise
+            attempt += 1
+            log_event('detail', service, f"[RETRY] {request.method} {url} ({attempt}/{retries}): {e}")
+            if body is not None:
+                body.rewind()
+    timing.mark('upstream')
+    return resp
+
+
+async def _iter_body(body):
+    """Feed the (already spooled by the ASGI handler) upload to httpx in chunks."""
+    for chunk in body:
+        yield chunk
+
+
+async def stream_response_body_async(resp, chunk_size=STREAM_CHUNK_SIZE, decode=True):
+    """
+    Yield the backend body in chunks, releasing the connection when done.
+
+    With decode=False the bytes are passed on still compressed (Content-Encoding kept).
+    """
+    try:
+        chunks = resp.aiter_bytes(chunk_size) if decode else resp.aiter_raw(chunk_size)
+        async for chunk in chunks:
+            if chunk:
+                yield chunk
+    finally:
+        await resp.aclose()
+        upstream_finished(resp)
+
+
+async def read_text_body_async(resp):
+    """read_text_body() for the async client."""
+    chunks = stream_response_body_async(resp)
+    head, size = [], 0
+    async for chunk in chunks:
+        head.append(chunk)
+        size += len(chunk)
+        if size > REWRITE_STREAM_MIN:
+            return None, _chain_async(head, chunks)
+    return b''.join(head), None
+
+
+async def _chain_async(head, chunks):
+    for chunk in head:
+        yield chunk
+    async for chunk in chunks:
+        yield chunk
+
+
+async def stream_response_content_async(resp, service, target_domain, url, chunks=None):
+    """Rewrite a large text body chunk by chunk, off the event loop."""
+    log_event('rewrite', service, url=url)
+    log_event('detail', service, f"[REWRITE]   Content-Type: {resp.headers.get('content-type', '')} (streamed)")
+    rewriter = StreamRewriter(service, target_domain)
+    elapsed = 0.0
+    async for chunk in stream_response_body_async(resp) if chunks is None else chunks:
+        start = time.perf_counter()
+        data = await asyncio.to_thread(rewriter.feed, chunk)
+        elapsed += time.perf_counter() - start
+        if data:
+            yield data
+
+    start = time.perf_counter()
+    data = await asyncio.to_thread(rewriter.finish)
+    observe('proxy_rewrite_seconds', service, elapsed + time.perf_counter() - start)
+    if data:
+        yield data
@@ -0,0 +1,146 @@
+"""Per-service circuit breakers: stop waiting on a backend that keeps failing."""
+import threading
+import time
+
+from config import BREAKER_THRESHOLD, BREAKER_COOLDOWN, BREAKER_PROBE_INTERVAL
+from utils.logging import log_event
+from utils.metrics import count
+from utils.routes import get_route
+
+CLOSED = 'closed'  # requests flow, consecutive failures are counted
+OPEN = 'open'  # requests are refused until the cooldown is over (or a probe succeeds)
+HALF_OPEN = 'half-open'  # one trial request decides whether to close or reopen
+
+_lock = threading.Lock()
+_breakers = {}  # service -> state, only for services that have failed at least once
+
+
+def _settings(route):
+    """(threshold, cooldown) of a service, per-service overrides first."""
+    threshold = BREAKER_THRESHOLD if route is None or route.breaker_threshold is None else route.breaker_threshold
+    cooldown = BREAKER_COOLDOWN if route is None or route.breaker_cooldown is None else route.breaker_cooldown
+    return threshold, cooldown
+
+
+def allow_request(service):
+    """
+    Check if a request may go to the backend (False: answer 503 right away).
+
+    Once the cooldown of an open circuit is over, a single trial request is
+    let through (another one each cooldown if it never reports back).
+    Services with a health path wait for a good probe instead.
+    """
+    breaker = _breakers.get(service)
+    if breaker is None or breaker['state'] == CLOSED:
+        return True
+    route = get_route(service)
+    threshold, cooldown = _settings(route)
+    with _lock:
+        if not threshold:
+            breaker['state'] = CLOSED
+            return True
+        if not (route and route.health_path) and time.monotonic() - breaker['opened'] >= cooldown:
+            breaker['state'] = HALF_OPEN
+            breaker['opened'] = time.monotonic()
+            log_event('info', service, f"[BREAKER] {service}: half-open, sending a trial request")
+            return True
+        breaker['rejected'] += 1
+    count('proxy_breaker_rejected_total', service=service)
+    return False
+
+
+def record_success(service):
+    """The backend answered (any status): reset its failure count, close its circuit."""
+    breaker = _breakers.get(service)
+    if breaker is None or (breaker['state'] == CLOSED and not breaker['failures']):
+        return
+    _close(service, breaker, 'backend answered')
+
+
+def record_failure(service, kind):
+    """A request timed out or could not connect: open the circuit after too many in a row."""
+    route = get_route(service)
+    threshold, _ = _settings(route)
+    with _lock:
+        breaker = _breakers.setdefault(service, {
+            'state': CLOSED, 'failures': 0, 'opened': None, 'trips': 0, 'rejected': 0,
+            'last_error': None, 'last_failure': None, 'last_probe': None,
+        })
+        breaker['failures'] += 1
+        breaker['last_error'] = kind
+        breaker['last_failure'] = time.time()
+        if not threshold or breaker['state'] == OPEN:
+            return
+        if breaker['state'] == CLOSED and breaker['failures'] < threshold:
+            return
+        breaker['state'] = OPEN
+        breaker['opened'] = time.monotonic()
+        breaker['trips'] += 1
+    count('proxy_breaker_trips_total', service=service)
+    log_event('warning', service, f"[BREAKER] {service}: open after {breaker['failures']} failures in a row ({kind})")
+    if route is not None and route.health_path:
+        threading.Thread(target=_probe_loop, args=(route.name,), name=f'probe-{service}', daemon=True).start()
+
+
+def _close(service, breaker, reason):
+    with _lock:
+        was_open = breaker['state'] != CLOSED
+        breaker['state'] = CLOSED
+        breaker['failures'] = 0
+    if was_open:
+        log_event('info', service, f"[BREAKER] {service}: closed, {reason}")
+
+
+def _probe_loop(service):
+    """Poll the health path of an open circuit until the backend answers it."""
+    from utils.pool import get_session
+
+    breaker = _breakers[service]
+    while breaker['state'] != CLOSED:
+        time.sleep(BREAKER_PROBE_INTERVAL)
+        route = get_route(service)
+        if route is None or not route.health_path:
+            return
+        breaker['last_probe'] = time.time()
+        try:
+            resp = get_session(service).get(
+                route.origin + route.health_path,
+                timeout=BREAKER_PROBE_INTERVAL,
+                allow_redirects=False,
+            )
+            resp.close()
+        except Exception:
+            continue
+        if resp.status_code < 500:
+            _close(service, breaker, f"health probe answered {resp.status_code}")
+            return
+
+
+def breaker_states(routes):
+    """Circuit state of every proxied service (for /_health)."""
+    now = time.monotonic()
+    states = {}
+    for route in routes.values():
+        if route.template:
+            continue
+        threshold, cooldown = _settings(route)
+        breaker = _breakers.get(route.name)
+        if breaker is None:
+            states[route.name] = {'state': CLOSED, 'failures': 0, 'threshold': threshold}
+            continue
+        state = {
+            'state': breaker['state'],
+            'failures': breaker['failures'],
+            'threshold': threshold,
+            'trips': breaker['trips'],
+            'rejected': breaker['rejected'],
+            'last_error': breaker['last_error'],
+            'last_failure': breaker['last_failure'],
+        }
+        if breaker['state'] == OPEN:
+            if route.health_path:
+                state['last_probe'] = breaker['last_probe']
+            else:
+                state['retry_in'] = round(max(cooldown - (now - breaker['opened']), 0), 1)
+        states[route.name] = state
+    return states
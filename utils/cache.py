@@ -0,0 +1,392 @@
+"""Shared response cache (SQLite file used by every gunicorn worker)."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from types import SimpleNamespace
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from requests.structures import CaseInsensitiveDict
+
+from config import CACHE_ENABLED, CACHE_PATH, CACHE_MAX_BYTES, CACHE_MAX_ENTRY_BYTES
+from utils.logging import log_event
+from utils.routes import get_route
+
+CACHEABLE_STATUSES = (200, 203, 301, 308)
+# Request headers that never select a different stored body
+# (bodies are stored decoded, so Accept-Encoding does not matter)
+IGNORED_VARY = ('accept-encoding',)
+# Only bump last_access on hits this often, so reads rarely write
+TOUCH_INTERVAL = 60.0
+# Bump when the table layout changes (the cache is simply dropped and rebuilt)
+SCHEMA_VERSION = 2
+
+_local = threading.local()
+_stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'stores': 0, 'evictions': 0}
+
+
+def _connect():
+    """Get this thread's connection (reopened after a fork)."""
+    db = getattr(_local, 'db', None)
+    if db is not None and _local.pid == os.getpid():
+        return db
+    db = sqlite3.connect(CACHE_PATH, timeout=5, isolation_level=None, check_same_thread=False)
+    db.execute('PRAGMA journal_mode=WAL')
+    db.execute('PRAGMA synchronous=NORMAL')
+    # Read bodies through a memory map instead of read() calls
+    db.execute(f'PRAGMA mmap_size={CACHE_MAX_BYTES * 2}')
+    if db.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+        db.execute('DROP TABLE IF EXISTS entries')
+        db.execute(f'PRAGMA user_version={SCHEMA_VERSION}')
+    db.execute('''CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        base TEXT NOT NULL,
+        service TEXT NOT NULL,
+        vary TEXT NOT NULL,
+        status INTEGER NOT NULL,
+        headers TEXT NOT NULL,
+        body BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        stored REAL NOT NULL,
+        expires REAL NOT NULL,
+        last_access REAL NOT NULL,
+        etag TEXT,
+        last_modified TEXT
+    )''')
+    db.execute('CREATE INDEX IF NOT EXISTS entries_base ON entries (base)')
+    db.execute('CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)')
+    _local.db = db
+    _local.pid = os.getpid()
+    return db
+
+
+def parse_cache_control(value):
+    """Parse a Cache-Control header into {directive: value or True}."""
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, arg = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else True
+    return directives
+
+
+def _seconds(value):
+    """Parse a delta-seconds directive value, None if invalid."""
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(resp, service):
+    """
+    Seconds a backend response may be served from cache, None if uncacheable.
+
+    0 means storable but stale at once (no-cache, or no explicit lifetime):
+    such entries are revalidated with the backend before every use.
+    Per-service SERVICE_<name>_CACHE_TTL overrides the backend's own lifetime.
+    """
+    cc = parse_cache_control(resp.headers.get('cache-control'))
+    if 'no-store' in cc or 'private' in cc:
+        return None
+    if resp.headers.get('vary', '').strip() == '*':
+        return None
+    
+    route = get_route(service)
+    if route is not None and route.cache_ttl is not None:
+        return route.cache_ttl or None
+    
+    if 'no-cache' in cc:
+        return 0
+    for directive in ('s-maxage', 'max-age'):
+        if directive in cc:
+            return _seconds(cc[directive]) or 0
+    
+    if 'expires' in resp.headers:
+        try:
+            expires = parsedate_to_datetime(resp.headers['expires']).timestamp()
+            date = resp.headers.get('date')
+            now = parsedate_to_datetime(date).timestamp() if date else time.time()
+        except (TypeError, ValueError):
+            return 0  # invalid Expires means already expired
+        return max(int(expires - now), 0)
+    return 0
+
+
+def _request_cacheable(request):
+    """Check if a client request may use the shared cache at all."""
+    if not CACHE_ENABLED or request.method != 'GET':
+        return False
+    if 'Authorization' in request.headers or 'Range' in request.headers:
+        return False
+    return 'no-store' not in parse_cache_control(request.headers.get('Cache-Control'))
+
+
+def _shared_with_cookies(cache_control, vary_names):
+    """
+    Check if a response to a request with cookies may be shared with other clients.
+
+    Only when the backend keys it on the Cookie header (Vary) or explicitly marks
+    it for shared caches (public, s-maxage); anything else may be personalised.
+    """
+    return 'cookie' in vary_names or 'public' in cache_control or 's-maxage' in cache_control
+
+
+def _vary_values(request, vary):
+    """Request header values selected by a stored Vary list."""
+    return [request.headers.get(name, '') for name in vary]
+
+
+def _entry_key(base, vary, values):
+    return hashlib.blake2b(json.dumps([base, vary, values]).encode(), digest_size=16).hexdigest()
+
+
+def cache_lookup(service, request, url):
+    """
+    Find the stored entry for this request, or None.
+
+    Fresh entries can be served directly (cached_response). Stale ones are
+    returned only if they carry validators, to be revalidated with the backend.
+    """
+    if not _request_cacheable(request):
+        return None
+    cc = parse_cache_control(request.headers.get('Cache-Control'))
+    if 'no-cache' in cc or cc.get('max-age') == '0':
+        return None
+    
+    now = time.time()
+    base = f'{service} {url}'
+    try:
+        rows = _connect().execute(
+            'SELECT key, vary, status, headers, body, stored, expires, last_access, etag, last_modified '
+            'FROM entries WHERE base = ?',
+            (base,)
+        ).fetchall()
+    except sqlite3.Error as e:
+        log_event('warning', message=f"Cache read failed: {e}")
+        return None
+    
+    has_cookies = bool(request.headers.get('Cookie'))
+    for key, vary, status, headers, body, stored, expires, last_access, etag, last_modified in rows:
+        vary_names, vary_values = json.loads(vary)
+        if _vary_values(request, vary_names) != vary_values:
+            continue
+        if has_cookies:
+            cache_control = parse_cache_control(CaseInsensitiveDict(json.loads(headers)).get('cache-control'))
+            if not _shared_with_cookies(cache_control, vary_names):
+                continue
+        
+        fresh = expires > now
+        if not fresh and not (etag or last_modified):
+            break
+        
+        if fresh:
+            _stats['hits'] += 1
+            if now - last_access > TOUCH_INTERVAL:
+                try:
+                    _connect().execute('UPDATE entries SET last_access = ? WHERE key = ?', (now, key))
+                except sqlite3.Error:
+                    pass
+        return {
+            'key': key,
+            'service': service,
+            'status': status,
+            'headers': json.loads(headers),
+            'body': body,
+            'stored': stored,
+            'fresh': fresh,
+            'etag': etag,
+            'last_modified': last_modified,
+        }
+    
+    _stats['misses'] += 1
+    return None
+
+
+def cache_validators(entry, request):
+    """
+    Conditional request headers to revalidate a stale entry with.
+
+    None when the client sent conditional headers of its own: the backend's
+    answer (possibly a 304) then goes to the client untouched.
+    """
+    if 'If-None-Match' in request.headers or 'If-Modified-Since' in request.headers:
+        return None
+    validators = {}
+    if entry['etag']:
+        validators['If-None-Match'] = entry['etag']
+    if entry['last_modified']:
+        validators['If-Modified-Since'] = entry['last_modified']
+    return validators
+
+
+def cached_response(entry, status='HIT'):
+    """Build the HttpResponse for a stored entry."""
+    response = HttpResponse(entry['body'], status=entry['status'])
+    for name, value in entry['headers']:
+        response[name] = value
+    response['Age'] = str(int(time.time() - entry['stored']))
+    response['X-Cache'] = status
+    return response
+
+
+def cache_revalidated(entry, resp):
+    """
+    Reuse a stale entry after the backend answered 304 Not Modified.
+
+    Headers sent with the 304 (Cache-Control, Expires, ETag...) replace the
+    stored ones and restart the entry's freshness lifetime.
+    """
+    headers = CaseInsensitiveDict(entry['headers'])
+    for name in ('cache-control', 'expires', 'etag', 'last-modified', 'date'):
+        if name in resp.headers:
+            headers[name] = resp.headers[name]
+    lifetime = freshness_lifetime(SimpleNamespace(headers=headers), entry['service']) or 0
+    now = time.time()
+    entry.update({
+        'headers': list(headers.items()),
+        'stored': now,
+        'etag': headers.get('etag'),
+        'last_modified': headers.get('last-modified'),
+    })
+    _stats['revalidated'] += 1
+    try:
+        _connect().execute(
+            'UPDATE entries SET headers = ?, stored = ?, expires = ?, last_access = ?, etag = ?, last_modified = ? '
+            'WHERE key = ?',
+            (json.dumps(entry['headers']), now, now + lifetime, now,
+             entry['etag'], entry['last_modified'], entry['key'])
+        )
+    except sqlite3.Error as e:
+        log_event('warning', message=f"Cache write failed: {e}")
+    return cached_response(entry, status='REVALIDATED')
+
+
+def cache_store(service, request, url, resp, response):
+    """
+    Store a final (rewritten) response if the backend allows shared caching.
+
+    Streamed bodies (images, fonts...) are stored once they have been sent in
+    full, if they are unencoded and no larger than CACHE_MAX_ENTRY_BYTES.
+    """
+    if not _request_cacheable(request) or resp.status_code not in CACHEABLE_STATUSES:
+        return
+    if 'set-cookie' in resp.headers:
+        return
+    if response.streaming:
+        try:
+            length = int(response.get('Content-Length', ''))
+        except ValueError:
+            return
+        if length > CACHE_MAX_ENTRY_BYTES or response.has_header('Content-Encoding'):
+            return
+    lifetime = freshness_lifetime(resp, service)
+    etag = resp.headers.get('etag')
+    last_modified = resp.headers.get('last-modified')
+    # Entries with no lifetime are only worth keeping if they can be revalidated
+    if lifetime is None or (lifetime == 0 and not (etag or last_modified)):
+        return
+    
+    vary_names = sorted({
+        name.strip().lower() for name in resp.headers.get('vary', '').split(',')
+        if name.strip() and name.strip().lower() not in IGNORED_VARY
+    })
+    if request.headers.get('Cookie'):
+        if not _shared_with_cookies(parse_cache_control(resp.headers.get('cache-control')), vary_names):
+            return
+    vary_values = _vary_values(request, vary_names)
+    base = f'{service} {url}'
+    entry = {
+        'key': _entry_key(base, vary_names, vary_values),
+        'base': base,
+        'service': service,
+        'vary': json.dumps([vary_names, vary_values]),
+        'status': resp.status_code,
+        'headers': json.dumps([(name, value) for name, value in response.items() if name.lower() != 'set-cookie']),
+        'lifetime': lifetime,
+        'etag': etag,
+        'last_modified': last_modified,
+    }
+    response['X-Cache'] = 'MISS'
+    
+    if not response.streaming:
+        _insert(entry, response.content)
+    elif response.is_async:
+        response.streaming_content = _store_stream_async(entry, length, response.streaming_content)
+    else:
+        response.streaming_content = _store_stream(entry, length, response.streaming_content)
+
+
+def _insert(entry, body):
+    """Write one entry (see cache_store), then evict if over the size cap."""
+    now = time.time()
+    try:
+        db = _connect()
+        db.execute(
+            'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (entry['key'], entry['base'], entry['service'], entry['vary'], entry['status'],
+             entry['headers'], body, len(body), now, now + entry['lifetime'], now,
+             entry['etag'], entry['last_modified'])
+        )
+        _stats['stores'] += 1
+        _evict(db)
+    except sqlite3.Error as e:
+        log_event('warning', message=f"Cache write failed: {e}")
+
+
+def _store_stream(entry, length, chunks):
+    """Pass a streamed body on, storing it once it has been read in full."""
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    body = b''.join(parts)
+    if len(body) == length:
+        _insert(entry, body)
+
+
+async def _store_stream_async(entry, length, chunks):
+    parts = []
+    async for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    body = b''.join(parts)
+    if len(body) == length:
+        await sync_to_async(_insert, thread_sensitive=False)(entry, body)
+
+
+def _evict(db):
+    """Drop least recently used entries until the store is under CACHE_MAX_BYTES."""
+    total = db.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+    if total <= CACHE_MAX_BYTES:
+        return
+    # Evict down to 90% so every store near the cap does not trigger a pass
+    target = CACHE_MAX_BYTES * 0.9
+    for key, size in db.execute('SELECT key, size FROM entries ORDER BY last_access').fetchall():
+        if total <= target:
+            break
+        db.execute('DELETE FROM entries WHERE key = ?', (key,))
+        total -= size
+        _stats['evictions'] += 1
+
+
+def cache_purge(service=None):
+    """Remove all entries, or only those of one service. Returns the number removed."""
+    db = _connect()
+    if service:
+        return db.execute('DELETE FROM entries WHERE service = ?', (service,)).rowcount
+    return db.execute('DELETE FROM entries').rowcount
+
+
+def cache_stats():
+    """Store size plus this worker's hit/miss counters."""
+    stats = {'enabled': CACHE_ENABLED, 'path': CACHE_PATH, 'max_bytes': CACHE_MAX_BYTES}
+    if CACHE_ENABLED:
+        entries, size = _connect().execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        stats.update({'entries': entries, 'bytes': size})
+    stats.update(_stats)
+    return stats
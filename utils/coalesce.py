@@ -0,0 +1,117 @@
+"""Single-flight coalescing of identical concurrent GET requests."""
+import asyncio
+import threading
+import weakref
+
+from django.http import HttpResponse
+
+from config import COALESCE, COALESCE_WAIT
+
+# Request headers that can change the backend's answer for the same URL
+KEY_HEADERS = ('Accept', 'Accept-Encoding', 'Accept-Language', 'Cookie', 'Authorization')
+# Requests whose answer depends on what the client already has (304, 206...) are never shared
+CONDITIONAL_HEADERS = ('Range', 'If-None-Match', 'If-Modified-Since', 'If-Match', 'If-Unmodified-Since', 'If-Range')
+
+_lock = threading.Lock()
+_flights = {}  # key -> {'done': Event, 'snapshot': ...}
+_async_flights = weakref.WeakKeyDictionary()  # loop -> {key: Future}
+_stats = {'leaders': 0, 'coalesced': 0, 'timeouts': 0, 'unshared': 0}
+
+
+def coalesce_key(service, request, url):
+    """Key identical idempotent requests, None when a request must not be shared."""
+    if not COALESCE or request.method not in ('GET', 'HEAD'):
+        return None
+    if any(name in request.headers for name in CONDITIONAL_HEADERS):
+        return None
+    return (service, request.method, url) + tuple(request.headers.get(name, '') for name in KEY_HEADERS)
+
+
+def _snapshot(response):
+    """Copy what followers need to rebuild a response, None if it can't be shared."""
+    # Only complete 2xx / 3xx bodies: never a 304 or a partial 206, nor errors
+    if not 200 <= response.status_code < 400 or response.status_code in (206, 304):
+        _stats['unshared'] += 1
+        return None
+    if response.streaming or response.has_header('Set-Cookie') or response.cookies:
+        _stats['unshared'] += 1
+        return None
+    return response.status_code, list(response.items()), response.content
+
+
+def _restore(snapshot):
+    """Build a fresh response for a follower from the leader's snapshot."""
+    status, headers, content = snapshot
+    response = HttpResponse(content, status=status)
+    for name, value in headers:
+        response[name] = value
+    return response
+
+
+def coalesce(key, fetch):
+    """
+    Run fetch() once for concurrent requests with the same key.
+
+    The first caller (leader) fetches; followers wait up to COALESCE_WAIT
+    seconds for its response and get a copy. A follower that times out, or whose
+    leader produced a streaming, cookie-setting or incomplete response, fetches on its own.
+    """
+    with _lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = {'done': threading.Event(), 'snapshot': None}
+
+    if leader:
+        _stats['leaders'] += 1
+        try:
+            response = fetch()
+            flight['snapshot'] = _snapshot(response)
+            return response
+        finally:
+            with _lock:
+                _flights.pop(key, None)
+            flight['done'].set()
+
+    if not flight['done'].wait(COALESCE_WAIT):
+        _stats['timeouts'] += 1
+        return fetch()
+    if flight['snapshot'] is None:
+        return fetch()
+    _stats['coalesced'] += 1
+    return _restore(flight['snapshot'])
+
+
+async def coalesce_async(key, fetch):
+    """coalesce() for the async view: fetch is a coroutine function."""
+    flights = _async_flights.setdefault(asyncio.get_running_loop(), {})
+    future = flights.get(key)
+
+    if future is None:
+        _stats['leaders'] += 1
+        future = flights[key] = asyncio.get_running_loop().create_future()
+        snapshot = None
+        try:
+            response = await fetch()
+            snapshot = _snapshot(response)
+            return response
+        finally:
+            flights.pop(key, None)
+            future.set_result(snapshot)
+
+    try:
+        snapshot = await asyncio.wait_for(asyncio.shield(future), COALESCE_WAIT)
+    except asyncio.TimeoutError:
+        _stats['timeouts'] += 1
+        return await fetch()
+    if snapshot is None:
+        return await fetch()
+    _stats['coalesced'] += 1
+    return _restore(snapshot)
+
+
+def coalesce_stats():
+    """Leader / coalesced follower counters for the stats endpoint."""
+    with _lock:
+        in_flight = len(_flights)
+    return dict(_stats, in_flight=in_flight)
@@ -0,0 +1,152 @@
+"""Response compression: gzip, plus brotli when the brotli package is installed."""
+import gzip
+import hashlib
+import zlib
+
+from django.utils.cache import patch_vary_headers
+
+from config import COMPRESS, COMPRESS_MIN_SIZE, COMPRESS_CACHE_BYTES
+from utils.memo import RewriteMemo
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Encodings we can decode from backends and produce for clients, preferred first
+SUPPORTED_ENCODINGS = ('br', 'gzip') if brotli else ('gzip',)
+UPSTREAM_ACCEPT_ENCODING = ', '.join(SUPPORTED_ENCODINGS)
+
+# Content types worth compressing (text, scripts, JSON, XML and SVG); images,
+# fonts, archives and media are already compressed formats and are sent as-is
+COMPRESSIBLE_TYPES = ('text/', 'javascript', 'json', 'xml')
+
+# Compressed copies of hot bodies, keyed by (content hash, encoding)
+COMPRESSED_VARIANTS = RewriteMemo(COMPRESS_CACHE_BYTES)
+
+
+def parse_accept_encoding(header):
+    """Parse Accept-Encoding into {encoding: q}."""
+    accepted = {}
+    for part in (header or '').split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name] = q
+    return accepted
+
+
+def client_accepts(request, encoding):
+    """Check if the client accepts a content encoding."""
+    accepted = parse_accept_encoding(request.headers.get('Accept-Encoding'))
+    return accepted.get(encoding, accepted.get('*', 0)) > 0
+
+
+def choose_encoding(request):
+    """Pick the best encoding we can produce for this client, None for identity."""
+    if not COMPRESS:
+        return None
+    accepted = parse_accept_encoding(request.headers.get('Accept-Encoding'))
+    for encoding in SUPPORTED_ENCODINGS:
+        if accepted.get(encoding, accepted.get('*', 0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body, encoding):
+    """Compress a body in one go."""
+    if encoding == 'br':
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def compressed_variant(body, encoding):
+    """Compress a body, reusing the result for bodies already seen."""
+    key = (hashlib.blake2b(body, digest_size=16).digest(), encoding)
+    variant = COMPRESSED_VARIANTS.get(key)
+    if variant is None:
+        variant = compress(body, encoding)
+        COMPRESSED_VARIANTS.put(key, variant)
+    return variant
+
+
+def _stream_compressor(encoding):
+    """Return (process, finish) functions of an incremental compressor."""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=5)
+        return compressor.process, compressor.finish
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    return compressor.compress, compressor.flush
+
+
+def compress_stream(chunks, encoding):
+    """Compress a chunk iterator on the fly."""
+    process, finish = _stream_compressor(encoding)
+    for chunk in chunks:
+        data = process(chunk)
+        if data:
+            yield data
+    yield finish()
+
+
+async def compress_stream_async(chunks, encoding):
+    """Compress an async chunk iterator on the fly."""
+    process, finish = _stream_compressor(encoding)
+    async for chunk in chunks:
+        data = process(chunk)
+        if data:
+            yield data
+    yield finish()
+
+
+def is_compressible(content_type):
+    """Check if a content type is text that gains from compression."""
+    return any(x in content_type.lower() for x in COMPRESSIBLE_TYPES)
+
+
+def mark_representation_changed(response):
+    """
+    Drop Accept-Ranges and weaken the ETag of a body we changed (rewritten or re-encoded).
+
+    Range requests are passed to the backend, whose byte offsets no longer
+    match this body, and a strong ETag promises byte-for-byte identity
+    (an If-Range with a weak ETag never matches, so the full body is sent).
+    """
+    if response.has_header('Accept-Ranges'):
+        del response['Accept-Ranges']
+    etag = response.get('ETag')
+    if etag and not etag.startswith('W/'):
+        response['ETag'] = 'W/' + etag
+
+
+def compress_response(response, request):
+    """Compress a buffered or streamed text response for the client (in place)."""
+    # Images, fonts, archives...: already compressed, and not worth a COMPRESSED_VARIANTS slot
+    if not is_compressible(response.get('Content-Type', '')):
+        return response
+    patch_vary_headers(response, ('Accept-Encoding',))
+    if response.has_header('Content-Encoding'):
+        return response
+    encoding = choose_encoding(request)
+    if encoding is None:
+        return response
+    
+    if response.streaming:
+        stream = compress_stream_async if response.is_async else compress_stream
+        response.streaming_content = stream(response.streaming_content, encoding)
+    else:
+        if len(response.content) < COMPRESS_MIN_SIZE:
+            return response
+        response.content = compressed_variant(response.content, encoding)
+        response['Content-Length'] = str(len(response.content))
+    response['Content-Encoding'] = encoding
+    mark_representation_changed(response)
+    return response
@@ -1,33 +1,29 @@
 """Homepage rendering."""
 from django.http import HttpResponse
-from config import SERVICES, SERVICE_BASE_PATHS, SERVICE_DESCRIPTIONS, SERVICE_RANKS, SERVICE_HIDDEN, SHOW_COFFEE, COFFEE_USERNAME, DEBUG
+from django.utils.cache import patch_vary_headers
+from config import SHOW_COFFEE, COFFEE_USERNAME, DEBUG
 from utils.templates import render_template
+from utils.compression import SUPPORTED_ENCODINGS, choose_encoding, compress
+from utils.routes import get_routes
+
+# Pre-rendered homepage: encoding (None = identity) -> body
+_HOME = {}
 
 
 def build_services_list():
     """Build sorted list of services for display."""
     services_list = []
-    for service, domain in SERVICES.items():
+    for route in get_routes().values():
         # Skip services marked hidden
-        if SERVICE_HIDDEN.get(service, False):
+        if route.hidden:
             continue
-        base_path = SERVICE_BASE_PATHS.get(service, '')
-        
-        # Check if this is a local template
-        if domain.startswith('local-template:'):
-            template_file = domain.replace('local-template:', '')
-            full_target = template_file
-        else:
-            full_target = domain + base_path
-        
-        description = SERVICE_DESCRIPTIONS.get(service, '')
-        rank = SERVICE_RANKS.get(service, 999)
         
         services_list.append({
-            'name': service,
-            'target': full_target,
-            'description': description,
-            'rank': rank
+            'name': route.name,
+            # Local templates show their file, proxied services their backend
+            'target': route.template or route.domain + route.base_path,
+            'description': route.description,
+            'rank': route.rank
         })
     
     # Sort by rank (lower number = higher priority)
@@ -35,14 +31,34 @@ def build_services_list():
     return services_list
 
 
-def render_home(app_name, version):
-    """Render homepage."""
-    html = render_template('home.html', {
+def _render_home_html(app_name, version):
+    return render_template('home.html', {
         'services': build_services_list(),
         'version': version,
         'app_name': app_name,
         'debug': DEBUG,
         'show_coffee': SHOW_COFFEE,
         'coffee_username': COFFEE_USERNAME,
-    })
-    return HttpResponse(html)
+    }).encode('utf-8')
+
+
+def prerender_home(app_name, version):
+    """Render the homepage once, plus a compressed copy per supported encoding."""
+    html = _render_home_html(app_name, version)
+    _HOME.clear()
+    _HOME[None] = html
+    for encoding in SUPPORTED_ENCODINGS:
+        _HOME[encoding] = compress(html, encoding)
+
+
+def render_home(app_name, version, request=None):
+    """Render homepage (served pre-rendered, re-rendered on every hit in DEBUG)."""
+    if DEBUG or not _HOME:
+        return HttpResponse(_render_home_html(app_name, version))
+    
+    encoding = choose_encoding(request) if request is not None else None
+    response = HttpResponse(_HOME[encoding])
+    if encoding is not None:
+        response['Content-Encoding'] = encoding
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
@@ -1,9 +1,15 @@
 """Logging utilities with ultra-compact time-windowed aggregation."""
+import atexit
 import os
+import queue
 import sys
 import re
+import tempfile
+import threading
+import time
 from collections import deque, defaultdict
-from datetime import datetime
+
+from utils.logring import open_ring
 
 # ---------------------------------------------------------------------------
 # LOG_LEVEL  (set via environment variable)
@@ -15,16 +21,54 @@ LOG_LEVEL = os.environ.get('LOG_LEVEL', 'info').strip().lower()
 if LOG_LEVEL not in ('error', 'info', 'debug'):
     LOG_LEVEL = 'info'
 
+# Numeric form of LOG_LEVEL for cheap comparisons on the request path
+LEVEL_ERROR, LEVEL_INFO, LEVEL_DEBUG = 0, 1, 2
+LOG_LEVEL_NUM = {'error': LEVEL_ERROR, 'info': LEVEL_INFO, 'debug': LEVEL_DEBUG}[LOG_LEVEL]
+
+# Friendly names shown in aggregated lines
+SERVICE_LABELS = {
+    'mdn': 'MDN Web Docs',
+    'club': 'Calculum Club',
+}
+
+# ---------------------------------------------------------------------------
+# LOG_WRITER
+#   sync        – lines are written to stdout by the request thread (default)
+#   background  – lines go through a bounded queue to a writer thread that
+#                 batches them into one write and also closes the time windows
+# ---------------------------------------------------------------------------
+LOG_WRITER = os.environ.get('LOG_WRITER', 'sync').strip().lower()
+BACKGROUND_WRITER = LOG_WRITER == 'background'
+LOG_QUEUE_SIZE = int(os.environ.get('LOG_QUEUE_SIZE', '10000'))
+LOG_FLUSH_INTERVAL = float(os.environ.get('LOG_FLUSH_INTERVAL', '0.5'))  # seconds
+
 # Simple in-memory log storage (last 1000 lines)
 LOG_BUFFER = deque(maxlen=1000)
 
+# Ring file shared by all workers on the host, so /_logs shows every one of them
+LOG_SHARED = os.environ.get('LOG_SHARED', 'true').lower() == 'true'
+LOG_SHARED_PATH = os.environ.get('LOG_SHARED_PATH', os.path.join(tempfile.gettempdir(), 'flashy-logs.ring'))
+LOG_SHARED_SLOTS = int(os.environ.get('LOG_SHARED_SLOTS', '2048'))
+# Worker processes that can write to the ring, each appending to its own share of the slots
+LOG_SHARED_WRITERS = int(os.environ.get('LOG_SHARED_WRITERS', '4'))
+_ring = open_ring(LOG_SHARED_PATH if LOG_SHARED else None, LOG_SHARED_SLOTS, 512, LOG_SHARED_WRITERS)
+
+# Guards _activity_window (request threads and the writer thread)
+_window_lock = threading.RLock()
+
+_log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+_writer = {'pid': None, 'thread': None, 'dropped': 0, 'reported': 0, 'written': 0}
+# Last formatted second, so timestamps are not strftime'd for every line
+_timestamp_cache = [None, '']
+
 # Track all activity in time windows
 _activity_window = {
     'start_time': None,
     'services': defaultdict(lambda: {
         'proxy': 0,
         'rewrite': 0,
-        'assets': defaultdict(int)
+        'assets': defaultdict(int),
+        'slowest': None
     }),
     'errors': [],
     'warnings': [],
@@ -43,11 +87,7 @@ def _get_service_from_message(msg):
     if proxy_match:
         service = proxy_match.group(1)
         # Map to friendly names
-        if service == 'mdn':
-            return 'MDN Web Docs'
-        elif service == 'club':
-            return 'Calculum Club'
-        return service
+        return SERVICE_LABELS.get(service, service)
     
     # REWRITE: domain
     rewrite_match = re.search(r'\[REWRITE\] Processing ([^/\s]+)', msg)
@@ -103,7 +143,7 @@ def _flush_window(force=False):
     
     # Check if window should be flushed
     if window['start_time']:
-        elapsed = (datetime.utcnow() - window['start_time']).total_seconds()
+        elapsed = time.time() - window['start_time']
         should_flush = force or elapsed >= WINDOW_DURATION
         
         if not should_flush:
@@ -168,6 +208,11 @@ def _flush_window(force=False):
                 asset_str = '+'.join(f"{count}{cat}" for cat, count in sorted(asset_types.items()))
                 parts.append(f"{total_assets} assets ({asset_str})")
             
+            if data['slowest']:
+                total_ms, phases = data['slowest']
+                top = sorted(phases.items(), key=lambda item: item[1], reverse=True)[:2]
+                parts.append(f"slowest {total_ms:.0f}ms ({', '.join(f'{name} {ms:.0f}ms' for name, ms in top)})")
+            
             if parts:
                 _write_log(f"📊 {service}: {' | '.join(parts)}")
     
@@ -182,7 +227,8 @@ def _flush_window(force=False):
         'services': defaultdict(lambda: {
             'proxy': 0,
             'rewrite': 0,
-            'assets': defaultdict(int)
+            'assets': defaultdict(int),
+            'slowest': None
         }),
         'errors': [],
         'warnings': [],
@@ -190,17 +236,134 @@ def _flush_window(force=False):
     }
 
 
-def _write_log(msg):
-    """Write log to stdout and buffer."""
-    sys.stdout.write(f"{msg}\n")
+def _format_timestamp(ts):
+    """Format a time.time() value as an ISO UTC timestamp with microseconds."""
+    second = int(ts)
+    if _timestamp_cache[0] != second:
+        _timestamp_cache[0] = second
+        _timestamp_cache[1] = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+    return f"{_timestamp_cache[1]}.{int((ts - second) * 1e6):06d}Z"
+
+
+def _emit(lines):
+    """Write (timestamp, msg) lines to stdout in one call and keep them in the buffer."""
+    sys.stdout.write(''.join(f"{msg}\n" for _, msg in lines))
     sys.stdout.flush()
-    
-    timestamp = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-    LOG_BUFFER.append(f"{timestamp} [inf] {msg}")
+    formatted = [(ts, f"{_format_timestamp(ts)} [inf] {msg}") for ts, msg in lines]
+    LOG_BUFFER.extend(text for _, text in formatted)
+    global _ring
+    if _ring is not None:
+        try:
+            _ring.append(formatted)
+        except OSError as e:
+            # Keep logging per worker rather than failing requests
+            _ring = None
+            sys.stderr.write(f"shared log ring disabled: {e}\n")
+
+
+def _writer_loop():
+    """Background writer: batch queued lines, flush periodically, close time windows."""
+    while True:
+        batch = []
+        try:
+            batch.append(_log_queue.get(timeout=LOG_FLUSH_INTERVAL))
+            while len(batch) < 1000:
+                batch.append(_log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        dropped = _writer['dropped'] - _writer['reported']
+        if dropped:
+            _writer['reported'] += dropped
+            batch.append((time.time(), f"⚠️  {dropped} log lines dropped (queue full)"))
+        if batch:
+            _emit(batch)
+            _writer['written'] += len(batch)
+        
+        # Windows are closed on this timer, not by the next request
+        with _window_lock:
+            _flush_window()
+
+
+def _drain():
+    """Write whatever is still queued (at exit)."""
+    batch = []
+    while True:
+        try:
+            batch.append(_log_queue.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        _emit(batch)
+
+
+def _start_writer():
+    """Start the writer thread in this process (again after a fork)."""
+    if _writer['pid'] == os.getpid():
+        return
+    with _window_lock:
+        if _writer['pid'] == os.getpid():
+            return
+        thread = threading.Thread(target=_writer_loop, name='log-writer', daemon=True)
+        thread.start()
+        _writer['thread'] = thread
+        _writer['pid'] = os.getpid()
+        atexit.register(_drain)
+
+
+def _after_fork():
+    """A preloaded master may fork while its writer thread holds these: start fresh."""
+    global _window_lock, _log_queue
+    _window_lock = threading.RLock()
+    _log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+
+
+os.register_at_fork(after_in_child=_after_fork)
+
+
+def _write_log(msg):
+    """Write log to stdout and buffer (or hand it to the background writer)."""
+    if BACKGROUND_WRITER:
+        _start_writer()
+        try:
+            _log_queue.put_nowait((time.time(), msg))
+        except queue.Full:
+            _writer['dropped'] += 1
+        return
+    _emit([(time.time(), msg)])
+
+
+def _tick():
+    """Close the window if it is due, unless the background writer's timer does it."""
+    if BACKGROUND_WRITER:
+        # Counted events write nothing themselves: make sure the timer runs in this process
+        _start_writer()
+    else:
+        _flush_window()
+
+
+def writer_stats():
+    """Background writer counters for the stats endpoint."""
+    return {
+        'mode': 'background' if BACKGROUND_WRITER else 'sync',
+        'queued': _log_queue.qsize(),
+        'written': _writer['written'],
+        'dropped': _writer['dropped'],
+    }
 
 
 def log(msg):
-    """Log with smart deduplication and aggregation."""
+    """
+    Log a free-form message with smart deduplication and aggregation.
+
+    Compatibility shim: the message is parsed to recover its kind and service.
+    New code should call log_event() instead.
+    """
+    with _window_lock:
+        _log(msg)
+
+
+def _log(msg):
     global _activity_window
     
     # Completely suppress certain messages based on LOG_LEVEL
@@ -209,7 +372,7 @@ def log(msg):
     
     # Initialize window if needed
     if _activity_window['start_time'] is None:
-        _activity_window['start_time'] = datetime.utcnow()
+        _activity_window['start_time'] = time.time()
     
     # Categorize the message
     msg_lower = msg.lower()
@@ -227,14 +390,14 @@ def log(msg):
     # Check for warnings
     if '[warn]' in msg_lower or 'warning' in msg_lower:
         _activity_window['warnings'].append(msg)
-        _flush_window()
+        _tick()
         return
     
     # Handle asset logs
     service, filetype, count = _extract_asset_info(msg)
     if service and filetype:
         _activity_window['services'][service]['assets'][filetype] += count
-        _flush_window()
+        _tick()
         return
     
     # Handle PROXY requests
@@ -242,7 +405,7 @@ def log(msg):
         service = _get_service_from_message(msg)
         if service:
             _activity_window['services'][service]['proxy'] += 1
-            _flush_window()
+            _tick()
             return
     
     # Handle REWRITE processing
@@ -250,7 +413,7 @@ def log(msg):
         service = _get_service_from_message(msg)
         if service:
             _activity_window['services'][service]['rewrite'] += 1
-            _flush_window()
+            _tick()
             return
     
     # Other messages - flush window first, then log
@@ -258,8 +421,77 @@ def log(msg):
     _write_log(msg)
 
 
+def log_event(kind, service=None, message=None, **fields):
+    """
+    Log a structured event; callers already know what happened, so nothing is parsed.
+
+    Kinds:
+      proxy    – backend request (fields: method, path, url); GETs are counted per service
+      rewrite  – body rewritten (fields: url); counted per service
+      asset    – static files served (fields: filetype, count); counted per service
+      timing   – request phase durations in ms (fields: phases, total); slowest kept per service
+      detail   – per-request internals (message), shown at debug level only
+      info     – plain message
+      warning  – message, shown with the next window flush
+      error    – message, shown immediately at every level
+    """
+    with _window_lock:
+        _log_event(kind, service, message, fields)
+
+
+def _log_event(kind, service, message, fields):
+    if kind == 'error':
+        _flush_window(force=True)
+        _write_log(f"❌ {message}")
+        return
+    
+    # Everything below here is silenced at error level
+    if LOG_LEVEL_NUM == LEVEL_ERROR:
+        return
+    
+    if _activity_window['start_time'] is None:
+        _activity_window['start_time'] = time.time()
+    
+    if kind == 'proxy':
+        if fields.get('method', 'GET') == 'GET':
+            _activity_window['services'][SERVICE_LABELS.get(service, service)]['proxy'] += 1
+            _tick()
+            return
+        message = f"[PROXY] {fields['method']} /{service}/{fields.get('path', '')} → {fields.get('url', '')}"
+    elif kind == 'rewrite':
+        _activity_window['services'][SERVICE_LABELS.get(service, service)]['rewrite'] += 1
+        _tick()
+        return
+    elif kind == 'asset':
+        _activity_window['services'][SERVICE_LABELS.get(service, service)]['assets'][fields['filetype']] += fields.get('count', 1)
+        _tick()
+        return
+    elif kind == 'timing':
+        data = _activity_window['services'][SERVICE_LABELS.get(service, service)]
+        if data['slowest'] is None or fields['total'] > data['slowest'][0]:
+            data['slowest'] = (fields['total'], fields['phases'])
+        _tick()
+        return
+    elif kind == 'warning':
+        _activity_window['warnings'].append(message)
+        _tick()
+        return
+    elif kind == 'detail' and LOG_LEVEL_NUM < LEVEL_DEBUG:
+        return
+    
+    # Other messages - flush window first, then log
+    _flush_window(force=True)
+    _write_log(message)
+
+
 def get_log_buffer():
     """Get the log buffer for display."""
     # Flush any pending window
-    _flush_window(force=True)
+    with _window_lock:
+        _flush_window(force=True)
+    if _ring is not None:
+        try:
+            return _ring.read(LOG_BUFFER.maxlen)
+        except OSError:
+            pass
     return LOG_BUFFER
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""Log ring shared by every worker process (memory-mapped file, fixed-size slots)."""
+import itertools
+import mmap
+import os
+import struct
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows: each worker keeps its own buffer
+    fcntl = None
+
+MAGIC = b'FLOGRNG2'
+# magic, writer regions, slots per region, slot size
+HEADER = struct.Struct('<8sIII')
+HEADER_SIZE = 64
+# owner pid, cursor (next sequence number), one entry per region after the header
+REGION = struct.Struct('<QQ')
+# sequence number (0 while being written), timestamp, pid, text length
+SLOT_HEADER = struct.Struct('<QdIH')
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class LogRing:
+    """
+    Append-only ring of log lines in a file every worker maps.
+
+    The slots are split into one region per writer process. A process takes
+    a free region (or one whose owner died) under a file lock when it maps
+    the file, then appends to it without any lock: nobody else writes there.
+    Readers merge the regions by time. A slot is marked empty while it is
+    being filled, so readers skip lines that are not complete yet.
+    """
+
+    def __init__(self, path, slots=2048, slot_size=512, writers=4):
+        self.path = path
+        self.writers = writers
+        self.slots = max(slots // writers, 1)
+        self.slot_size = slot_size
+        self.max_text = slot_size - SLOT_HEADER.size
+        self._pid = None
+        self._map = None
+        self._region = None
+        self._counter = None
+
+    def _region_offset(self, region):
+        return HEADER_SIZE + region * REGION.size
+
+    def _slot_offset(self, region, seq):
+        slots_start = HEADER_SIZE + self.writers * REGION.size
+        return slots_start + (region * self.slots + seq % self.slots) * self.slot_size
+
+    def _open(self):
+        """Map the file in this process (again after a fork)."""
+        if self._pid == os.getpid():
+            return
+        size = HEADER_SIZE + self.writers * (REGION.size + self.slots * self.slot_size)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            if os.fstat(fd).st_size != size:
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+            ring = mmap.mmap(fd, size)
+            layout = HEADER.unpack_from(ring, 0)
+            if layout != (MAGIC, self.writers, self.slots, self.slot_size):
+                ring[:] = bytes(size)
+                HEADER.pack_into(ring, 0, MAGIC, self.writers, self.slots, self.slot_size)
+                for region in range(self.writers):
+                    REGION.pack_into(ring, self._region_offset(region), 0, 1)
+        finally:
+            # Unlock explicitly: mmap keeps a duplicate of fd, which holds the lock
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+        self._map, self._pid = ring, os.getpid()
+        self._region = None
+
+    def _take_region(self):
+        """Own a region nobody is writing to, so appends need no lock."""
+        fd = os.open(self.path, os.O_RDWR)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            for region in range(self.writers):
+                owner, cursor = REGION.unpack_from(self._map, self._region_offset(region))
+                if not owner or not _alive(owner):
+                    REGION.pack_into(self._map, self._region_offset(region), self._pid, cursor)
+                    break
+            else:
+                raise OSError(f"all {self.writers} log ring regions are taken by live workers")
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+        self._region = region
+        # next() on a count is atomic, so threads of this process need no lock either
+        self._counter = itertools.count(cursor)
+
+    def append(self, lines):
+        """Append (timestamp, text) lines; text longer than a slot is truncated."""
+        if not lines:
+            return
+        self._open()
+        if self._region is None:
+            self._take_region()
+        pid = self._pid
+        ring = self._map
+        for ts, text in lines:
+            seq = next(self._counter)
+            data = text.encode('utf-8')[:self.max_text].decode('utf-8', 'ignore').encode('utf-8')
+            pos = self._slot_offset(self._region, seq)
+            struct.pack_into('<Q', ring, pos, 0)
+            ring[pos + SLOT_HEADER.size:pos + SLOT_HEADER.size + len(data)] = data
+            SLOT_HEADER.pack_into(ring, pos, seq, ts, pid, len(data))
+        # Where the next owner of the region carries on
+        REGION.pack_into(ring, self._region_offset(self._region), pid, seq + 1)
+
+    def read(self, limit=None):
+        """Return the complete lines of every region, oldest first (by time, then sequence)."""
+        self._open()
+        ring = self._map
+        entries = []
+        for region in range(self.writers):
+            for index in range(self.slots):
+                pos = self._slot_offset(region, index)
+                seq, ts, pid, length = SLOT_HEADER.unpack_from(ring, pos)
+                if not seq:
+                    continue
+                text = bytes(ring[pos + SLOT_HEADER.size:pos + SLOT_HEADER.size + length])
+                # The slot was reused while we copied it
+                if struct.unpack_from('<Q', ring, pos)[0] != seq:
+                    continue
+                entries.append((ts, seq, text.decode('utf-8', 'replace')))
+        entries.sort()
+        if limit is not None:
+            entries = entries[-limit:]
+        return [text for _, _, text in entries]
+
+
+def open_ring(path, slots, slot_size, writers):
+    """Build the shared ring, None when it can't be used on this platform."""
+    if not path or fcntl is None:
+        return None
+    return LogRing(path, slots, slot_size, writers)
@@ -0,0 +1,71 @@
+"""Memoization of rewritten response bodies."""
+import hashlib
+import threading
+from collections import OrderedDict
+
+from config import REWRITE_MEMO_BYTES
+
+
+class RewriteMemo:
+    """Bounded LRU of rewritten bodies, capped by total size in bytes."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached body for key (marking it recently used), or None."""
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key, body):
+        """Store a body, evicting least recently used entries over the size cap."""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def stats(self):
+        """Counters for the stats endpoint."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+REWRITE_MEMO = RewriteMemo(REWRITE_MEMO_BYTES)
+
+
+def memo_key(service, content, url=None, etag=None):
+    """
+    Key a body by its upstream ETag when it is a strong one, else by content hash.
+
+    Weak ETags (W/"...") only promise equivalent content, so they are not trusted.
+    """
+    if etag and url and not etag.startswith('W/'):
+        return ('etag', service, url, etag)
+    return ('hash', service, hashlib.blake2b(content, digest_size=16).digest())
@@ -0,0 +1,294 @@
+"""Prometheus-style metrics (per-service counters and latency histograms)."""
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from config import METRICS_DIR, METRICS_INTERVAL
+
+# Upper bounds (seconds) shared by every histogram
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+HISTOGRAMS = {
+    'proxy_upstream_connect_seconds': 'Time to open a backend connection (TCP + TLS)',
+    'proxy_upstream_ttfb_seconds': 'Time from sending the backend request to its response headers',
+    'proxy_upstream_total_seconds': 'Time from sending the backend request to the end of its body',
+    'proxy_rewrite_seconds': 'Time spent rewriting a response body',
+}
+COUNTERS = {
+    'proxy_requests_total': 'Proxied responses sent, by status',
+    'proxy_upstream_bytes_total': 'Bytes read from backends (as sent on the wire)',
+    'proxy_response_bytes_total': 'Body bytes sent to clients',
+    'proxy_rewrite_bodies_total': 'Text bodies by rewrite outcome (skipped: no URL to rewrite, memoized, rewritten)',
+    'proxy_upstream_errors_total': 'Failed backend requests, by kind (timeout, connection, other)',
+    'proxy_pool_requests_total': 'Backend requests made through the keep-alive pool',
+    'proxy_pool_connections_total': 'Backend connections opened by the keep-alive pool',
+    'proxy_pool_expired_sessions_total': 'Pools recycled after sitting idle',
+    'proxy_upstream_retries_total': 'Retries after a failed backend connection, by result (retried, denied by the budget)',
+    'proxy_upstream_hedges_total': 'Hedged GETs, by result (sent, won: the hedge answered first)',
+    'proxy_breaker_trips_total': 'Times a service circuit opened after repeated backend failures',
+    'proxy_breaker_rejected_total': 'Requests answered 503 without contacting the backend (circuit open)',
+}
+
+# Updates only hold this lock for a dict lookup and an increment
+_lock = threading.Lock()
+_histograms = {}  # (name, service) -> [bucket counts..., +Inf count], sum
+_counters = {}  # (name, labels) -> value
+_persist = {'pid': None}
+
+
+def observe(name, service, seconds):
+    """Add one duration to a service's histogram."""
+    index = bisect_left(BUCKETS, seconds)
+    with _lock:
+        entry = _histograms.get((name, service))
+        if entry is None:
+            entry = _histograms[(name, service)] = [[0] * (len(BUCKETS) + 1), 0.0]
+        entry[0][index] += 1
+        entry[1] += seconds
+    _start_persister()
+
+
+def count(name, value=1, **labels):
+    """Increase a counter (labels are e.g. service=..., status=...)."""
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+    _start_persister()
+
+
+def quantile(name, service, q, min_count=20):
+    """
+    Bucket bound below which a fraction q of this worker's observations fall.
+
+    None until min_count values were seen, or when q lands in the +Inf bucket.
+    """
+    with _lock:
+        entry = _histograms.get((name, service))
+        buckets = list(entry[0]) if entry is not None else None
+    if buckets is None or sum(buckets) < min_count:
+        return None
+    rank = q * sum(buckets)
+    cumulative = 0
+    for bound, value in zip(BUCKETS + (None,), buckets):
+        cumulative += value
+        if cumulative >= rank:
+            return bound
+
+
+def upstream_started(resp, service, start):
+    """Record time to first byte and remember when the backend request began."""
+    observe('proxy_upstream_ttfb_seconds', service, time.perf_counter() - start)
+    resp.metrics_started = (service, start)
+
+
+def upstream_finished(resp):
+    """Record total backend time and bytes once the body is read (only the first call counts)."""
+    started = getattr(resp, 'metrics_started', None)
+    if started is None:
+        return
+    resp.metrics_started = None
+    service, start = started
+    observe('proxy_upstream_total_seconds', service, time.perf_counter() - start)
+    raw = getattr(resp, 'raw', None)
+    received = raw.tell() if hasattr(raw, 'tell') else getattr(resp, 'num_bytes_downloaded', 0)
+    if received:
+        count('proxy_upstream_bytes_total', received, service=service)
+
+
+def record_response(service, response):
+    """Count a response by status and the body bytes sent to the client."""
+    count('proxy_requests_total', service=service, status=str(response.status_code))
+    if not response.streaming:
+        count('proxy_response_bytes_total', len(response.content), service=service)
+    elif response.is_async:
+        response.streaming_content = _count_stream_async(service, response.streaming_content)
+    else:
+        response.streaming_content = _count_stream(service, response.streaming_content)
+    return response
+
+
+def _count_stream(service, chunks):
+    sent = 0
+    try:
+        for chunk in chunks:
+            sent += len(chunk)
+            yield chunk
+    finally:
+        count('proxy_response_bytes_total', sent, service=service)
+
+
+async def _count_stream_async(service, chunks):
+    sent = 0
+    try:
+        async for chunk in chunks:
+            sent += len(chunk)
+            yield chunk
+    finally:
+        count('proxy_response_bytes_total', sent, service=service)
+
+
+def connect_tracer(service, scheme):
+    """httpx trace hook recording connection setup time for the async client."""
+    done = 'connection.start_tls.complete' if scheme == 'https' else 'connection.connect_tcp.complete'
+    started = []
+
+    async def trace(event, info):
+        if event == 'connection.connect_tcp.started':
+            started.append(time.perf_counter())
+        elif event == done and started:
+            observe('proxy_upstream_connect_seconds', service, time.perf_counter() - started.pop())
+
+    return trace
+
+
+class _TimedConnect:
+    """Mixin for urllib3 connections that records how long connect() takes."""
+    service = None
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        observe('proxy_upstream_connect_seconds', self.service, time.perf_counter() - start)
+
+
+def timed_pool_classes(service):
+    """urllib3 pool classes whose new connections are timed for a service."""
+    http = type('TimedHTTPConnection', (_TimedConnect, HTTPConnection), {'service': service})
+    https = type('TimedHTTPSConnection', (_TimedConnect, HTTPSConnection), {'service': service})
+    return {
+        'http': type('TimedHTTPConnectionPool', (HTTPConnectionPool,), {'ConnectionCls': http}),
+        'https': type('TimedHTTPSConnectionPool', (HTTPSConnectionPool,), {'ConnectionCls': https}),
+    }
+
+
+def _snapshot():
+    """This worker's metrics as plain JSON-able lists."""
+    from utils.pool import pool_stats
+
+    with _lock:
+        counters = [[name, list(labels), value] for (name, labels), value in _counters.items()]
+        histograms = [[name, service, list(entry[0]), entry[1]] for (name, service), entry in _histograms.items()]
+    for service, stats in pool_stats().items():
+        counters.append(['proxy_pool_requests_total', [['service', service]], stats['requests']])
+        counters.append(['proxy_pool_connections_total', [['service', service]], stats['misses']])
+        counters.append(['proxy_pool_expired_sessions_total', [['service', service]], stats['expired_sessions']])
+    return {'counters': counters, 'histograms': histograms}
+
+
+def _write_snapshot():
+    """Atomically replace this worker's snapshot file."""
+    os.makedirs(METRICS_DIR, exist_ok=True)
+    path = os.path.join(METRICS_DIR, f'{os.getpid()}.json')
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(_snapshot(), f)
+    os.replace(tmp, path)
+
+
+def _persist_loop():
+    while True:
+        time.sleep(METRICS_INTERVAL)
+        try:
+            _write_snapshot()
+        except OSError:
+            pass
+
+
+def _start_persister():
+    """Start the snapshot thread in this process (again after a fork)."""
+    if _persist['pid'] == os.getpid():
+        return
+    with _lock:
+        if _persist['pid'] == os.getpid():
+            return
+        _persist['pid'] = os.getpid()
+    threading.Thread(target=_persist_loop, name='metrics-writer', daemon=True).start()
+
+
+def _after_fork():
+    """A preloaded master may fork while its snapshot thread holds the lock: start fresh."""
+    global _lock
+    _lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_after_fork)
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _load_snapshots():
+    """This worker's live metrics plus the latest snapshot of every other running worker."""
+    snapshots = [_snapshot()]
+    try:
+        names = [entry.name for entry in os.scandir(METRICS_DIR) if entry.name.endswith('.json')]
+    except OSError:
+        return snapshots
+    for name in names:
+        pid = int(name[:-5]) if name[:-5].isdigit() else None
+        if pid is None or pid == os.getpid():
+            continue
+        path = os.path.join(METRICS_DIR, name)
+        if not _alive(pid):
+            # Workers that exited are dropped (counters reset like a restart)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            continue
+        try:
+            with open(path) as f:
+                snapshots.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return snapshots
+
+
+def _format_labels(labels):
+    return '{' + ','.join(f'{key}="{value}"' for key, value in labels) + '}' if labels else ''
+
+
+def render_metrics():
+    """Metrics of all workers in the Prometheus text exposition format."""
+    counters = {}
+    histograms = {}
+    for snapshot in _load_snapshots():
+        for name, labels, value in snapshot['counters']:
+            key = (name, tuple(tuple(label) for label in labels))
+            counters[key] = counters.get(key, 0) + value
+        for name, service, buckets, total in snapshot['histograms']:
+            entry = histograms.setdefault((name, service), [[0] * (len(BUCKETS) + 1), 0.0])
+            for index, value in enumerate(buckets):
+                entry[0][index] += value
+            entry[1] += total
+
+    lines = []
+    for name, help_text in COUNTERS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} counter')
+        for key in sorted(key for key in counters if key[0] == name):
+            lines.append(f'{name}{_format_labels(key[1])} {counters[key]}')
+    for name, help_text in HISTOGRAMS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} histogram')
+        for service in sorted(service for metric, service in histograms if metric == name):
+            buckets, total = histograms[(name, service)]
+            cumulative = 0
+            for bound, value in zip(BUCKETS + ('+Inf',), buckets):
+                cumulative += value
+                lines.append(f'{name}_bucket{{service="{service}",le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_sum{{service="{service}"}} {total:.6f}')
+            lines.append(f'{name}_count{{service="{service}"}} {cumulative}')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,112 @@
+"""Per-service upstream connection pools (keep-alive sessions)."""
+import threading
+import time
+from collections import defaultdict
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import POOL_SIZE, POOL_MAX_IDLE
+from utils.metrics import timed_pool_classes
+
+# service -> [session, last_used]
+_sessions = {}
+_lock = threading.Lock()
+
+# Counters of sessions that were closed after sitting idle, so stats survive recycling
+_retired = defaultdict(lambda: {'requests': 0, 'connections': 0})
+_expired = defaultdict(int)
+
+
+def _new_session(service):
+    """Build a session with its own keep-alive pool and no cookie persistence."""
+    session = requests.Session()
+    # One session is shared by every client of a service, so backend cookies
+    # must never be stored between requests (they are passed per request).
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE)
+    # New connections report their connect time to /_metrics
+    adapter.poolmanager.pool_classes_by_scheme = timed_pool_classes(service)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _iter_pools(session):
+    """Yield the urllib3 connection pools owned by a session."""
+    seen = set()
+    for adapter in session.adapters.values():
+        if id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                yield pool
+
+
+def _count(session):
+    """Return (requests, connections) made through a session so far."""
+    total_requests = 0
+    total_connections = 0
+    for pool in _iter_pools(session):
+        total_requests += pool.num_requests
+        total_connections += pool.num_connections
+    return total_requests, total_connections
+
+
+def _retire(service, session):
+    """Close a session, keeping its counters."""
+    total_requests, total_connections = _count(session)
+    _retired[service]['requests'] += total_requests
+    _retired[service]['connections'] += total_connections
+    session.close()
+
+
+def get_session(service):
+    """Get the long-lived session for a service, recycling it after POOL_MAX_IDLE seconds idle."""
+    now = time.monotonic()
+    with _lock:
+        entry = _sessions.get(service)
+        if entry is not None and now - entry[1] > POOL_MAX_IDLE:
+            _retire(service, entry[0])
+            _expired[service] += 1
+            entry = None
+        if entry is None:
+            entry = [_new_session(service), now]
+            _sessions[service] = entry
+        entry[1] = now
+        return entry[0]
+
+
+def pool_stats():
+    """
+    Connection reuse counters per service.
+
+    A hit is a request served on an already-open connection,
+    a miss is a request that had to open a new one.
+    """
+    now = time.monotonic()
+    stats = {}
+    with _lock:
+        services = set(_sessions) | set(_retired)
+        for service in sorted(services):
+            total_requests = _retired[service]['requests'] if service in _retired else 0
+            total_connections = _retired[service]['connections'] if service in _retired else 0
+            idle = None
+            entry = _sessions.get(service)
+            if entry is not None:
+                live_requests, live_connections = _count(entry[0])
+                total_requests += live_requests
+                total_connections += live_connections
+                idle = round(now - entry[1], 1)
+            stats[service] = {
+                'requests': total_requests,
+                'hits': max(total_requests - total_connections, 0),
+                'misses': total_connections,
+                'expired_sessions': _expired.get(service, 0),
+                'idle_seconds': idle,
+            }
+    return stats
@@ -1,49 +1,74 @@
 """Proxy request handling."""
+import itertools
 import os
 import requests
-import re
+import tempfile
+import time
 from django.http import HttpResponse
-from config import DEBUG
-from utils.logging import log, LOG_LEVEL
+from config import DEBUG, STREAM_CHUNK_SIZE, REWRITE_STREAM_MIN, UPLOAD_SPOOL_MEMORY
+from utils.logging import log_event, LOG_LEVEL, LOG_LEVEL_NUM, LEVEL_DEBUG
 from utils.templates import error_page, path_not_found
-from utils.rewrite import rewrite_content
+from utils.rewrite import rewrite_content, needs_rewrite, StreamRewriter
+from utils.pool import get_session
+from utils.memo import REWRITE_MEMO, memo_key
+from utils.compression import UPSTREAM_ACCEPT_ENCODING
+from utils.metrics import count, observe, upstream_started, upstream_finished
+from utils.timing import timing_of
+from utils.retries import retries_allowed, upstream_timeout, earn_retry, spend_retry, hedge_delay, hedged
 
 
-def build_target_url(target_domain, base_path, path, query_string):
+def build_target_url(route, path, query_string):
     """Build the target URL for the backend service."""
-    url = f"https://{target_domain}{base_path}/{path}"
+    url = route.base_url + path
     if query_string:
         url += f"?{query_string}"
     return url
 
 
-def prepare_headers(request, service, target_domain):
-    """Prepare headers for backend request."""
+def prepare_headers(request, route, validators=None):
+    """
+    Prepare headers for backend request.
+
+    validators are the If-None-Match / If-Modified-Since headers of a stale
+    cached copy being revalidated.
+    """
     headers = {}
     for k, v in request.headers.items():
-        if k.lower() not in ['connection', 'host', 'accept-encoding']:
+        if k.lower() not in ['connection', 'host', 'accept-encoding', 'transfer-encoding']:
             headers[k] = v
     
     # Rewrite referer and origin to match target
     if 'Referer' in headers:
-        headers['Referer'] = re.sub(rf'https?://[^/]+/{service}/', f'https://{target_domain}/', headers['Referer'])
+        headers['Referer'] = route.referer_re.sub(route.origin + '/', headers['Referer'])
     if 'Origin' in headers:
-        headers['Origin'] = f'https://{target_domain}'
+        headers['Origin'] = route.origin
+    
+    # Ask for compressed bodies we know how to decode (rewrites need plain text).
+    # Byte ranges count bytes of the encoded body, so those are asked for unencoded.
+    headers['Accept-Encoding'] = 'identity' if is_range_request(request) else UPSTREAM_ACCEPT_ENCODING
     
-    headers['Host'] = target_domain
+    headers['Host'] = route.domain
     headers['X-Forwarded-Host'] = request.get_host()
     headers['X-Forwarded-Proto'] = 'https' if request.is_secure() else 'http'
     
+    if validators:
+        headers.update(validators)
+    
     return headers
 
 
+def is_range_request(request):
+    """Check if the client asked for part of the body (single or multiple byte ranges)."""
+    return 'Range' in request.headers
+
+
 def should_log_request(path):
     """
     Determine if this request should be logged.
 
     LOG_LEVEL=debug  → log everything (same as DEBUG=True)
     LOG_LEVEL=info   → skip static asset requests
-    LOG_LEVEL=error  → skip everything (errors still logged via log())
+    LOG_LEVEL=error  → skip everything (errors still logged via log_event())
     
     Falls back to the DEBUG flag when LOG_LEVEL is not set explicitly,
     preserving existing behaviour.
@@ -77,55 +102,158 @@ def handle_404_response(resp, path, service, target_domain):
     return path_not_found(service, path, target_domain)
 
 
-def process_response_content(content, content_type, service, target_domain, url):
-    """Process response content (rewrite URLs if text)."""
+def is_rewritable(content_type):
+    """Check if a content type is text we rewrite (HTML, JS, JSON, CSS)."""
+    return any(x in content_type.lower() for x in ['text/', 'javascript', 'json'])
+
+
+def stream_response_body(resp, chunk_size=STREAM_CHUNK_SIZE, decode=True):
+    """
+    Yield the backend body in chunks, releasing the connection when done.
+
+    With decode=False the bytes are passed on still compressed (Content-Encoding kept).
+    """
+    try:
+        chunks = resp.iter_content(chunk_size=chunk_size) if decode else resp.raw.stream(chunk_size, decode_content=False)
+        for chunk in chunks:
+            if chunk:
+                yield chunk
+    finally:
+        resp.close()
+        upstream_finished(resp)
+
+
+def process_response_content(content, content_type, service, target_domain, url, etag=None):
+    """
+    Process response content (rewrite URLs if text).
+
+    Bodies without any URL-like token are returned as the original bytes.
+    Rewritten bodies are memoized by (service, ETag or content hash), so
+    unchanged assets are served as cached UTF-8 bytes without any rewrite work.
+    """
     # Rewrite text content (HTML, JS, JSON, CSS)
-    is_text = any(x in content_type.lower() for x in ['text/', 'javascript', 'json'])
+    is_text = is_rewritable(content_type)
     
     if is_text:
-        log(f"[REWRITE] Processing {url}")
-        log(f"[REWRITE]   Content-Type: {content_type}")
+        # Nothing to rewrite (typical of API payloads): no decode, no copy
+        if not needs_rewrite(content):
+            count('proxy_rewrite_bodies_total', service=service, result='skipped')
+            return content, True
+        
+        key = memo_key(service, content, url, etag)
+        cached = REWRITE_MEMO.get(key)
+        if cached is not None:
+            count('proxy_rewrite_bodies_total', service=service, result='memoized')
+            return cached, True
+        
+        log_event('rewrite', service, url=url)
+        debug = LOG_LEVEL_NUM >= LEVEL_DEBUG
+        if debug:
+            log_event('detail', service, f"[REWRITE]   Content-Type: {content_type}")
         
         text_content = content.decode('utf-8', errors='ignore')
         original_len = len(text_content)
         
-        # Track what we're rewriting
-        has_pathname = 'window.location.pathname' in text_content or 'location.pathname' in text_content
-        has_api = 'api.github.com' in text_content or 'api.' in text_content
-        
-        log(f"[REWRITE]   Contains pathname reads: {has_pathname}")
-        log(f"[REWRITE]   Contains API calls: {has_api}")
+        # Track what we're rewriting (debug only, these are full-document scans)
+        if debug:
+            has_pathname = 'window.location.pathname' in text_content or 'location.pathname' in text_content
+            has_api = 'api.github.com' in text_content or 'api.' in text_content
+            log_event('detail', service, f"[REWRITE]   Contains pathname reads: {has_pathname}")
+            log_event('detail', service, f"[REWRITE]   Contains API calls: {has_api}")
         
+        start = time.perf_counter()
         text_content = rewrite_content(text_content, service, target_domain)
+        observe('proxy_rewrite_seconds', service, time.perf_counter() - start)
         
-        if len(text_content) != original_len:
-            log(f"[REWRITE]   ✓ Modified ({original_len} → {len(text_content)} bytes)")
-        else:
-            log(f"[REWRITE]   No changes made")
+        if debug:
+            if len(text_content) != original_len:
+                log_event('detail', service, f"[REWRITE]   ✓ Modified ({original_len} → {len(text_content)} bytes)")
+            else:
+                log_event('detail', service, f"[REWRITE]   No changes made")
         
-        return text_content, True
+        body = text_content.encode('utf-8')
+        REWRITE_MEMO.put(key, body)
+        count('proxy_rewrite_bodies_total', service=service, result='rewritten')
+        return body, True
     
     return content, False
 
 
-def copy_response_headers(resp, response, service, target_domain):
+def should_stream_rewrite(resp):
+    """Check if a text body is known (Content-Length) to be large enough to be rewritten as a stream."""
+    try:
+        return int(resp.headers.get('content-length', '')) > REWRITE_STREAM_MIN
+    except ValueError:
+        return False
+
+
+def read_text_body(resp):
+    """
+    Read a text body whole, unless it grows past REWRITE_STREAM_MIN.
+
+    For bodies without a Content-Length (chunked, or compressed by the backend).
+    Returns (content, None) once the whole body is read, or (None, chunks)
+    when it is too large: chunks yields the part already read, then the rest.
+    """
+    chunks = stream_response_body(resp)
+    head, size = [], 0
+    for chunk in chunks:
+        head.append(chunk)
+        size += len(chunk)
+        if size > REWRITE_STREAM_MIN:
+            return None, itertools.chain(head, chunks)
+    return b''.join(head), None
+
+
+def stream_response_content(resp, service, target_domain, url, chunks=None):
+    """
+    Rewrite a large text body chunk by chunk (memory bounded by chunk size).
+
+    chunks is the body when part of it was already read (see read_text_body).
+    """
+    log_event('rewrite', service, url=url)
+    log_event('detail', service, f"[REWRITE]   Content-Type: {resp.headers.get('content-type', '')} (streamed)")
+    rewriter = StreamRewriter(service, target_domain)
+    elapsed = 0.0
+    for chunk in stream_response_body(resp) if chunks is None else chunks:
+        start = time.perf_counter()
+        data = rewriter.feed(chunk)
+        elapsed += time.perf_counter() - start
+        if data:
+            yield data
+    
+    start = time.perf_counter()
+    data = rewriter.finish()
+    observe('proxy_rewrite_seconds', service, elapsed + time.perf_counter() - start)
+    if data:
+        yield data
+
+
+def copy_response_headers(resp, response, route):
     """Copy headers from backend response to our response."""
     for key, value in resp.headers.items():
         if key.lower() not in ['connection', 'transfer-encoding', 'content-encoding', 'content-length', 'set-cookie']:
             if key.lower() == 'location':
                 # Rewrite redirects to include service prefix
-                if f'/{service}/' not in value and f'/{service}' not in value:
-                    if value.startswith(f'https://{target_domain}'):
-                        path = value[len(f'https://{target_domain}'):]
-                        value = f'/{service}{path or "/"}'
+                if route.prefix not in value:
+                    if value.startswith(route.origin):
+                        path = value[len(route.origin):]
+                        value = f'{route.prefix}{path or "/"}'
                     elif value.startswith('/'):
-                        value = f'/{service}{value}'
+                        value = f'{route.prefix}{value}'
             # Strip ALL caching headers in DEBUG mode
             elif DEBUG and key.lower() in ['etag', 'cache-control', 'expires', 'last-modified', 'age', 'vary']:
                 continue
             response[key] = value
 
 
+def forward_content_length(resp, response):
+    """Keep the backend's Content-Length on a body passed on byte for byte (players seek with it)."""
+    length = resp.headers.get('content-length')
+    if length:
+        response['Content-Length'] = length
+
+
 def apply_cache_headers(response):
     """Apply cache busting headers in DEBUG mode."""
     if DEBUG:
@@ -139,27 +267,131 @@ def apply_cache_headers(response):
 def handle_set_cookies(resp, response):
     """Handle Set-Cookie headers from backend."""
     if 'Set-Cookie' in resp.headers:
-        for cookie in resp.raw.headers.getlist('Set-Cookie'):
+        # requests keeps the raw header list on urllib3, httpx on its own headers
+        if hasattr(resp.headers, 'get_list'):
+            cookies = resp.headers.get_list('Set-Cookie')
+        else:
+            cookies = resp.raw.headers.getlist('Set-Cookie')
+        for cookie in cookies:
             response['Set-Cookie'] = cookie
 
 
-def make_proxy_request(service, target_domain, base_path, path, request, url):
-    """Make request to backend service."""
-    headers = prepare_headers(request, service, target_domain)
+class RequestBody:
+    """
+    File-like view of the client's upload, read chunk by chunk as it goes upstream.
+
+    len is the Content-Length, None for chunked uploads (sent chunked upstream).
+    With spool=True everything read is also copied to a temp file (in memory up to
+    UPLOAD_SPOOL_MEMORY) so rewind() can send the body again for a retry.
+    """
+
+    def __init__(self, stream, length=None, spool=False):
+        self.stream = stream
+        self.len = length
+        self.spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MEMORY) if spool else None
+        self.replaying = False
+
+    def read(self, size=STREAM_CHUNK_SIZE):
+        if size is None or size < 0:
+            size = STREAM_CHUNK_SIZE
+        if self.replaying:
+            data = self.spool.read(size)
+            if data:
+                return data
+            self.replaying = False
+        data = self.stream.read(size)
+        if self.spool is not None and data:
+            self.spool.write(data)
+        return data
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    def rewind(self):
+        """Start over from the first byte (spooled bodies only)."""
+        self.spool.seek(0)
+        self.replaying = True
+
+    def close(self):
+        if self.spool is not None:
+            self.spool.close()
+
+
+def request_body(request, spool=False):
+    """
+    Body to send upstream: None when there is none, else a RequestBody stream.
+
+    Chunked uploads have no Content-Length, so Django would read them as empty:
+    they are read straight from wsgi.input (which the server de-chunks).
+    """
+    try:
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        length = 0
+    if length > 0:
+        return RequestBody(request, length, spool)
+    
+    if 'chunked' in request.META.get('HTTP_TRANSFER_ENCODING', '').lower():
+        stream = request.META.get('wsgi.input', request)
+        return RequestBody(stream, None, spool)
+    return None
+
+
+def make_proxy_request(route, path, request, url, validators=None):
+    """
+    Make request to backend service (body is streamed, read it or close the response).
+
+    The client's upload is streamed upstream as it is read, never buffered whole
+    (idempotent uploads are spooled as they go, so a retry can send them again).
+    """
+    service = route.name
+    timing = timing_of(request)
+    headers = prepare_headers(request, route, validators)
     cookies = {key: value for key, value in request.COOKIES.items()}
+    timing.mark('headers')
     
     if should_log_request(path):
-        log(f"[PROXY] {request.method} /{service}/{path} → {url}")
+        log_event('proxy', service, method=request.method, path=path, url=url)
+    
+    retries = retries_allowed(request)
+    body = request_body(request, spool=retries > 0)
+    timeout = upstream_timeout(route)
+    
+    def send():
+        # Make request to backend over the service's keep-alive pool
+        start = time.perf_counter()
+        resp = get_session(service).request(
+            method=request.method,
+            url=url,
+            headers=headers,
+            data=body,
+            cookies=cookies,
+            allow_redirects=False,
+            timeout=timeout,
+            stream=True
+        )
+        upstream_started(resp, service, start)
+        return resp
     
-    # Make request to backend
-    resp = requests.request(
-        method=request.method,
-        url=url,
-        headers=headers,
-        data=request.body,
-        cookies=cookies,
-        allow_redirects=False,
-        timeout=30
-    )
+    earn_retry()
+    delay = hedge_delay(route, request, body)
+    attempt = 0
+    while True:
+        try:
+            resp = send() if delay is None else hedged(send, delay, service)
+            break
+        except requests.exceptions.ConnectionError as e:
+            # Nothing came back: idempotent requests are sent again, within the budget
+            if attempt >= retries or not spend_retry(service):
+                raise
+            attempt += 1
+            log_event('detail', service, f"[RETRY] {request.method} {url} ({attempt}/{retries}): {e}")
+            if body is not None:
+                body.rewind()
+    timing.mark('upstream')
     
     return resp
@@ -0,0 +1,185 @@
+"""Backend timeouts, budgeted retries and hedged requests."""
+import asyncio
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FutureTimeout, wait
+
+from config import (
+    UPSTREAM_CONNECT_TIMEOUT, UPSTREAM_TIMEOUT, UPSTREAM_RETRIES, RETRY_BUDGET, RETRY_BUDGET_RESERVE,
+    HEDGE, HEDGE_THREADS,
+)
+from utils.metrics import count, quantile, upstream_finished
+
+# Methods that can be sent twice without changing the outcome
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE')
+# A hedge is sent once the first request is slower than this share of its service's requests
+HEDGE_QUANTILE = 0.95
+
+_lock = threading.Lock()
+# rejected: hedges not sent because every hedging thread was busy
+_budget = {'tokens': RETRY_BUDGET_RESERVE, 'retried': 0, 'hedged': 0, 'denied': 0, 'rejected': 0}
+_executor = {'pid': None, 'pool': None, 'busy': 0}
+
+
+def upstream_timeout(route):
+    """(connect, read) timeouts of a service, per-service overrides first."""
+    connect = UPSTREAM_CONNECT_TIMEOUT if route.connect_timeout is None else route.connect_timeout
+    read = UPSTREAM_TIMEOUT if route.timeout is None else route.timeout
+    return connect, read
+
+
+def retries_allowed(request):
+    """How many times this request may be retried after a failed connection."""
+    return UPSTREAM_RETRIES if request.method in IDEMPOTENT_METHODS else 0
+
+
+def earn_retry():
+    """Every first attempt adds RETRY_BUDGET to the budget (capped at the reserve)."""
+    with _lock:
+        # Rounded so ten deposits of 0.1 make a whole retry
+        _budget['tokens'] = round(min(_budget['tokens'] + RETRY_BUDGET, RETRY_BUDGET_RESERVE), 6)
+
+
+def spend_retry(service, kind='retried'):
+    """Take one extra backend request (retry or hedge) from the budget, False when spent."""
+    with _lock:
+        allowed = _budget['tokens'] >= 1
+        if allowed:
+            _budget['tokens'] -= 1
+        _budget[kind if allowed else 'denied'] += 1
+    if kind == 'retried':
+        count('proxy_upstream_retries_total', service=service, result='retried' if allowed else 'denied')
+    return allowed
+
+
+def retry_stats():
+    """Budget left and extra requests made by this worker (for /_stats)."""
+    with _lock:
+        return dict(_budget)
+
+
+def hedge_delay(route, request, body):
+    """Seconds to wait before hedging this request, None when it must not be hedged."""
+    enabled = HEDGE if route.hedge is None else route.hedge
+    if not enabled or request.method != 'GET' or body is not None:
+        return None
+    return quantile('proxy_upstream_ttfb_seconds', route.name, HEDGE_QUANTILE)
+
+
+def _pool():
+    """Hedging threads of this process (created again after a fork)."""
+    if _executor['pid'] != os.getpid():
+        with _lock:
+            if _executor['pid'] != os.getpid():
+                _executor['pool'] = ThreadPoolExecutor(HEDGE_THREADS, thread_name_prefix='hedge')
+                _executor['busy'] = 0
+                _executor['pid'] = os.getpid()
+    return _executor['pool']
+
+
+def _reserve_thread(service):
+    """
+    Take one of the HEDGE_THREADS, False (counted as rejected) when all are busy.
+
+    Requests never queue behind others in the pool: without a free thread
+    the caller goes on without hedging.
+    """
+    _pool()
+    with _lock:
+        rejected = _executor['busy'] >= HEDGE_THREADS
+        if rejected:
+            _budget['rejected'] += 1
+        else:
+            _executor['busy'] += 1
+    if rejected:
+        count('proxy_upstream_hedges_total', service=service, result='rejected')
+    return not rejected
+
+
+def _run(send):
+    """Run send() on the hedging thread reserved for it."""
+    future = _pool().submit(send)
+    future.add_done_callback(_free_thread)
+    return future
+
+
+def _free_thread(future=None):
+    """Give a hedging thread back (done callback of its request)."""
+    with _lock:
+        _executor['busy'] -= 1
+
+
+def _discard(future):
+    """Release the connection of a response that lost the race."""
+    if not future.cancelled() and future.exception() is None:
+        resp = future.result()
+        resp.close()
+        upstream_finished(resp)
+
+
+def hedged(send, delay, service):
+    """
+    Call send() and, if it hasn't answered after delay seconds, call it again
+    in parallel; the first response wins and the other one is closed.
+
+    Both requests run on hedging threads. When none is free (or the retry
+    budget is spent), send() runs on the calling thread and nothing is hedged.
+    """
+    # Without a token left for the hedge, or a free thread, there is no reason to leave this thread
+    if _budget['tokens'] < 1 or not _reserve_thread(service):
+        return send()
+    first = _run(send)
+    try:
+        return first.result(timeout=delay)
+    except FutureTimeout:
+        pass
+    if not _reserve_thread(service):
+        return first.result()
+    if not spend_retry(service, 'hedged'):
+        _free_thread()
+        return first.result()
+    second = _run(send)
+    count('proxy_upstream_hedges_total', service=service, result='sent')
+    pending = [first, second]
+    error = None
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            if future.exception() is not None:
+                error = future.exception()
+                continue
+            for other in pending:
+                other.add_done_callback(_discard)
+            if future is second:
+                count('proxy_upstream_hedges_total', service=service, result='won')
+            return future.result()
+    raise error
+
+
+async def hedged_async(send, delay, service):
+    """hedged() for the async client: the losing request is cancelled."""
+    first = asyncio.ensure_future(send())
+    done, _ = await asyncio.wait({first}, timeout=delay)
+    if done or not spend_retry(service, 'hedged'):
+        return await first
+    count('proxy_upstream_hedges_total', service=service, result='sent')
+    second = asyncio.ensure_future(send())
+    pending = {first, second}
+    error = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is not None:
+                error = task.exception()
+                continue
+            for other in pending:
+                other.cancel()
+            for other in done - {task}:
+                if other.exception() is None:
+                    await other.result().aclose()
+                    upstream_finished(other.result())
+            if task is second:
+                count('proxy_upstream_hedges_total', service=service, result='won')
+            return task.result()
+    raise error
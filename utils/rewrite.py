@@ -1,6 +1,173 @@
 """URL rewriting logic for proxy."""
+import codecs
 import re
-from utils.logging import log
+from utils.logging import log_event, LOG_LEVEL
+
+# A streamed chunk is rewritten up to the last place a match could still be
+# unfinished (see UNFINISHED_MATCH_RE); the rest is carried into the next chunk.
+# The last characters are always carried, so short tokens (window.location.pathname,
+# getAttribute, a lone "fetc") are never rewritten before they are whole.
+STREAM_TOKEN_TAIL = 32
+# Characters before the carried text that lookbehinds (document., \wg) may need
+STREAM_CONTEXT = 16
+# Never carry more than this many characters between chunks (a quote that never closes)
+STREAM_MAX_CARRY = 256 * 1024
+
+
+# Patterns are the same for every service, so they are compiled once at import
+WINDOW_PATHNAME_RE = re.compile(r'(?<!document\.)window\.location\.pathname\b')
+PATHNAME_RE = re.compile(r'(?<!window\.)(?<!document\.)location\.pathname\b')
+BASE_TAG_RE = re.compile(r'<base\s+href="/"', re.IGNORECASE)
+# FIX: Changed [^"\'`]* to [^"\'`>]* to prevent matching across tags
+ATTR_URL_RE = re.compile(r'((?:href|src|action)=)(["\'`])(/(?!/)[^"\'`>]*)\2')
+FETCH_URL_RE = re.compile(r'(fetch\s*\(\s*)(["\'`])(/(?!/).[^"\'`]*)\2')
+LOCATION_HREF_RE = re.compile(r'(location\.href\s*=\s*)(["\'`])(/(?!/).[^"\'`]*)\2')
+CSS_URL_RE = re.compile(r'(url\s*\()(["\'`]?)(/(?!/)[^"\'`\)>]+)\2(\))')
+GET_ATTRIBUTE_RE = re.compile(r'\bgetAttribute\s*\(\s*(["\'`])href\1\s*\)')
+
+# All of the above as one alternation, so a document is scanned once.
+# Every branch starts with a plain character (lookbehinds come after it), which
+# lets the regex engine skip to the next candidate position without trying the
+# branches anywhere else. The last group of each branch is named after the rule
+# (read back as match.lastgroup); the three attribute names get a branch each.
+REWRITE_RE = re.compile(
+    r'w(?<!document\.w)(?P<window_pathname>indow\.location\.pathname\b)'
+    r'|l(?<!window\.l)(?<!document\.l)(?P<pathname>ocation\.pathname\b)'
+    r'|<(?P<base_tag>(?i:base\s+href="/"))'
+    r'|href=(["\'`])(?P<href>/(?!/)[^"\'`>]*)\4'
+    r'|src=(["\'`])(?P<src>/(?!/)[^"\'`>]*)\6'
+    r'|action=(["\'`])(?P<action>/(?!/)[^"\'`>]*)\8'
+    r'|fetch\s*\(\s*(["\'`])(?P<fetch>/(?!/).[^"\'`]*)\10'
+    r'|location\.href\s*=\s*(["\'`])(?P<location_href>/(?!/).[^"\'`]*)\12'
+    r'|url\s*\((["\'`]?)(?P<css_url>/(?!/)[^"\'`\)>]+)\14\)'
+    r'|g(?<!\wg)etAttribute\s*\(\s*(?P<get_attribute>["\'`])href(?P=get_attribute)\s*\)'
+)
+# Branches whose URL gets the /service/ prefix unless it is absolute or already prefixed
+PREFIXED_URL_GROUPS = frozenset(('href', 'src', 'action', 'fetch', 'location_href'))
+
+# Bytes every REWRITE_RE branch starts with (or contains): a body without any
+# of them can't change, so it is passed on without being decoded at all.
+# Plain substring checks run at memchr speed, far faster than one alternation.
+TRIGGER_TOKENS = (b'href=', b'src=', b'action=', b'fetch', b'location.', b'getAttribute')
+TRIGGER_BASE_RE = re.compile(rb'(?i:<base)')
+TRIGGER_CSS_URL_RE = re.compile(rb'url\s*\(')
+
+
+# Ends of text where a REWRITE_RE match may have started but not finished yet:
+# the whitespace, quoted URL or closing parenthesis may still be on its way.
+# None of them contains more than two quotes.
+UNFINISHED_MATCH_RE = re.compile(
+    r'(?:<(?i:base\s+(?:h(?:r(?:e(?:f(?:=(?:"/?)?)?)?)?)?)?)'
+    r'|href=(?:["\'`](?:/[^"\'`>]*)?)?'
+    r'|src=(?:["\'`](?:/[^"\'`>]*)?)?'
+    r'|action=(?:["\'`](?:/[^"\'`>]*)?)?'
+    r'|fetch\s*(?:\(\s*(?:["\'`](?:/(?:.[^"\'`]*)?)?)?)?'
+    r'|location\.href\s*(?:=\s*(?:["\'`](?:/(?:.[^"\'`]*)?)?)?)?'
+    r'|url\s*(?:\(["\'`]?(?:/[^"\'`\)>]*["\'`]?)?)?'
+    r'|getAttribute\s*(?:\(\s*(?:["\'`]\w{0,4}(?:["\'`]\s*)?)?)?'
+    r')\Z'
+)
+
+
+class RewriteRules:
+    """Prebuilt replacements and prefix checks for one service."""
+
+    def __init__(self, service):
+        self.service = service
+        self.prefix = f'/{service}'
+        self.service_root = f'/{service}/'
+        # Replacement strings (also valid re.sub templates: escaped slashes are kept as-is)
+        self.window_pathname = f'(window.location.pathname.replace(/^\\/{service}\\//, "/"))'
+        self.pathname = f'(location.pathname.replace(/^\\/{service}\\//, "/"))'
+        self.base_tag = f'<base href="/{service}/"'
+        self.strip_prefix = f'?.replace(/^\\/{service}\\//, "/")'
+
+    def prefix_url(self, whole, attr, quote, url):
+        """Add /service/ prefix to a relative URL, returning whole unchanged otherwise."""
+        # Skip if already has service prefix
+        if url.startswith(self.service_root):
+            return whole
+        
+        # Skip absolute URLs (http://, https://, //, data:)
+        if '//' in url or url.startswith('data:'):
+            return whole
+        
+        # Add service prefix to relative URLs
+        return f'{attr}{quote}{self.prefix}{url}{quote}'
+
+    def rewrite_url(self, match):
+        """Add /service/ prefix to a relative URL match (attr, quote, url)."""
+        return self.prefix_url(match.group(0), match.group(1), match.group(2), match.group(3))
+
+    def rewrite_css_url(self, match):
+        """Add /service/ prefix inside CSS url()."""
+        quote = match.group(2)
+        return f'{match.group(1)}{quote}{self.prefix}{match.group(3)}{quote}{match.group(4)}'
+
+    def rewrite_get_attribute(self, match):
+        """Strip the service prefix from getAttribute('href') results."""
+        quote = match.group(1)
+        return f'getAttribute({quote}href{quote}){self.strip_prefix}'
+
+    def dispatch(self, match):
+        """
+        Build the replacement for one REWRITE_RE match, by branch.
+
+        Nothing before a URL contains a slash, so the prefix goes in front of
+        the first one (no group lookups on the hot path).
+        """
+        kind = match.lastgroup
+        if kind in PREFIXED_URL_GROUPS:
+            whole = match.group()
+            start = whole.index('/')
+            # Skip URLs that already have the service prefix, and absolute ones (//host)
+            if whole.startswith(self.service_root, start) or '//' in whole:
+                return whole
+            return whole[:start] + self.prefix + whole[start:]
+        if kind == 'css_url':
+            whole = match.group()
+            start = whole.index('/')
+            return whole[:start] + self.prefix + whole[start:]
+        if kind == 'window_pathname':
+            return self.window_pathname
+        if kind == 'pathname':
+            return self.pathname
+        if kind == 'base_tag':
+            return self.base_tag
+        quote = match.group(match.lastindex)
+        return f'getAttribute({quote}href{quote}){self.strip_prefix}'
+
+    def rewrite(self, content):
+        """Apply every rewrite in a single scan of the document."""
+        return REWRITE_RE.sub(self.dispatch, content)
+
+
+# Rule sets per service, built once at config load (see load_rewrite_rules)
+_RULES = {}
+
+
+def load_rewrite_rules(services):
+    """Build the rule sets for every configured service."""
+    for service in services:
+        _RULES[service] = RewriteRules(service)
+
+
+def get_rewrite_rules(service):
+    """Get the rule set for a service, building it on first use."""
+    rules = _RULES.get(service)
+    if rules is None:
+        rules = _RULES[service] = RewriteRules(service)
+    return rules
+
+
+def needs_rewrite(content):
+    """Quick check on the raw bytes: False when rewrite_content can't change the body."""
+    if any(token in content for token in TRIGGER_TOKENS):
+        return True
+    if TRIGGER_BASE_RE.search(content):
+        return True
+    # "url" alone is a common JSON key, only url( is rewritten
+    return b'url' in content and TRIGGER_CSS_URL_RE.search(content) is not None
 
 
 def rewrite_content(content, service, target_domain):
@@ -11,94 +178,140 @@ def rewrite_content(content, service, target_domain):
     1. window.location.pathname → strips /service/ prefix so apps see clean paths
     2. Relative URLs (/path) → adds /service/ prefix so they route through proxy
     3. Base tag → adds /service/ prefix to base href
+    
+    All rules run in one pass over the document (see REWRITE_RE), so every
+    piece of the original text is rewritten by at most one rule. The result only
+    differs from rewrite_content_multipass (one re.sub per rule, each run on the
+    previous one's output) where rules interact:
+    - a match inside another: in href="/a?u=url(/b)" the multipass also
+      prefixes the url(/b) found in the link's query string;
+    - a replacement creating or breaking a later match: in
+      href="/p/window.location.pathname" the multipass puts JavaScript (and a
+      quote, so the link is left unprefixed) into the URL, and in
+      location.pathnamewindow.location.pathname the rewritten second token
+      gives the first one a word boundary it didn't have.
+    In both cases the single pass only rewrites what is in the original document.
     """
+    if LOG_LEVEL == 'debug':
+        pathname_count = content.count('window.location.pathname') + content.count('location.pathname')
+        if pathname_count > 0:
+            log_event('detail', service, f"[REWRITE]   Found {pathname_count} pathname references, rewriting...")
+    
+    return get_rewrite_rules(service).rewrite(content)
+
+
+def rewrite_content_multipass(content, service, target_domain):
+    """
+    Reference implementation of rewrite_content: one re.sub per rule.
+
+    Kept to check the single-pass engine against (tests and benchmarks).
+    """
+    rules = get_rewrite_rules(service)
     
     # Rewrite pathname reads to hide the /service/ prefix from JavaScript
     # This makes the proxy transparent - apps don't know they're behind a proxy
     pathname_count = content.count('window.location.pathname') + content.count('location.pathname')
     if pathname_count > 0:
-        log(f"[REWRITE]   Found {pathname_count} pathname references, rewriting...")
+        log_event('detail', service, f"[REWRITE]   Found {pathname_count} pathname references, rewriting...")
     
     # Match window.location.pathname (but not document.location.pathname)
-    content = re.sub(
-        r'(?<!document\.)window\.location\.pathname\b',
-        f'(window.location.pathname.replace(/^\\/{service}\\//, "/"))',
-        content
-    )
+    content = WINDOW_PATHNAME_RE.sub(rules.window_pathname, content)
     # Match standalone location.pathname (but not window.location or document.location)
-    content = re.sub(
-        r'(?<!window\.)(?<!document\.)location\.pathname\b',
-        f'(location.pathname.replace(/^\\/{service}\\//, "/"))',
-        content
-    )
+    content = PATHNAME_RE.sub(rules.pathname, content)
     
     # Rewrite <base> tag if present
-    content = re.sub(
-        r'<base\s+href="/"',
-        f'<base href="/{service}/"',
-        content,
-        flags=re.IGNORECASE
-    )
-    
-    # Helper: check if URL is absolute (don't rewrite those)
-    def is_absolute(url):
-        return bool(re.match(r'^https?://', url)) or '//' in url or url.startswith('data:')
-    
-    # Rewrite helper: add /service/ prefix to relative URLs
-    def rewrite_url(match):
-        attr = match.group(1)
-        quote = match.group(2)
-        url = match.group(3)
-        
-        # Skip if already has service prefix
-        if url.startswith(f'/{service}/'):
-            return match.group(0)
-        
-        # Skip absolute URLs (http://, https://, //, data:)
-        if is_absolute(url):
-            return match.group(0)
-        
-        # Add service prefix to relative URLs
-        return f'{attr}{quote}/{service}{url}{quote}'
+    content = BASE_TAG_RE.sub(rules.base_tag, content)
     
-    # FIX: Changed [^"\'`]* to [^"\'`>]* to prevent matching across tags
-    content = re.sub(
-        r'((?:href|src|action)=)(["\'`])(/(?!/)[^"\'`>]*)\2',
-        rewrite_url,
-        content
-    )
+    # Add /service/ prefix to relative URLs in attributes
+    content = ATTR_URL_RE.sub(rules.rewrite_url, content)
     
     # Rewrite fetch() and similar API calls (only relative URLs)
-    content = re.sub(
-        r'(fetch\s*\(\s*)(["\'`])(/(?!/).[^"\'`]*)\2',
-        rewrite_url,
-        content
-    )
+    content = FETCH_URL_RE.sub(rules.rewrite_url, content)
     
     # Rewrite location assignments like location.href = "/path"
-    content = re.sub(
-        r'(location\.href\s*=\s*)(["\'`])(/(?!/).[^"\'`]*)\2',
-        rewrite_url,
-        content
-    )
+    content = LOCATION_HREF_RE.sub(rules.rewrite_url, content)
     
     # Rewrite CSS url() - handle both url("/path") and url('/path')
-    content = re.sub(
-        r'(url\s*\()(["\'`]?)(/(?!/)[^"\'`\)>]+)\2(\))',
-        lambda m: f'{m.group(1)}{m.group(2)}/{service}{m.group(3)}{m.group(2)}{m.group(4)}',
-        content
-    )
+    content = CSS_URL_RE.sub(rules.rewrite_css_url, content)
     
     # Rewrite getAttribute('href') to strip the service prefix
     # This makes comparisons like: if (link.getAttribute('href') === currentPath) work
-    def rewrite_get_attribute(match):
-        quote = match.group(1)
-        return f'getAttribute({quote}href{quote})?.replace(/^\\/{service}\\//, "/")'
+    content = GET_ATTRIBUTE_RE.sub(rules.rewrite_get_attribute, content)
     
-    content = re.sub(
-        r'\bgetAttribute\s*\(\s*(["\'`])href\1\s*\)',
-        rewrite_get_attribute,
-        content
-    )
+    return content
+
+
+def _stream_hold_point(text, start):
+    """
+    Position in text from which rewriting must wait for more input.
+
+    Everything before it is rewritten exactly as in the whole document: a match
+    starting there is already complete (it may end after this position).
+    """
+    hold = max(len(text) - STREAM_TOKEN_TAIL, start)
+    # An unfinished match holds at most two quotes: only look after the third last one
+    begin = len(text)
+    for _ in range(3):
+        begin = max(text.rfind(quote, start, begin) for quote in '"\'`')
+        if begin == -1:
+            break
+    unfinished = UNFINISHED_MATCH_RE.search(text, max(begin + 1, len(text) - STREAM_MAX_CARRY, start))
+    if unfinished is not None:
+        hold = min(hold, unfinished.start())
+    return hold
+
+
+class StreamRewriter:
+    """
+    Incremental rewriter: feed() raw chunks, get rewritten UTF-8 bytes back.
+
+    The text from the last possibly unfinished match of each chunk is carried into
+    the next one, so memory stays bounded by chunk size and output starts before the end.
+    """
+
+    def __init__(self, service, target_domain):
+        self.service = service
+        self.target_domain = target_domain
+        self.rules = get_rewrite_rules(service)
+        self.decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        self.context = ''
+        self.carry = ''
+
+    def _rewrite(self, text, final=False):
+        """Rewrite text (after the lookbehind context) up to the hold point, keep the rest."""
+        start = len(self.context)
+        hold = len(text) if final else _stream_hold_point(text, start)
+        parts = []
+        pos = start
+        for match in REWRITE_RE.finditer(text, start):
+            if match.start() >= hold:
+                break
+            parts.append(text[pos:match.start()])
+            parts.append(self.rules.dispatch(match))
+            pos = match.end()
+        end = max(pos, hold)
+        parts.append(text[pos:end])
+        self.context = text[max(end - STREAM_CONTEXT, 0):end]
+        self.carry = text[end:]
+        return ''.join(parts).encode('utf-8')
+
+    def feed(self, chunk):
+        """Rewrite what can safely be rewritten so far (may be b'')."""
+        return self._rewrite(self.context + self.carry + self.decoder.decode(chunk))
+
+    def finish(self):
+        """Rewrite whatever is left once the input is exhausted."""
+        return self._rewrite(self.context + self.carry + self.decoder.decode(b'', final=True), final=True)
+
+
+def rewrite_stream(chunks, service, target_domain):
+    """Rewrite a body incrementally, yielding UTF-8 chunks as input arrives."""
+    rewriter = StreamRewriter(service, target_domain)
+    for chunk in chunks:
+        data = rewriter.feed(chunk)
+        if data:
+            yield data
     
-    return content
\ No newline at end of file
+    data = rewriter.finish()
+    if data:
+        yield data
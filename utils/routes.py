@@ -0,0 +1,167 @@
+"""Compiled per-service routes, swappable at runtime (SIGHUP or services file edits)."""
+import os
+import re
+import signal
+import threading
+import time
+from dataclasses import dataclass
+
+from config import SERVICES_FILE, SERVICES_FILE_CHECK, load_local_templates, load_services
+from utils.logging import log_event
+from utils.rewrite import load_rewrite_rules
+
+
+@dataclass(frozen=True)
+class Route:
+    """Everything the proxy needs about one service, computed once."""
+    name: str
+    target: str  # domain, or local-template:<file>
+    domain: str
+    base_path: str
+    template: str  # local template file, '' for proxied services
+    prefix: str  # /name
+    root: str  # /name/
+    origin: str  # https://domain
+    base_url: str  # https://domain/base/path/
+    referer_re: re.Pattern  # our URL of this service in a Referer header
+    # Per-service options (config.SERVICE_OPTIONS)
+    description: str = ''
+    rank: int = 999
+    hidden: bool = False
+    cache_ttl: int = None  # None = use the backend's caching headers
+    server_timing: bool = None  # None = global SERVER_TIMING
+    breaker_threshold: int = None  # None = global BREAKER_THRESHOLD
+    breaker_cooldown: float = None  # None = global BREAKER_COOLDOWN
+    health_path: str = ''  # probed while the circuit is open, '' = no probes
+    timeout: float = None  # None = global UPSTREAM_TIMEOUT
+    connect_timeout: float = None  # None = global UPSTREAM_CONNECT_TIMEOUT
+    hedge: bool = None  # None = global HEDGE
+
+
+def compile_route(name, target, base_path='', **options):
+    """Build the immutable route of one service (options: description, rank, hidden, ...)."""
+    template = target[len('local-template:'):] if target.startswith('local-template:') else ''
+    domain = '' if template else target
+    return Route(
+        name=name,
+        target=target,
+        domain=domain,
+        base_path=base_path,
+        template=template,
+        prefix=f'/{name}',
+        root=f'/{name}/',
+        origin=f'https://{domain}',
+        base_url=f'https://{domain}{base_path}/',
+        referer_re=re.compile(rf'https?://[^/]+/{re.escape(name)}/'),
+        **options,
+    )
+
+
+def compile_routes(services):
+    """Turn the {name: options} of config.load_services() into {name: Route}."""
+    return {name: compile_route(name, **options) for name, options in services.items()}
+
+
+# The live table: readers take one reference, reloads replace it whole
+_routes = compile_routes(load_services(os.environ, load_local_templates()))
+_reload_lock = threading.Lock()
+_reload_listeners = []
+_watch = {'checked': time.monotonic(), 'mtime': None, 'requested': False}
+
+
+def get_route(service):
+    """The route of a configured service, None if unknown."""
+    return _routes.get(service)
+
+
+def get_routes():
+    """The current {name: Route} table (treat as read-only)."""
+    return _routes
+
+
+def on_reload(callback):
+    """Call callback(routes) after every table swap (pre-rendered pages, rule sets...)."""
+    _reload_listeners.append(callback)
+
+
+def read_services_file(path):
+    """KEY=VALUE lines of the services file (# comments and blank lines skipped)."""
+    values = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, value = line.split('=', 1)
+            values[key.strip()] = value.strip().strip('"\'')
+    return values
+
+
+def _file_mtime():
+    try:
+        return os.stat(SERVICES_FILE).st_mtime
+    except OSError:
+        return None
+
+
+def reload_routes():
+    """Rebuild the table from the environment and the services file, then swap it in."""
+    global _routes
+    with _reload_lock:
+        environ = dict(os.environ)
+        mtime = None
+        if SERVICES_FILE:
+            mtime = _file_mtime()
+            if mtime is not None:
+                try:
+                    environ.update(read_services_file(SERVICES_FILE))
+                except OSError as e:
+                    log_event('warning', message=f"Services file not reloaded: {e}")
+                    return _routes
+        routes = compile_routes(load_services(environ, load_local_templates()))
+        load_rewrite_rules(routes)
+        _routes = routes
+        _watch['mtime'] = mtime
+    for callback in _reload_listeners:
+        callback(routes)
+    log_event('info', message=f"🔁 Routes reloaded: {len(routes)} services")
+    return routes
+
+
+def check_reload():
+    """Reload when SIGHUP was received or the services file changed (cheap, called per request)."""
+    if _watch['requested']:
+        _watch['requested'] = False
+        reload_routes()
+        return
+    if not SERVICES_FILE:
+        return
+    now = time.monotonic()
+    if now - _watch['checked'] < SERVICES_FILE_CHECK:
+        return
+    _watch['checked'] = now
+    if _file_mtime() != _watch['mtime']:
+        reload_routes()
+
+
+def reload_due():
+    """Whether check_reload has work to do; touches no file, so it is safe on the event loop."""
+    if _watch['requested']:
+        return True
+    return bool(SERVICES_FILE) and time.monotonic() - _watch['checked'] >= SERVICES_FILE_CHECK
+
+
+def _request_reload(signum, frame):
+    # Only flag it: the reload itself runs on the next request, outside the handler
+    _watch['requested'] = True
+
+
+def install_reload_signal():
+    """Reload routes on SIGHUP (call from the worker's main thread, see gunicorn.conf.py)."""
+    if hasattr(signal, 'SIGHUP') and threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGHUP, _request_reload)
+
+
+# The services file is layered over the environment from the start
+if SERVICES_FILE:
+    reload_routes()
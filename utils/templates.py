@@ -1,7 +1,12 @@
 """Template rendering utilities."""
 from django.template import loader
 from django.http import HttpResponse
-from config import SHOW_COFFEE, COFFEE_USERNAME
+from config import SHOW_COFFEE, COFFEE_USERNAME, DEBUG, PAGE_CACHE_BYTES
+from utils.memo import RewriteMemo
+
+# Rendered internal pages keyed by (template, arguments); they only depend on
+# their arguments, so a backend outage serves ready-made bytes
+RENDERED_PAGES = RewriteMemo(PAGE_CACHE_BYTES)
 
 
 def render_template(template_name, context):
@@ -10,40 +15,93 @@ def render_template(template_name, context):
     return template.render(context)
 
 
+def render_page(template_name, **context):
+    """Render an internal page to UTF-8 bytes, reusing earlier renders (re-rendered in DEBUG)."""
+    key = (template_name,) + tuple(sorted(context.items()))
+    html = None if DEBUG else RENDERED_PAGES.get(key)
+    if html is None:
+        html = render_template(template_name, dict(
+            context,
+            show_coffee=SHOW_COFFEE,
+            coffee_username=COFFEE_USERNAME,
+        )).encode('utf-8')
+        RENDERED_PAGES.put(key, html)
+    return html
+
+
 def service_not_found(service, reason=None):
     """Show friendly 404 page when service doesn't exist."""
-    html = render_template('404.html', {
-        'service': service,
-        'reason': reason,
-        'show_coffee': SHOW_COFFEE,
-        'coffee_username': COFFEE_USERNAME,
-    })
+    html = render_page('404.html', service=service, reason=reason)
     return HttpResponse(html, status=404)
 
 
 def path_not_found(service, path, target_domain):
     """Show 404 page when service exists but path doesn't."""
-    html = render_template('error.html', {
-        'title': '404 - Path Not Found',
-        'message': f'The service "{service}" exists, but this path was not found on the backend.',
-        'error_type': 'HTTP 404 Not Found',
-        'service': service,
-        'target': target_domain,
-        'show_coffee': SHOW_COFFEE,
-        'coffee_username': COFFEE_USERNAME,
-    })
+    html = render_page(
+        'error.html',
+        title='404 - Path Not Found',
+        message=f'The service "{service}" exists, but this path was not found on the backend.',
+        error_type='HTTP 404 Not Found',
+        service=service,
+        target=target_domain,
+    )
     return HttpResponse(html, status=404)
 
 
 def error_page(title, message, error_type, service=None, target=None, status=502):
     """Show error page for backend issues."""
-    html = render_template('error.html', {
-        'title': title,
-        'message': message,
-        'error_type': error_type,
-        'service': service,
-        'target': target,
-        'show_coffee': SHOW_COFFEE,
-        'coffee_username': COFFEE_USERNAME,
-    })
+    html = render_page(
+        'error.html',
+        title=title,
+        message=message,
+        error_type=error_type,
+        service=service,
+        target=target,
+    )
     return HttpResponse(html, status=status)
+
+
+def backend_timeout(service, target):
+    """504 page for a backend that took too long to answer."""
+    return error_page(
+        '⏱️ Backend Timeout',
+        'The backend service took too long to respond.',
+        'HTTP 504 Gateway Timeout',
+        service=service,
+        target=target,
+        status=504
+    )
+
+
+def backend_unreachable(service, target):
+    """502 page for a backend we could not connect to."""
+    return error_page(
+        '🔌 Connection Failed',
+        'Could not connect to the backend service. The service may be down or unreachable.',
+        'HTTP 502 Bad Gateway',
+        service=service,
+        target=target,
+        status=502
+    )
+
+
+def backend_unavailable(service, target):
+    """503 page sent without contacting a backend whose circuit is open."""
+    return error_page(
+        '🚧 Service Unavailable',
+        'The backend service keeps failing, so requests are paused while it recovers.',
+        'HTTP 503 Service Unavailable',
+        service=service,
+        target=target,
+        status=503
+    )
+
+
+def warm_error_pages(routes):
+    """Render the outage pages of every proxied service ahead of the first failure."""
+    for route in routes.values():
+        if route.template:
+            continue
+        backend_timeout(route.name, route.domain)
+        backend_unreachable(route.name, route.domain)
+        backend_unavailable(route.name, route.domain)
@@ -0,0 +1,59 @@
+"""Per-request phase timings, sent as a Server-Timing header and optionally logged."""
+import time
+
+from config import SERVER_TIMING, SERVER_TIMING_LOG
+from utils.logging import log_event
+from utils.routes import get_route
+
+
+class ServerTiming:
+    """Durations of consecutive request phases; mark(name) closes the phase ending now."""
+
+    def __init__(self, service, header):
+        self.service = service
+        self.header = header
+        self.phases = []
+        self.start = self._last = time.perf_counter()
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    def finish(self, response):
+        """Add the header and/or log the timings for a finished response."""
+        total = time.perf_counter() - self.start
+        if self.header:
+            metrics = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in self.phases]
+            metrics.append(f"total;dur={total * 1000:.1f}")
+            response['Server-Timing'] = ', '.join(metrics)
+        if SERVER_TIMING_LOG:
+            phases = {name: round(seconds * 1000, 1) for name, seconds in self.phases}
+            log_event('timing', self.service, phases=phases, total=round(total * 1000, 1))
+        return response
+
+
+class _NoTiming:
+    """Stand-in used when timings are off, so call sites need no checks."""
+
+    def mark(self, name):
+        pass
+
+    def finish(self, response):
+        return response
+
+
+NO_TIMING = _NoTiming()
+
+
+def start_timing(request, service):
+    """Attach a phase timer to the request if timings are enabled for the service."""
+    route = get_route(service)
+    header = SERVER_TIMING if route is None or route.server_timing is None else route.server_timing
+    request.server_timing = ServerTiming(service, header) if header or SERVER_TIMING_LOG else NO_TIMING
+    return request.server_timing
+
+
+def timing_of(request):
+    """The request's phase timer (a no-op one if none was started)."""
+    return getattr(request, 'server_timing', NO_TIMING)
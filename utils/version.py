@@ -1,21 +1,55 @@
 """Version management."""
+import functools
+import os
+import shutil
 import subprocess
 
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Written at build time (see Dockerfile / startup.py --write-version)
+VERSION_FILE = os.path.join(ROOT_DIR, '.version')
 
-def get_version():
-    """Get version from git tags, fallback to version.py or 'dev'."""
+
+def _git_version():
+    """Latest git tag, None without git or outside a checkout."""
+    if not os.path.isdir(os.path.join(ROOT_DIR, '.git')) or shutil.which('git') is None:
+        return None
     try:
         result = subprocess.run(
             ['git', 'describe', '--tags', '--abbrev=0'],
             capture_output=True,
             text=True,
-            timeout=1
+            timeout=1,
+            cwd=ROOT_DIR
         )
         if result.returncode == 0:
             return result.stdout.strip().lstrip('v')
-    except:
+    except (OSError, subprocess.SubprocessError):
+        pass
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_version():
+    """
+    Get the version once per process: APP_VERSION env var, build-time .version
+    file, git tag, then version.py (or '1.0.0').
+    """
+    version = os.environ.get('APP_VERSION', '').strip()
+    if version:
+        return version.lstrip('v')
+    
+    try:
+        with open(VERSION_FILE) as f:
+            version = f.read().strip()
+        if version:
+            return version.lstrip('v')
+    except OSError:
         pass
     
+    version = _git_version()
+    if version:
+        return version
+    
     # Fallback to version.py
     try:
         from version import __version__
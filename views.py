@@ -1,17 +1,41 @@
-from django.http import HttpResponse, JsonResponse, HttpResponseRedirect
+from django.http import HttpResponse, JsonResponse, HttpResponseRedirect, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
+from asgiref.sync import sync_to_async
+import hmac
+import httpx
 import requests
 
-from config import SERVICES, SERVICE_BASE_PATHS, BLOCKED_SERVICES
+from config import BLOCKED_SERVICES, CACHE_PURGE_TOKEN
 from utils.version import get_version
-from utils.logging import log
-from utils.templates import render_template, service_not_found, error_page
-from utils.home import render_home
+from utils.logging import log_event, writer_stats
+from utils.templates import (
+    render_template, service_not_found, error_page, backend_timeout, backend_unreachable,
+    backend_unavailable, warm_error_pages
+)
+from utils.home import render_home, prerender_home
 from utils.logs import render_logs
+from utils.pool import pool_stats
+from utils.memo import REWRITE_MEMO
+from utils.compression import client_accepts, compress_response, mark_representation_changed
+from utils.coalesce import coalesce_key, coalesce, coalesce_async, coalesce_stats
+from utils.metrics import count, record_response, render_metrics, upstream_finished
+from utils.breaker import allow_request, record_success, record_failure, breaker_states
+from utils.retries import retry_stats
+from utils.timing import start_timing, timing_of
+from utils.async_proxy import (
+    make_proxy_request_async, stream_response_body_async, stream_response_content_async, read_text_body_async
+)
+from utils.cache import (
+    cache_lookup, cache_store, cache_stats, cache_purge,
+    cached_response, cache_validators, cache_revalidated
+)
+from utils.rewrite import load_rewrite_rules
+from utils.routes import get_route, get_routes, check_reload, reload_due, on_reload
 from utils.proxy import (
     build_target_url, make_proxy_request, handle_404_response, 
-    process_response_content, copy_response_headers, apply_cache_headers, 
-    handle_set_cookies
+    process_response_content, copy_response_headers, forward_content_length, apply_cache_headers, 
+    handle_set_cookies, is_rewritable, stream_response_body,
+    should_stream_rewrite, stream_response_content, read_text_body
 )
 
 # Import version info
@@ -22,47 +46,142 @@ except ImportError:
 
 __version__ = get_version()
 
+# Compile per-service rewrite rules once, not per request
+load_rewrite_rules(get_routes())
+
+# Routes only change on reload: render the home page and outage pages now, and after each reload
+prerender_home(app_name, __version__)
+warm_error_pages(get_routes())
+
+
+def __routes_reloaded(routes):
+    prerender_home(app_name, __version__)
+    warm_error_pages(routes)
+
+
+on_reload(__routes_reloaded)
+
 
 def home(request):
     """Show available services on homepage."""
-    return render_home(app_name, __version__)
+    return render_home(app_name, __version__, request)
 
 def logs_view(request):
     """Show recent logs page."""
     return render_logs()
 
+def stats_view(request):
+    """Show connection pool, rewrite memo, request coalescing, log writer and retry budget counters."""
+    return JsonResponse({
+        'pools': pool_stats(),
+        'rewrite_memo': REWRITE_MEMO.stats(),
+        'coalescing': coalesce_stats(),
+        'log_writer': writer_stats(),
+        'retries': retry_stats(),
+    })
 
-@csrf_exempt
-def proxy_view(request, service, path=''):
-    """Main proxy logic - forwards requests to backend services or serves local templates."""
-    
+def metrics_view(request):
+    """Expose per-service counters and latency histograms of all workers (Prometheus format)."""
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+def health_view(request):
+    """Show the circuit breaker state of every proxied service (this worker)."""
+    return JsonResponse({'services': breaker_states(get_routes())})
+
+
+def cache_view(request):
+    """Show shared response cache stats; POST with the purge token purges (all, or ?service=name)."""
+    if request.method == 'POST':
+        token = request.headers.get('X-Purge-Token', '')
+        if not CACHE_PURGE_TOKEN or not hmac.compare_digest(token, CACHE_PURGE_TOKEN):
+            return JsonResponse({'error': 'Forbidden'}, status=403)
+        removed = cache_purge(request.GET.get('service'))
+        return JsonResponse({'purged': removed})
+    return JsonResponse(cache_stats())
+
+
+def __route_internal(request, service):
+    """Answer internal and blocked services; None means a configured service or unknown."""
     # Handle internal logs service
     if service == '_logs':
         return logs_view(request)
     
+    # Handle internal metrics service
+    if service == '_metrics':
+        return metrics_view(request)
+    
+    # Handle internal stats service
+    if service == '_stats':
+        return stats_view(request)
+    
+    # Handle internal backend health service
+    if service == '_health':
+        return health_view(request)
+    
+    # Handle internal response cache service
+    if service == '_cache':
+        return cache_view(request)
+    
     # Block reserved service names
     if service in BLOCKED_SERVICES:
         return JsonResponse({'error': 'Blocked'}, status=403)
     
+    return None
+
+
+@csrf_exempt
+def proxy_view(request, service, path=''):
+    """Main proxy logic - forwards requests to backend services or serves local templates."""
+    check_reload()
+    start_timing(request, service)
+    response = __route_internal(request, service)
+    if response is not None:
+        return response
+    
     # Only allow explicitly defined services
-    if service not in SERVICES:
+    route = get_route(service)
+    if route is None:
         return service_not_found(service, "Service not configured")
     
-    target_domain = SERVICES[service]
+    # Check if this is a local template
+    if route.template:
+        return __handle_local_template(route, path, request)
+    
+    # Continue with normal proxy logic for external services
+    return __handle_proxy_request(route, path, request)
+
+
+@csrf_exempt
+async def proxy_view_async(request, service, path=''):
+    """proxy_view for ASGI: backend calls don't block, rewrites run in threads."""
+    if reload_due():
+        # stat() and the reload itself block, keep them off the event loop
+        await sync_to_async(check_reload, thread_sensitive=False)()
+    start_timing(request, service)
+    response = __route_internal(request, service)
+    if response is not None:
+        return response
+    
+    # Only allow explicitly defined services
+    route = get_route(service)
+    if route is None:
+        return service_not_found(service, "Service not configured")
     
     # Check if this is a local template
-    if target_domain.startswith('local-template:'):
-        return __handle_local_template(service, target_domain, path, request)
+    if route.template:
+        return __handle_local_template(route, path, request)
     
     # Continue with normal proxy logic for external services
-    return __handle_proxy_request(service, target_domain, path, request)
+    return await __handle_proxy_request_async(route, path, request)
 
 
-def __handle_local_template(service, target_domain, path, request):
+def __handle_local_template(route, path, request):
     """Handle local template rendering."""
     from django.http import HttpResponseRedirect
     
-    template_file = target_domain.replace('local-template:', '')
+    service = route.name
+    template_file = route.template
     
     # Local templates only serve the root path
     if path and path != '/':
@@ -72,7 +191,7 @@ def __handle_local_template(service, target_domain, path, request):
     if not request.path.endswith('/'):
         return HttpResponseRedirect(f'/{service}/')
     
-    log(f"[LOCAL] Serving template: {template_file}")
+    log_event('info', service, f"[LOCAL] Serving template: {template_file}")
     
     try:
         # Render the local template with basic context
@@ -83,7 +202,7 @@ def __handle_local_template(service, target_domain, path, request):
         })
         return HttpResponse(html)
     except Exception as e:
-        log(f"[ERROR] Failed to render template {template_file}: {e}")
+        log_event('error', service, f"[ERROR] Failed to render template {template_file}: {e}")
         return error_page(
             '❌ Template Error',
             f'Could not render local template: {template_file}',
@@ -94,8 +213,9 @@ def __handle_local_template(service, target_domain, path, request):
         )
 
 
-def __handle_proxy_request(service, target_domain, path, request):
+def __handle_proxy_request(route, path, request):
     """Handle proxy request to external service."""
+    service = route.name
     # Ensure trailing slash for service root
     if not path or path == '/':
         if not request.path.endswith('/'):
@@ -103,57 +223,274 @@ def __handle_proxy_request(service, target_domain, path, request):
         path = ''
     
     # Build target URL
-    base_path = SERVICE_BASE_PATHS.get(service, '')
-    url = build_target_url(target_domain, base_path, path, request.META.get('QUERY_STRING'))
+    url = build_target_url(route, path, request.META.get('QUERY_STRING'))
+    timing = timing_of(request)
+    timing.mark('routing')
+    
+    # Identical concurrent GETs share one backend fetch and rewrite
+    key = coalesce_key(service, request, url)
+    if key is None:
+        response = __fetch_proxy_response(route, path, request, url)
+    else:
+        response = coalesce(key, lambda: __fetch_proxy_response(route, path, request, url))
+    return timing.finish(record_response(service, response))
+
+
+def __fetch_proxy_response(route, path, request, url):
+    """Get the response for a proxied request from the cache or the backend."""
+    service, target_domain = route.name, route.domain
+    # Serve from the shared response cache if a fresh copy exists,
+    # a stale one is revalidated with the backend instead of refetched
+    timing = timing_of(request)
+    cached = cache_lookup(service, request, url)
+    timing.mark('cache')
+    if cached is not None and cached['fresh']:
+        return compress_response(cached_response(cached), request)
+    validators = cache_validators(cached, request) if cached is not None else None
     
+    # Fail fast while the backend's circuit is open instead of tying up a worker
+    if not allow_request(service):
+        return backend_unavailable(service, target_domain)
+    
+    resp = None
     try:
         # Make request to backend
-        resp = make_proxy_request(service, target_domain, base_path, path, request, url)
+        resp = make_proxy_request(route, path, request, url, validators)
+        record_success(service)
+        
+        # Backend confirmed our stale copy is still current
+        if validators and resp.status_code == 304:
+            resp.close()
+            upstream_finished(resp)
+            return compress_response(cache_revalidated(cached, resp), request)
         
         # Handle 404s from backend
         if resp.status_code == 404:
-            return handle_404_response(resp, path, service, target_domain)
+            response = handle_404_response(resp, path, service, target_domain)
+            # Our own page doesn't read the body: release the connection to the pool
+            resp.close()
+            upstream_finished(resp)
+            return response
         
-        # Get content and content type
-        content = resp.content
         content_type = resp.headers.get('content-type', '')
+        # Partial content is never rewritten: its byte offsets are the backend's
+        partial = resp.status_code == 206
+        rewritten = not partial and is_rewritable(content_type)
+        upstream_encoding = resp.headers.get('content-encoding', '').lower()
         
-        # Process content (rewrite URLs if needed)
-        processed_content, is_text = process_response_content(content, content_type, service, target_domain, url)
-        
-        # Create response
-        response = HttpResponse(processed_content, status=resp.status_code)
+        if partial:
+            # Byte ranges (one range or multipart/byteranges) go through as received, never buffered
+            response = StreamingHttpResponse(stream_response_body(resp, decode=False), status=206)
+            if upstream_encoding:
+                response['Content-Encoding'] = upstream_encoding
+        elif rewritten and should_stream_rewrite(resp):
+            # Large text is rewritten on the fly as chunks arrive
+            response = StreamingHttpResponse(
+                stream_response_content(resp, service, target_domain, url),
+                status=resp.status_code
+            )
+        elif rewritten:
+            # Text is read whole and rewritten (URLs need the /service/ prefix),
+            # unless a body of unknown length turns out to be large
+            content, chunks = read_text_body(resp)
+            timing.mark('body')
+            if chunks is not None:
+                response = StreamingHttpResponse(
+                    stream_response_content(resp, service, target_domain, url, chunks),
+                    status=resp.status_code
+                )
+            else:
+                processed_content, is_text = process_response_content(
+                    content, content_type, service, target_domain, url, etag=resp.headers.get('etag')
+                )
+                timing.mark('rewrite')
+                response = HttpResponse(processed_content, status=resp.status_code)
+        elif upstream_encoding and client_accepts(request, upstream_encoding):
+            # Everything else is passed through chunk by chunk, never buffered,
+            # and left compressed when the client understands the encoding
+            response = StreamingHttpResponse(stream_response_body(resp, decode=False), status=resp.status_code)
+            response['Content-Encoding'] = upstream_encoding
+        else:
+            response = StreamingHttpResponse(stream_response_body(resp), status=resp.status_code)
         
         # Copy headers from backend
-        copy_response_headers(resp, response, service, target_domain)
+        copy_response_headers(resp, response, route)
+        # Bodies passed on unchanged keep their length (media players need it to seek)
+        if not rewritten and (not upstream_encoding or response.has_header('Content-Encoding')):
+            forward_content_length(resp, response)
+        else:
+            # Rewritten or decoded: the backend's byte offsets and strong ETag don't apply
+            mark_representation_changed(response)
         apply_cache_headers(response)
         handle_set_cookies(resp, response)
+        timing.mark('copy')
+        cache_store(service, request, url, resp, response)
         
+        # Rewritten text is (re)compressed per client, after the plain body is cached
+        if rewritten:
+            compress_response(response, request)
         return response
         
     except requests.exceptions.Timeout:
-        return error_page(
-            '⏱️ Backend Timeout',
-            'The backend service took too long to respond.',
-            'HTTP 504 Gateway Timeout',
-            service=service,
-            target=target_domain,
-            status=504
-        )
+        count('proxy_upstream_errors_total', service=service, kind='timeout')
+        record_failure(service, 'timeout')
+        return backend_timeout(service, target_domain)
     except requests.exceptions.ConnectionError:
+        count('proxy_upstream_errors_total', service=service, kind='connection')
+        record_failure(service, 'connection')
+        return backend_unreachable(service, target_domain)
+    except Exception as e:
+        count('proxy_upstream_errors_total', service=service, kind='other')
+        log_event('error', service, f"[ERROR] {e}")
+        if resp is not None:
+            resp.close()
+            upstream_finished(resp)
         return error_page(
-            '🔌 Connection Failed',
-            'Could not connect to the backend service. The service may be down or unreachable.',
-            'HTTP 502 Bad Gateway',
+            '❌ Proxy Error',
+            'An unexpected error occurred while proxying the request.',
+            f'Error: {str(e)}',
             service=service,
             target=target_domain,
             status=502
         )
+
+
+async def __handle_proxy_request_async(route, path, request):
+    """Handle proxy request to external service (async version of __handle_proxy_request)."""
+    service = route.name
+    # Ensure trailing slash for service root
+    if not path or path == '/':
+        if not request.path.endswith('/'):
+            return HttpResponseRedirect(f'/{service}/')
+        path = ''
+    
+    # Build target URL
+    url = build_target_url(route, path, request.META.get('QUERY_STRING'))
+    timing = timing_of(request)
+    timing.mark('routing')
+    
+    # Identical concurrent GETs share one backend fetch and rewrite
+    key = coalesce_key(service, request, url)
+    if key is None:
+        response = await __fetch_proxy_response_async(route, path, request, url)
+    else:
+        response = await coalesce_async(
+            key, lambda: __fetch_proxy_response_async(route, path, request, url)
+        )
+    return timing.finish(record_response(service, response))
+
+
+async def __fetch_proxy_response_async(route, path, request, url):
+    """Get the response for a proxied request from the cache or the backend (async)."""
+    service, target_domain = route.name, route.domain
+    # Serve from the shared response cache if a fresh copy exists,
+    # a stale one is revalidated with the backend instead of refetched
+    timing = timing_of(request)
+    cached = await sync_to_async(cache_lookup, thread_sensitive=False)(service, request, url)
+    timing.mark('cache')
+    if cached is not None and cached['fresh']:
+        return compress_response(cached_response(cached), request)
+    validators = cache_validators(cached, request) if cached is not None else None
+    
+    # Fail fast while the backend's circuit is open instead of tying up a worker
+    if not allow_request(service):
+        return backend_unavailable(service, target_domain)
+    
+    resp = None
+    try:
+        # Make request to backend
+        resp = await make_proxy_request_async(route, path, request, url, validators)
+        record_success(service)
+        
+        # Backend confirmed our stale copy is still current
+        if validators and resp.status_code == 304:
+            await resp.aclose()
+            upstream_finished(resp)
+            response = await sync_to_async(cache_revalidated, thread_sensitive=False)(cached, resp)
+            return compress_response(response, request)
+        
+        # Handle 404s from backend
+        if resp.status_code == 404:
+            await resp.aread()
+            upstream_finished(resp)
+            return handle_404_response(resp, path, service, target_domain)
+        
+        content_type = resp.headers.get('content-type', '')
+        # Partial content is never rewritten: its byte offsets are the backend's
+        partial = resp.status_code == 206
+        rewritten = not partial and is_rewritable(content_type)
+        upstream_encoding = resp.headers.get('content-encoding', '').lower()
+        
+        if partial:
+            # Byte ranges (one range or multipart/byteranges) go through as received, never buffered
+            response = StreamingHttpResponse(stream_response_body_async(resp, decode=False), status=206)
+            if upstream_encoding:
+                response['Content-Encoding'] = upstream_encoding
+        elif rewritten and should_stream_rewrite(resp):
+            # Large text is rewritten on the fly as chunks arrive
+            response = StreamingHttpResponse(
+                stream_response_content_async(resp, service, target_domain, url),
+                status=resp.status_code
+            )
+        elif rewritten:
+            # Text is read whole and rewritten in a worker thread,
+            # unless a body of unknown length turns out to be large
+            content, chunks = await read_text_body_async(resp)
+            timing.mark('body')
+            if chunks is not None:
+                response = StreamingHttpResponse(
+                    stream_response_content_async(resp, service, target_domain, url, chunks),
+                    status=resp.status_code
+                )
+            else:
+                processed_content, is_text = await sync_to_async(process_response_content, thread_sensitive=False)(
+                    content, content_type, service, target_domain, url, etag=resp.headers.get('etag')
+                )
+                timing.mark('rewrite')
+                response = HttpResponse(processed_content, status=resp.status_code)
+        elif upstream_encoding and client_accepts(request, upstream_encoding):
+            # Everything else is passed through chunk by chunk, never buffered,
+            # and left compressed when the client understands the encoding
+            response = StreamingHttpResponse(stream_response_body_async(resp, decode=False), status=resp.status_code)
+            response['Content-Encoding'] = upstream_encoding
+        else:
+            response = StreamingHttpResponse(stream_response_body_async(resp), status=resp.status_code)
+        
+        # Copy headers from backend
+        copy_response_headers(resp, response, route)
+        # Bodies passed on unchanged keep their length (media players need it to seek)
+        if not rewritten and (not upstream_encoding or response.has_header('Content-Encoding')):
+            forward_content_length(resp, response)
+        else:
+            # Rewritten or decoded: the backend's byte offsets and strong ETag don't apply
+            mark_representation_changed(response)
+        apply_cache_headers(response)
+        handle_set_cookies(resp, response)
+        timing.mark('copy')
+        await sync_to_async(cache_store, thread_sensitive=False)(service, request, url, resp, response)
+        
+        # Rewritten text is (re)compressed per client, after the plain body is cached
+        if rewritten:
+            compress_response(response, request)
+        return response
+        
+    except httpx.TimeoutException:
+        count('proxy_upstream_errors_total', service=service, kind='timeout')
+        record_failure(service, 'timeout')
+        return backend_timeout(service, target_domain)
+    except httpx.TransportError:
+        count('proxy_upstream_errors_total', service=service, kind='connection')
+        record_failure(service, 'connection')
+        return backend_unreachable(service, target_domain)
     except Exception as e:
-        log(f"[ERROR] {e}")
+        count('proxy_upstream_errors_total', service=service, kind='other')
+        log_event('error', service, f"[ERROR] {e}")
+        if resp is not None:
+            await resp.aclose()
+            upstream_finished(resp)
         return error_page(
             '❌ Proxy Error',
-            f'An unexpected error occurred while proxying the request.',
+            'An unexpected error occurred while proxying the request.',
             f'Error: {str(e)}',
             service=service,
             target=target_domain,
@@ -2,4 +2,8 @@ import os
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'settings')
-application = get_wsgi_application()
\ No newline at end of file
+application = get_wsgi_application()
+
+# Do the startup work now (in the gunicorn master with --preload), not on the first request
+from startup import warm
+warm()